@@ -1,22 +1,79 @@
 # import openpyxl
-import base64
+import time
+STARTUP_T0 = time.perf_counter()     # before the other imports, see startup_report()
+
+import os
+import sys
 import sqlite3
-import hashlib
+import threading
 import tkinter as tk
-import pandas as pd
-from io import BytesIO
 from tkinter import ttk, messagebox, filedialog
-from PIL import Image, ImageTk
 from datetime import datetime, timedelta
-from tkcalendar import DateEntry
 
-DB_NAME = "inventory.db"
+import inventory_db as db
+import inventory_core
+import inventory_lookups
+import inventory_reconcile
+from inventory_worker import DBExecutor
+import inventory_export
+import inventory_archive
+import inventory_diag
+from inventory_grid import Grid
+from inventory_db import init_db
+
+TXN_PAGE_SIZE = 200
+ITEM_PAGE_SIZE = 200
+SEARCH_DEBOUNCE_MS = 250
+LOW_STOCK_REFRESH_MS = 30000
+GRID_POLL_MS = 10000       # open list windows check for other PCs' changes; 0 = off
 image_data = "iVBORw0KGgoAAAANSUhEUgAAAZAAAADICAYAAAGxEod0AAAAGXRFWHRTb2Z0d2FyZQBBZG9iZSBJbWFnZVJlYWR5ccllPAAAAyJpVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADw/eHBhY2tldCBiZWdpbj0i77u/IiBpZD0iVzVNME1wQ2VoaUh6cmVTek5UY3prYzlkIj8+IDx4OnhtcG1ldGEgeG1sbnM6eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IkFkb2JlIFhNUCBDb3JlIDUuMy1jMDExIDY2LjE0NTY2MSwgMjAxMi8wMi8wNi0xNDo1NjoyNyAgICAgICAgIj4gPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4gPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9IiIgeG1sbnM6eG1wPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvIiB4bWxuczp4bXBNTT0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL21tLyIgeG1sbnM6c3RSZWY9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC9zVHlwZS9SZXNvdXJjZVJlZiMiIHhtcDpDcmVhdG9yVG9vbD0iQWRvYmUgUGhvdG9zaG9wIENTNiAoV2luZG93cykiIHhtcE1NOkluc3RhbmNlSUQ9InhtcC5paWQ6RjVDMDY2MEQ5NDM3MTFFNTgyMzRDNzkzMEJGMTE0MDAiIHhtcE1NOkRvY3VtZW50SUQ9InhtcC5kaWQ6RjVDMDY2MEU5NDM3MTFFNTgyMzRDNzkzMEJGMTE0MDAiPiA8eG1wTU06RGVyaXZlZEZyb20gc3RSZWY6aW5zdGFuY2VJRD0ieG1wLmlpZDpGNUMwNjYwQjk0MzcxMUU1ODIzNEM3OTMwQkYxMTQwMCIgc3RSZWY6ZG9jdW1lbnRJRD0ieG1wLmRpZDpGNUMwNjYwQzk0MzcxMUU1ODIzNEM3OTMwQkYxMTQwMCIvPiA8L3JkZjpEZXNjcmlwdGlvbj4gPC9yZGY6UkRGPiA8L3g6eG1wbWV0YT4gPD94cGFja2V0IGVuZD0iciI/Pimf8UkAAQqOSURBVHja7FZpUFNXFP7eyyIJECBAEBRkCaiIcUHbulFUlBmkClq1WmurQzt2rK3acRxn1B/W2nGsVtSxrVXrMG5TtS64CyougIoWRAMkIRFE2ZeEELLf3vdS0R/93Zk6uTMnL/ee8+493znfOfcxhBC8DYPFWzK8QLxAvEC8QP5fQ8j9PH9hQk1tF2bvLzOa8mbLXil7ex2QXrdhZ6OG+WB6HEoeNGLRgVKyM3sEI/Jh8dWxcnJg2XupI2KDiopKGyAWMZAHSJEyNgInLmohEAoAhiA4QILwYAn2nKwEd2ulqCIwVqVA3vlqtHVZsXrJWBTffY5STRN4AwYYFR+Cv7RtWLN4DLirLmqgP77+4QYk/YR4d0gYJo4egGajFW43eZ0Ra68b0yyhZH+msg+E8KPjMFmduCpqhG+ImAhZAQaG96lhdxGsnBo/eene4puPHjdhV1Gt+pq6ZfObUSrRt63ZVqDRcf/dhDAON1FywjIM74DN6Y7j5pzeRef/6GO5p93pDudtBQwEVDgw/LrLHc/ZdpiskIpYCCloTnggz+o6oVVaMG+eCsyOajA5F+AKD0H/vGeYOk2Jx4V6DFKLSJC/yAOSbgw3sLNId0O9K4spqe/atGFmUmKGKmL9xwfvEQcFuTr/CZk/KXrb8pQ4ZV17zyx5kIScr+/Qmq0Ona7D/Hlntw3zpsbXfjgxRnfoSs2PYAnyda1aqZDVc3bSfsLG6y+N5VWG9vjmNjN0hk5w65RC2pgIGXotTqRuLSSBASJwwgOZbhCSmzf1YLaU4db4HiBaAQQHA42tEHxfhl27Z8I5RQRtvZEH4qSOqmtasX3mcCZ57QX78DDZRpPZhv4hvtg1f9Q7FU9bkDMhZqWVZtRPJIBMwJ4dvfYCz4HDm9Kx+7pun2qIAgKWQVNbD/YXar9NT4nh9371yURooKiaWXLogUYe4IPJGy/xCi6TvtTxJYfutaQlhJ7uoWdwwgPZLGpGTs5YoKvbs8m6JFRlCTE5VgKYzGBmHsa09IMID5H20SY+Ro4gWT/IpeKGJKUcnAjpbi86LYmUFmhotyT7UD4PHCDjRUABcePoeTUYSgn2jTbz7OBcJnn9xX/96Du2bFwipSXOrH6febUmojRv67SEXnvcmD3luwJi7XV5gOTdb/JYNLXDU20CJJ7sgaulEzD2gJxbhOuFOajUtXFkR2iIVJwxJRrJSWG4vSUjNuvHIltFTRvKqWy9WnMoeVQELlc3f6KpM6Ja347Fv5QYn2zP4B3R0cZSuzOLGflNvlFX3wkiYge0NFtQvT2TFgMLVUIo74rZaofF4ZKGySRVKVsKSc0LDxsCfMVY8muJ4eq6NObIlxMYLnr9Q6W0p1C0zKobhPw0GezCP1C0IhZOQT9MOWuEdd1w+HxxBeToPKzKvYOV2Srag9yeg8wOSgNPkLh0X6LUDJJLaTeJ4OcMLeg7D1/Ch1aiKlEBU7cd0VF+vH13txMymQg2mwtiMUv3cvGUUgT7wmKz03cJmlt7ERYqgclEaUOT6S8VgdB1u4Pw3bHL6OCp6e/PN14PEL3BhJhBfoTrZOJPT8FNnRBb7IijEVM/WA69vgNGo012v7K1m6MwVWNwrJzP3YnL1ZifkYhT9Jk9PQHnCnVch0JWWjxOX9NgwYwhOH6hGrPTB/MAzxZo+INnpSXw+5yhNkmDFYiLDPTQmkotPVcZFcTPOfs56UNoXbr73h0/KhKhtJ1z8/SUOFy5Veuhlp0eUK7uYJpazVgWKIY7bw7+XDoa+3Mz+RcnbShoCA6RdZdWNiF1/EAcuKX//Uj+EzzRtsNOIx6h8EFmahzUhg4UaVpRSoHvy69C2rhoGj0WBS+6ylmGxe2Hjci9X09mpCqFQwfLsf3wI+SWPSfKyABKJQfUte3YfLLiIEefqP5+NEga/Fbx0iILECNpqAJL5w7H6pwxooSYQAT6i/FZdhICZGIsmjXs9c3OZebyjTrmoROF7M8GZBYbMaHYjL155cyOuarIjbm3qY2bb7tOt5t2FE/xPtV3CFSrzlv5S4npq0foG02UKhKM2XCZbFuYPLK7145X6tPFdX5V1UaeftxYsOdua2S4H4bFKhAlEa8wNJhwt/xln54bWhqcyqp2/r+MOl/7zAjDcxMmbLxCwhS+Hmp5v7W8QLxAvEC8QP7r8bcA7Jl5UFNHHMe/m5NAAoRTRAREDVgURItSRVHRglbqUXSs19hqtbbW1tGOrU6tra3aGSu0zjjW0U7tTKceaEe0KB5TQeWQo4KoEa8Q5YgkYNAkEMh294VEbftnZ/pP3sx787LZ3be/3d9vf+/7eZ7t12OIxxCPIR5DPIb8J4CuqOwhFhS1UJqT5pav17QGHD9/b8qSN+LPlJU2o5N2Y/7+cvrpuIEkfWwkJjItfWVLBrlU8RBDBgailGmIZdnxsHU7cOaSHgPCfXGX9R3VR4XdR2uFfofGBCErbQBu60w4ePY21i0dhaILOpTVN/9jcN5yMd6bOxwR4SoovCRYtukM0hLCkToiHCImcx+0WoR6Uyf2d65Ip82B+bPi6LdRTm5FmHbnFYfFhWLO5JjCoatPGkcm9WFK0Ano/JRyVN98JNxz3c2Sqiorp7hTInomhHj76TuLrNaunlAXXOMnu1f0AjuhjIun5+DcC2e3gw4Q9cI5fvAyF5xre2wjLjjnzuzqJcdo248zEZnXjAbOrrgyq9OCmB7DkbdAqFh77RExme2YsO0szeyrJrMnxES//VP5XQ6fzq2fSGyd3QgLUeJaQ9vUhGh1qZSITC0mK3h5Zk4R9XVQMijIZ8762cMOzdlbSn97fwxR+8gxfvt5ev2bLPJL/nX4sgmqrTcgpn8ANFFqzNtfSo+vGkuUrN7yfWXaZD+Fxt9PgfSRETBabMnxMYHlXOUnJ4U5V4QbUVRnQMMNPbK8DID1CVq2JIMmxYJsrcaBA1VI2F/nfpeJ8PNi46f3dr85nHBDaph2Z+oX+sYOLN5TejJxfYGxpr4VBtNT3NG1cx2NMLWTibU96cQ742Jyh8aGCL+1Oa+TuHXHKV9MseRZyPIJrvoik/RjMpayzpcnRWh4eXuHTQB0EcHK8tGfF1IO59wxcv9+G8bnMON8FbAyv4ZYiorbesBoBmQiLPokDYulrRxTCI1iogMgl0kE2sxXlsM5m6Ubz40DHM5xAzic4+5j7eqGUiGVTU6JxAxvyYdNvf596MRN3N81w+tOU8fgq7WGW8/HSNV1A5b+WkkllDi2Z8YJkGDl3AS8srGACriFPYPDOfeuFcWW0bFnGnP4Lvg8MrEg8Ma0K8yVLTZA1+Ls1dcbtbecceHnK8fQuCCMH9Uf4T5yA48ZL4UU0ZFqNPyQTQwH5hLuGqGBSo50Qdms5awYDalIRHvsFKFLj1C5VMxWzAKpTIwue0/npC1ntbxvi72HPdYOb4UYcoUEscFK7e9rxokpCwa1nxzcgvw1aWTX/JfJyQ9SSfb3F7uef/sVLmThEczUeOHYNStbCTbXMhb87RbQI/OQl39DPSIhrN01WxyyuY66OyaQLgf8A73YhuCEcLpGM7q7KDrYoBJjg9wgzdXODdaICGZzF1y8zFX+9+f8W7lKJePbBqL6+/eSxrdO0I7cycKs9k3fhw6VHDYWVGDb6N5J0Vj7RwOKN4wnlyuakDAkBHW3WjGANT5coMXsDA3yz93C9EmDIBGLcKxQi1lTNII75Z12grm8U1rMmDwYxZV6mNqsmDA6mgW2FIWXdbA87UQWayvq3fFajE8QFqwStv8Wow2l1Q0CzLtY3Qgj+88F9/gXgbzTWk5w8d3miU7XurEhlagKnqCi4gEWjQyHNX8RTi1MxGIvMb5m+aBmWybZsb8KKw5W0QN5dSireYA/bxgQNzAI6V+doZSQqB67A6t3XUJupZ6u3V0C02Mrckt1tMfRgxnpGjYoKzNOgjGJ/fBSrBojEkNQe8+Ij1cm47PDVwtdgM7Qau0jl4vVPAcVXdFj2bwExMcFI/vVQegXEZD07qLhCPCTYVCkCrklOlrcZK56IbPvNOtIvb6D7EhJAVlbjAxzIAI1wZmbX9P0cjLnpySL3c6uYsEl+FG2NYMMiQl8AdDxBqGB3ij5MoNVE6ut9m7U69rd+eW+zozKaqNQn+ehnz8aOyXAXy4AOj+lrDllY4HpQuUDN9BrbOmA9k6bcO/DEqNSKUNJlQFHV6WS45vSkzwK0WOIxxCPIR5D/rfjLwHYt9KoqI4s/D1o6IZmafbdsIiAyCIiiBjFDRUUozLGLEY9oqiJJhqXjNGJE52Y4IaJE40mauKSGI27sioqoGwqyt5I2Pd964buhpqqhxjMSU7m90zfc+oA7z3ue1X33q9u1f3qfwZ+1Z6lFrVB1AZRi9ogaoOoRW0Qtfy5vNjuYjUFJoz4W9/UDZlcBVmvEscyqlLyZkwKREE56A1AUxPwGA50diOiuWL1qx7WR9hWeXOzHGHBTnj8uHEwoUZaSePUvUnPEtmfe+aM4u4/rkboqw7YcimnpqlHaTXG0uDm1U+DQwcz719iivgteY8RpigqbUZrey+chhlhir8NVPQ6a5din0FPXwg5/T734cbIK2mGjkgLukIBzI10GI2QJxYPClPt6WQKiVgbE8faQt6rQHVdF25lVfFkYyasptHX14/UlEp+y4YnHg9V8Ft14QURmclgvYN/7Dkpmclg7YP//TlBmQmrg7DnGO+3pkX+gqw8KKwuIvi9hRg/8G1tO6KYLUJbew8WhTrDwkIfrUHDYWTkST+6DPeSpejvI5gy0/lwRUX74UP3ypBZ3yMPnzNCd6yfBTo6lWhq6kGoqfjWngQpOIEGfRGHcZ7W0NXVxuF3fK1zKtvm7owpuGwbcZ58+/YYTqnqU4fHUMiS9/Rh2K40MnmCHSGz9aClLUBtlwJW25LA7ciA8Zpr4I7+iglJjdj6qBbb3bww/sB9vP66JxKjQlD/zRydcZtjSfbTOqtGGmF/uAoFI+LKYKivjb3x0nPsWkSg40fMa1b9mE2sTMQwNNRhm/Lo6lbhYHJpy7n08qNDdeRWty9dcSKDCIQa/GalTNEHIVXMiN/6YiE6VCpMG2OLS2XNpLxDvvAVcz2Y0ojacDWHXEkv/9DcTI/30gAPa6xZ4ImLpc0kYNNVYmGghQWhTnhzgRsm+djw11+b5Ijwac5YvdDTiumLDBsJcxNdTPKy4vWfKWogzc3dYK2lpRt5hY188153pZLdXxLiqhfsPwzUd6FQETR3ytHSJYfXpmtk/sG7vXwtaWgbClku3+SRrqhJvw3e+zTkmlpx7z1HlHep0DTaDnaSVkwOd8aw4wLIHuXz1RONbakgFM6OTHdC7sFQfPFTdo23laGFnp6oQawjeqFv/bUcnhusQc1iqKPVEDnefo7XMMOEPoFmUMT3mSTlk+kcgyRLihldMgXcHI3xnaOf8aofsqotV14k8Zsmc8FRtwnzoOsbg3gQ0dDQwGgXU77IlEDvB+yMI+unjvjg28Sig4PbxTkVrfBzt8DmaSPCd17PvzDexWyfRCKChPZfW8DhixmuHPS1l41Yf41UfzWfk8uUaKXwC+oUTS09SMthjGWNWqYrLbcBWjTaHWwMGEFexpipsw/cJXf+Ecy/jCFQcU2H/9dv+NiFHUkl5+OlXUp6kcFwxGsjoaI6P79ecCN110wucGcCuZBeHrV4kuPmP4yQkbI2iKknJSQU81hNAZzVbPmSy/lnKmwoN0J4oQQmh56hKsIRrNLHGRmANLbSnmkicpU/Vq25gmAXc7yuZV9fXt35Esf1wBwP7vMQd26pqwW3d4GHRV1le0Lc/UosP5mRxLZv2KGT1IxqJKdXQaSlCV0dLb79e4mvD1PT3NQFjr5zd7hXCIsM1np6lMh6Uo/MJ3XIyK4Fo13vjymIdjIfwPLCtp7op+09NatOPVR62xr+wmoibk7GPNwOFdKlPJF/IIyzWXuRuK27rLJ/zqD+KzkbOU6HFU5n77sjF2lxrDQJGwPh0+Ky1pfnhkAHnjbeKVeZ7n5zdGg6RZgH26ZzJ9PLN7V1Koxl8j7IhtYNmSzytUQKnR/8fG2hteIqYGwAPD9VsNJdG48mKnHEtgEiQxGMf2zAq7YiEBXjndMgM5eAm3kSP55dhDG+NkCHDGOoV/7RPtmSv42CwzAJ1rztjTVveeHRv2ZxzHDjvCzh4WoGQyMR9Sigm8Ila/Oj79URCktGEjEInci3/PT4Zj8YK5/wJWxjYxE83Mzg62HJG4xGmrC0YaCa5SoRbfYwEFrf2TFda9XpRzKPj2IIG0B3V9MhMMrRCZ2gR67Eo89mcUb6wtZlpzMJ+v96j6+2Xob4LVO4bmWfSFrd7rPzYs5ZuVIp//1zLk4S2FiJUd0i936Y1wRtmoQ8LGhC9mch3ILDqc36Ik06d5OXDfIPWGPCBHs6IDpQHp0DrlMGjuIdA9yj+Qp4e7phdYoSvayUnZELgz6aoTS2gWPF3oY2kNilvB59fRE0HjxB5LH05KBd8YR7XqZmkBWVJG2ypPpNJUL+xARrrLL95TxPLupq/tHI4+llDEt1acQ9KWm2fO1QCjkdMY6r+C6cszLXRdXZN7if353Azd53l2QXNTuIaQbT26vCuu+z8jaefpgS8/5ETt7brwgdbfMhe+fDxu5TcwId7PQMdJD9ZZjujU1BvvarLpKFu27HFVe0SSbuSiSbY/OJQKRhp+zphyZ1jFvbp5mVR8/lmDMym/i4WxpfLW9tYPquFdbd7pD36n59S/pzl7JP93FVywJLEyHStgdz7xxJe/hBiNub0sp2vWNZ5XyaF1fVVq2vq2149HrRYt9tcaShvivP09kEY93NUNXYhb0nMg1ZVAftSSKX0yoiXtrtLSpsxZg9yeT64lGwttbHiBFmCF5xEQ8onvfSSFDSiPl5rhnCg1xpAqCAeEkszfu00H9mIe+Z6zfcgJODEdY6j0aqSQsXuOE64XNQtfzXQu6s4F5M6n1EhYyNAZx7sZCQIANs2RKD+GPz0dYmh0SiMxDeiy8AZypAToWDXBlg12zceAPONDeXuJkiOrniWf5MN2cNIsLOcG9ue2IhOTTfiwsJcsDoTTc6doW4GXi6mfOQ1NPZDmm1Ah9cfkqKD4ZxhEbKmv33TizwsF4W6GeNxhYFtGmk3Lpfhh23i8nHk4ZzMwLtoFRxcKBp+IkbBeKdCYVdcX+fyokpeBf92gKhlqaZ/TCTRoVCBRd7CWJTyrGcwk/u7lAuJq3ckkZ7nYK+PNDLhj6rgaycOqz95Sk5FxHArTyT1VNxPFzESs75BS1834ZTHfR/tO88qFSolP1oUKhmudtJYvToOoMxIbppAuDz8U1yerm/tpGBjlJXR4DymnbcL256z2eY5FB1s9zd28U4r6NNISiqbXc1FgtzF8925vONXWdztybm14UeW+oXGJNchkb0r30pQgpLBg5fyWhE3EuvxL67JaVVTg72ZIfvS6ujyso2dHcr4Urx/trtZwhT2eHL6tyR5kbigoAxdjh0+jEdzAGCzMn8GlIQHcZ9dSIbmQ0dJ7xNRcv4BGK4BV0cDUTPmSSp5oeLvD1P3y/b+opAsGn2RMcydr2kpgPHYgr5Zx53yIifkR7/Ab00U/l02Vj+upamhualrModc31tt/f390tEQgFfvE99VMevp3gojs0j1gaixlBXy0hrPe1LE/3sceG2FFUNAyf6rlW0kNUBDkvOZlbsz9w/05Q8nzvE+gPsJRFd/HlGXq6s6eyxlR6ax+nQRENIoXLHgdSBPuZWyzI+n6XLjjCyoTSjqXsTTYNz6RxR297js3CGYw5NQJT1DXIINAdDYaDvIupwfh/flMdvnaLTSw0+cZzNnxtEX6zFZzJ6FOfZSTx2xKmZri5HUShLflINd5qWtnYo+NRRX1dAfwow3MGET1kHJeiTOHJ+7QQuv7QV0UnFqqtbpvIRqUfHlr31UmIZvF1MzUQagkZTOun5b71J4jYMpLRVdd38ebDi2jbsvVdCVvu/wgU4mvB6rW0NIXjeu4zixvDUoobwrfM9FvEeRt2P5fxMriSXYk+SlBxc6M0ZUnhd+k0a2R3uybEuW9OByy9vQVSilPzwXiDnYm0I/3/Gk+h5HlxpdQsm+znwScmS79I79s7zMGDLhL23pCWn3h3vxMalvbOXX+kvP5nZe3ndBOHtVN6PsPwtb57AIaSDfS5W6hPka5N9/VZp/+CYrFniB6VyIKOKOv4AB1NKySezXDkTbQ5rV/pBXTFUby6qRW0QtUHUojaI2iBqURvk/0D+IwB71x0dZbn0f+8mu9lN772HkEJCqCZUKdIUUFFAQEFFQbyA5RPx3gtiwaNig1hRFEEpl6YS0It0CaEESCGFVNJ722Szm63vfebZ7CYUz/U75/vrOzs5c5Ls25+ZZ+Y37z4zY4O9thliI5tAbAKxkU0gNoHYyCYQm0BsZBOITSA2sgnERjaB2ARiI5tAbAKx0f85WQuAEdECrozMBnR0aWESRLS2dY9Yp5RnIjoEyCyERK+Hyc0FGBkH32PnGj6ZGB5QXq+Ei0KG5KRAVFd1WYvQawx6rNpzrVOpN7qIBhM2zk4QhkR74VJ+04iNJ4oyRb0Je5eNFsamBPNr1zd1Izu/gSfoXCtshJuTA6/O5CiXYvLoEGiNJthJJPjtzE1eN0sus0dcpBfyylphMhjh7irnBcc2/yuHr1C30Oh4f179yc5ewMxJEcjMNifjUPExIhnbtvKJ4VCr9cjOaoDaYEBuuTkhh5JtNFrDLQNGqRKy3jXPa58caU26CQ12ta5lXv7Gcb52i4gKlhHRcwyLN1em+vlUCZKHBt8hDGshs9uJXU62witadPd1zOz4Wyz+nn0V4ofj8JqzAacneWHl8dNo/GyG//NHi8X19aJoKTyTMsqfL1wm0rMB/G7pSGtrAhkE9OiM8HFxuHLl7RkClYR/bPtFkcprE1uUwjZDbqN9GWXfH6rXLSnbEIg1r+bhyrFSbHp/GtLSCjF1ajQSEvxw773mRWTNW2dCyrRF+E0jZjuoBItQblaq4G1y5GkF/am8UokIpknl1R3WtZA3iluhZRru7e5okwb69eIg/nBX9ob8FvUS4/ezERnlhenTovH11ofg4+OMAjZ1J3ydCS8vR746kPif//ydn+RGpApDSuxFhb0MolGAu4vDn16wuqWbs4Wo1qHIboMKbh0vaHxr5sdntZ+eLSswGEWXPzuHnSDI2D65D316TnvyRuMmae+y1N6SgtH9ywVq9MbQ/opBJQZJmfRG83adwRRtOZYSa7R6o4/lWJ3RdLfyg9bzk3mW9DIdb2FmHaz7mHoTdrTMOpCpJT6cW/ezpUxhf7YKhPoQuDjZY0uz3Rv538zBvv25fOOyo8Vw+KUdwtzdeO0os7njh0NYtA/CymOQvH4BEROjsHHjKcTE+EA11Qk+p7rE8qp2tCnvntI2amgAwv1cMIz5EksqT02TCicLGt6f+3m6LiXC6/X9q8Y4LB8XGR/g5di1bG+WaNevniNZxmW7rooujlLdgmHBg3cvH+UwNyX01XVp+Y3b08sPhoS648npMSUaud2n1H9ECrGUPWHVkev176w+kEOuDCOSApjw7TA4yrM0rbyl5KeK1uIwL+Z/AhyxeF48JiSHNE8eHuLUIsGeRydGlSbH+ZWmVbSWUL+TBVOiSx+fGlPS42CXSuffc7J0RTO7f+KCoibenqSouAWZ7eritJutJdPvCS0V6aYZx8d6gorsOTvaI6dd/SA9FS2V7c9WgRSVtiFgf50obhqDJ586gPnzk8wD4KaAWNVClf14FUMwx8ezqmLDAT9PPF8lw7p1k1BZ2Y5rWbX4Tt6I3JLmhV5u8juEca242Zx9ym5+wtsnuKM5sGrcGHbGIXuza149/D/3yvofFxbqildmxK5dsP2SqKUMXDaawc8cEB8eHryHsmktRAuW/7V6rF9GTcecX9LLH79U2YaLxc37aJuSaSUt6n5iXPg/KWXimc3pRwpKWqBQ2GPc0CCaTlAIgi505c+i0SBA1anD+cs1UHVoch6K859QU6dCXok5q9jJUdZdVN4OewYsZiQGrpsW63vgo9PFX9C6aWKZTAoZc+RbT5V+z55JSRr3x7UalNd2QNOjh7JNy86vxwMfnGkjQLP+p9zz3p4O6M9WgTgwpOGYY15pHjPQG5JHd0PydiZEpkmdzwbhkzm+SH3QC5WzmLq9FAlB0wMxrwxIz4TwST48mUkbPjwYg/xd8YJH9K7qxi70y2bjWbj7SpvEsW8dF1/6KdcwwM8l/eNZCUKQmzzjkc/Ss9zl0g575uTDgs3lJhPCPVBV04l7B3hvov9/zaiecC2/OZDO8/zkgQvL2bbRif4c4VCPJfJjsT4uuWsP5P4wNyWMIycLdXbrrEiImRA5JQjRDLHQ0TUTHMjMxK48KNLKd6PBxFfOkyDt7e/EPFT5kUzeS1Pj5tK9+Xo4gZJNyRTSZQ5drV7cYzC5WfZvaldjSJw35AoJYzvMGhq4c8PDiU9frmgb3a02oD9bBbLhYO7R7m9n49KlKuYXJsJtUBh4hmZUMHe+L10TsDpfjrC9SgYfpfDVdvKET8SEU/cqXiVy9QtpuCc5BE5pZ9hcBLo1+r6HINg7NU5YPihQ2PhQov3CEcHjyJFT7xu6zDMp4TOzCptBXFjWxq5pnuYmmG3zqp1XTj+740oBnau1UwOVRscGWou6hk4Ul7dxXjw8eA5t71BqrddNSfBHEoPGHs4OfHXNnlcn3EcdXUwm62J0nGEzoubLOYKgkGLvufJls6YM+EvOlypkisyvJq/7VeQL8UUjg98Gx0tvzbhDinI2I+3YTD5b1PTcwpTwFycN8tlOn18qbXmUS0DSFxHyXxfDIu8/f64Cycmh/MOORiW7Yj3Q3mm29XIZ0KUCA/joYrMjgqp2SqVUthIoqcK7l5uRumUmUj/NQMbL9+BKQUNSbWPXrXDOnmZAXzuanBst+COzxoz3RVSou3Qg7u7UMsxub2WSiFE0oVOtdaPjXJk2WrhDqYOyy8wmg4lnyvb3OVtOlhQu2Joh7k6/+ep3T4wUBA4fcEsyKsUsKmba5g4P2fZmWv7WIH/XvyQQOsdvaybZC2ygFWyGavUiprx1oru68U74rurSQ9NtwLs/5X1Z16xGQWkHfJ0cmv++P2e/utsIC/dF6gOCkTDY33yh+XvN2u/mBKvdsXeAr6OAGGcRAcGhuGjyhLguEQIJytcTn52+yQsCrF41mhdhrtPo5sczTbwD0jEfounQItLPFVPHhOE+xkQamTDnnqH+IB49IhCUAWVhsv0BborGxEC3DLobHQvcdGx2EScwU0AJnMR6B7updK42VY/1evf4OscdfuVe4YeMivee3nbRbLeEOwe3qKQVm54a8ayoNSJk2T5zRd3/KhDA2U1m5OZrx9VTdkxpPlo4dOzNSuUt++mZdXBlqNOfoVO69pPbLogrdl0RG1u7fQRmFqkaBLXokvSfIaSFO3dcQ1ZWHa/8ycJROhPDgUZ+b3uGq/HFWDlGuhng9sF1fpTIQhiRqi9Q0qe6bxBMPKIWjHZ3sb90sgksMqdUMWKqN0uVfT84Wpiq0RhBTPD3RmUH9DoTpL0Ksf2pFP/dL4wfQ39TBE+zrUXZw+08BaXE7xwpOETOkvop9ddi8i/5qbMFgT3XF2k3NhDqoVQ56z7sJ4eZynYGR/l+TGlOVrXv+iuzRMvu94nk8NQ/ylsnrv4xKzfE1+k8CaA/jRseCKlMwKgNx0y/vGSuOkz844pxApm8Se+eEAVupPtn4ZbUYNXq0Rg6NBCqHY8CDR1skLWw1PpelC5iTVojdhUZ+IHCzRqzpjGBoUuNl8f2oZ4r1+sR4iLfW1bVgareHmWkTkF+zjw9zMtDzuOUIDZLiOt3LhBo2ifFeCG7t1xzW1cPgkPdMGvLOaOTIOjDoz3h7qdAuLuievI7J0UPVzl/vUNU29CFAA8FWPgjVG19UKhsVWPxZB5awIE577Agd2ZxpZgW7//bpt8K37Bnj5THkFZrh5q3uKOGV7MnRnJNpXjm8Ivjh54sbVpojlmYuen36oS/NpFJKCXb1dlFhrrmLjwzacALpDfM7Hl7uMhhkpidPo2vm7OMxRd2PLt3dlLgVw7sWCNvoUam1w7fLU2JEpjCBLFQoL6tp08g01prDvaXalIIQzvk+Dp644mqesjDfHmLQBZkQKT3WaRb3T1ktCHT9930+M+zGMb3yX/1QG7VvG/NZoK0btHXF8TPz5RcEHpvVsVMCzE95O6lKULY8kMiNWakIjKE+ma+c7JmZJjHwW1LU2QmLcHGHmxeNDz0sZEh787adLpJzlCZQmbHA7mR6/8t7lx8j1BWqUJbiyZk8683vqPr+gY4r2UBmWBiXveLv426n8BF8IpDYo/eGHwiu36RwIRwJKd+q8jBgI6ZSCOi/J2zKS+eKKeiGTHR3veR2VQbjE5ShXRIbasmfM2h66cf/+aiyWgUnWhw+Xu5lWMDL+XXo0WjH2PqfWYvL6dkFiT6pqw/JjardGFFFR1yqjxRyhT1wvUmVLWoIuk6g9ccEY0mEw+EOfo4e64K03bkij3bzG3aZPP2QE/OUSGHMnUy3Jb/ho7UCXBfzRBUqB9Q3oAdS6OwZHclgz0q9Bx6nOfU8RP+pMQheZMwdJDPXQ1vV6f+Tt/CPqdE0Yambg5RlSodFI5SDI33uaWDmjWmYSaGFIa3NGSCiWRmyt/bkU96F2d7DkEtpO5hoKA3p49aLnp5yEAt5Exin2lpaOxhcYZ9P1QkRR67RmyUJ7uPW00vveA09qK0HnZuyhd0dnVgMYaWm9vb9+cdQnvvp5nFIqRE9C/FT1KHvmejWjNxA73M77Jc3RXQRpsd7JtvnIBu3wLzlGcReuCyNMDRCe7rM6H+6j7+fmr7sQIs+aYY7vWdaD//HN93zZpf4c6c6xdyhwd0JjkiFu+3reL+X1BspFdR4XdzYq0dGl2YVvhuLRRLHw9DQX4jZs2OhzB9B+KVDKZFeDK0I4GDUoMeJjxn5lAlTDDTRoVi3ytj+ybA97XIS5YJ6h4B167XmSNu6sFRreRwdAAL+CyF3h3lAvYcKcLSOQloYRHyKRYDdTHfsfjhRJ7hatZuA46nl/O/7xsTASeFua0GzaRLubW8JsucKTEorWxnULKZ+SFf9NUpoW6QJdZ7o33nTY/lNpyIfh85Zd5O9d9DA1zN/RBuI2obcCy9AjPGR8LbXX4Lyvrp92L+29dbgVFDQmCB3Yd+L7rlHHTJR3o7VNLsOHelitpuwJ6FESPifXExp45XDPrUUsi+p0eL5nYVNvrplox+/RQXBgVPb48NwdWzyyDuno83qdGJOzMLP8xF1+EnoDy4EKmPJ+HFl46Yb/BoN8onujCUYgc3FwkKW1Qrz1e0fsRwEJycZJI6lXaalJkXwpRUNEDZ2okLzd2XH/34j5KAACeEB7rgaEV7GSFpH08ZR1DuzBQIboqXu2V2b1FvXonEhAgGBMYPCcSWS1ViQpQPi0FFNqCe2HK+Qgzwd2OmU8rO5cpiVk+EhnmMaLe32/jM3CR8frlaPJ9Ti4o6JYs9BDizYC0u1i/RPcx9nQSC0/wt57piB3rA08M86N6eCoYC3fBYaro4Y0IE5m0+yztkqJmTp+9JAn2cMTjGx3FLZrU4JCYIGq2Judou3GT+Ib2h60JWVTsv5H+1vBXfZNV2X85rQDFTnPgoV/j7OGHL1RpxzOAAzJoRjbIe47eevW+7uUpIZDL+zyNT4nbm3WyPFJb/e4O4dTqv4FDGEEltTSf+MTMGL98XxSs7vPPOGby2djz8/V2w+ZOZEH7Xonigjvk+KXYfvoEahnyYJvywaE5cSBQbnF//KDfp9dpjP1S2cgSSFBfIrzfQ2/ng2XbNKuZEpXlFLfpnJ0S9WFNvLjqwdtsl7hOYDd7OZpVfNvkN9rNu0RD++Ym1k4T1B3PPpw72HaPS6HFx4/0CtTClynA/pJk1VG4vuaLTm+Y0s3su/ny24OJqHuwn1h7jiI+hn+sJwwMeCQ127e7SGZyv5Db12nMD73JgdqgSFtTpUPjJbEHaO0M/2ZnFtZ35E7WHi0NHUJAj1/yRQ8yx3OQxIaPOZNTij20XsOe96WD356RV9wGfOGZxCt67327xFxkXwoJcRm1aPGzpuay6u3+FO2VoyBs/Tg4VhCNdKGdB2KBBfpg6LRrVDMYyTcf16w344IMZ8PJ2gt2zRyGs/B1fNRUJ3UxzyBzVNqpuiYRvD6Zu3/bmIwnB8WuO6p6el3hHJNzfoUv4K382yHIpN5/dDAldKGsZ3aky4EBG1ZpOrQ49ej30RkPvdczH/Xq9bvWkN4+LB46W4kZRJ6h1KpXgs5w/p6xtyLfHS9a8PTthZEy4M4hHJHrhoekDOKetGics+T5T3LAvd4sDFcthTAK7/TnoX0KMxA1Nagh/4isaW3TMgijAbt9U2qBKmP7uaWUzi4EIQNz1CyquIeykn7eXC2q5PFBYf7EWI+OBqzeBThYUhjItaO9C4M8nqzaPDQuj5rcW+nJ3lrnvLHo7WpsIE5rbXMiozcVdQuDUA7nIeneGMPiFw+L7i4bN/m/OL4dp7rjetwr7Vo5NbOxQxwZ4OBbqe6s3dGhuRXH3JwamjvJ3+4dXgLM5dmK7RYd4oKTaXNMqKcoz+8mJAz6IXn5QfGB8uEDv4Ew6A5sBWq5guSVt+JkJ5asTJTsuXK7mY5PIoGtJRccd99bS1s2gvAEVVbduc2YzS8qUiPxL1vVm6+efLhg2MCLS3SPUz/nPvzHsTwqFrO6bWEGorSyAT6QcJ66o8FCQAcqWUtgzu0qmor9Apo2LsP7N4gnlim2Xjs6O8Ru7Yl4Sf9dD7/xp2Ki0BsG+E8VNoQsmDoSWCe79JSMW2FEFnF56bnoc1+AGlUY0MOkOZOaTHDFvMq8zC93XTZ434f1T4uXXpwgWpOuqkCHQy2yPL2TVUiFPRU17NwYN9ER2QR166JVLhAcGR3piyphgvLc/TziTUYWV02LfOpfXsKi8pGkXXWdycgQfQJUML9gLki3zk0PXhzF4zWE502gqwFlR24ldN+ol3+/L5bET1TtZsWQY/H0V2Lo/jyvAhzuy4CE3uwQ9i1eeXzLS+m5vb9p1iYyZ9+xrNdxn20pr2JYB2cgmEJtAbGQTiE0gNrIJxCYQG9kEYiObQGwCsZFNIDaB2MgmkP8v9B8B2PvusKiure91hikwzAy9dwFBBFSsgBUL1hDN1RivmsQ0jcY09cYSazSmqWkajZrE3HuNMbEbGwp2ERVFRJDekTJM7zPnW/sMjEPReN+b733/Oet5NmXKPvvsvcpvrb3PWmy0lyWWWI3FEkusgLDEEisgLLHECghLLLECwhJLrICwxBIrICyxxAoISyyxAsISSyyxAsISS6yAsMQSKyAsscQKCEss/V9Ru2QaHWsSkBQqBcUykLbowGg2M+l9yWskGaZSbSAZcEFrsECPEDGcvFzpXqvWvXivSftsEzhEyikHVxMFHDFt0XhYzGV+PMhM7em708dTeL+uRQ9uzgImEQdJ0lRZr4DQABdolmqZ7CNJ/QLgQUmLLZtWGzlxHWDyV+dpIKlxu0qrST5O8sWRQZIM8AaTNT0V+Rubv8SxZFpCwPJYP5d9D5V6CPB0htFDQqDjgWZSLOPKzWomMa1SY4Te0d5M3rg7hY3gyOeAgMeD+iYV+LgLQYRzYDFZYFRykDVjPP4wtWbhIvnmfvvjATgLeUByjja3aLBPPpM4I667J5hMNBRWSIFkZpGI+ExuJX8fMWi0RiapFKc1bc7mX9oX3bAncqXkGF9Q6k3g6mxN2kGKcST3CQA3Nz7U1qugBlsbnb1RDU0yXbs+SKrpt1/qz+ROIkSKdeTcqrel7LEv2tFuPUgBD50JHptbB6lPpCdk5T+0FfVoI5LV8q0XEmxprW33g/+GBD0q9mG7Fq7F7A9O2Ap/2I9hYLRP+74dedC3p3e7dSV51H8/8wAS+wZ1umZXRIqFdBKQp5IoXOjyGumIjYXKc5bJw1GCKiH4Sh58ODYMNk6KAa79RJAJd+CQLOZu2BIuZle9t2LfXbjAdQUYHgeQlQfTtU2f9wvzWGx/DTMyzPDBgaDXmeHWzQYmwS/zOvL+P+cmU6QYiUZvhLhunjD0ozM01ZrxhmS13DKlNyVCZjt6oQRmPhMDDaT0Ag6Dh4x99Hbtji8vlv6CHyUN3ARc5bVe/hJdaxLGNlKrjazqZOnpIRbRJMVV0glvNHLpOXJn2sClzpl3jAd6nBCKJ3nBoXl94dUpcXAntw5Gjd5l+968BUeY33fx9YYGFdy+VgWZn40DemMSvHbgBNCr+sGCabGLFuUp6VncQHrPlbKTAu4jASNMPTDRF3r38WKEhmgVMWrsiGA3iIv0ZpKXdaW9pHIdJPcKgKLSFiaFE8lQ6u3qCK8M7/b6qEiv/W2fa9GbxBM2nr1PcvY2tlhbHVoGmULHcgZLfy4gJF/Yz2cLv5omCKZ35NQfo9/tAbLpPlB6sYJ5v6CgAea+eRgsZhpKSpqZChXpZ16Bgmo5XC1ohNlvJ8P1B00QF+8H3t4ieOutJLhzuw7mzjsEO3ZMhpMnH0ByQiDsH+YF9EQRTE4KSp3nEkKnfH1NR7KKW1rzkxHzOCjZFzy8hOAiFtjylv2ZqSTWrqFRA9l5D+FarrWFiR0/sze9RbXyaJETn6kTRiBdRZWsncxZ0RrFNIr6ayb9/0efLP0v+CBKlckGbJuk6qBhpbxKlzIl0GscYWOOB2zceB79EQ1Mnx4Pt27VQEJCAMiQ+futy4AHe2fC2GsaOFWhYYpaICC24n/CjVdqISrYBVZGC+ClTy4wzsIbKFBjx3ZnLjdgQCBs+DgTZs/sAyuCXWG9PFDgc9uBnnDm/K9rZiY838bQYpED+kGWp745kkCQJIy1L25w5Fbt3+yZUiTkaytqZNDQokV/iEuwfI8lO69dlyl1ovHxAZ+lxPjsUumMJeRemlSGbjlVshdP3q1b5uTE064cG91PLBbk/9k4DEaL9/qj93LqpBr/FPTDenqLt8R39yxSaY3mBoU+sKhJ9dIvWZWrEZ5a1kyMGeMrcTpLoKpCqyfKhyd1oA7mVLWkakwW23oFO/NPi3kOxYi3qe+zynsW1iuGktfdRY7Nbw3rNg7/zCb/B/qLIb9IyiQQJAqvRmfanitVD61q1kQDj2N1YnCCB+fXTxwY5XWc5Hl1FvNBKHGwFfooqlLNO1Yh3UrygFsdIwBnB44xMdzzCNeJ25xbLRtTK9OGQmvlL0bD4Gfjg92uucq0/2rhcsbcwvFrTRb+o0kxwfsz+1Jqk7nTfOUVNnYCBg1yXffjNbJCm0bBtQ3zFBVGeDnfkip0M+yVpRcC+nqppt33t50u/OlIfv3szb7Oo3sGuaU/tTKzd4aybtQwN7du7+3fjo8Y/lxOmBJqSmUgQXgSHOQKCoQu4chwpDAI4wxtfQA6AR9ond460dl5AG0QqV8sCogFqMpaoJtlxHsFKjoUaBEpmoETKXIGera/7drffnMFRGJHCEEBIUnYU1IigPrgCnCaWuDeoiRKrbP6BXqjhckcSYjkOB+06gRNce18kMm9KBJEuIiwbsmLCZCFVoOkPiUprhsV+thp3168S7UuPK01QeHXaRRHyIUlO7J/OnindjZJ1np/0ySqAh31/FIpuEgcEaI5McJ+p7gZOHgf/WJ9ISrEBYJe+50GRweY0MN3/663k6YRgTQgFFSj70TW8dtj+Wu2nS9ZCQYLVH8/hSqqVEB+RQvUoVUb2T8QZCoDOukt6Ow7oT4RwMiBASCZsZcmpSHifSS3D60a3adFqYPGOhVaTj6cvFP3+pojedvJ2BPchc+78Lm/9sT58nYTghjh5qRhoTBw2cmmZp3Rg8zFxTVj3B0F3BarX2eBqlolqPCemaoFOHfPbjlPvz8+5s0vMoq2khnhWcB87+tnuCQ7NAXWvLze7s6QiwxLkuWL0FEesuo0ve+dwYHuYkENqZpDbvRkVgVT7mF7dhVNKg44cR2068f3EBIHmkMqeGJvJClyeaMq+avMkn0P5boAitSgwzFlLB1Nae19QEZg2wsNz4HDGbUh3RzqK7lfIdf2IJUR/jU3kSLBEC7yUkOz1ubgR4a6MoEfe7pZ0jR1+aG8X5kqCfidE0tSAlxEgtonCUZigndnATl+uhR+zCja9lvf/nObRgjQStTC/fuNsHBhEqxalQ7Pv9IPCmsU8F4lByqOXWMGdHNhKPh4uuA8cazape0+TSZSkgjSi+WwMAOl2U0MQEpaEFiRXwq0wQCUWg/00P7w715c+PflCji6dDiUlUkhGBf9m2+uwsIFicB59zxwaBNcnNmTIlVBaQY6OXQtIMi806J9kqVKPQPDZoyPEpy6VTswo7BhcbPW4E4Eg7lbXJhtL/QJS0oILK+qVsDEzZkMU5KJz/54AqVpLU1BJpSkCneT8BkByUUB6RfjxUBKxvogwySvPmP77qEFQygjTeqA8GHCpgzaTK6Hi39q8QhK31rUhTAdEbTkeF9GQB5UtsCwPv7QGkBi+uy1+ChNIXORwjYX1o6lVPh71ubzQDtQL7eYLLvbBMQVBaSNqdpqHmrN9MALjcpr5F8vR17t7Hi/gLYl7ouC7e7qZFVuOOahq0/TH02IoV58ricEvbrfek0cyOmlI7r7ewmLiDVpkmoh44q1DBVJe7v0RD79+ZReIrRGamJhSKp2Ak352PY8aKDJHAu5DuolQyNEpAKEANcoLMBaMgqtTMKqY/cu/vvVQa7PfHPRQCJ7AWLBw59eH+hrtrMAJiZfuZVIMaGhK0/TRxYN85i69cpDA01zCZPP7O5NGTtA7AlDwsDTrUM1QJp2HP9xhvb6J+Op1I8zFDKDSUzWKmPpKEpjND8+ijUqtDPEqqyTR/+WPHjuXm4VqNW+kJQUAqNHR8LZ9CLohXCo5z9OAZUUD0BKOsVFMEV4SNkqiZcvzNyXB0caHYmqItjGWh/MwoE9AzigWJ8E1WXFEHMQJV0hB5rkECbmuEc3oFQq+HsW/l2pAY+Xf4fa79Lgyy2X4b33h8DuH24A/dUIoLaWwqKfsv94a3T38YwJdRcxVYs6xzxpSIz0ukIKIzCMeKMWPC10xrJnYjZ6OvGgpE4Brk4ChDwmNMPOUIKfW/773VtUa5mTaf2CPr5X1Nip2/p6A7jixEeHuoHKLl27Rm+GV4aFr9h9tfwj0sfSg7m5H/8tPn7Tify95lZlMTDcK50wuD31CHGFFiWpdaAFH9T+BR0SYr+REjl3x+Wy70hFpomfZ6pPLhnuTHJMa82d4SVTdC7UgxF8AWrOtUfyPmFydeNnDy0ZPsCttcAqmY/yLkoLk/Dxvj8eQM0P06jUlWfy7jUoe6Z+ev5BtKfo/v4lw2NcJE7g5SGExmbNX+N/keCIwmD8akbfUQv35aTXKPU+P1+q+GL2sG7vUzZYY7MckPbFeeXyZ2Nn1taqpOYnRF1J0dSe4R7Mbxt8Rqsa/85BbfrqsVw5rtvJZSMlA5f+QZOaPSM2pNPXPhpHdVybJzrp72Q9zKcysmHqqO6wa9cNpr6nRm2AkaMiYUpiMEB0GNCXc/EO5VZY5e8JdBsmpFtLWKHlAGfUUuj4AmWC2XmuUFFWBgGh3WCIpxEohFbg4QLgi4uqMxBnB+g7D4BGgSrelsbEuYlwEJrzcj+4eKEM3oeHcHVg/3EeCHckjJP+eD+EaKWQEDfw85eAET/H7EuYHzn0JESsQ7h2r7gBCkqa4H69oo91+DSES5y2ltcooWOrQGiiQf9MITd0av2C3HbTrX3fr5XHSWU6SC9smN6GFsbF+m4ipcw6NjPCxAK0JHcRvnRszkbLP9v6VKj1QoVKD94uTu3uMzrEzfmbRcM9ZqRGecjVhsCDNyo/eHbzefpWpWzY0lFRqXc+m0AF+IlrhCI+41PUNaofO2c6vQnuP5DCL+8Oiz3+7rCexBIXNKl6xL5zmOaYLNTQvv62et9/BenxejHBbmdHRHgdIv//eK3iveJ6ZQoPlQCfzwUV8pxaY4Ble2+d7uYtyh0e5/Mv1Z+E3uMjPVHw9My+DGmkBuzAlSf1215LTEChMZtwvrVaI2SuGMUn8JMISeon55SOAoSADtCpdSkghv6x1AwPmhmcFJ2cZyb1sG4EIV2qVAI8qCBqCmiZChkboa3KbtKRGWk5fobLZ6wHJREB5YamtUUKnu5uoFEq4XojfobLJWXuSc1PayUxUkGMWIP6JhiyMw9KapWtrNWqpfGm1r2UgE6/GM7l1LxoRAyj05v+dBGIZgwPdYdAP4nNr/NCbeiO/lSAvwv4+7kwv+0rTnr5ijyjwt2hY4vByZciXJTrDZ3aQ6XOxXYBDomEMSWuTW3aUqYz+jrwcRE6NILV49Av6hnp1al1C3GX2GNyohU7RuwKK2T6V9anN5++XNZsMZuqD96u3UAsDsFq8UGuFzzwbw4qAtK4epNtHR9Hl3JqwdGZAxHBkvya75+jSPFGpkzehyctK3658+vs52L+MiEhkOxhgwreS+0+2c2R18xUl959/axCrudJZVoI8nYmcGxSbrV8yNop8ckV1UpbQcfHBWMGxPsxVXVIfRSNwQQL99y4/tLgsDWUzpJTVaWAigo5FKASuFcoNX49IyGR3InCYBIt2H0jRyISMHVy7VvXYV5cl8RID8i7Ww8ffpgCs2b1AZGQB5IXf4MhGy8C5ecOlBfyAzIaxecxi0e1Bqo2DfeCijk+kPusE5SNd4DqkRaoneICDQvCIbukFvw+uQ8GuQaGCJRgWYMMTxxBFAxK5AgUWhQq2BvulTVBxPwjDGtNmfJPePudY5Ca2h2chAKmNsnh7KrEnYfz4Idj+UwI92mI7MAiNmGwsC9xhvF+2hrB4a8lhf2jDYLsOF+ym4+My+O0b24ufIhCvygAoYa/u13D/w/ertnZJh+LxkW/F9nNDbbM6DOh7fq7L5V+6YTCSsLWbY2Pzc/TGdxc+Yx/4yYRtGv7blR83xZIGB3ju4+PSqWySdVhB53mECd4//lSSEkOhuufjOXseLn/aKJsXvghSxv7/nGl2kRDk8YID9HXCfBxhiflQOPiff/7UAEYdWZoatLCnc8mUmsm9ZxP1vjI3dqppI7K6MHBf5kVUeKYiKexf26SJ/EJiB85/rMMAyknVd+i9Xhz5/UjB98a7EQKkjY1PRnekTqRpKwi8VdIO3qjenVxozouzkuyBe2O0L5ZHCihxUDnvpwYspl8906trPenv9/drkYrrbJrXQtIsxwuFTZBUnIos2/BOGaI3W99PAZOvtkP6JomoBtlQCu06JQaGRVJtx6HePdUHYRsKYa4mO4w5IQSAk4hAvtVCj7r70BavhuKOTrkBBk5tkonMjhxYGn0Z2ipAujqJujlJgD64N+Ztw8cmIm+iLV8okKO1sZdDJMHBF16JS0GXhwfzfgPFdXy9huF+PdDtHykMjbZLBQ6OsD4lFAYNyIUx+UFfsgkvt7Cdu3vKWGfzh8RsYbZ12lU9SlrUA93QjNPGgkKlNUrGeEix0ZukfAj3iypC+aFrUltGJJbp2Aqv6bF+f08pX/AZgF6y0Pj/E5vfqHPDKuWMotvV8r/5oSQkzQBWuAHNXIm5Er6LCyXMpCDFMMjBXdQGwZcLGlmBGxUlPfJj2b1nV7SrO50VMP+qMXne3LgYaMGQjyE6afeHyoiEEJutoii3z5M69FJVCqNoFCgoDRr0bI6MFaOw6hkGjzcHSlSTI40d5z/oioZA0lJm9AvaGvBpxMpEiygUKEMXHeG7njE589sCuENpgoux1pJCoWUIhuzLchDXBR8Hs5J9nq8BhESZO6ZWy5dm7jhbNPltWM4Djwr/CEnKR5XLYsIfWpyCIIWiim2KtPow3ecK1p17oMRTjERbhoHLkeDysbW0CXQBPkINRPj/N/r5Se5SvrYl1P9ekGdYhwpWUka6adLARFev2v+Rc7rNIgIxPOpsd5WaSCev8XEWABAi9BWUYhC55cT6EviaMAjTroMmb60CujIEKBv3APK2wPA08V6/ITcLIFpWj3zeaZUH750eVFil5PwwQ83AVAwnxkS9k8SNCQwi1RNv1TUsBDsLAnxPzJrZJf7dvdkCtt1dFVcUNO4oMWSODuipnaCID9Xpi1+Ln719ql9KH+hoH7RwdyMLScL9pMiemV1yk7x+AflRDCVsO100Y/zfr55wdmBYzgyfwj15bxBswMCXMDHTwwuHk7wt1ERe0+9M4yK8RLnrjhyd/+iPdlXSiqkcL+sudPmoEypY0LKm4/f3z5t+5Vq4olmLhpB7V6YNI4oB3ceF1ZPiYOUnn62+mjRYR4Jc5+JgekjImDu1N4QGuJBas+RglHqm+tSkamtEClxwxl69e+5h8vrFaBC6Fxc2QLX8+pAbzH5AQrXgVu1Oy24rgbE6IN7B0KAl5iBUhxkOAID1bjetzc9QyWFemQwTEo/craLalsgsZc/DOkXCGkjwq37XkzwwuSc3McXlYgQlLjGJIxL/MadF0t2qTRGp2fQx+Xg2BpaVGjwLNAgVcP+BUN8iN+VUyMb+PP8wWFShYEmIfC7pc2AWh/ie3ihjm2FiTi+6WO6M5Ue3XA9G1Hwz16vJkeKRM9tvlj80+uDvK7mPWQKwcdFuENCtCdTmrq6UQW1zSrILmyG09cq4NMXeicx/ggJjPx04487xS3J1+7UI3yVd70P8kd6SdAEjU/lDlMZvDalfa26/ZcqYNp315kNHopAHgKt0Ne48Iof9I6Nglk7rsHhG6h9fhgHKxACbcxARlCqUUCCmXrfVEUdM7c7Z4TC3xPDwOm9K0CZDQw+YwaJo4xGyJK/ZUKnyBS1qwpS8+/um5sSNX1LZtE5zlOeQSaO8K43E1PIBlfbnuXjiMT0S2sU6FppoXugBH66WLbhSF7dUgNCFJuk4YX5qElHhXt9MW1A4CKpyggiZy7EhHuAWMhvx/jkWqROXnGlHJQozHK0aFmVsmV/FDxcpVHq+cyAWmGUA1qOlEivnfNHRb5WgmMQOfMhDAWt1THlbzpXmM7lckxUFwcV0RnlfjVn4CS0JHISuSI1wknZU2L1TmVXpfwzq3xF2/fwPa6rE79JZTS5Uh37MVq46ybHDdXhnPl4CpmNxTYLQPZ2SPAE4Y6w/+Jj8g1pca5qg0l9HYVNYbFk4rTQVAdj0rr/yAkWO14pl2sGOzi0Hz9RiQPCPM9NGRiyjsA7LlrejNy6WVKVXjIy3vfb0goZE1i416j+pEajH8DpwljhFBJWIEf0SJTZaN+/maa5g0I99w4Idd9G4HhEiAvcKWpiTlWQab/erL6ElzXh35aO4+7m7nx/1wdD53cWkDOlsO9i6Sd7+g5YUpZgsdWOra1VgD9aEVIV84Wvs8DSoIALDRowo4m8+nY3dCr94c0d2XDgPkIv9Cf06/tDs0IFqZ9kw12KVJ5GJ8qDguNz45lNKvGCC0AOGBKIRdXKwJLxGrz8zTX44a1E5kRpw0MVE4ViBrj4MvDUSrj4UjwV1s0VpE26Tqd8/yys+N8cCSHXou20Jont/zfpjO0LaDIKmbbChCf1Sf8X9/mfDPXP5opuU1h2moB+ij7pp7wm3cUY/puwwP90TkgQKD7Oq7MFuXitxrotf+ze1r2Dh84759YAEX4SOP5HAbPv8Mor/dtvzMw7BDnFzVCHjiUDk9xFbVwF0CBD1YOvkfAkOaJMim0SaKY3grPBAhLE1bVX57Xrb/nyU8wu+aefjrMObs1NEJRVW87P7+dAgsjhIW5QVi7rJCD0Yyb7yYxK2Vako/NK2ffUxfuP/ezTfN4OpnR57SeM64nX/Q/G8LhxM9b8f8yMVj+DKXr9lL20mwtr4OE/G/N/eN9dfb/tmvZjIXBw4AC/zgJyM/ehjbk0aoPrsHy6hZt5C4w/P2u1MCgoV69Wwauv9oeQEKt1Gb4iHc7frYeHOyfD6pVn4NK1KiCBWgE6XBbiiKLJN2sNEIXMvWz5CNh1rxF+Ti+Gsm8n2YqgznvzMHzx+Tj4/cA9mDWzD7z75SXY0nMAvHA+c/uHL/efS4ZYUqJgIlfnblWNQD9TTVm9Hwrhk8hbzDs3uE8g7M8sHSbkO2hQy3PQpFu8JbxsplJ7sAcIWjcD+Vwz4nQu/OPb66kSIU+lR8i4ddHQyzr8XS01ofnlwA/H7yar0C8g86nWmUU7V446ZURrR46IENhEnoW5kVfP9HentHk0XkJr9T+BwredE3t4nSI7w/FR3kyR8bIqOZQi1CJHILIKH44U8DhM5yqdUbRu7qAz+L/ll2MPSFFyYU5Z02BHngMiGAsvOcb7hoDLUbm4OKJy8ECIZAadzsBc6OiVyoENzRoBTonZaKbR7bPwyYTweRwDmjnj8yOjL+sR2gb4ivHeOdZnVVCJ3c5vYPYIciuliWqNnofzY0YIxTdZLIL47t5KX7FjtqcL3zB+TARUoq/V0tK1xSZj8PcWgaebExzLKIVjuTWb8ytk3QdEep6YlBD4jYkDUd0CXAoN6HwbW09AEGqS6nAOGR/S5fjV0r58LqW3Hs2iHcWOVBaOTUXudXxSGDPmokoZVNQrybxLiqqkcXqTRcjlcDjI2Gb8je6NRUTGh/dmQlSoSxscfhW/Z3F1ETBjIy6vuwuX0dtf/nJ3cItMS1sFicgLhxcV5pEhrZNBtdIwVsClVOQt1N+CY1snneskIIUl8k5w4Jvfbq/5Orb/So99p6Dpp8mwe3c2zJljfbhm7947zOTNmNG7vSNbLQd5646zo6MDxAW72t7bsCEDoqK84MGDJli6dDgKXAUD38jm3qKvL8MXob3A49DZlty1o9yNrXF3IuWVJPKD19p/oog8vCXZdqtKfmpZSqybkH9PpTSBM/oC/zqGAlwt253sL5njgQ5iT3TW2yTe3U0IzQ0tDNMTbVFWr4PsipYlrmK+/rtLZVvWPxv74ti+AXsseI1T58vI4cVQnljQq4ev5HB8lLsNAun0NNQ0qRkjSTTSgfOlUCfTul6ol7UkuAijfV2dCl8aF2k9bYzfCfSSQIC7NcRKhDWvohl9teoNOy+WLr20KpUsrprMs7b1/BMKlvhoTs1r4/sEbNLrzeAiErRuM1nwb77NN8hCZ7K+QQUfnr5PT+8f8vHUvoHLgtERJQ9lVbdohnDMdJGzgFvfNu98VBBUa+SKEHHYwwJdIfnDk/TyqXFrXh8XtfrspSoI9BZSYz7NtLwxNHxVWv+gtfZ7F2TeSkgZbTslfTCnZocWddB3rw9MybnfyDjNlY3qfi06g19csNtRewNFjtHwWs/qkfs9mF4EP92rVaN/o7+ydox7KbPfYY12ZaECst8Q3nuj+tT2Vwek3itvYY4Uac10wuL9OTcrdz3HP3W10ughdASxiO96OKvy+cHdvbe3XdPP2xkVpJjh5V9PFcPIxFBI23iutKReGZa/JY0ieyfE55Og3zZs6YmyA0uGhe1BZfXpB8mdj5rQnU9uwEvjYlb1vle6qjzeqw+1MusWRIbA4WUn4fCGsTATtT3RRnl36yA2zo/RUORo+pnD+YyVIWHMTGSgbz/OhPffGwxbtlyGL7+cBDdv1sBzz8VaT27WKSDpD7RcPUNhYrl864Gw2vlh7yZB69ElhrFW4Pfsn6izkLBLq6OHk8Js/m36/pb1kBpqBoPRCJWoFUhru4+ekT5EQ9ttJDoQi0RdvlX9jXT31C/dZ/5Cr/w996fy756jHFqdA283J0uQjwhaZAbb90rQH/v+REGXcBcZiGpS6OHzfXl2jiQNn88dBIbWGxKg9Xo+KWxZeZMmdvCqk6rM5aOYs1/kmIgTMvGsbVnXv5rdr4cJXyPPianQwSeMebeoud0xCqYvHrftsQSzUmuE0iqZy7HrVeN7+kr2Pp8WBXzBo9Dw/pNFcBate7u9D3KfOK9k8FU1SqhHH9PJiRdMJHt8H/+fRYL2oWVHZKKRySHtXhueGPxuzJsHVbHvH6Xj/V2vzR/WbTDO241hCX7g4vzo8C7Z5f6WKFQ7/4WEmlu30igTsUi+zrb30kZ2Aw9Uam2K6dmU8FQvd0eoqFUxPKaV62xrOzbJOia5yiB7aXT37dwOEfFGhXX9RiSGMAdhD/5jeLcDlyveiHnvCH16yQhfBc7d7/caJu59d2gYKSM/vfWUeScBeRK5uwhzvvflUVxuEzwMdItwefnQbUXacGdoVoLj1TvwToIHzEuLgeAAF5g//1G4dtSoCKYplXoYkBoJ3Rccg7LQMJwxdILSs+BlgW7uj3EB2zncBtAgTGpjpLYd0tVfXXns46Z/BaGWhbQPTkAZCsbyn2/uDnrzAP3rguShlfXK6r/kAmQnHKER2ZOxp7XT45/J/UImHb4+nb66dixlRsYZ+VG65dyKFI7RZOn0XI4GNa7DY4ITJAqUmVMDU0aGcxB2WAgcLC6VIdzi23bg+0f5w4mL5V3up6CiMMhleiioU3y47HDe2s+nxPv07+XT0PFxm4pK9BtrtO12xL/9LUf9+9tDKHL6wlnIF722+3qN1GT2SQ71yNgwNT7FvosQPzFU1aueatrIuIk1dHcV2p7tSb9QxQjH44hYWK1a084bbZHpuzxFMCDEffuv85IPj/kssz5z9eiYF0ZH7PrT50GeKnSKAxeLHYu3jI0QaeQV4OPjBNoxoSScyVmzLWsCYrnJNVpTbIuF8iXn/70FDg2+fKrYlQOnh0T5/LZxfPemFrkBtLX3wRjpDM5OLkAeeRV2EHtiOa7froOJw7t1HoPZot9TUAcnrlSGhnuL8sjp2pFDghircOmgInrEoFDQdtC2MoWp3XENInSomekAHzFF4OjZnFpYOq33nOVTe7/R851Dhig/SeWccI83u4qAGO0ODTq0QoJ2IdMOhwo3/XoXPpydwFiTR8JPw7Elw90TV56m0744X+8h4svOLBvJUWg7L2Yx4nBo9SFs17VjFFQqDlNQO5aVyFqcnXn7Yrp7wK6M4s8G+UkWG+zGEo1Qt6ROaYMHJHzbej6NT6I2wQGidcunx6+LevsI/d2VsvKz68aESVHz7/7tDgNR3F2coFeUb7t7P1nZYpzj5MDj8QTYJUd1bGmKL3GM+i4+SktTo0Bjtw4oQLa5YZx6bntmJ8JLd1AMGSjUFrugBpkDbofvEeFp85OCA8WPxoefKyhqaYcc2laJ8ApCWCZESZAEyY/g0JYE4HHPgxR08EGYTR/UDLfvPQSFysDs9JJT7eToNoEDGp0ZvD2cmBh/OWoG8oisH2J/Artkcj1kFzXByxOimUdY88qlEOQpAomEj32amD6IpnN24jLPEgidSH8WcEUtEB3hAQaUerPZ8tjw3S8ZpRO3ZBQfHRfru7mXn8t3enTWjubV/fzjgqRkVxe+zH6S65o07ZiY7D7P2XL51/yHiqkEx6TFB675W7/A1YRpe/fwYCDNzK8u35k1OGxFr2DXo/bMfz67xqbJyeeuVDR/cqVKtkSnNzLRu8Rgt68nRXktNHdQv4QxUpLDOgmPSMCDgchMN79OczBaaEtHH7C5UdflGajdGUXzr5Y3L62XawMIHk1AZ9MBXTW12dInv6olnnx57bgetmP25N7I3LZRRkHDwtuNqiUNCvw+dj+wm8f3Y8I9XyeOdyoqmF6Lj2iUGoPToHDPw2IO/SzdGlmLCXaDYXH+NgGZteOaKS3Of8mtKunzLw4JX38+v37CH3frXi/dnkZx+Y/2UnJym5kd/UewRxfww+WyPXeqZSmESRNC3E+ECXkvIqPbjlOTpBYfvjagXZCA8N30jZnbcuoUc8kms0Qo0MV6On/c21eytvODamb4cH4yGDooS6Icp310ehP28RbyIJcwdf8Al2/GR3u91aZE1y4e3FlAWGKJpSccd2eJJZZYAWGJJVZAWGKJFRCWWGIFhCWWWAFhiSVWQFhiiRUQllhiBYQlllgBYYklVkDYKWCJJVZAWGKJFRCWWPqr6f8JwN57x0dVbWHD60yfTDKZ9Ep6ICQQeu+9gwiK7WLBggUvem0X7IpiB0G914KK2BCU3luA0EOAEEJCeu/J9D7nXWtPJqSBeF/fP77vdxa/TZKZOefss88qz7P22nuEal5BBBEiiCCCCAYiiCCCgQgiiGAggggiGIgggggGIogggoEIIohgIIIIIhiIIIIIIhiIIIIIBiKIIIKBCCKIYCCCCCIYiCCCCAYiiCCCgQgiiGAggggiGIgggggGIogggggGIogggoEIIohgIIIIIhiIIIIIBiKIIIKBCCKIYCCCCCIYiCCCCAYiiCCCtIrE80tZha7Tmy4eoKhEB5lXakEqEYFYwoFULIK6ZgskRPlCabUBQv0UYDDZoarBOPxwXt2iajs/tF4siTTyIoUceIev01EfJoHLgyLVv/jKZb/4qqT24AAVNOqtoDNYoUesPzRqLSATcyDGc9scLogI8mbn7CiXKrS3r9yZvRnwc8Bx0GWHRfi6E3/SptxOl/tvFIVC4hgQodk4IyX0Xyq5uFouE8OMCYmdTiPBc2/Ymo2nok29OQhQK9j5jHYH9tkG3koJKPFYk8UBfview+qC2ybHgWcTcCtds0Uqa42QdbUBvRAPNuobNpPdCQrsk0ohBbFcDAXlWgjxU4IO71eKYxDsr8L3JODnLaPLw97TZXCtrPmGD5C6v2BSdyip1kMzjmlKfABYbE4YNzQCRHid9DPlbFzZZ/HvDbtz2T1eHzIeFs3tDX7YB+Yx6ZjjZa33I8IBSr9aiePEdRhqHkamhsGJrOob9s2Oz3L8oG5wLLOi07H/vKsfKOSSTscEB3qBHMeloxw8WQpbjxR0Os+kgVHgdFwfcxeO8agBkZ2e69nL1aDRKMFbJftTo5g+PqqzgfxVkaPBHMqqfO+ISPlPU0qiHOLjUQvrAEprAMwWELlcYOVAppPKo8pC/aPOxIVNB5t9PVwugBHZBZunJwUvEYu4qq7OHRXpA5UVRrCYHdB27/mxSSG/x/rIuaIGY0hGSdPS/QX1L3Gi6yMxJDZgc3Otfv4iVPxe3QPhXFYN+PnK5fsv1zy39XLl2yfKmu5JL2m8h9TjtalJg/DHOcFHCnJLEeRWRSkVw+bMsr3LHOrJMGEMwL7TcHfVNXhxRC/oMysWPxF7/cN8i4tD0ekssGpjHnxQWQfpowbMS1d7zVP/cUj7UYAyGb1UZTvPgF6gT99AyDhXB3b0uB5x4utW9BYSEVdz1/CYfxtdfOrJksbpnvctdqd00fge6OnNYEYvasHPYhesQ2P8ViwcF7di3pp0npOKWLde25VzdkByaJ+oYJ9L0MbbiNH1MG8pfC2EIH+Fg8gwYqRlVb5+XxnHZ4wfOblnTi5UD0U9WjsRfnplAvTpGQJvvnmw3THbt+dAc7OZ6drGXy/Bqw8PhqJ3xwH/QAQ8XZoNuqR430e8ois+3Hs100vW3ladCGsGDAwCpbL966S23btpQIlheGRCwA8d+8njv0C1EhSy62FahWE1BGHbmgcGTvKoPYf3M/ODwxfFEoQ/TkdrazZZEMFxgmYIcusG4oXK9sq+vMpfJ094TZp1DWomqeDKF7MhJNgHpkz91s1hECePHRsHWuQTHgkJ9WZYlhxyr14hsG7dOUg/UQJXrtTAAsSm/PK+MCbtGBTOm9L3vlN1vMPuCOloJBRJZHh9Og9FkMQYf4iJ0EBkqC9Eh/o2d+Xn6XOE/QnjeiHWjwnzhvp6A3QP8DoAdlc7AF9dZ5JqdTagpkOOca2oSdAKQW7dQHinS7r4TC1fO2Vk2EtXz4Lt29ngj2Tn5eX7IC+vDt54bQJkIVGrQLI5enQsLFq0ufXYE+klSPhKoKSkCVL7IKFDojVxYiK8uzINho+Ihtlz1sORT2bBld421pXHbP7VZXX62zsaSf8BwRAQpAJfXwV4KaUMgrF2ExhERilHMuqLZNdq54GQmtV5HfK5AaYIjlyoHFtc3gzUyqp0SJOcglYIcoscxOnixm8tskHPWDjW0wHRwSlwNK0IYmI1sPD+/uBwOMFstsOhw4Xw/POj2CGbNt0LJ67UsozJ0BlJkIBRJJAyQSgvLx8HRpMNZs/uyf7u3j2IKfm5k2XAfzQKuEd2wzvjB2yOz62dNjEgao9H/10uJwQEyKGx0fqXbo5s4SwSdU9Gg/iFBDmUs+XE9LJDJk6Ij/HfT79fK27s7EGIk4jcP/82r4TnIhgnEqDc/3cMxGJ2tXuDUo1R7550QVIMFM4JhFjE/UVFjTBsRBQsW7YPXn1lPGRkVMC48fGstZURL+4FYOlRJxR9OLXVQGJi/Bj8mTUzif0dG61BpTfBP/7RH+bM+QH4rf8A8X1/wKIJg3bvyGlI7d09KMvj8SmlWt9g+WuKip8lmNfKozCiONukflk2TiyySDh3RthgtLEIpUAjKqjVTz5Z3LSkoME0wup0qRViUXO0n/L0uO7BH/WKUB+iNO9fETpnYY1+6MG8umfz641jjHZnAF7bEO4jz5iSHLImyk+5hcamNXK3/Gq1O6PtTl4K3I2dgNnqaJaKRfUycWdAQJGWE7WczMlL7C4+lueuh96WKFxCWVnPCR1tUtU8/o3XT+RE7RKK7DiHi2/C8/m3UMOOZBDRLM+ZrA4T/lR26BMnFnP5IjHXJQS4ATBQ43mCO/bB7nCV8y7ecv1YHhq05nbOh37bf7Xmk4HxAQf6eQfs/J8MxN5mUOhh9n9lfzVMGQEnMXKIcZCXLd8LRoMdKiq1sP77O8DLSwYVeGluzgbYsXw0XPANhlVFdqgvRS/8j6nAYXSh+YrYLfXAhfNwT7QCHvY2wbjnd8E/0KDWLx0OTz41jF1v3vwfYc2aWfDZZyfBuWEucM+kwcwS1aVLISrO2ibHLRFzOLh/IeOmEIPGV9aOS/F4Pq6FwNNghnpJD1fWGpCz1COv8YafT5d8dzi37v4QjbL0oRGxSx/2V9597nKNITkh0Kek3jB2Y2bZ9x8fMEWO7RH87aNj4h/SWV1/Yhgi2JZZ8d7mCxUvaLxk2rl9whfPTg55pKbRpI2L1KhK0AD/uFDxcVG94Y+B0f47XpyZPIv65cJ7tdkdUGV1PJGlN88srjMmA57Lo4qpfsrPHE6ei43S+D39c+YUrcHqD2jpE3uEbHhodPw/3PDUhbBUCXX1JqYlaEg+jRyszixrmmZrY4z7Pz5iv/jBLJmRjB4hbXS0NzTrrK3JmbP1hr01BmssQVJ2fTxvj1D1+eAaw4pyh/PJrErteAe0MRPsv59C1tgzxPt4caPpZLbecndhrT4VUK88mU3/A9c+fWxy9392HK8ihLouZ3sLoTm4xevP1ZidLkXruKIB9InSHCyvNTyKz7WwLSQHrr0+03PflFG2dMuFiqWHXpnI0TzRLftYz4RQXsF1crrxQN4Tr8T2/WzxxZPwxfNj2Wt6vRXQUkHt6+6j6u5fwYTayg3pDXx4CHC7jgJvsdLdAAxLxZ9SZiBw6Ix7Ao80ezrCKHp/93HgawzA738QLl2sYvzETeY5hGq74JnnRkLEbj0EHzxZ98eSYcG2FiPhmC+47iWzSpumLvkpY7fHV/QJ8912T7/IOQzGoIJFhSA5bzYjsfdj56/TWWPv/fJUoScI8UhKDi6bwAWjYfy65QqsOFrAk8d8flKP+8N85OtD/b3AaLFD+oVK6J8UzK4eGewNJ3Prpr1/IHcXYLe+uWeAeMbEOFdXE4VE+ocv22MxuFzy2YnByyf3Dn1Hi0qIIwOltXroEe3PHqYJYaqL4/r9e+vl8zROvz81Sj2gb4S+sLIRSsv0UI0KPiw5EEavOOROU+O1JkdoOB+8x4fnpUIWPjsfmUjy+M/n7WT8nN0FZevmc0aLEz0pQG5+E4O2RryOw4HGh1q6Nq0gM6tS19czFpOTgnd+8fjQmZ4oJlfKWLSWoVJ/tfEScKhT76dd0zYbbeoTb0xWns2usahUcnDYHBCOY/LwujONdSabHx27dEL3l9U8tyIqRAVBgSq4lF8Pw5ODYfzKwzwZMT1nHpX08IsTOKOtfSSW4P11mpR0ubxnrzqmd7S8HO2rLH1nbq9oH2855BZr22UdQ4O8IMhf0e74befKX1xzOH8lPaLvHhycHKRW5NzMKKZPjOlM0puaTKxZDFZ4pUHxmfKnPcw4yDDeeecwy04dPVbUeuDZT2cD3DYeeDl66EY0LqUcwNvL/VNvojjtbgp8HweSvY4GxDfpAKYMh+dWzHF7QjSOgoIGvLYZJkz4Bj74YDqYUbGe0xVB7b3Tg7IKGqb7eMmBNTrPLUxPkIe4VNjAQjUNdlGFDuKj/OGxb85cajv294+K/TwwQAlqbym8fSiPR5IC9wyOWr1gdOx6u6PryGBH5Vs4tfvuxeMSV5KyLtpwzum0O8XkrV3YdAYH6LHZrTykPrOdN6JxTOwetPPzZ4a/cyPP5cBz3j0lIfPje/o9SF729k+P6qrr9IGRwWrwVklh8pBI8PVRtMce+Gu92cEqGwgSJcf7O9JenRRCTozHfg15blc5GUWT1gqhqKgeJaKI4ItjOSY+6Kt+YeoDfMt97r1SM+PYldoJRuwjtUZ0LO6oLcJjRTCwdzDMHxD5qa9KZjSY7ZbIEDd0JQe05XgRhKlkmzxR2VfE/aRWSVgEIwONQEdT32xhvPTBQdHvtuBdOFvcNF2MDrNt47E7rpaxpMZjW77p0qExiUEb+BbjHRbn/6UJ+91sbM9JqWIgQKNoVT1qUrEY1uzLWwm8O3Hz3K8XTgYFeYMf9ulGrcssVi3ie2pP/Pf0HugZDddWjoM6hB5Lnt4Ojz8+FIKCVDBzpptc52htkLKhGOBoBrpMvCML3khcNPYAQ6gII4TO7H4dPRYoUKllcuDiIglQu8F+5lX48OdMePB4AztffHwAy3j99tvdsHnzZYhPCIQPnh4JcCADFh+r3umPCiyTojeTABvwmwmF1tNXatp5FR+FFKa+sucEKmsrIVGLRMaVi4Y8qcT3kh7fYubk+HCsDlg6PWmp1mCDwSkhDL93TB8nJQawcph/3Zbybx6jAScXQ9SjvzsUeB4HPgEvhQhIOSa+sa+U3qNzrnty2Eyd3g5zJ8R3OicpxAC8VnZ+I/SL9vuO0tDUlyEv7KzDC0HvOH8Y8Ow2GLVsN1Oqdt4Wlf3DXy9ANBpAVYMJnZi1FloiWHmDMaKuzgiVNXoor9KBFPsShA8/FL29xlcOSpXUpTXZfTctHd2PZzyFg/tXHz8Q6KUAOScBOT7HBoxcq745B0Z0ksfOViAHNDeqZJL6Szn1UFiqQ7ith6xrDWBCOOZyuFpDgdnscOkQjpfVGEGHuqKUS/F5YGRDBzQhOeR9ih70dN7cnrWZAycqsqO1UT8VCN89zd/PC87n1Q+6e2jUGx4eVlyuc+w/UQLbDhdCYUUzFGDLQ2gfG+YDJryuxXi9lVcZgskwhkT7pTGD1ll8ZZwLxHjdG7UuOQiFU7x5SE/sMSVk+2EIv+02eOONg/DRh9Nh//5rMH9+b0h+fBukfTwDkv+Ti0qeDREBCjg3V4wIiqOZNzxJL7drwwG32exQihHpVZsM0sqdwGu8GWlHVoVRRIvm7YLvfjkHQfJBsOrdPWD7/R40xC3IQ+YwmDVjeg/4eoQfPKwaBHtOXh3ZIybgOOunqHMIbjOT7r//fMVw4ipaNM5LZc2hB65ULzxd1DCHk7bwDsSo/cLVh96Z33cCZbiOZlc9aAGexeRJqRFbzdhFScukZWS4GvKKGlqJY1ykGqoQGpHUEXca0u3z3y9WPeGSieD1dRkPD0sI+tpHLYeiGv3gkmZzN+rmoPjAIxeuXc+O9e8eCFl59a3n7B6jweh4nSf9e1bykpV7rq7hkD+9+vPFNfePjV/SDx1IJRqArosUNEW69buvtng7DsQyMUO0xFd2pxWhH+B0Hmw+Y3yCO0nR6nHx807XhUnJodsPXK2ZxSkkkPqvbU1nP5jmR9FO7iVinfQ4m9ZsoETE+s5D1yVxbVPtnqjCGiEVvU0ZG+JTWNxkijNYnQqMfr5yiUh7/X6crHkozbYzpU9q/JQ6ndneCTsQESdC7rmGXCkCh7N9tnDpxsz0127vvTAuQJV26pvTJRT1X1h/ftM/pybN/0vzIOR5fz9R8AQkRsKRl0dDTk4tvP76RDiGsOrOO1Mh7XIN5KDCB39TAJCdx6CTCwdK6uMHzaiMG680wsbLtbDxQjXsyqmDKipEjA6H3x7qC2unqDF6ONzusqQCPaEMGGEzmeGDU7VgRyKZvHQnfPHFbQzSFRY2gRa90qK5aHBHL8ErR0u3kXex2O0YhOw3vJncOsPIo3W69EPV2vQt+XXpK/fnbs6o0M7xUspMEd7yvAlxgWvX3tFH/tiY+AkyVMDoEC/4+EDeOrcn52HJ1O6P8dhHTyMtCKaQi48mAL0uvWRBXO9pdw2OfolvIZRfHCv8qlukLyjxAby59fJ+Vq2Cry8YEv0aPShPI8WKDPFhx4QjXqbXiBt42viU0M89sOfn9MKnfNGjju8VdsN7pmzao7NT4P5pSfDI7GRweiZC8RyzJyboJo2OBWpTx8W3M45WHpdbD+ueGjabb4F/TTaH5j878paLeRHLa/XuEfi3pk1tdpf4/QX9prOohQa65kD+tzK5HEGGjDW5TNrafBFSrz2Q9+k781Onl1boAwBubI0aHzmLzqIWpaamQP0sLmlKmD88+oceUX6l0DKu+7Kq5gVSFEUd6KrdIIIAfF1kXA3VZyBp5nh49dX98Oabk2D6dHdKdvzrB4FD6AUGA0BKPKAGo7boWzIKLngmU+o+m9nsPpnUBWHiEjg5LwDuGJwAP1cUwYl8o5uzIHTgNKgkfr54PuQr/XpAzrGLUFSthwsnS2HlyinQrZsGdu/OhRl8M+wc0MvPoLMxAswULEzeWm3aVvpHaraMCvKe63DyrVwlAT10aaMZQjRyKmclXs0ikBbDr95k5yhVyMg/HmPWW2sa0VN3lKRYfyBC6upAgNQ+cj2DNIhznUiumxr0YoRazga9Rc0yZaisSeHqo9YOnp/KZ+iclDUymNuTVKVM7GrlGuhEKprMkb2iNeVdpT7JONa/PgV+P3ANkqI0rBrY08UAH4W2W6gPeLgUTYBW1Zm6zBOb0Djy1s7x6f7UNj2H0fCDXVfenj8iZo1cJtb1QEh56Wpda0Xw/62Q48BnkStqeUR7L1TOfXt+Khis7jFytUnzVjVYIuw2pygl0je9oKh50M3Om5oYhNBW3q4k6T/78z5NSQi8UIlQkaLeg2PiV353svglgr6/nij55/T+EatvZnTtIogBMbJ5QIrkjlD3S2Qcq1enQ0WFlpHAF2/rCby/L/AYw3j04ryXEu80oCVXzrkNw+FwRwfiHQhJq3g5rMlsAG9vb3gnFcOyhIwIFSfEH3gfLzyXnZEw3miG5+7uB7H4QMeNi0OYdYpdNzU1DFY/NohSR3Auv+4OGXoVmUx8k3lNXhwZqQERzXdQaYo7V8/y5Z5BZ9kyHL7aRgNcKW1MImLOYAN6/jo0wiY0nI4tFPmXqAXCtG3ksSSe/uADuFZnHHm1tCmMpUNbHpPL6WyFDW2bGmGVHqOkQd++ETlWKWWMfRIv2H+h8k6REzpVDVB27dd3pjJeREZAEe/NLZcPsCwXKvyFT2b5EdxSeElZa2i23nDS8lRmNY4TZ3hhTvIydl00zKHLd2upPo6YBfG0v0tIVYyIYx8cGbuS/Y3Kuj2zYrEU+02Nho4eCQ3rS79kHrlreOzaZuQVN5tTpbHpFuEDRoT1nsZxPPxwJH/J63N6TUIjAzGOz2MT4v/tiZSf7L26SuUlQV3hO7WuIZbIORCiQuBfMxLhm6/PwuvIP65dq4dY9HSUyejVH6PHpWsAZdWMR5Dn5NtOSkil7IGy9yhzRWBQKYc9lZSlsUEoTRZKMMR4q9xpX/K8dCOl+IHzubC+0u1JqWZ/1aqZjLhHRKghPsoPIL8S9hU0PksFikr5zSf/SWmjEOp05fHo4TRrLehJDVBTb4RrFboUD5/xkogNNGmpbbZ02Zq11k6todECXnKJzjMZVVRv7H36Sm1C69PEny56Hi6uUzMYbFBUqevUCsq04C0T13j6XNJo6qdQiNsbCEamdS9P9NfqbQEIywJqDZZhT/+YmXeqsGFCd43X6bUL+hGe40Uts/X0XKy2G09s0tyDBHnk4kk93lWLRQb38xTBgk/STnK8E/qnBP2NIAt5AzqBB8YmtCrriq3ZX3ghkacIT9xHZ7QxCJtfrk14dEL8kqpaw80LPjD6+3kpQITjSo3DVlxlSJLIJS6EXvX0HAh8WZDGJIX7XmauC1+rajBHc9D5X5cQa29G5d3QJwwGpYRB/+QQ1Pf2ivheehXyCBuaN/5R3cCMgPNvs/gEowev8QXOqXdrInltpQJU+jq8b5H7ARNJ51sWM5ksLKvFjAwHp7ao/nr69YHfWPZi1uwkGDwgAiTlVXCZlw2uqDEwb9kzQX7TGXUykhiEHKXl2navN6FxFJfpWqNqndkmaYM0eJn4ehlKW/FFfBseour0OpFXjrs+G1xWqZdNHxYl++lqTWucRxgGsi7INV3H38fapRGjUrd6HlRrOdeBOnDo2Qc+vyOdLm5xOHsQfe0d6nP60wV9fVVeMh1FZeaEWLQEKCjW3jCx4bkPAzo2hVgCF1fP8YlZtJHnlFLILGseeqFUN2l479D9x85W/m0mYjLZEVnboFek5nx2rb6/E7tW2WDsFqiWl8lYMoWD748WfhIboS6i50289Kaz3egM9WZb68Ipup9nf848+vrcXnfyeLqruU1MJ3om+MGq+waMnfrRkXriP098d/b0t4uGhjpd/J/PpBdorQOhpglEkgB4ZNEfMHFiAtShp3366RHs/csFDW5ugVbOYYfIAqHtiSlyVNYBH9sNNaUcNcMbeYoRnuivxMAhgau1RgLYjH8AEW06np2v5cE166AZPUcDKvF36+YxozLhINKiqQiXDUrUPqIohGBmliL883ITFkkifBmi82Q84tFo4rC1KnSDqfTAHi07m8Xl8o6P04DDyXeJ9XNKm7p8MBa7szVxHhfqU9DQYK5sXQdDfgDv19zF/AdBurBQny6VFTlBgOfvIJW0wIRjy3lOyGCiC4YG+/Z04GcXjk+AjMLGB9ceL1z39KaL2qk9Q376avGQe7FjrfAgSC2DigbzTWAPB2cvVMG44ZHosxxI2kfMeOjrMztZ6vfTo/sq193J+RGHazD8LQZC9kvrfJbN6Dnlnm9O19F1/rXh/J6P7+mf4usjgxBfBfx8omTpNw8Pibfh83A6bz75FeyvZFDTE7nFYo6rrtUHDYsO2Jx7rYnNpJOUonP085E3SNAB4RMRVTeZQ8KCvcRoV84/NZAKqzMKtZP9PmtWEtx2W4o7xKPXjnl0CxLzKIBuwYzM8u4ZODf3cE/HI+EOhD1TRNAnUAJhm0LxRQes6NYEU1MSoLG2Bh66isogRny4JBx+yKiGxYcc7slDDI3gzzGF8nt8OyzoGwo//nMYC1TnMyuholwHgRIXGog3hAV6gQGV1eG6tfVMrFYH3VMIwrYAbB2jTrS/13m2PJfKOiwOLgK5htHaGYqY0UhDOUXnUhb05FaLXUqYnbIyQxMDjiCy1DINaCnLoKXEDjHXqX7KThFEI4OOJJHKfLQmmw+tV6FbTA7x2dKgs7hri1ztlZoWr1mwv0/fmfqt1uHqv+FMyVN7cmvvefGnC9qViwY94Ulk+CHfKUOCfrPiSIrO3vg5mgidMihy15B9eWfPlDUPotRvjyVbDEffnOKdnt/wN4EsYBUZIcHe9QhtbWaXS5ZbpUsO9FOwZcNXihv7UiVEqI+s0GK2A/cnRZ19k4KRoF9HM+9vy/4NBwcmvH+Q75KES91OnvjaE1+e3vvy3F4T2+dfgjobiNbOexEnoA+ScZSWNrPyECnN4OLFGF9oe4f4Qc7uViaHRAEl81D5HTw06IxQNptmRb1BrAgGq64B7v69EpoqaZIQlY0PQefmAu46a26FI7zEjbWPHSuGP7ZcgQcf6A+3354Cn19A3uOjhNf+ewpsqHyPzusDGm/5LT0MUhL0GOCLA9gx86WUiS2eLBR5n5p6kwg9katjHdDmg/lw+4SEdkV87L7Z31wrL0iM9deyKl2WBqDR5RA6mCM0KllFx+h26GwZzB2f2GntPe9ZT89ST04YFB90Oj2vrkuSakXjMKK3MCP0ff2+Pks2pBc9RQ/9p1Oljy8YFv1FVLB3a7GnFyr6zWqQZHhcTl4DBGrcdYU/Lx09OH7JHzyxZYPTpdp0quQ1m92h+7uIeh0iCgVyysdGxz2/6kj+asr6/Xqi5OX5w6PffgWV9omxCf+0uSgZ4bwpXqDIERXi05rCViFH3XW+fN6a+wb1w7HM6+pYf4yo93510kjXPJFXNyEI+XFXjrEdSfeTITlTuDcK2LUrF2rQo5zNqEB4JHbHRMpeIYdwZ7Ec7HdoIcIOuxXSK4zMOExmMxwu08PXF2th8uZiiFpbDidkGHkSYwAiQtwPn0gTcRSEHzzxEMqK0fmMVpb2pIVXq5Go9+0bzsrrDaQ0WhOseHIEvPboULxBxS09iMRYPxiMEWlQn1BWCRAa4t2u+fop4Y5h0T+yh4aGsP9yzVIZRgVPowVXJ6/UsNn7U/hThr9IcICoibEduVL7GCkkycy+EeuL8b6taCjPTk96qTULdaV6iViGx7U0GSpq+uUa5s0v5ze6N8NgG1a429Vq3QhomdTsGanJVvvK4HzJjT333lOlIEKCTQu+tj43JtkzvzDn/SOXaKLTUz4RhdCyq6jblpxevtYALry0C2+pGZ/L4dcnh3rmZFZszno9NtK3/O9aiEywU4GO944RsZ/yLSneT/fnvelEq6ipMwRP6R3yqQ15bbPO8icE3QX+/nI8l5i1S+VNY0Q4pv0S/C7g+Js6NrwbU0K8n2nmwG6bWrNoZ8sepGUbZou7dWkgkXJRCWqeu1hreg8YNCgS5s3rDRoVEuiv55IpA9Q0u+us7C0rj1ogC82t3LOxARqQ8/qHhMDCjbXw6jk7XDIike+OnKQBj8u+BlDb2H7qlXAjEf8mxLa1WuB/XQC7Xh7broMTiAs5sJt6A5RUaaGiVg+lFVpsOhxIY7ucr9XmFNc2mYCaAw0uMVoDARi2qWnQa7CEAN++Lb8t5T6+ZS7iP2n5H3mjctJJlTjIVMPlmUUmvlGL/CgomBROAeGhKlh76NrnzOsj7Hvrrt73hwTKWKhfMrPne54MzY8nS17UIIyUIg9TyKRUrtEKdci/VCOu91ZIGVxTI0d7c2v2Dq6lkPLHJSNTkXTDiau1NyxBM6Hno6wQ1USp5OKchABVPnvwaIh3vH1wV1mpDkpLtFBWqmXZIRFySE81Ao6ANDhQAUHY/P3IOfIsC+RC1s9jUyukNYtGxa1yJwbE8O3Jkp/bPr5bWXjgyaSxbBr+a9aZuUZ0dhXVOlCiQyb7m5wavsM9t+ni3tua/ePgpOB0lbeMTdJaqJyH7RPQ9fml+Lyolo0qgAkOPbshc/cL03s+bse/k2J8OzkFHy8JlJVp4ZHhMQtajX/HlXVRYT4QiFwmKEDZtYFE+0jP0PyEpUPIp+K2IMSL/bv5Xs9AtWxhwyBZ61DxLBslomgTFQpcow54mgg8fwX44ADgIpGXNOs9Cw7YTC+r8HW1ZFxuMtyVYjkodXpnTYMJGputUG+wsjx3fq1+aNujDA5nz4EpoRASqOq0pQw9IF9vxL2BPhAZpoGIUHdTa7zg6DvTEmiwyHPqXM4+CXF+UNVsBL6TWvJwtaiZ4edrtYaRdo4TkcfesHT0eKWfNwSG4PnQm4nxIZz9aGY0T7PaGGFOF9Td5u8nh0yW3eI74fGM7GrE/xKo15mjm8w2DQ3xsrkpzyqV4GrUmeDrZ0bBt8+OanFMLetYMLITlBuZHAqR4RqIj9BATJgvpL01NdHjkY9cq59mcbp6ULQsrUHHUqkFUs7qej1U1xkCagzWRCLBFvTavt5KGN4ngnlkHx8pa97eUnjjvr7PeHEixvBNDmc7h1SNY6TBaG7GfrXNBBEvMqEn9kYlJ6dGs9Ne6N1pTkjuI4+MCPeFbthfyoHTYriXb0uZz5YhoMfYkVV5z6uzU2ZYsU91TWbwQtLuEvHE2VrXxCjlYt5PLSfCDcN6R8CVgia2FMLm4JUGnUU5KSX0P+YWyOTtJW1X/xaCRqDEyIWG5fKRS9h9OVE3cit1yZTza9LeIIKM6xW6AVQKOJ3d5U48sGxqvNv7O1uU2mwF3mxtxflo7tfL2mlHLCp9NxgB2TFg7HYT+ojgllot9/HMUFrOGR3mfeMwGhUB/WXO9IQYVFzErqSUwYiVN2aWv9z2c2X1xljUWF/Gj7iusa8FHxztsOLEa4tbVgrGhKkLFqZGDCfCftv7hy+cu1QtvVHmhBZVVZTruPtWHTtG/X6wb7e54/qFHaa9JVhJFefes6tbmLr0tclJicQjntuQ8cfFK3X+VNZ+I8lC/D//UyRfKA8Pjn7xqVk9P7HhEB05UwmF+U0gtriu2xYa3kv39oU5w6Pd0YjStKgQ5eiV88ua4OExcSvY/aLSTHpz31UqI9K3VL7S7H1chBp2Xq5+DvmPKirIG5oNttZISfdtMFAa1sFabZMVTr0zVeUxurYz1ZRa7d8jGO7EKC9WSAZ6kgch4T6p3RHe0n4ApLjZBY2kkIyY7b1Ss4ISJgYcCz+NFIxGB6qC04qckmWIfJRSE3JGLUWEK0X1bKEcTdRaRdxgzyN1SMSDUxMCoQ+tSEVd0KNTr8N+Lvz8ZJbG30trQHj4485cNrOe2E0N/ZMCwYrPu6LeAMcuVcPWI4VQUKmD56f3vMdTT3bX6uMXaS6IkhVdGkhqYuBlxBTw4e78Lh9gNFoeKRCHUIFDT8Ba6zoNVsvADIaqWtElAUeknspI/NT4O1pzeTWb96C5BoaTPeeg3zHyUNXr1TJtp+teuVYHEBsC03oEvXc6p27YunOlmcu3XbZN+egwz3dgrsQH7vzyVPNL27P5VYfzr3x36NrrlAxwt/aGQliTJg0d5Lnw70CV/OQXd/X3kaBnuffLk7ZT+fVPShGK0P5fRPLpJz3j04WN/5r58VEXFTSuXtA3OiHYewsdT+dppuhWjTyEYIE7MZD/w8NDlCqFxPjwd2cazpQ0vULLfj3noowVrQLMqdY/9OiGc8yq35qRMnRscsj7jTQZSVWyPK/GiDni0W/PXPQs9KKfC9am51ZqzcMcTt6XeVW0zshuGuiGXOOtRYNfVotEeg/USlm6lS+uN83CYVDqzPYej/z39MlGq13Dxus/Jy3VeusUvI7cAxBYYkPMsboyuZiSDsC/d3e/BzxwhaBSfmUT6btIa7bH7bpQtSKrStdaCrLs96xtZwsaHrTYnKHYP+8KrXnmhPcOuYjnpV2rHffB1qwf9WZ7AqHcyHAlSPF+XprW80E6/Qv4U4JQNKe0kcFB/FwUcr1nPk8r+MRz/qMF9fNOFDQ8j/AyHPuqaDbaer+x6dL+4mZTfLPJ5nv0cu1EvB9fD9hh0c1ThcOzVLqqtEof+MOxwle51olykCz49FgOjU+XC6bOo2WN+/SMUYeYg/94dGfvO/dHoMkjNrEgcmtZKBpN1r8HgbahDuLfyIbXpgTBawsGgGjFZeCoKDHUn5WkcOU17ipelRe4Vo+De/9zAn7OMrgNh3qI3o3Cm/GHecBmVNvI2Od2QVq3BNjfR8pdKtYN236lcsWtLrodHBeQtnBM3Bue3PvN5gFOXaxis82UACiu1if/N73o15J6Yy93ylbshjeozNHB3pcRvz4U7KM460SrU2F/+ycHd7mBRFGZDpp0ZoQHHHIEU8z606W/5FRqh7CnRuGL7h9/hgeoCu/pH/nY6D7hB2iWPwwhorsIkoPvThf/0mi2hoi6WAlDi4cRJpg+fmDQdDa3gE6GKggIVpAjundV2j5e5M5UkooMjQ7Yn15UPwUN3tkhGnAze4ev7hXuu4XKPYLp+i33Qx5ajPdPpfX/+OTYmUaD1X/pmISEA3m1VJsWg5D0e4zCTq7ziltyGpIIleJCjdXWm2vTf/Ye8sU1i4aNoTo1qpCglZeLVh879PHDg8YT7Dt8spTB++35dUeR/zm6Oj8qvmRYlP/6U2VN91HRAnd9XDin3Sl9cVrKSIxOEB3uDf4Iiz/56QJyQQ7KjLaP6m32weis7J3X+zjFxz6ZOaaTgew6UATplyoWvtOj3/cZMXroj1i+raRfqYWRK9IQY5hZypWUJtRXApdfGQ7aRjSQly+B2kcCzf+dBYt/OANf7keopvbCCOIDHGWpKhrgvVmh8MKCoSB+bDetEnMriMnGFlQNjPCBsyundFbeNzIgvLKy6qs7k8PlUhnEx/jccqaEstAW862vHSciTmnXcowC5YjZbQiPIhH6nTlXBSOHRkI2Qh2NRg5hASq2co2MyeG8+ZJbykwZsQ8llXrE/2Z2TsqA5aOHnDU+EfKKG1nmK9hPCbFRVPouZeckoyUs74M4Xi7nbpLG5hhMaZvCbkkUghyjh7SNv9HrHaBWS7rMZjU02FgtVJdkmHeXuNM6mSDsZwWOTwD+lGMUlcr4m9y7CKprzUh85V3WgNU12Im2MueiUMrYYlRyUjar2+MToebEN08Xl5QbISpC1WVyoKBYD8FIuttyEHpdqZB0qrlq26+obr6dI8iu/YUshzz2lJZX5xSA9tvbOh0c+MBm2LN8DAxavAUACWG4rxTOvzwYbCY9RD2fQUvH4O0xvvDSnAGw6rdT8PKeGrBo1KDCG1851AuemDcMXlmXBu+c1LPZdCmS7ZV39gYddur1u1LZNZYv3wcrVkxmv7/77VlYFt4LvtcVDEhJCDwfgmSTFsT81Ump/zVX7ynPICV3OtxK6+T5W1rVeLOsDtfy02MIfJtiyi5083++R/7/wTjxLWUC3F/oG3+L1+yYqvm7z38r56VHnpjo19lAMrPq2Cnf+injlz+GDV+Q28sG3eMC4CcMSzk5dfDWW5Ouz7qiB+k+/0cwxQSAt9POzmq04dAFadjVJ0dw8PX9yRAe7AfilorayrpmuGPVeThTZmawwgtJ2vKZPWDZY0Naz3v6dCmkpRVBQIAXjB0dAwnfFwJX0wBZzwziMq80QGZp0/yPt13+DQQR5P+VEBVIf5zrZCDHTrkne32UEui3qYQXV9SA4+uZ8PuWbLj99l7w+usH2AKq1jkHJLmJY7+CalpzQHlqIucYJhlx1lvc0IlIfKgv1VW4eYvOyNbMxjaZIGVoFGx/d0qb8G+FnTuvQlycPwwe3A0eePsgfN93KHxtLBgSH6k50zMuEMwYfus7rGngb+Ax+D/1llw7n9iRkwB/o3dv/Nk/+3xXNWRtP9/x/Zueq8N14ZaPvPHx/P8YGj0R0cV7lhP8uffvNBYcdLnG59bu938YszbXa9cX/HXggJDOEaSw6HoVwYHTJfMe0yRsuu1oGvzxzlTYueMqaBBz0l67K1dOdU/gvXYQDhU2QUijEfwajFAcoQELkXjshILWpNPqLjy3yV/FQLEIyVhwaTP40LqJ2ACAeiPYtt7HZpKpZCILSTIdO3BQJFzKrYU+F0SQuPdo/o6XxiQ6kK9QQoyKBq/m17UbWjVi9LAQH8SzptaNBuiWwkK8QINcqSN5ZhvElTRA9jX37HQP7EtyYiDLdHAsSyuBzXuyW9OesyYksGxKV0WFVwoaIYf606ZDCdH+0LtlQ7y2YZuKINPOlIHecH1m2Bc5zIRh0e6sN97bvuOF1x8aXnPqqBiWFey4jp0mODfvv8aya11JSJAPDEkNYzyE76LftHAq/XxZu/IVMZL67vH+4OetgEB81rey/Zinr1n59VBWbYDu0b5sfsaBlL1Pz0DQ6a2dqohZVt8JsP3ItXbFrjT6YwZH4rVV7VY+Ei+sQl1Jzyj7UxgoQ0IzEcdTJhW139+Cp/kQEazfmtM6ZvRaSs9Q6I5849CJIjaJ6ungqtfGda7FatJfr/Ycmhq2OeqDXSVbbpsYvTe9CGbMTIJ1355jxuHhCAffmABpWdUw9rVD0Gtub1iZFACffHwcSlFRFai0DrwxEX0fRkkzBCMpmjm9B7y84U6QzvoBnhjWDT5bPJhdi7YvPXykEBrqzPD8C+7dGft8V4ij6ID9b05KpJniqloLmM1OWiSkvlaj70ObvbFo6HQp/PTSLC+VrLm80dSrpsGoQpLlsjhcSrvLfqyooplXeyshLtI9oyoRuWiZBNTrrd0L6wzhOFh2/wBVY4hammOlOjK9i7iGqLBWP1ouFdspS2J38pe7R/s0kALX1JuZgl24Wgu1eJ94Tq+CWsMwmYRr6Q+vkCuk5+ubTU2Uv++TFMLSv2fQ+C0Y/UprDf31JqsS3IXQYl+8N5VCcjQzu5YlBfJr9JPx/GZyxniYV25+/X4qDUuMD2JzCjSP4nS6M1XXqnWTVXKpsWU2XdXCmXiFVGSSKeWVJRW6IlpcFhuhps3nmGJSVo3WVkjZ8frJSpnISC7DZHP4yKQSXhOgvKoQiUoCEzRI5hVQXKJzbzzHdS4CpXU5MTiupbRla72x/4FrdW9k1ui0M1PCntPbnakDRMH71D6KFiO5PoHY1GxnnK6gxjBFgsi8hYJxdhfvVbf/6j4yqLkTk9zfy8LTrlHlLOFXWm8cQWOGLylbytwMzAdz4MUWrok4o4+XzFJVYzhHESEmSs22OFIpaRmtiGbaRQU1+rFKmZhNCFnsTpXCR3ko41KFw2CyxWutzjiZRGTCh04ZhUOdIsiVnLp2g0A7K8a/eYx3Du8Dp4fKYHDvMFbA+OvGS/Dcv0ZDA0aN9esz4dlnR7LJJXGbilVu3k8AXnLm6XI/ngbdg7ueBHzl5X0wfUYPSE0NZb6ddmHnFu0E6Nsdjg5UhgYGqmrcnXR7FFpEc/pitezxXzOtlAZdPa+PPCUuwBYYpIQLefU0+TPmo8PX9n5+Vz+vhBh/l8cTUf/sVgs47W4v0ahDhZFII+796lQ54z7vTA1QqaSNMi8ZG9Qjx4tDn/gho+rTewf06pfol+2rdmdhaOLMYnWxvaIYocT/Tl4ol724I8dKD+nzBX2ViTG+FvpyHlYw4AAIVnuxQkGSU9nV8MuZ0u+2ZVfdPz0h6K3HJie9qvCWsIpf8mzl5XrYebnqbSfPa/qGqJ8aNSiKKSg9IztiY1qmS79LZSLYuCsXXtmV09ykNfvmfDSHo8nAPHRGnx/M+7hCZxm8cHC3kVyLpxzSO5xFC2XLF9NQtmrv0WL4/ExpZUWNLuzCB7O47eikjBzcv3Lnle/WPz1yzsTBEdtIWam6t7BY2xrFCErFdlO3bqm0aM3xfWMSg78OUko30uTf1TrDm1+nFbyyf9lEztIy809fOERG0i1EzSAQneOX3bmQU69f8dP5imWLR8QuTfDzWt0z3r3+3cHWlvOsfIaOU0glcNfaY/zq+wcm7ztVkqPAKLWjrJnvFaG+4m91pPTo5gdypXTm6mOF296flSKi4ykBMig5BKO5piWrh9fcU6h6ZvMFA93L1/cO4Ghfspg4DVTXGSEX9eeh78/yK+b09n3ukf66ThOFYpmsXbO4RJD5rxEcdzkfhpy0wo60AlB5SWHpP0ewTm/adJl9tUFebl0742AKhxHmzCtj4cLbkyDQq/28Bm3rs3btSTbgb709mVV10uIsCovcE/sBRvaBn6OdI6MjNTU0J0Kes76JtiQyQ22jCbKu1ds0Cmm1Qilxzp4UZ6NSdUrN0go9q9aSFuklO3X6UpWrocnMapSo0aOlcgqzjWcNbQD7bqkIVSuy6WaGvLS7QUbpUrxGUUkTek5ttRw9pFohyXYy+ONkjRbvkDcurzNABbYybFvOltuUUlG9XCqyfbM/z1KBcKCSGg4626mQg9bNtqk04qXZPR+gXbTzmsz3UKpYjfcoQTjlsLtXQh64Wrv48Wk9n6KlvGTgbL+tFi9Oa2Wo1TdaEHaYId7P6yC9kY+GoTPageYP1jwy+NlarWVg90gNxIf7QkKEL9TU6Rk8rcaoV4NjWF5jgH59QqF3N/UhGpy4eF8Iwr6M6xv2fUqU3+WFnx7fmpfXBJmXauFyTj2Df6RwZdV6uIJwaufhQtiFBnXweDEcOFc+6Y7R0RsTYzVAjuHuEXGvEiziW3gIzyKck6Gp2kYz1LW0xmYLeFn5rwhfLpyS+GOf5CAQYVigbzGja53DKF2CUbUYr1lcpYXxfcK3xIf65NA17pvYg00TWO0u7tf3prE0+R3j43d4i0WGeLxfqu6Nw3uniM+1bJRBLaabj/HIK5PY9qU7cmo2qdQy1g9vpAbppc0fnlsxTRoR5KXrcj1IV9RGhsp94u4kbvhX5/lZQSNh/qrj8NvbbmI9f14v+PzzUxAa5gNvv32Ief9nnhkJRsRyg5PcnuCll/bAtGndoRs+rD1789hm1zqaHcbR+v33LJg/PxVmz0mGXUcLYUaaFiA+AlaYK4YNSOlxyoMhyfI//+kSMyDSNhHbiYbn3BUrPESEq2Df0VIoxOhGu7k7XS6RA1339kN51yMaeqzUHqHtcKlCRrVPFp+M92aGDnhpR/V9q48fX790xMjKy1o3dscPx4apMWI4kSPZWkrCxfDMZyeYInj4jOcBsMHEzn225WrraFJ5+cpHBrdunEChv05rgzkDIr/dmln+INogen4qLEC/KnJ/pkeo+hwV3w1AeMa38CKa1d5zsqLdMmKag/AAfBojvYXWTYDM4uJtvz41QtGnT/t9vXakFcHWgwXtkhi5LVvm0OemjomB7NxGiA32zsquaO5Fe3852ixJcOKQ69AJtYVb7G28iXs/Pn5s8ZjYUbSziI9SBL88NSKeSjza1mfROo+vN2W3Hs+1yaPTFqpBAV5tlhiIYfSQyNZxZaUgBstcGUZOLY6frc2mflRz9eaTg2k7IUh/d5raZnW066PB6GC1YPQMohHJ4DOoG98j+MCWjPJ5y2/vxdlsDravUUmtPs7m4h1Jcf5dl5rcSGjHi19mdeeSdhzO2DRiFHBLDkDG5WoIDFLBsuVjwYeWlOLDsrVUr169Wtf6RToajQIOHyqEL786wzpdVaWHqVO7w6uvTmDGQfVQSYu3wgwdGnVZFXwVYvcOC/A+1XbOYO0PmUwhb1bReaO6K0+70RfiUKnHluMFNS/OSF5+pqx5xJ5zlXeNGBDZ5fY4bUmjZwufrpaxep47W9CEylOD0Y82xKZGu5lQe25mykOkoS9uyPylDt8n6OayA6z4PfvXZbOSZ1AZjNFsY/VT1Og7HMk42t5Tuz5JOLZN0uMbMrQHjpSgMtrckYt3b1hBkOqXXXmt/eI8/W89XgT//ekySOn7CfPqZgaqFc3eCMc0CA09zRuVcwoa0aRR0a1tNHLJoYmBRzOqtCMf++kCn1XW/I/9ZyuolKaQIrCipRHy+B4Jskh0/fo3z7Q6GV+hnVg8jRS8vMrYpSOnBAid0cO12ooeox9txtGIEVZEKEXKwTf/HDGJQtqcD9Mq6DsLx791wPzxA4Nup0FzOeGvGYi7dt8Br0zvOfCxUycWUm3VwEIVBD60BXLyG9jNvvDCaNZIBgyIgKFD3V+CmJgYCIsfHwIzkGfQ7ozvvjsVBg6MBIvJBjP/vQck/y2G3JGDYfCWPds2zUzgOLHY2L7Wn4fK2r9nmeeNZNuxInh0avd3fDjOsvS7sz9TtadU+vd9+e+lwkYqxmvXaMvM1Gj/jL2Xqu7095Gz2EIGcPxa/SzkF07iGG0brd++oXNA5/HgN6erHvr2NN9stikI7l4rboZPvslEZ6Vl7VJWE8sW3uj4lz87u7BEa75/+S8XjvYM8dn3y5PD/QKCZBASqmhtoaFK8FKhsqukrY3+fnFa8pjHBkXd70LlfP9g3vo39ua4mnUWL1pRybc02nGyf6+QvzRuHdeBkBPIyWu84ee9vbreeYV3YoSndYDYXC1Nq7PD9hfGJ1VqzWEb04qeXP3goME1GE2NVjtrf9lA3LVMPCRHB/ywIdWbm5129IuGuChILfIBbvkpGPbMTth9tIhtZEwyeXIi+zkPYVhoqA+MGhULl/PqYOGKw8A9vg+UOw2wMzkV4jIu5r3bWKpYMCRmjqnDrhvk4VZ9n8G82/9LoYxOLeLQ3LW3sexI6IMb7VNHxf5t579YUA+BGjn4+0pbm0Ythffv7jODlGhbRvliWp9+tVo/4puHB/eWthQJtm2E3W+YasXIvebu/mEr56dyaoWUDSKta6DsV+s6DDSunrEBNzz+hXv7rp/cJ/zns6VNo5Bo+yYnBqABKDu1vKs6uJZ3vZ2/UA956ACSQtXrd/xrDPfEiNglCH+4f3x5ylhc0CAqQAfqad0j1Cyjd6viYFsZXY8XldXGTly3y3mODlULFTU6tv1qxybn+FyNUmZ4b3fOp+MGRV7qFq4GT/ufDKQt5LpzRNwTn0WKuLuPpD2trqvXn+qRDDP0wSDd1Ajc+4gz/30KuKVoDC+kA/dmJnDflEHvPCX8EJsMIoQaYw+mffsFXyt7a0ZP2pGjyy0rCBrUNhig7U6HrTsetj5dd6LfipzDZLezRnMW7vV+7dvNSj9W/3YRimr1sG7x0BFU1fllWsE3dofrb1k8V6+1sgJMiUjcrgVrvGoUEpH94325q/y95fD2pos7/NXKAp0ZeVqbZrC63JDpJkIwRmThYUiIOk6EcGgkRmnsvPR6dS7A7WMTW7f07CgqHwkkd/e3HX1jcsSlGt3Ef3+bsZYlRbDR8oLiCh2UVOo6RTFCanRum83FFm4Nig1Y+83CQWxzq28OFzxNJNvTCqt0f+kLg9iy3AYTFJdqoQRbfrH2T48J8pezNSy0DoUabdxtw/EjHtmxUdIFDcqF8Jsa43me1iVJ/6tCKbzU2MA1Q5Ika6SiZnDVNMbsz6q6q8bqHN3EieKqjA7/AIXEoNHWVwbXlWUMivH/LdjX63jYuHAoLFfRdv83/Ao18gSZ2TUwZ3xiF8VkAAeqdUZtkznkwMkStkY9NMAbiFxRGXm+yXZt5MCIDsZGIdvebrJMzIlYAV5kiBohjx1CAnwQPapODI8pPLYhveghjZesy7We7HsnuPYRqNP70N6GtQipOioHfe6zhQPHLVp3+jjCyIAxyaHrCEt3hELUV8LWkg67drfzprQcJ5gqcKEsOtQbSsqaYHt29dEgb9mwtp/n2nwLDqVvPSSePHV4mAoa682VE3uG7Pv+WNGTz81NecVbJW366NsMoF2ICEFMGh4PfBu/oTfbw0QqUY/uoT6HaLNq2lLVSynhRyYGHSXqIxFfd0ySltozmrjwcLmO9ynq8BqtJiyg74zkrqMYcRdYk20m6NmM0lvcDoV0ta7HPZTtzyOVdu1EJf+3HpI6TdtuIrErHpQYtDLIV7myF3KPZf85BU9O7QFakwV0iKG9FDK296ztFsIsx2aZ5Tf0OBOSQrZ/n170T0rlFVRowWR2MIxaZLRNfXxazzf8223owLGKU5ns+rmOn6+CcNpCyOHqds+YWAyjYigsaQJNgBd8tWTk6L7PbHURnu94XVLUZ2b3ag3lVAFg4BF7782VmO1O8d0TEzDE2sHNK65LcVEzxMb6dSpI7B3tl05bcM788Ej95Q9mcEZrZw/vwv5PHxHTroSCjGX3ySJKdbJVdhaMDLlFDTB3SCSbO8io1H4U6e911tlGmShZc9f4hNb5m4goH/hsX56s+IQJaqpN8PnGLJg7Lg4+WThwSu/ntvN9nt3RmLt6DkeZRzmtp0cDy7xSBX2TQtsqoOuFny8cPPTyRK6i1gR8rQ6jpQwuFjX2f/++ftPaQh4i2gumJbLrkzFsOVoMyWEaJGlltP8Bv2l/FSg7OBeNrwLunN2z3bhlXKkD3mJnxm1zOCX5JVrYf6y0k+cnGTM0BoZj6yi0sCz7ajWNn9jJ86LSMi3sOpKPz829M8qSRwf/fQZyI3jEA9z0SzZvij9xoJSSG4fjp6d0X7rvYuXt0z5Ocz03MXFSiNqr4OLVpsl7LlY9vfvNCb3afrcHGQ+Vm5vbxINqnW3ai5uPb7XZHNzy3y6lI9Eci0TYTns1iQKVcPLNKcqBL+y08MC3U8zMnLp2u5Cgwfgfq2j6sVlv0RAm+O5Y0cHxUZqH9CZbSSdPpBBDWIcJU73ZBc9PT15y4Er1/Sbe/b0eHUs56mrMnbA18ZS9V2vXny9pnEkh9d51p5wDwzU/OHg+ACHSZJPJLpuVHPYSzQ21poXRQ1bWuRMeEjzfp4evbcgobriD5pGmvX0wu1+I97LtR4u2PnxbKmx6Zuyg+avSziYu3caP6eZ7B16PbXBgQ0Ua0DMco5+zJdvkkrx1e+q42R+lWe4YEPlSsEZZs+Zg/re39Ql/MzpaZfJ4b1KDtPSq1mwiRbOz5c2ffnaiaAmF93u+PFXXO0D1YYJG8XxbjQlEx2vE6N4W7DabbH0/35O71kn7CZc1J774XcYf/YK878Ix6gTVtQYLmEydEbzRYg/5/GD+Oq3RRnVQ8PiXpw6NjFA/gGpX2slZ8zwPgggiyA04qjAEgggiGIgggggGIogggoEIIohgIIIIIhiIIIIIBiKIIIKBCCKIYCCCCCIYiCCCCCIYiCCCCAYiiCCCgQgiiGAggggiGIgggggGIogggoEIIohgIIIIIhiIIIIIBiKIIIIIBiKIIIKBCCKIYCCCCCIYiCCCCAYiiCCCgQgiiGAgggjy/0f5PwKw9x3gUZVZ/+dO75lJ7w1CSAghoXcQFBVBFEFdG3ZFVxT72tZd7Kxl7V2xooiKghRBBKTXhBQghfRepveZ+z/nnZkQSALB8v++73nu2R3JzNy5963nd/or1OYVSCCBBBJIkLAEEkgggQQSAEQggQQSSCABQAQSSCCBBBIARCCBBBJIIIEEABFIIIEEEkgAEIEEEkgggQQAEUgggQQSSAAQgQQSSCCBBAARSCCBBBJIIAFABBJIIIEEEgBEIIEEEkggAUAEEkgggQQSAEQggQQSSCABQAQSSCCBBBJIABCBBBJIIIEEABFIIIEEEkgAEIEEEkgggQQAEUgggQQSSAAQgQQSSCCBBBIARCCBBBJIIAFABBJIIIEEEgBEIIEEEkggAUAEEkgggQQSAEQggQQSSCCBBAARSCCBBBJIABCBBBJIIIEEABFIIIEEEuj/Pkl6+7C23nzGH3IcgM8PUFZpBIlYBC1tdqhvsUJ0hBI6TS6QScXg4/0gEYnYtV6eZ59LJBykxuvAZHaBye4BmUQMOpUEDGEyqGq0QgPeY3BqOLjcXnA4fSDFH0slIolcIVIp5GL1T78eVx5uMss0col/QkaUKy8nxl7fZLWrFFKbGNvRbHJAQrQGwO+HsjoLJMWooL3TiT0VQWKEGhwuHzjw3mFqGdQ2WyA9MQyk2NaK2k4w6JQQppWBA9tld3pBi9dYrG5QKCWQnxUDVTguPPajPyTHfh2uM573wpqSz7Bd/J8xWXgTjo09/qlVSFxhSqmF40Rmv99vSgpXNRjU0ho5xxUnhauPSICriA2TO2QyMVgcHhDhODo9XnD7ACI0UlAoZDB9Qgrg9MCZukTzW9togS17akCKf7u8PjBo5NCJYyMRcRCGf6fhOB6vNkJykg5KKzvA7fGBFecvUifF5/IQppKBG3/XYXTgs6X4XgoiHCOVQgJmkxs0agmcOyGZ9bJ7e3z4xuvv2UAxNry2yQK7DzSCCu/N4e+4wBfs2RarC7T4Oa1Rly+wjsR4QXZGJFTXmiAhTgdNHTYwWVzQZnLiepCDQiYCmUwCbdhG2hgc/iAuUoP34MHl8kJ4mAJ0uCboPnxwDxCt310LJcc7aJ3+njllUty47FhITtBBMY6dBsdGgjdvMztx/BQQE6WGtk47jpEchg2KhPBwOVuHtN5pr9bgi/7usUdxbjbuqYWmdjubw77Ij/dS4B64elY2REaqwUeD1l3KxPtYca4LDjXjtuK7+t31PX5g9XigoKIVv+PO2Gd6nhrXQD72ZUdhU3BVnz15vH4YnRUNGlx/m3BtEs8503M1uN5uumQoqJRS1pczzg9eEhOlwjUr6dfeV+J1qzdXwtfrj4JcLunXOIzPiQOf19/3ddhODa7lfOzrmfarGBfnroJG5MUWGDIoGnRaeb/62R+aOS25fwDy/4OIESlxwmlZt3fas3cdbbp4T51lWo2LH2qudsS6owzI6fSAOxZwZ+MPJLQjAKYnB3cuD9toYBAoIIq4hAeQ6wM4cREdMIK60+gJd7nKB9dI98QqJGsHxIf9opCIWnm6FBnZWW1yPrDR0xK10NRiB5vVwybqtL/x8hCukrWOTo/YbLZ7dDavL7rR7Ew1OrwRrM24KWmD9/l77FuSQVUxKFrzxcGyNvc5Q+OsWjHXiCDmG5MXr3B4fdriqs54u8+f1WDy5Gw+1noBMWi6LxsfarSPZ+8NSmlrfqJ+/dBY7cdJEepNUrGgeAokkEB/kQbyV5AMpTM5vqqbzef9VNT4950ObpYrLVEEaQkApDFEIvPXtgDUtYLUYoaM1mYY7DNClkgNyUo1xGiVqCEomAQhlaJWg/8jSbMDJcgOlNQa7HYo77DCkVY7HLN4oUksl9qSY7JqU2KyICZ8AWOoTe0A5bUQ3tTSOjVSsWxApOZtlUxcwYvOLAIRQ5fIRTBqRAw4HF44UtqJUlnfQEIYkRatPXTjxPQrSeomSaAKNZ4YgxI8qAWpwxUz/r5s3w8On1/eq9SGz4tQyYovHRL3xOAwFUrMWvCj5tTZaoMxKLmRVKzlOYhH6YgkI5lIjO1yg08iSvihoOHFX4+0XoEfMuHO6PZGba5su+YXfAGOmVYmtdx7weCr1ArJaie+P1PvSQLtj2QpkEACCQDypxCptWSeajPaB24+1vbQegt/s2/YIIBRWQDI6KG0CmLqGmCquw2umJQC0yckgU6Xib/MZL+vqzVCRKQKlEpZj3ubkCE//cxmiIrSwMLbx0Dl8Q5oL++Af103HKLxs5qaTkhJ0gMXNClU4r1W/loB35Y0wQGfDDpyMqO+HZR4P3Le+2HvMYiqrWucHqN8ZmKW/H0EOafjNP3yoVQvwfsOy4sEm80DR48YGaCcUSMhEJWJQY2qsw81L5kPNlwyLOGZL/fU/Aukff/Wi89LQYDlEDBsHj8o5D1VaXrr8fnBisAUE6aof/aa4Vdiz6+79b3dvxXUGkeFxoELqH5g5f3af31f+OOG4sZtr986dhre2nsm9bwFgUskEjQXgQQSqBuf/7NvqEQmaba5Br++8cjWG/a08w/EDCr7aeqkm30R4ZB04DC81HYELBeHAb9kNDS9ORNevGUU/LyyGGxWd9c97DY3FBY2wR13/ABbtlT2eEaYXskY66hRiaBByT45WQ+TJqZCbKyWSctHjrTCrQu/h+pqYu4e+PCdPTBxYBSsfWIauF49D/gHhkDxEA9cW7gfxLWN0JqfE7d8+rTX/u42OK5ZWepbd6D2OTEpTacx9RCQkF10+IgoGDkqGoFOwj7raf4K2IxjItSQkaAHhUwCapUctBo5ZCfo99EM9MdCSfxdpZDC8MxoBlh2u6fLFk3aiFIuhhHZ0ZASowEzjqXF5nE/PT93WqJB1cD30i4OgWhnWdukF74tetWF9+o0OqHT1PNlxFdjixW1PT+IBCVEIIEE+rMBhBypZJ7aXFj/77/9UOZ91JBSWnDZBZPIZzFx2w7YlmgC/rlxUP7WxWDw8HDXotVQXdXZZeohAFj64rau+9XWmcDt9sGiu8bB7t218MADa3s49iwWd5cPgZzesqDDat++WsgeEgOLF0+EZ5/dDGVlbTBnTjaMG5cMv22vgltv+w6aGi2QhFL95cPjwfnOReC9YwC8aToK4XsKwD00U/TtBdMfusuocD2+pvRIbYvlHMVpnHMhjSQXNZK8/CgENBkoUMtQqaXs82QEjWFZscxpFxWugmgEkuiIwL96ndwPZ+nfIlNSQ7MNmlvtoFPJ2H2HDIyExPgwpnH5CVVwXHz4j16rsM4dlfQS9OWgk4lgdWHDTTtKmjMoAKK6wXLSqwrHqaLGCC3tNhAL6CGQQAL9mSYscsaqUeN4ZsWhj1fz6gUw6zzk/q0QsWEHvHttDsx9cRI4UQN46pnNULCzFu68cxxcf8MIGD48DopLmuHe+36Cq68aBpfNzYEifH/rrd/BPXePh42bKmD8+GTIH54AA5E5en2+HlEm7717KRPLTR12CA9XQly8DqoQlI4cbWOaSDZK49nZMfDJJwfhP/+ZicBSB8uXH8b385mWQgD21ddFcP6MDJAgQFx7YSYsnJ/L2rv41d/g7SoP1My/IPNFo+UXzU87Pf8Yl3D95edlfMEFHfinkh+BRKkUw+DBBgRAG3hQYg/4snng/6LJIw9HY6sNaputvfoxpGIOvDb3bhHOkR96BrtQX2wOj8zu948ZnKIvs7tPBBfQGDW12cDi9QHPCxtFIIEE6ieASE4Tjki8hEw7bqcXblm6+Z2fOM2tcOF0gMIKGLziJ/j+0SmQefNc2LOHNIefYMmSGfAUvlatKoGrr/kKln00D3KHxcO+/fWw5N/nslA30i4unpUFl14yhD2DNIgQaXVy9u+1r+6EzzaUAaDEfRK5vLD6iWlw0cgESE01sFeIFi0az/5tRel667YquGPhaMYYiVZ+WwSzLsqEjk4nbPm1EgYMjICMjAhw4/0eunwYvJUWDm9/Uwh3rK0E65wp0kd5/+dLHtv0/ouzB1568dT09Vbsf18UHiGD9jYXeL09Qx7/TCJosprd4PZ4e3Vyk1vG5fC6qM8slI/r/S6tRqeexiEEIATWrZ0OcLrcoFZKTgJAekwogs6O6wQBUuz2+DRWh0dpd3vFVqfH5/X67biCbDKxyEfX+fx+5hP7/0lcUMAhEAWOovV4DteZBtuntLu8UvzX7/L4nFygnW7SMuUSrmt9nBWQcxwbl9/bRS54D7GI+1PXS0AZPXPbAs8/c/tD9zn1Ou4sx6D789j13B/rn0jUv2dz8AfmiOv/dX2NU9/jwJ1xfrhgP88Yxhu0BlHQEvFp/n8CQOrq7b0zLGyNFhn46u2Vlz28tfYb/3wEjnYTpK1YC+sRODJSs+GLLwtg2y+VMDQnFh599ByorGiD5hYbMyNNnpwKF160DG6/bRTceOModk+S1J9DZr4VtYMNT5xzEiNsdvFw2OyDw1YeajIzcLQjARRS4MRixjwpokiK2skqsQFaaz2QqxPBEK0I5N2YwOxntkAzStKv3DwSxqNWEugHD2q1DDIzIyEmRgOXX5HLPm9oMMM9i1fDggUjoBml+qnYB/+8XHjjq0Pw9/V14LxupvLOsrp1rz36c+m3D08Zrw9TGt29hARTH6QxYmhotP2l0jvde1RuDHOs+3t5EPmjNhc1Z3j31wInFfUqDNCKjAtTlPu4gEGThr+mwQRKyq3AN2SelOB4d9pcgzYfbblhf63xijqjMw3cXrb6xQoJGFTSFp1CZnTY3Q6lSqo0OjwGs8Mb5UUwZjZKmQQSdIrqkSmG7wfolR+kaxWHaXH7/8SxoI2jwE1jdvmit5e1Xr/reMd1lZ2OISy8mzYojpFOLumI0Mo7Ucu0KeRSmcXlCcO2RntcXjF4qJ1iCNfI24bEateNTgx7Iy1Gu4s2oiMIrDQ2lEfkdnu7mJfX51d+fqj+aE2bNUmMIITt8OLnPujDteXjeUX3sHxai6S9rkaNWCUTWRUScVuYUlofp1WURqtlW3C/bcZ5rJf2EaQhx7Ft6XD2MDHSe5vTm/R5QUO5xe2VkVCAn3mCbeu5FtxeThGteePhebn3WZyeHuuZU0ugutXE8nhOtQZQ2w40W94uaLXdhsInPcPfV/9xnUo8Pl7CYb+PmZ1L99YaF+LFGlpn2D43F/jtafkujqHU4/WLKMmn2edfg1q0vqjZMkGE4y85zfjTWCtEnG9Ks2VieozmkNvbvxVornQGNht3ZmikPbdiT82nG2qM81Hz72sMxD4/LyXzNwECtndCpFq2w9dHvgalHpC/VaFkc9gnTyHgqGyxjnpgZeEenE8YMaB570vXDh/jZkaEv4YRcb1F3xQfaespZdEE4z8L39y55pfkARdAVgrA15vg08sGwDWzsk+6duPGMhgxIhH0eiWLiDpytBWam6zwt7/lsRDcwuOd8MCyA7DhUDCJCAcHosIhMm8gOKMjwIoMH7k+qg7tAEYzgNUOnFIO/JihAcjmu3YJcG1GgP2lwFOuiEYdyB2JRqCJNoAMvOCuqAeuqh54kxXFcT/zT9x27gC4/5JsSIxUsQSx9euPwZdfFsKNN40AvU4BO3bWwILrhjMmQUlqlNRIyUoXPfgT/KSLAxiD/V21DZ4aorlq1viUL5k2wp3MmQOJlsgk/b2vOpJ491a0XXDXJ3vXUpLjqVfxuLjzkgw/XD8yeY77FP8PTRklm+k0UmjpdEGMQQ6RBgos8HdbymxDcg99dWhnQZ1xDNeLVskjAA9Pi9j9whXDxuGm5kXICErK2qGt3QHZqJFtLW2++pvChv+2m50REAzlnZ+f+PzIFP3zOoW0MzpcBRYcPy/eJw6B+Ot1R+HyGYOgstYENhwzA461A8cmJlIdsbqgYfFX+2of9Pj8UhofrUJqunZM8qPTc2Lf6MA+kPnv9yQSHi5qhWqj4/xPdlW9VddpTyO1i9o5JT3i4xmDY/4dH6U+TomCFrsHtAgio4bGwoqNx+DcsalQh7+npFIdjqVeI8P7WRUlDeYbvitqfKrT4Q4nhJNLRfysofGvzM6Nf1CnlXmjIzQQH6eFmhYTeFB4cGL/bGYPKHAtVjRZxCara+ChOtP164+1POBGRnHqvI2LVM9OC1OsJjygwITUBD3MnJQKu4qawe2HyNoO27QtZW13H22zjg9ELeCP8AuNUmq/cULaooWzsj5Q6aQIOoG55oLSd0WVCbeLo0uDInCz2N3Yfgl4sY+VjWaJj+OyEVjv+bms5YbeIiJozcVrFU0f3j52VHyUqs7l9p8kbCjkYoiJ1jIA6c43KIHvYHELbNtfq0RoHXTweOeMnbUd97Xa3TEhPyWPfR2RqF93xejk+3QKSQnOC0sk1qBAaDQ7oKnTqcTtMmzl/rqnDtSbpnOnACYTXuUS62U5cQ8n6hQrhg+OanHYUPvGtREfowWL2QWVzRYKZc/YU2u8d92Rltt723oUjh+tVbR/fPOYwTjvbV7fmRkrJfnx/UjGU+P6eueXsuc//u34g4Bj1WNP47PGJBt+nJ0b988orbIoPUHr6cR217fa+9R8qd/0XXKCBudS3KugGHIn4D5NWrhsf6nR6VbTuPOIHOfmxK5+7m/5s51e/x+GkIlj4nvuwyeffLLHh0azmy0SeonIXIGT3NJuS77wpe3lRVPH55L0Ofy3XXDslQsgBxnNJ58cgJdf2cGc4fHxOkhPj2BmqRde2ALhBhVMmzYAhg2LY6GulLvx5NeH4Zu9yNgzk4GblAdc9gDgwrXgwE56SioBdhdQdiGKe44A/EokASkoXBdIKKTJ5ANcmmvrBN7qQK0EGaTXEwCc6gYAkwX8BCgIPFx6AnC5g4CLjwBvpxXiFRxcNzWNqXhkrsvMjIIxoxOhod4CUpToRo1KgNg4HZQjM338nxvh4KFGUCkl8BBqTSN5O3zz6U7wXzwZfinvvKy1oDL90gnp34tQSpfLpIGXPPAvSQ0eL8+ipE5dHvTshk77wLUFDdcw5txTTIHYMOXRvPiw5b7gomFSpcMLTUY7nDc+mYURW1FaJPNUS6cDYhEQo8PV7LlxESpYvrP6sVX76q7lZOJeNxIuePcLV+Sdixupg7LDB6SHQ0OTVf7lzqp3Xv+tctX+BvNch9enwq3gf+byvBufuzL/Up1MvNHu8jmpT6T5uLF/ftQyKGu/pKIdsvEeHciwXTiX1F7K6EdwcyQaVL/cMWPQEtTq9qzeX3elE3glSp8zv95d86TN5koYlxm9Lj1Z5/cHo9ZCLx5OCH9cN2EGJXVYvrXq3oe/PrRjy/H2ayxenwFQ7rxpctpzS+bmTIpRyVfhcjPyOM5WHDNi1qRNxEdroPR4B6QlhIHZ6upqJ204i83jTYpQ77vzwswXpg+N37i5uGmezetXlLZax32/v/aJ4y3WcyZnxaxNiNHatBRJh2vLaHGyCgs0nh0WN58YoW6fNjR2k9/r5wqqO6dyJ0nrPMQopat4niu2BPNvKIs/GfdMbYuVKiLYwxXS4ilZ0R8uvij7X20mR1ZZgzmHQ2bkQal7d1Xnxe+sP/LkgCjtgeRo7TGz3QtOZPJ2p48JOmFhCpaBT3uP9osLn0FCthMZCQK6PzPF0HzxmORVHrdfUVDRPjFBr2xSiMUe/E7J9hdlnHt9ms+2VN6rlkntk3Pjd/AI1GLccxLad/i3FZl+aCwpEzwUeViHGjsCshfXXXNmom7HVWNT/tPU6civarEOJp3iuSuGzb9/TvajOHetZgQ2EiQd7lA7SQDjvDnphrq5Y5I/OdZgHl/dbB0QGjt6Aq3gZy8bOnXq0Nhv8XY2Wm9mq4dVuCD+ZHVgu7DfMXplx5ScuDUxGkX1zqMtlxhUcmucRt7e6fBoA6Yi3EN2j+pwrXHG+bkJH/gD7kumDff2omd7fD584T7Gd7QXe3uhoAG0l1/bcOzFrCRDTYxGbmsxO7UnANQHM4bELrt7RuYVMqmkSSLm/BQAY0IQtOI8csF13v1FY6vTSiEpVhNgCbjG+F5epM253T7FQ18X7Gg0OeJC40b/VjZYBnWY3eG5SYZ1Jqub7cff+xo80NA/E1Zr+wkTlgKZz9YjLVMXrq/a7Lv8fIADZXC/wQ5L35wDm3+pgOdf2Ar3LJ4Ab74+G15Yug0+/HAfSrD2oAlrWg9krXL4YXdyOvDTo4BzuVA/tAWlmeB1CdFsIfN1TQw4WPZ5UP3kECiQOwZqqASZLNhdVD8A+NAM4GRzei3wAxJRovKyFcBb8HcEMuQrSI6B76Ji4J4DFnhzrKGLKSUh+NGrExnxvfetYb6XB+6dBOdMSWNO9pdf2c7AcdaUAdCMYDjioY1wfNp4WNlpuK5s6Zbcz++ZMBrb7ekuqBADVKvFYDL9MWMNAS8xgQPH2qETGQRJb73JKxQ15UJmgrst/JZ3CzcdrunMI+bTm+aRHqE5/uXiSaMMGlm7A9+jhAvvriq56+nvi14lUw5pLLQ4Y1EifX3ByKE6lawNNwQkxKIEipulrcPRr7bTVEWFK2FEvJYB6cAU/dpD/5kVPvvZzUVVHbYkMq39Utt5yy+vb7vl9tKMpY9cnvsgAlRAWgrV+eD4LmlMh+38+tfjV9z7yf7lQAml0oBRWCni3Ksemz4yJ9VwmMxMQwdFQTWORyGCWn/MiMR0qVRJeqKeSe9JBtX2H+6dql+0bN/OgtrOMQTCe+tNU85b8nMTMrGfXr5+1GyyPsWEKSHeoIajjSbQi1Xgw7Xb6vOCXCOt7suwzQWXrhkZ8XHUtqnUCGlUyFRg2KBoFD7EjHn867JhV0pFIveqA7UoBEjYVvDhdXe+t/uHR+YMuf3iEUnv2N0n++IMWjkzs9kc7i6wHZAcBmmJugAYYz/jDMpqeqMQiapevyp/4gvrjmzZWd46ISRo0Jr5z08lL6w+UHfNmzeNGSORipynSur1zTwDP2orlXAh4CI/mhUZIt27Fj/TAvcb3m0O5Sa5jM51P2w5foJB4v2kyPib222wq6ABvAhGW/fWggzb22lylKNWPqO7GK6QSmwo4NV3tjiYFF6Hwp4e+6rWBEqSkA6PoiJb/03NNtBLxIUseITnPXdMHTjvuZ+P/thmdYUzjY2sILg3nv7h8Mrnr8yfY/ecvjKFXCo77ffEIw9UdEx4bu2RT+mZV01IfebNzeWPnzT/yMxN7faSrzccZRo1zT/9btyweCbEinrKjzAwNYxZGvxnWMAqXBv/Xlm4rKLelHluXvzaAzXGcR0Oj54JYTiX3+ypXpQWp6lZcM7AF0/nu/3TfCBUxykwcCI4VtUxZNG2xvU+8ndsOQSPpYlgyW0B5/Q5qFnQy4MT8MYbu1j47ZTJaXDx7CwIRwmYVGiqR0R0sM0Fc39pg6qqDuCKy8iYzEwwV09LAKn6lHot0aQ1RCIA+E54vijbTeYGh8ICRjcuIJcIaqwALSS9ENBIcGGgJMxLEEyS4xiQdHEO1A6gpQPgeH3go4Jj8PahSHh7/wC4aogOlk2OZLb+baiGx+gV8NGH8xhDefmV31idrLsXTYArrshl5i4KK87KioLiVy6EEfethdIxI6BwzIi8K176bf9LVwwbhaq3K/TYEC6SRiISieFsHSLYJh9pbAfL25iEJWZOYXHA3o+Lj8xgyqDz1+LwJOyr7rx6XWnz4laLM5YAgOsWfsyejCCUGqE+jhvqhqsvytxiw3uSrwfRV37zmzu37K1sHxNiIgQeGqnYgeAxJSVa0+bpZi8eiNL7oCQ9tHbYwYpMg4PeTQUkYaUj86LSMceqjd0B0fzytcOHL/xoX1GT2RnDzBWoNb39a8UDG0tb5r1/67h87J+JnO/ENf3BjajGjfLEl/s/+mbH8es5haRrjGUovb56zYhxSrHoMNWS6s6os5INgNIsHKnu7MNEwLPxHIKaEwEHf7IAwL97y+hJt7y3e3dhrTGfGA+HmuivR1tmznxmU8O7N44eGaVX1XlRVvU5/fDvTw+ygAExSdWoZoBUdEa/De2RD34qhWEDIyEHNffi2hPtlON8p0aql3Fi8bV8d18zzvfnO6vvT9EqPkaG6Ore5tCf8dFqCNMqWP+6M3++2zX4W3FZTafvnVvHTvxy+/EHnv3+8Au4mAJbDtfOkTZb7vnPbLK/uGDkVZdNTFlucXhPmmsEFtixrx5KUbChJFm9WnaSPR4FL2Z9F4lEXrVKzne339P2bGuyQnFFGxOQpMG1Kg2YSntFXgRDjq4NyBOBsaN1qUdtkHwJ+mDADZlzTMgX6DJk1vJIjaLooZlZCx5afvBHf1Dbp3X+c0HjxZEq2Yu3Th94n83t6xPsafz4PmRAScB0lPLAVwfX+nGv3ntR1v2tDebvmjvsr8ApZjhsPsfKCAUFIuJ5vx2o7wEQtOenjkwGlUIGTtfpwU2N+2D5b8cfXL+v9vKR2THbX7x2xMyPNlfc9cra0lchVIsL/31l7dEXYjWKvUOS9VtdHt9fCyBWZO7EUFvaXNF3fle61Tlrqgx2l8LiOB7BYyz8sqkcWlttTB3cvrMGKsrb4fXXL4YFC4Yz84kSGQcyVPj6l0oQ46QOPCcXjtpw3A6Vkj4NPDICMi2pUDq/coAUsjOSQSyRouRhBsRb2h9IkT3CHzhWmFHEAAGXEi5GH/hcBpTwTfB5oRFePOQFR3hEYIt4g5FJNDnVDczMxfwkJBITQHaaAX7ZCV9UxsMXZWkAheUAja0MqH78xxSYNSoRZl6YCTu218DOHdUwLC8errpqOXyz4m9wrKydRaHtXXoBZN39E9SeNxFKhuUMfWdj2esLzxt0C0nQoWbTBqbNotWIz8oGSQBwoM546cE6I3/qduLrAd4/UNuNG/BMwoFQhDFtVOon/l+M90k1KAvOGRj5ypgBkZ+oFWK/AgGtFiU42nQKuURy07u79qBEltsFHsB2Hjz5t+E3ZqVHHCP1VXpqLgxeFBcfBhGRaig+2trVNz4oPeWiBkCFNBkD854q7aNqrpS34aa++r7lBzeGQoyJQZc3W9IWLduz9b3bxo2QSCRelv+DEj2Tsr4+8Pn3e2uuCoFHYLd54e+zhjw8MiP6AJnzFPKeTHsQgkg6gt6h0hbm0+8OHgNR44jSK8Hu6J1DoHTteXROztybP9xdYgmZenCsG62umAXv7Spadvu4rHCdvHFgohYmD4mBtQfqGNCd1SYkJmRyQnmdmQFQd7t2i9Hh4npLNsWGyHEciCmfap7ngppHSNo/XcQQSf6/7quFO2YNXnpBfvy3c5f+eqDd6dFRH9n3Eo5b9OGeL7/afnzhh3dNOJe07JCzlwTHkUNjmM+sw+g8YzWGPxLd9Eci0TrMTt3YrKjVN08d8My7m8oeOcFYxfDl7pp7J2TFbJqUHfOTzeXtRRjiWJQjzUsPQzOTe0Tw1I9Fn5o67No5Y1M+vWBI3Iu7ytpHIrgqmO/yDB2kr8XdrqE1SQU7cwYaUMMjTbTv31Py8G/FLbNf23D0+fhYbeMz83Mvoj5cMynttYM1nedtKWmeTXuabu/BJfHkqqL1b103YihqoOUer/+vAxC3CyV57NWT35d83zxhRDjUtMA86ICX7j4PSoqbWajstOkD2bWhCKZvVxbBLNQ8SBKZ8s+NsLWwGbhoHfhzM+CYFQffg13ITAWuuT3g0CaJXCLuJpWipGk3wy07bLCuQRowejI0swU4EpnCcCNJ1QqIknMwLQoHCrWhzNgwiEpIhnvwddvoZvi01AiPFslRE8GL7XbgCShoFyHTZMUFySDr9QCn1wGKnQHtpAOl48xkgHAt8GXVMHvJZnjy6jz45xVDwWJ2soikY8daWXIg+TQovyS0gbY9ORWG/nMrWC45B76rarw571jLnovHp71nd3lPkvoopPesIqywzxmRmu0TYrQPUBRQX1IZbebURJ2Xl0vsVqPTmptuMBpNToeH511hCJis/IiIJ7svkH1NjP2Nj9EgPvhBjZrbC6uK3yis6sjlulcOxcWVnxq+MV4pXb7nUMMZ20rZ9SaLOxC2jO/zB0VAYIHyp+mfD8YMDN80LSv6241FTXMhZD4h80J1Z+6Tyw+9dv2E1IUU2URJnyt3VN/KwKNbO5mJLVzdmB2hfrcQ5+dMVUepgjA59cmGT9JrBq5jJ9UXszpP+zu9SlI1OSPqyzWH6m/saieuxw6rO+yfKwpXPn/FsAkSCcePQi1mY0HDWc2zA9fJhNx4yEuLYEuxO48i0Fyxp2a6n3KKuvux8P280Ylv5WZGuGy9mCRoFBwOX78cvwRA7cj8N++pg/Ej4isOvDw77PFPD775yZaKhSGgJjPI9sr2yXn3/Wj56NZxU0dnRu2yBdc3/X5sXhz8vL2aCQb/20qmhZpTQ0E8o1MerWmxDVxX1Hg5Y6w0ViitPvDFge8/WTg+f0CctrhnZBbPqkf3tv3Iaf7E8oOf7TrcOGnysIQtS+bnXldwtA06O+ycn4ffFZ9M2k5avIZpPC3tfZuJyQdVWNE57L4vD31HvPMfM7PnKcRiE/mFSMhePCPrqvJma0m90ZHEiQOBFhaXV7F4+aFd3yyekhWhkbV6ff6/BkCoaOE3W8rv2quLHAeReojcUwhv/Hsy+45yNKgO1bbfquGSOVmQlhYOxk4HS/yj5gy5ew2UHGtDHVrPGDTvdrMF3yUeR4cDxEQGKud6LT3CBeUu+jxodqJJUCsDoaDMoIe34jlowHH9rEYCnx0HSFJ1wOcTTJCZngz6+CRYIJWBUtQCi3d6AyYwAg76Pf1NLpUwnBylEifIHwAUX3ADEqjp1cANSgG++Di8tuYoDE/Vw+yxKWBG6ZAcxY8/Og1efnk7FBQ0gi5MDhPHp8CC60fA0gtT4fatBQATh8Gbq399fmiS/ju1WtYWktQohI7sqFKppN/l4Ak0VXJJR/6g6J1Ujr2xycIA61SfEtlTo5Ex+shhT6XnpWI2jrQ4KPKCFAdJMIYc74ef+ZgTmTa+w+0N23ik+WLoJdN+SkbkMpm0/6G2pL5fSuZMHNOObmVpTkd07fiBkZ9vLG6ae7KJRgQ7K9uvu35S2jMahbS2rtEiWbG35m44tbQM9m/CwIiVKQkai93VP7Xch1rrRZNSwe32s2oG/SEnNm7igMhla4sabzwpIRPH50Ctcdz2I23n56eEr9PJZRRdxiK7zkSk1U0dngB3UvIqtmUvAnUZaiCx4UoYkKhjkWElNcbcr/fVPRKaH7Z0UBB47Iq8BxbOynqRzJpqdU9AIG3AavH0O6eFfBiVNUaIjVBBaoIOllyVd8es4QmfLHhr5xaH3y/jgkEGuDPlV766befl41Lff/qqvFvI/0LapVYjhdzBUbC3sOl3lbT/y0GE8qFQCJOjALjk6rxry161jaxotqQzMy9+6fD6pYs/3f/z53eNH6xSSs3dw2mZBoP8ze7wdgWu0bca3Esf7qt9cOX241cnJenrHr1kyOy6DgcD49+jiXWPdh06KBrUKgX0pSUEQrQ9hn/9ULzBZXeLH7wk5+6xg6N3EKjT+LtwL2jkYutTl+bOuP2zvYUun18a0Jw5aDU7Ixa+u/PXt28cnYes1PNHK733CiCV1UbdZyXt/4CZCBqHyuHp85IhOlrL1N1164+xqIeHH5wMU6em9wwB/u9FQNaAtLeKobmmjZ3TABpVwKDcXacmZqDRdql4XSYQAg7G3FmMceBzukYhY8jKkz3I4QxoMKiN1Hpl8NhhJ3ygb0cNQQ3KsHCYkWyFEeVm2N8ipahxZvoCmTQY0UNhke4uwDrh0URNp8ICfFw0LLpjCvz3nBMha7owBWzYUAbTpw+ARx6Zyj5zIQP47LODsG3rcbhtXi58vmsdbDM7oDkrw/DF9qpnF80acguFsnJddmcefk9SCEnVtChSk/WsvEsDAQmCQH8T8+i5ZAunc05Cv6FFSuBQ3mod2WZ1xXYP6aTxUcolnuwk/V6K7JH2U0qhTXO83gyV+JL0s1w8qe4Wp+cQSnhOBDZFaC0QszLa3ap1hxomjUuP+KKu0z60qtOR1QNA8L1WLN5aeLQD3P0s0R8qakmmvf7ORmB4+KIwpayt0+GODI0XF9SCdpS1XhguF68jOzpJpUw672N6ELh840fFwi2XDg249vyBNU5MgYqPEsi3djjUL35f8vya0qY7CUzJ7IoSp//S3Ph/LLlhxAtqrZwxF4VC3GMOyJHd1mE/64RIWhskPRv0KhaWOzglYtfOp2Zqb3lr+5a9x9vGckGzHGklX++vvXltQcPVHy4cN35Iiv4QachpKWHszJKqWvNpE5H/p/QQyjdrbLFBcoLW/Z+r8mcseHtnkRklcgaOOG64xuLufH/v1leuHTHSHzi+qJuJkQOdRtIlOqhw/WwpaZ7/9i/lz0uUUv9z84ddlhitsZSUtwcqUPzOVhJwReqVTMltaDL2uj7JjEbax5Ifi79paDZHzxuf9tr5OfGvNrTbGXuhxN+oSCVblyOjlEdeu2bEzIUf7f3ZJw6aifG3JfWm7CWrile8cPXwS+xu358PIL8WN8xviIqKRZEZ9E2NMOeOyXC0pJnB1ayLBgNcFLjuyy8LQIuMadasrJN+v3DNcWiubMVRaAYKo4Tgi1PIgUdkZed7EACclLcQSmzjGLMn+yT9liOfidMZAIEwHQXdoRTmCKRZK+X4txtaTS6U+hSoQgdKnkhwI6plosC9xEHfQ9AQzwUjUcDpAp4iuNyegEePQIQkR2zzq7+KYFq8EuZknghbGz8umTmcKXO+ng7xQYmtHSWOX7cch0mT0+C26amwbVcdQF4GbD1SPmd6RduDyBg7QwyColWSYsN+90TRfSRBICEJo6nZwpxtZ5JmyutMsOVAXQ/AYT4uuyeGHCynLnipiHPazG5rPUrGvn6KKNQ+kmCHDozo9wE21IZOu9v22eEGl9NDAHIy166sMyVMRWkse1BUpOenUg66MSY+KJLnDYq0jB0YyQ7L6hdoMZONCyVuU7+ZLA2dnOecSpnYisJo5KmQ5PD5EyI0ClDg+jldzTAa6Tq//7N3dlZ/+sZvVUHZhfejION1eXwiq9urpeikCK28OVItK58yMPK9/ETDqvgwxboog8LX3O4AK4KTQi3rda7bO5xQ32j5fdn0FMJrc0NJeRtMGp3Igkh4XuT+8Z/njvtkY9mtD3564B12PEAw3Nfi9yvnv7T14GNzcx66e3bWCwSa4/PjWC6K40+O9PkziPpnRO1Ag1pIlFZRsWRu7iWLvziwzh/M2SLGWlRnHPbimtLPH78s9wpncG/xTEPjAgEWweCAsgbzsH+vKv6C1t8/L8m5flBi2J5mowNZh/V3jX33PURh8FQzry+BiMya7208tnT/sdZpY7NjttxxXsYiMkcrZBxLv6ipN4FGI2ORj9SWgdHajbefk7H4jY1HX+4yv7IAgoY5L2tk/75qfOoTtm4+2z8FQI612i+EwakAzZ0wOkwMMZEaOLivnm2BnJzYruvORYn82LGTkw6rcXOuKGwN+BVCmgZtfLEkIIC73AFmTtoETwxB0TVRXMCuAWCxA+fBzuo0wIfrUYnwMgc3Y3ZxkcAbLQhGigA4tBpheAYPeo0cJ1oKDocDLA43NJgQGLzB1GryQjIzFm4KuhdzzAbNYixUOGAOYT4ZMq21GeGdfc0nAQhV/SXt69xzB0Jubix7zZo1GNavOwYH99fDzLHJEPHzDminzGCNNqrFaB87ND1yLeUZhJKBeBaRwv2h7HSmkaD2kBLUSChr/FSzGDt5TSmjrGowIAMekRndS6SdCA7XmWxbN5rgZMmeI7OY1At+uUQmOgnkT2sGQYCnU9BKK9v7rR2RTIASkBSZVc+sK+xnerLehKo6/La9yUah1N5u5ViYIIBjWVzeLvda3NDfrGKWTY7j1mF19b88RcA2LXG6vbJeCoqRidBkR8HG7vOdVquh7wbIpbdpJdznxCAUSjk3c2SCwu3jM7aUtd68obTlDgpHb7M4Y9pMzph2rTwjNVx1bPLQ2DVebPP8abFMcyShSXRK++jenRRa/Qd8ECFTVqRBAVkDDGxMjRYfzJuQ8u6Fw+OXz//Ptt1HGk2DKUKLCzqhn/q+6PnPf6u645sHpo6KjVS3jh+RCBsRHOF/Wf005kj28NCJ/Mml9sOQhLD1952fecfStaVvhkyExFjXFjZcnp9q2HrZ6OQ3CKwDgQY+ZhImjdlh5+VPrDy8wml1S+64cPC/LhgW/ykBJo09VcmW/U7ti9gTOc9T47U47t4ePIIPnqb4w76a2z7ZWnl/SqL++LNX5s2kKK1K1Pq6HylhQoG6EzVRKSvmqoPrpw54pcnkyFy5p+b2rrB+/PeT7VWPp8bqGudPTH2Lwnu5PwtAah3eDHIow/EmHGgt++yCCzIZ81rxzWEoK2tnJUColtSEianQjCrzXR/tZyG7dcgL7CZ7QENQyQPLWxScwdC/7G8Ri2bhu28CCqxXIzCEy4HjPbAwzg7JahfYpTJ4Q5cAbaiCEnMH8mOQl72hDW4fKYPF2SrQhEeDy+sBa3szvFfugXIRMv8wPwzWeOGWDDGb/P0NDvi02M+cysy4T84lbBQvQo1HCsHqvhwrabGxpBUS766EDmTQc1D7+PLeCTBv3tAeY0UJki0tVlSOFBAt8kE7xd/rtVDTZswekgprWQgl9Qs5Q6B0wZ/jZQxpJOnJBhYu22xzhvguO9KXHNt9178KSP8DYjUHdUqZ3ez0qLpORwwwWEVth2OQVimr7C9jJtAK0ykhIUYL/bWrEogdaTCl2V1ezalmNLlEzE8cHLU3Iy4M4mI1xT+WtTY3IVM9KTQSx7PF4c7NV0lXifoZmkjtjEDpLFsV3m9/FJXqqG2zp9n218b2GFDs7OgBETsyEvVAeTKnP6ALtVGO90slEhZYy7NtILIalOKDc/IT7nz22hF3fr+79vZ/fXf4LRK62pye6GUH6pYu21G1dHJWzI8fDYq4jKLCegvIoC01MF4DFU1W5l/5vQeAkfnxUEkLJMZqWV5MSAPVacTmrU9fkPXEF4defnvdkXsonDkQ9CCG4yZHyoj7V7c8Pn/offdeMuSlljYLlBxt/1+nheDYM609KUzH5v7qKQPfard7Bn34S9k9XQEDuPef/bHkdZVM3HLOkNgVoTybwPlGInjk28IfKmo6M2aPTfnib+NTn2xnggjHzGN/hChZcVBqFEQY1Mxf0yPiivKQytqmv7T+2NvU1mS9cv9Lq0oe9/rPELhQ2hRov4RzqTQyhz0UScg88SQAHH5TK5fUTRgc/ePvMWf1CiBtbj4K5DJWQiQlTcU+++9/t0NxcQsqEhz884nprOJtl10Xt8PawmZ2oBFE6JhvgpjoyTuJ6258CDBwRHau2yb2UG0ntRtUschosXOzUmWQkxQJbSYrNFlbwWVws1LoA1UuyIuQQqw+HORaPchkMnCYjVDf1AKLdntgZ5sEOL8ZeNxIFLG1ID8TJyYM/ru+CD712pjzk2W0nxIn1P1vj9sD9eRkRQYaYqFUILKtzcZKtBwqaIS9qJVde3UeDMqIZBn7BgkrlgSgVUPF0drk4rJWCGkgZFqL0KuZ/Z3/kwtkUT6HRiSGqFgdRBmUgU1/pkdgU5Mi1TWDY7S79lS2TWMmxW52/aMt1kvHDIxY5+jHogooeSLYX9wI54xKBrmUOylcti9SoxR0oLrzUr+3Z5TR6KzIjdnJ+oOUPStHCX/KwMgvvtpTszgQqhRSYQDKWqxzrhojewr7fPpRDX5J57bsKmqC9CQ9i8rqj7mNwmn3VXfMcbm8ou7tpHGKj1A3jUyLXOFw+lCesQNlWTMh4QxzzKIOkZntxLbMmZwGY/JjmfnrplkZb187I/2T+c9v23mwqj2X5fIgw9ha2T57wOIf3E9dkXfr1dMGvkeBFVwvc6rH+XchM/u952AziRv385bdtTB9fFLX6chEVnw9eFnW4pl5sR9d9eqOnVafjwkerB0KMSxZefjFzYeb53zw9wnTTWa3d3+j6X+XGYs0COQJFpub5VFRUu6NUwYs3l/VMbGgunNkqF4cRWY9vbr080EJusOpMZojbmRMVHX85TWlr24rbJyRlxm1Z/G5Gdfaaa45YNn5VBXijwiHFPySGKcBIwqCp54rRAJMXZs19ZGVBT/SboxUy9urOuwjccmP7L8XCMCgkDZ7vP5EBB1JqLSDH+/92MrC7966bsSojDjdwbM97lvSx8P40Grig2NCZ26QGceDiPz4Ez/jwInAaHLAR+/PZU63LrMF+RM83tOr0nwQQLonOOGfSk0Y3DxW3yVkuv2BWkjhOh08OSEMQsUFKLrK43HhYDugvKIFfuyQwwq7Aaw2PXBelAiUHvwxH4jmEgVd2DwfEM+pfSK+l+HtxmVC9TOCOyckhVGplsGZUcypPn58ChQXNUNBQQM0Nljg6mvyQoPGfieXinkdAilJpAEACVTS/DOJLbRu42xhC9ndr+zVQB/9sHBK+g3FDaZSm8d3QgtBSWtredsNF2bHvhKrV5Z6+jBjscgcXA9GfGb+4GjYuq+W2V8Po4aaGI1gSUyS75spV7XYUn8qary9e8IdMWW9Vm5dfEHWjYRdFHZMLOqGKQP+caCm8yIEjEFdJyziPUoazSMKGswXj06PXOU8jRZCm7um0QITkuNQQq+D+CgN1DZYUcqWsYO6+oIf+h1KhKrNR9tu7m7qYyZX/M995w+6MVovM9P6L643MvOYWt6/PBBWMt/ogHUomAxICgtUTQjUbbF/dPuYYQ9+dvDHDYWNs8jswLYXMrHHvjr07srdNbd9ef/kcWLSRk6ZGwrbjo5SQSNqIr9XCwmF9haiFjEiO+Yk86DdwcPABH1h4Uuz1Q8s2/fxyl3VC7pL779Vtk0e/tBqx8uX5+XEhKvMpwpm/+NaCHaFDkqjyDE/H+jrY7OHzLjz032lLVZXDBes+eZwe6VPflv8zUd3UFIreL7YXnX3J1sq7zKEq6xPzs2drwxT+CU4LmQFaDe7GWD/3ugrCogYiAINjiv0mM8AO5Es+uTABqvJqTx/eMJXD8wacmV1o5WBYX/mmAvysFTUUG0ub+rNH+0uttJ+D5Z2cfn84n98e3j98jsnZOh1SpPP7/9jABIl41o7nK540KpwkwekiHsWT2RJgr2ZUijMlcwR4ci4xEoxtBKAkOrHB/ICeCahik841MnXQExALoJQlhyTfGwmWLTHBqsbZSBy22HFNDXMHp0JlXXNMGW7C6qqzIHlSKUFFHIAknCSYgLVTsoqgSP/CkV84YsnB7sUX0rvyZFfqK0EckF8zL7PeQOJagRKXLC2DF2ni9DCXRdmMMd5WkygFk13rYtoSE4MezGwc7ih08u8XMjJbZAYrqyJi1EDlQkJZuOyLHJmNAuVoT7j5AdBz39yJjEtuOhwJUwYlcA0wu5gQQuC9/Jgt3n6ZQ9Pjg+r+eCmMeOuf2fnXqefl4WK89EG+mh31bKlV+aPRRA/GQf4oP8CF3BDuw1MQUksJOUZbS5oPWaHUVnREK5X9tgU1EYCl6d+LFpmdaBKHZL8+MCCfOlveefERyjqCJzI6alRyckE6fr0ronj57289XBdhz2ue3HIlftqn7swP2EtaoHuU4GAnkVmi32lzazw5MlRL35y1CPz1uP6lUCPiqV0CiQKRx/vrFzaQGVXuidaorb92JycBaPSo9ZSZq/N5YGtJc2s4N1Z+x0azLDzcBML63W6AuV3CIheWjBi9uurj/zr7V/KnujOpA/WGUfk37fa+t19U/Iz48NKumuJ5IVR4F4jHxi16XTcm2aV8kXcvaE8flRY2sacsbEISN2lYh+zOvjg+QXDrx+VHv7zI18e+swfTFij9WPz+iX3riwsGBmn+ypQr/x/WvMIrEviQ/SiIJSoCFVXu7RqWedzl+edf+eyvfscfr+EMVaKVqruGPLFrxX35qeEb3pp7ZFXKCfpyUuGzApXSWosloAPzUF16Nhxz3+skxkpYeB0enr48kjzeX516cdl1R0ZOekRRQ9fnH0NmeLSkzRQ12RDMHSf8dk0demJGhTMZBAjUVY9Nz/v4kWf7t/oD7p/KQqtudMetejjfT+/fO1w3O/g720f9RtAklTi0qMdlmEQpYfDR+sCKpZC0qcUFYtqc8v7l7L3TSi5DHriV+ShwRLI0gBYMChhvg8+4DFi0HpytU8yg4hajeAvIyCg2j9aZJDiQPnowjK8ABl4VgpwxRUAVFgxIxE/PxpwhGekBO7TbgSupQOBAbcSKUJ+AozEbpqPPyA6BjUSPlSYkQ9GZzFgEcOUVB08dXlOvxdAS7sdmvxiBmyc0QIZg3WHNSjlSL0BhyNtwHaLk2XZ04SSTbO62RINp6kSjfAWFhmpZGaw0JkBpJGZzS5WG4ua7fX5T7GWBN4oNVL2tz8EKn1I2PRp7uCIwt0vzNTe9NqOzfsq2sZTsh5toIKazlHP/1Dy8aIZg66zB59HEhsx5KomC+jU0j4XL4U+UqVRqsybl41aGy7eUKIZleh44JMDq/ZWtk/uYsrYx+RwVe07N48bGaaRtbCNxElZKXmlLJDRHqmXt+9+5oL4W97ateqnfbUXc0opa+fRRvPgu5bt//WVa0dMcOMA0bVkyyfTXl2zhY0110u0WcCUxIEVAbDD7YDM1AjQaeRd8fdhKBD996fS577dW3NHV+kUOj5YJHL/8MS5+Tnp4SWU80EBHI8v2w/H8VlUXZYq5fq4Po9fCRTBC84ThcZHoUY7KD0iUHjTe2JBGK1uuO38Qf9Mj9EcfujrghW8NFC1mZi0g+dlFzy1qfipK4ctvOn8QW+b7Z6ucW9qtcPekibm94sKVwcjqoImPNyPVqubFV9y4tepA/RKiUjkCAkhND8JkWqIQOCn3CfaLkrKYVKKel1D15476PMrJg34dt7Szb/tr+oYHsp8trm98l+r2q+DPsY9sL75rkPXQsIUdyZTabdx9bL1xNMR2kww8weLlrK5t7k5uqfHx0tbrA4lKzdDnaHxd+CzkQ9FG1TsN1T5LylcVYCayCWPf3t4NR9kdTTn72ypfFYkOu6nirz/vDRnwdjM6C0UcSYJnrfR1GplZYZC1gDyLeL66ZXdsqoUfr7LosEH62ENHYhswM8x0xoJFKHITXKaL9ta+e/Ve2uvjovRti25dOhUt8vv9Qb7EYF7iuazgaow9/JEVuYH10xqgpatc6qRRoU3h6dHbLr3wsF3/WdNyWsnEnjFcLi2c9RzPxT/+OKCERcxy0k3Daa8xtx/AMmJ067dWNN4JUzKh737eKiuM0JKor5fjDRWr4DL86Phg3UmZqNmDNoXtFnRYvKGGLU78BGvO6nHrNxIkgFFP0lAYyAthjQF0jgiowFMNuabYVFcBlT7UxEcyqoBDh0FLj4KMQa1j8TYQOZ7i/GE9B4Iw6Bdyc6nOGG1CkZk+btFZuHr9olJZyVBbDzYAMYwPSvVEmu3NqXExe/mORGrn0XHwg5M0SMzMyN+8jBkQASEIfP79WjLTX2KiNj3I/WmiSgaTxybFf7b4bI2qKg348ZW9M9Z7OO7MpFpOdJip3Ik0mCi4aknBHAycK99csaEN1YcPm/pupKvbH4w0KLaVNp0rc3rS1+2aOIM/Il918H6riD5M8lcgZL2PBQd60BNRAEpsRrK6lVd9d/tvx1tsuQTs6E2KnhwPjJ36M13XDLkc9upZ1FQRehTwne/eHTanO83lg9/4NMDK1vt7lRq56GajnE3vruz7Mt7J06K0Ckat+5pgOMNJpYUq1FIzthOAsK9hxvBgO0cgYAXF6kW3/ja9lXrCxovIkYSyB/yw23TBj73xFXD/kHMz+v1suKbH31bAtMyouH8IXFs8xPgrS5o1Lz289GT6pHhwMHYoXHKadkxTACgFwEImdbiIzUIsnKmgXRSMdMgQ7B5eJiWl/jNZ5Gaobe8v2uf3eeXd/c7PPZVwVur9tXd8MGdY2cYwhSm6gYrHDzSwnJKHDiWxFy1CIQ0rmoFAT4PpU2mqXT/hg57arvFNSkv1bCBbN9m1FrbsT9SXLfhWkVX9QT6jKO83r5NsI7PFk8a8dGm8kUvrCr6b1c9LRb6yvcqdJL/oaLBCBPyE1muWJvNxZgwWTJKHB4NtFrhRGAFiwyU8SJOSSXlKZ2AkmOjI+S4p0yMSUYgUJKvgHLUyLd2qMk02YdjieKg1MHD9PyMyDKnxw/tJkoK9DFBLjFagWNvZQBrxbkclaZfc9vktPve+rXixZBg46TzGBw+8Q2T0p+dMSzhE5PN0yWNHy5vpjNXID1Vz/pE40zCyq7ytijPDh90DzsnX+qAVINm3shEZtZW4/5vbHPAgeJmyrti6+A4tkWFc5oSq2U+kV+Kmq55f0vl4xKl1PfkJTkX495vJ8HqWIURgUYMwwZHgRbfxyDgUwXsNpOLVZwIJRLTnBMLoBBj2mciBNu8zEgmzF01KfX1smbL2FUITqHILOrzxsNNM5esOPz+Q3OG3EzWE6o2bTR5wNeXibe3Dy8YlbwivbO9ikJaLUkJsHLr8bNipm9cMwzSE3RddZnYeRcBMRx4YuKUe0Eawim2NmaWl0oDpiWbHUSBMs8sXNcfEx7wrZjMwOPveas1cE4ISTEJ0QwI+JpGBJMa4ByOQMKhWgUiyi7v7tsI1lZiocTe4IFHooBTnZXJoLPYz0uHmXlx/fdF4EC/tgnHKCOJPf+caMXypGiNWa1gBxRRpVAOJRg6DS+ruN684OnvilZPenojv6emYzLXh8mD4R3yzmve2L7twqc3lqw51PBYq9U1AaWbKDoUUMYKK/bfqUILijEUtiAcTNrxeE4clMS4APY9QiX9+a7xA8JfuzI/OzNcvY++3FXVMSFz0fe2a17asqbd7IynLOn+nJHOQSBZkCr9uty++Ee/PLRy3GNrbUfbbfkEYPFqed2jMzIvfGZ2jnJQtO5zV7f2hOo02SxuOlXxJDWaGK9BKTvw5EXZaZ/cPCZ6ZJxuIwkplR22AWMeWtdw2dObtzV32NO1wVpR/XEF0HVUmM7t8Wsf/Gj/Gwm3fuNdX9pyETnk1Cih3zN54NXf3jWRu2RE0j9YGROjGwUDCzMhkNRPQFnVaGbVZXEcdSgc3N7jwfi7NQUNj5rMzmiKkKbjk+m3ISZLIEUSaHSMBvR6Oeh1Uvaig4SGZ0YU7X5upiE3PqyQ75Z1T5t/X51xdO79PxkXvrrzuSrU+AgoxEGQofEnBmlEbdBm8yjf/rVi1a9HWucTs6DzMv71Q/F3+ys7zmtqcUBtYyCPQdTLWiRhT8JzrNCqGveKThZ8BQ7qYsEwd5w/6NVfHj8vI0Iu6eT7OGeD2mW0OqGuzcz6ToBLEYOxYUoYlxlNfPacokbzld39TSyT3OWR7q4zvpQ7MJyLQI2NmHVIGwnVkyIrgB95xBc7qpa8vrn8JaYN4f56Y1P5G7sq2q8xdtpZnookWNqDRTEm6iA6SgsREWpQImjeeH7mS9Nz49bwIbMggtDM/IRv7pw5+BEvq64tAysKiXtLGtgeonuR9F/fYmN5OCjhhy3fUfN0DwELn7WuqOluo9ObS+rf8ToTG7NQH+gerAik1cM0yBd/LPn4X6uKPyULjlwq9qDA2VBeY4Jt+xtgV2ET2xvdtQ6KmMtMCYMJebE4rzw0dthYRQQqlU/nGZEfk9bminVH4dsNZayEzvSc2M9AzJ0sSFL13n21N137+o7itnZHVHu7k01FX5aGXg+U2rqjBjbsrbnh6Tr+Q5icD/rVW6Dw8QmQdAYthG51w+s74ZMtVQgE4gDjplBdkvj5U05comJ84VL4an4sZGekglQuh7b6Wli8uQN+KEBwsFjg46tSYMEFeWAzm2HuNxWwoRHv09mJIpE5AExJ0ayUO3uwGX/T3HEi50OnApAr4Y5cKbw8NxvEEgk8+W0BPLWpA5htq0etGp4lLUIoT6PNDi/dORoWz8k+I/N5+fMDcG+RC2BkJiT8tLXxtUuzB+MmNm8qabnshZWHvglFfP1he3CXc5+4vQemjU/Z+MHtY887tZIofxZJ76HraDPR+R5rNleiQmeEEUNjwe32BKqm2lxjdla0L9pS1jrXZnezhD/cSMYUvao0SisvDFNIjuUPiOjYU9BoGzE0Tn2osj2y3erKMLt9OTWd9iyL1WWgNsuVUn9evG7teYNjnk0wqLZTJjWZIRqarJCRHg4ThscxCcobjFzrzn/5YNFIyiCnYI6Cwy1w7HgHxJNfKiiI1HY6MjcVNt6+t8G4wGhxG+hHKrXMmRquKopSywsUYlHZhJzYtgPFjZbBAyLlda22iEajPa3D4Rl6vN0+1Gh1RZLIRhGAo5INm2fkxL0SrZSu0WvlPjtKr6pgBWQKGmFOU2Yi8SseWHFo7/E2aw5jmgSCLIGVO71Rml7E4PC6GJ2i4cd/TMul0vrebuYN6r8sWC49dFoBZar/vK9++u3v7foOpUNtj4OhqGwQPVss4v82Ovm938rbpuO4DGDtChXd7G1dsTyoQN7Uw7Ozb5mdn/B+KKyTVSzG34UblCc5igOnJ/hZmQ+PNxCswgVP5fvPD8Wvr9hTzTLpY/TK2gemZmQh+NgaUXj5eFtFwEzDwWCTj9+LUr6GfEqBckMigNMJJyEfAfIUvMw3NiV8hdPtNRxoMJ8fMD/zwX700cfgvedNTPvwyfnDbrIHq0VQEiVZCxiAcpzszmX7Co5Wtg+OidM1vHnNyCy5TGymA9fKa4ywp6iRrQHSYrbXmVaWdNjnkgmWjTEHJ2sePePIT8y9RORXS0Qdc/MT/7t8f90Tbo9PCu7gPJ16D09gfsQyiZd3eVxXThrw8vUT0x9nfq6g+Y7mJiVOSxFb8MEPJazeWwhkSGMr7bR/X2tzU0FMidfllQeiCE431nzXmpmQGb3pt9dmndsvANm1vwkUODr3fbxvwy+Dss6jRTXj+BFY//wF0B8OOGPJZvj5YCNwlDHLmDKCCBUkC2ULEqiIxBCnFcFXl3cDkMY6uP/rSviuKHAeyQXZKvjy9hGgj4yEjfuOwKzVneBq6AwkIxJ6R4QBT+HCzPQEzPcAnRagQ3BowJPCJbB+UQ5kZQ6AmupamPF2MRxt8QWc6EwT8XVFTSFc44SKGfABqoNvI3jcdv6gM/a16EgLjFy6G1xzpwH8vAeeSJNdMTE3/utOswe0qH2Myo3C2/+Zh7eeEMucTh9qFK6uUEuqIP5HI17EokDdLLLr0pkfNZR9T2csS0Us05XUbZRkxFKpOLOo3ji0xezK9IghyeXh9R0mhzw8TOlSycWdSpGoQcZxZYMTdIeVElGJSirxymQB+y7tNcrMj4tWs9INOo2MdcB3FqGnLAiBzknBTW/CMWhstYHV5Ye6BhMzl4mCY2F2eNLrTY5cs9MzpNnsSuDFXERrp12pVck9Bp3cpOChWaeUlCUb1IfkHHckyqC0O3FTRoaj9oprobXNBsm4Kcl0SP4RWlrkhDWZA+YC0h6GDo4CjUp85si3PvGEY5KnP+gfIR8Kf0rgRMjhrpQxLYmd9xEdoQS5vHffBAVttLQ62Xk0KqW43wIF+SGray3Q2uFic6RRS9hJhBx35sq+BDJUeFAaBL3C0laDUimJx/a6q6uMFdgtf4RBAcOHRLPvWZY35V9xv2/cSOgpqzSxSL30ZA30tzggC/Sw+lBjcXfF9FC2uRwFGhRymMlUxuyvPsaEFSoR8025XTyTVVR0vGwwK5/Nk+j3h0w7nH7UZM0wdJCh3+uHAmcqq61QgfOkxLaE4f7R62RdGl1ordBelgbPR+cCahq7Bs7yMGl2uiWuz9Q0ff80kDUbKpl05XZ7tX//tri09oLJCVBeBzdy7fDBw+f066GL3t8Hr/14hDxwoMRnuCxO4KjoHzFoJgVxEKeTwFdXJ8CQQWkMQFobEEC+KofvSAORUqkSFcweroOP5w0AQ1Qc1NbUwP3LS2DFXnMAiHRKIEc/82MwDooftltYYcS/T4+Gf1+eg+ATjfeth7kflsD2Ckegym8oE52cbnRmCf5sTF4C/Hy4iUmzW5ecC5OGxJwkvgQsXSeDZ1OLBXIf3gSts6YAHG+Emx1NS++4KPtBZFrIgJQspNVkdP1pyYOn0yD+iifwQbPRCedlIOKLNARi9oHKtj4WYEFMtdPoZMybvXf7giXMJAx82KE5obpnPB88VJL/U9rNd5m9uK4zo0PnYJBDnNpIG4s5WfEaOseETrQzoNpPfWAWTNIsgo7RUNUAvisQrnefT6iW2p+R13PSOSRn6GuXWYmHvyzCKRR40a+jwHtpX6htoeNv+WDkHtM8Tjl07X8+tveUP4NtPxU0uV76yHHwPxZlRvvJ34856u4M/z1t5YKRa8PzYvoHIDv3NgRRTAz1jaYBV6+uKLLNmqKAXcWwyOCE/y6edLIHDRnmsmUHYNCgCJg2bWDX5wfK2yErKYxJrdUNFpj30FoorDWBL0YLPpQaYnRiePOSaBZyyGyhEoD//NwMawoRBHQKgDA1BE5O4+GFaQa4ZnwK6MMN4EENpLG1EyoazdBo84INpQMtSgRJYTJIx3tHhuvZEZxNTa3w+tpj8MKGZvCRaUshDcUegxyBg2+xwqL5ObD0noknhTZy3Rj+Bx/sRSnUzs5FnjcvB9LSDNCCUjmN2uSntkLV1LGs9Eru3oN7n583bLyfAy85fimc81iTZfzHv1U+w85WAIEEEkig/3tEvC87Tlf40SOTF/ULQNb/UtX1N51KWFbTOfSeDZX77JdNl0FZPSzwNMPHD09lTP+pJb8wUwLlHVA89JDsKLjp5lGg0/UeLUQRHbc//jNsOVgPjgg1WCXik2EfgqG/OhWcdDg2q6tsA87lhKEJChiTroWB0UowGFRMnSR7bavFA0dRbT9Q54QSVG2ZXTVU+4VMHtheg90FOgS8u68fCXffMKLPQaup6YR77/0JXn75IigpaQGjyQlXXJ7LHJ8mm4tpHi0XTaFzZGFiednGZ68ecV7gfG0ED1lAkq1usw1evb/uOpFYgA+BBBLo/yZRRGdiuLLqqdtHvdsvANlb0HzSe4oO6DQ5Yxd8sHdv7TnjEsmvkbX3IPz67HkQjSDQ3m5jgLF8eSEr8JeeboCq451w3YLhgRyOU2h3WTvMXroNbCjJx5kcIPL6oEMtAzOFs5FtlGpohepShcIsKNQSr4XgMbehaqygUgCPGkxX7YyQk5nMIwgWSpcX9A4v6PBfKz6jBQHHi9rPG9fnwW3nZfRQoSmZZ8uW49DQYIZKdjwqB5GRKrjlltGgUknhi5+OwLXfVoB/7jkA2wvhepnt9cevHn4XOeMCEEgniimYSYQyw2vqz1wdNZChfsJswsHp7c2B+/FnXZQxMDS91FHqVqGQ6/O3fJ/+FQ4CkUSis7BHhMbkjHbrYBmYUOnz/qrcIhbKyIcyu/tod7D13Nm3TSw6uzb1ZxzPNA6kGYtFJ0xLZ2uG4IIRWXw/TF9ccFxCYxEyC/5l5hhRwH7PnPIUfotzR74GEsTYMbY0n8F8KOas537f6Yd8N5Pk6caarC+Bsi5nkZXNKi8ETLx/lslBLBJ1rZuzM4WeeZ2Fjl0IHOssYn3trX4e85rg5+dOSe6fCavkqLHXwVfioD74wc6PViijrocx2QDfboGnRxvgkRtGdV1HcfGvvLKdlU4eOjSG1R666KLBrH5UqIPH6k3w9DfF8Nn26sDAqGQgR+CJQoBIR0Zci8DiUEjBpVeAC79zUxw+NkBld53SeGCA41DIQOrxgRyZv9ziBJkRtQwcm5zB0bAHF2Ld/2vvSuCiLvP+b+6bYZjhPgeQS0BEVDDPLNM3297ItLus3bKtttK2LSu7djt3s9pds2uzzCyt1cpMzU3TCA9ATgGRG4Z7mIu5j/f5PQMkCIjt7vvu+/k83z7zMWDmP///8zy/+8LGgjTVwkGLpJ5YMRV+eXniiLkV2B69qaEf/r6rihIptipZumwKHQLld9M5Yd66vVCclAqQFA383Yd9H1wVf9mls6K/w4Azd5BA+/QusDu89NBjkLX2TLe/YGoCUsUALL4/LkZFmzJWn+0j92M5L1WWFgYJeaBU8mgrGRlZGxkRtvgcw8xy1J7xuVgD4qOjXo+WdEFBUceIsa/YzTN3WgSsvCye5rSbbR4w2z00zIZz3PGFRLFrfxVVFHijskMwuHjnqkxI0gaByeKkAW3MyhmdRcUdZH7YN6idPFu/yU7jJPXNeso0xucHHEiIDaQxC3yFquV0tgnNAPL+FJvA+8JZDDgLo5NYwnhtLCLsN449GwOJBZWfG69KpcIG8+tNxILt7LaAnpxDXJe65r7BYrWRe4ACbVqSmqYn48yUIKKUSCRCf2zHO6orAP2dhz4j8oIDBS2gI/fF511cXxu835hIFcRFBNJ1VClFdAb4ULxmLHpFpoDxHxwwhS+s66hu6gOTafx5Ib5B5jk9LRTchMDcTi9t9SLicyAzLYQGyLHTq78olPOzYhhDAhBjZaFqKS3GqyRKJdasJEUHQmF5J41TLciJpKFKVEq5hA5xxdKnqCEsREZjV1gAil1ox0u+GBKaeC6QJvF9mM58+EQD1arHu3f8DOqkOPM9MlQJaYnBoA6U0ime51bkcwaDCt3kXquJwtzVZ6Wde502xz+v9ZN7lclEMCM1jCqj2JFBqRDRTtyjlRbawYHWwHCoNwZ//nB3NXT2Dox5zmizUpEAImOCaIzSZ8PuvQOE/gntY481ztiLueVPy84XQmNLprE3xOl1w6v35K1eUap7b/WWPQesV82XPE7e+vqdX8Dnv54Bc2dEUUFx7725EBIih1dfPQpt7Q7YubOCztDAYUxCcsPJUUrYcn8ufPjgHHrd3YUt8NRHpfDc2kvgF7OifhJGZGNwEl9LswE+/64B9h5rpQvF9w6WdGDGEDnQa4klkT0tDCIiAyAiIoDO7BhCGdnY5z4ug8dWZsCMKeoRz4Npe7uIwNizpwbuuy8PSkp1sGCBFpYuTRphOT2+6Ud4vsoKcPVSgBPVMO+bgwf/9ujcq8jG2rFYBwkas4FOVXQPa0lYkaofcCZuPdn8er/dFdfcb0sbMd4Ye9MESqoiVdK69BDFegGXU40JhRGEoL6t6HisoL53ZavBlmlz+7iYpYLt0uODpKUxAeIjM2NVD3q8Q4mtPnqotZFKSCVMHM+W2+kkL/dwghkCK167LK5bqgYc9/T1ONO6rE4lNoDEw7hPZxpQhSuWXZIRepTLceEIV8JMnZTxoZT2eb2CapP9k2KdaXGf3aXEQ4l+0SAJ3x6jlJ4w2lz3Wyz2cnx2mYQcdqm/8A6ztjC9E2+1Akd9EibGH0yxRP5Ffh9aa3a81WF2pLWZ7FN8Q2nOg9lIMUpxvUoiaIjxwQOE4KuHGSF5Xhyck5qoARFhLJiC2dFlGdaYsS22gGgQp7vNT3ynM93RMeDUDhcjkmsHCHi2eLXsB/JltcYB91qyfy4MkTV3GqGDCBB8PpfPF6YDzmudZntUg96aZ3V5uCgEwpXivnC5uCLJw7lN5OO26InQ0ZuMtMoZBVws2Qfe4HMg4+MMuU+JIEZLvt3hebnUaF/YYXZOMzndtHUMPQtqaadWLat3efzleih7CDGLdAZbgs7kCMSagUv53B2ZSepVWOBltNrBYLHRs4bPHBWioGuL+4k/dxPm0awzDqWlDtI1B1qtjtfO9NvmdlucGQaHW0jdq2Q9U8MVZyMCpZXkXHH6DTb5kUN1ceR7o+Vifmt6WEDB5Skhr5J1LVMGiSE0RDpIPx6iKDrAYHT46xIuYGmjRaFRSYjSI6DCDRk6usiJQA3cfrxlU3m74apcrfr9zFjVnvjQYPuRmt6ISp3xlroeS+7SjPCPvj/Tc/tdixLvzJsS/Jl9uGbI32MO06updXYOczfi+XP9pJz4FS1PQqXJsbnP6kpsNdrihgsxUDkj/8YGSWsDxYIzU6Tye8hl26u7rHC6s4kK4shgOVyRE01TqftMNqII+SeqIq+ICJaANlwG5S2Gazceav8M9yFIyndGBUorzAMOkz+JA3xkDwJ0DncOniWlWOBQcDmFRDmgRC4XCzgcPje8vm8gBaeJBsuElmlTQxMJy+zCERUm8qK1QuRZsREoCpQwjYRmyQ0nKlClBXitDs+bhV0DS1rN9lhqLXMH+w3yuL7kYFlBtFhYE+Py/Mbt8tgiohSQnKqB4jO9K3482X6n3eMNbTU7MsmZ5+F1owMlOrVEcII86jWTskBqz+gvaG6KiZay4d3jT27ROZ+FFQsB56aH/lAEu9bNgbzpkfR9A0SjePedIrjjzhxQKETDn3/7rRPQ2KSHlddlgJ1oEnlzYi8okW967Uf4+B/1NKtrpBRwwxdPLIRfzIwa83PYXLC8vIOO3sVeVvh9KGD6+61gJdrwK68coRuSlKSBtNRgmDtPO/zZDZsL4bkTZC3yFwD0GSFgz9HerXflLM7LiizHDR1y/QxNOnSfU+CFa4QWyO5/NEBOZih+h+rGvxY04hxtwkh8b98+c3qgRFCGbaCjQxV0c6Mj5VSrPFTURrOHIoMk8PKemi8NdlfUG7fMyG4lmhoWQuVkhtPhWWOZ3mjreBw28ODUxXNUCSSuDmIdtemJlhepgN2luif2lunW8fg8d8+AQ4P55/m5sdtfWZ1zo7+DsN8EFkoE9JqHjzZAaJAMDDZX5h1vHytbvSDhkRU5Ua9UEmspd1ooZQzuUaNAzQMuYo34rbHRmhBnsJPN/h8bqfWiVIg1t75V2GCwORUiHtfz1JVpGYQpVKNgWDonyt+eflRKDBYJo0czmFhtVJM65++YUfVdSRu1qhIiA9S3v3Ospsfq1GAO8cpZMRt/fVnSWjPRXiUywTlrBMNFp+gRdRDtO0Ijhdf2VP/pQEXHyi1358WZLQ5PZaMephPNMFBxfjdfj8ff8FMb6VdkRtwTOWe7yRnu7LVAKFmvzUcbDpS0Gi5HAbJqVuwLqy/RrlcSqxvTZ1GMVNfrqWKSGq+Gpz4r21/Vakh/7uqpcYRpunwj5iD4LRSsuscWJJi6KRgq3j3XFU1+d7S4jaaXz0gNgd9tP/X5gVJdPq7JkzdlPbMuf+rTBSc74Sg5f3FEyZsao4TSdsN1D3506lPyXJwotbRr92OXTgtSirvc5/RsGrJEsCMxDlnzDlqUaMmgkoZuYd45KaZDQKb/fXX3qmd2ln6SlRJa9N5deTO7CF32YeU0eX6cbphBlIRpRPFbs7nw6wMl7f/14s0zrpwRr947VuNMmvU32GkBG4oGBUhGrD/SpMnigL9/dxZS41TQZ3ZMeWRXxWm7y80PkAgtr12flaCSCbuxDiohOsjfY2+UZYL763f1eGF0kxYpYeQfFTa//HVp2wN/Xzs/VSLgNZwiitOe4020D941c7Rg8/iyH95VVuwi5zI9Lqj6+z8syfyuqN39yoclkEn2OY9YfrMzwuBvh+ufffWLqiefuTbz0pQIxSGHe+TwPSwMxLqtPMJbJCLe8NoOZUvuOFBH1lwAi4lC/vi2ki2fFzbfhp0LlEJ+/59vnJ6tDQtoGnKHBofJaRfnhkYDnSUSGSYX5r98qHpZVsT7+TlRvz9+uptY8g54/uE5k7NAfLyJG8Lh1g0QreWJu/Kee9zpfu7lj48//06787GulUthTq0dBK9/AS9cGgXrbp0By5ZNoZ18hwTInj3VICQPjHM0Pvu8klgoJvj24Fk6X0QbFwRZ08Op9TIa24i1su3BkQ/Q2WaE5hYDpE7RjGkCGshBfOmlIxCvVcFXX9XA1KkhNLZxzz25EBQkJS9sU3/ViM+1dZjgLmI5feMNAFg6i/ymHTSffNO/8dqp117+xi8OYet6bIXAg5/WCAm+rKYHPibPxuf+VMRE/a1YodxuRCvB63V7sUGYkhCTNzxU6plCrKW0pCB/3RCfA98caoYawjSQ2HBj68k+kLXrG7DaAz/dW0Wb3qGGUYvTHkfKDXqgE2PV5BVEq2LHmYcJCiIQ9Cacwggu04DLsGl1pvbbmp7PdxY05f+9uO2GI6e7ln5w39xcbXjAGRydazZZ4ctv66gG1sg3gtXlNqGmmxIeUK0gdn5WSggRlB5iBVjOP1zkfUjob5N1ae0ZGFGENhTnoZ1+T9J+ax7yHdjUCDtWej472ugTcGgLCzhS3TU8Ee7c/cUeVLcTaxErCsZyY2D9hr+NC6fvL7fOmL7m/aLqfnDJd5xoeSglIqB0SVbkh+hvH7ofu9M3wueNhYPbjzTcub2wae32B+ZFyuRCD04DzBILqIXp8fpgVJtJqg3XE8b3Q0nHmDEhvxDEmCK6PbmWkczJB82EHlBDV6slNHsxTCMDL8cLj16dds1rX1ZvUaulMVHBsvrxfPOoDWNrlC3kvJ/XHRbdUwK/i+MAsfobeokJg5aZ2zvMgLIyNZCSpILTNX3QTwRsarhy5+XpYSv2lelWtvVZQ9e+d3LbxtuyL8O2IGMBPb6odBQTenhrd9WEM9KxVKDJ5sxHF3ZTt2VKZX1PnELEbzIQ7R5nCyXFBIJKIaCuyA356Vd2G+2VTo9XOpRTMxb89+WDg4XNYDSf32hwKJZTaOjEs+nG1lXUOOFz3YlxKl+QQgiJWtVgByTfiFiE3mSncz94As4I+h/eW3+dhfzNX+Uujw0PaCDWJMwkwgBrd5QyET1jRr11xGcsNhcHq8cXzFgOtYSB28matxFauTo7cgPX57P1m+1am1V8yD1GZf8AURIPHGmBeTMjiOIgGqYBPGMi9PQQgWQgvPfZG6ffPiNes3f99pJPjRyP6rZ3TzS+tHLaf89LC/3C6vDQCnobUfRUcjF+94zsdV8Wbbpj1rLFmeH7kH4XTY+Azw+N3Y2E/8/46WirCZsLbliUuH5R98D6wvKiX71Xq3/NujBH+nBYKDz8dDHEtzbD67dkwvJQf3rv0Phbo9EO9YRZrkL/eaIaNr15HMorOiE3NxrefvsEpKRoYP78eHqwd++qooICp37dc89sCCeMt7a2B/74x6MwJy8WTpbooKysA5KTNXQ2R8GPLfT/ES+9tBSef/4QrLl7lr91MdG0a4lWMGNG5E+bSLSSP20vhWePdoB3wQyAyxcDpiynbP3i5NolyTfJ8zPqUokWhLMeRMKRFhAKj9Lqbtj6xWl/hbJv5CyOIT/seDEw73DlsT+ne6iilMMZGdGmpjrnXCZ0vnRoajfQ++NPMO/73I+S++W+u6ea98q9l1y7PDvyv375ZuGeXrtbdeXz/6i9Z0nSC4+uyFyPbofFc2Phm8MNoxkhx3NObcVYBI1WRysR8o2d5uEmcecHCTkTBLhhuK5jrF48fYSg39tbA4/elAVSKX/CgLY2QtH2xm3Zi3757onjDiLlX/i6eku0WnYmNVp5jGqz1CePsSj+UDt+qG4zznhlb/W7m++cvTQtUqmzDQobBbFKxvomVB4KyjtB1zMwHFC92CAvCgbsE4Wa+1tH6nekaOTbp2hku8JC5db7rkheGRenpGOkx3pW/E4D+ezn20rpd3PG4PFDw4r4HM6Y94dWwymioJxu6ocQpRiM6A4z2EPp4SP3FiEXleh0Fpho+BBeNlQhhud/NXvCYD+OZ/2qpO3Qn/aeXmngcpTI2LQaac01mRG/nZko2YPtetDCRVm5OCcS3rxzVjr2KsPCubFqc/2jo7nw9fdN0E0sdaTNnzMXZSxlBPcF26eETw0F6WC8a6z9I5bnr9G9ikWziAZizYiJVMXPj9d6CC+F+6KNUtB/seEhKiI3Lkp4wev20ULHidYaY0lefz8UGKwdh7kzIobPKLZUXTk/Zsf0hMDyG18vONnvccof2VG2+9lr0m9enh21zex00z5in3x/ds1fDpx548CGJdHhammbBYUxxlqJYLl6Yfy/XoCc+xDol52RFPJOapTqHYnIpPrky7JX97sEtzcszIOrHCqAV6pAUlkHq9NVsHZlJiTEquDxx38qSnzuucthwOKk3blwQVB4DJmdQUQbKylph5gYFRUeiOTkYGrFJCQEQVl5B6C2jO6pisou2LDhUmpqVhPTC4e+rF9/fvHjgYIm+P2OCjjqJJbRnAyirk4DyJBB0OHj+puS1b/NSQ75mzd5KjUPrY6xiQVNyGOlOvh0by09rP/fMMgT4MVtJfDimkv2Vr12De/mN44ePlHXM//NQ3WP7TjWvObz3y3IJlZSU5/BCseLO+A/qaCFzq0gpnVheRfkEMXhQjPig8WiomeuSr/isd0V37rAx1m7/dSh9+/KnRqhkVJt0U0+7xgkpu5+W9h975888dDSlDVxQbL91USBmbhTLIcqU11620UHyGm8xOMJMNpdUQark9tvdYXtq+p4uKC+77rY2ZLtTqcXzjT006pjGREeFqKlSkX8EcwZLQ+TxQovv19E2+zzLrJ4lWjJzu7OATh6XAetfQOgUIpo95n3Cpp2ltT3LpBLhbbHr8tcfeuS+E+tF5h5ToO6hB4kROu+UCrQ1AzN5pnx6h3vHqrb9I8z3asa9baUV482fAWHzvr/Hhbww+XJIU/Vt5m+M9sckBkYhoGEMZk8rkEXUUxLiPUj4HP/5ecN99gy2PlXIhl/hsxQcL24rIu83zXpOSF4OdFg52jrJOfK43d199qHOxGPBzMxtFQiYc2h9ZcpHvyoeP/h051LNnxW/lF9z0Dey3fk3Ld+a8lfy8/2ZR/ZsETo9HppMtT5z/RvEiAjQxJekMuE/SvytKvzvb7VXm+X5uC3px4+aPKuMabGKzclxcKmErJS7xeDuLsHrggVwtJ0DVwyNQwykjTUB3DrrdkjrrlwYQJ9jQYGvnET5y/Qjnkvs3NjiKVjo+bsESJYdlfrocJFLIjEaH8r+Jk5AFWNoP2u8NSyOOXGtBjVVnV+Gm1pgxs4ESPAjS4obofP9p/5fyk8hjVOnHbWbYF3vqyAB6/P8u387fwFWw7WrXlqZ/mbfQ63auGTBxqfujbzgbuXJL/R1WWF6ub+/6j7x4NdSbTljAQ1eC5ApxaiZGRqVQfvWZhw76aDdX81+1zitdtKvidCJF0uFRCj2A02qwfbnAvXbSs9fnV21Kb8WVFv4bxoqZh7QWHW2eukbij+xdb9cGh2Gv/Hsg5Jc98ANzpCwRcLeNZzue/gYCuoa9DTLMZleQnnadcYy7t6fiJ8cqDGX+U/yRQp7Da89XDD6qOV3XOtdpegvd82paHDFBsbLO+dm6D+w1u3zfwF0kJSoorQt4+2O7mAPCQMyAUdnc5xmRqdG0IELs4bkvH4+l9fNuX6/GmR1/s4vvDjLYZ7jtT2rGrqG0iq6jbPreox/+O1Q3UoTH78a7TqtnC17CxN8BhtzRNtCJsKrrlhGrzzSTml4X91FwhcUzqqArNSxxhEhsIFhVv5oPC42O8fasHu8/FoDO5C6caYfagM5F9Uavi2dXOv+MtXNb97cXflix8ca773g+/r7711UeKmHY8tzsM58BcjFPj/TuL2ty3m916RHf3oEp/vUZx70NxVl7y/VLfmpMl9c19EqOaL8Ej4QkgERwM5lIU6gNYegB49KJ02iBNxIFElgmhigYQS0xUzD1TEfMVmbbhJ+LB6kwP0xGzvICZro94OZ00uaPdwwSlXAESQ68aEAASEAqjIz5EdwGtsB21pRXluR8OmJdOjPnZlKsy6MB4EB4lp+2P/9L2JCQQDtiWnu+Dzf0J4cM55Df+MeclDr+GfYdQ7L3TViwf62r8nlpQ2IhCumB0HV+fGb16UHrn9l5sKjp3pNqc88/eK1z8tbL7//XvnZPcYbc6fOy713wF01zV2moAj4MDUaDVMZiTnOm3GpgG3N+2DQ2fvbekbiFr3UfE3f8jPmIPKCwa3X/qyarM2WHbmN0tT7qezHy4QE8RYB3YS7u13XLTmP5SRF6QQ65fnxdbp+q0gkvBhWU7Uj3qrc6rT7ZHCoGvrkhmRlPGiNTQWsLuyNkIJtyxLg637TvtroSYhRHD083WXxG575Lr0pzHNu7ffDtkpGnhmZ/nfthU0bdx2smVjdozqx49y5i2TiIQm12At1hATG5riN9z02ke754LTMX56NhWIxLI/crId4jQKGvTGqcoapahjeVbEhhWzYzbYrW6obOxL+Lqm6/XiFsOVVX0DcxY/823dxhuycpMiAo473OPFYTigjVFCRU3vv6WNEBUiFjt9eIVcPCxEaEo1+a+8qpd2u/253+2fE8IHuYRYDoS/+XycMRUnTD1vazVdtJsOz2iqRvFBoEK8vn/AESCVCd13L03+i0TGB57w4u6Z/79F6BgMRb+pUi6uvTwz8qGrxYKHcJHjI11QfrYyts9onXVab1tcZ3bn9nP5iUa5XFamCoAypQLTG8hTk5ebnDALf7DyzucvKkRnqMAFoHSQ9xClTWAGvsEEIRZDd0S9oWyase37pFD5YYVYVOkN8BoFM0OBwwul2gG2GLE7nBclvTEIWdukh8KSdkjRqibnKuLSOgMfv1VPK4wwa6/gVIeoucmAA2+GDwS2is7ODBs+kJh6e6zHIuULuLa52TFgn4A5cvx8iA6N8cLEPYaGYhY0iO32D53iEerduq+WyFs5JMcEkiXnGr9af2nqX7+peeKNvdXP1fRaEuc8dcB0d17sA1IR3/ifMqeUBr8JIX39QzNoloj8bqwL3JueY4M1ixLv6zHYNHvL2leVNurzPjvV9saG66b95s9f164rbe1f+vED82LcODlxEuNpMQGio81GM6b4/4TrBAOlGDy2WJxQ12qBIC5/JtaZyAMlkBmp8DcobOqfU95p/k0+H653jhFY9fg8dIDQ8rla2H24nsblJse0/PGsjDQNjb+YzS548dbsO2Ynqg8+vPXUthKdcU7mQ3v0f7x++lWXTg//BpUtWmxIzvbBwiaaWUZjb4O3ND05jNZOeMYL9qP70eKIqe63br1mQfyVRBGz4PfjNbDGAwUmKogJ0cr6jXkxy602d+Adbx+r1nWbw+r0A8vz58cdx55zYwsQLo3lYOr4v839S3hQL1FaC461jXAlcgebkXL/ySZfGJ/CJpgyqRSGU+1GuOs4UFdvpHVYFztKl+sf8sUZtf8/64b5/1eEjxYEahBIBDKpqDk8SNocE+7aOdvggJS4QGKpWEDI80CIykFMUzvVrpJig4RHT7QJ95e289Vyke+6hYlORYDA2W+0eyRyPvQI7dABbohLDadEgHEZtCzQ/Ma6BtOAG3w8Lwh/5nBy9LFiodpZIkBQw5k8k6NFdCZNpai91+IId9ndnD67e8nSBHUx3iNO7qtt6Ae1igf9RLPBlsxITC63V1bRaVp6c27sIxg45U8UuAR/nn+EmAejEkiGmVxTqxl03VaaXWS2OH0BSpHskVVZAsJkPMi8MDhJ59sLeNTKc5FrPPDf6b+/cmbUp9e/euREv90duPlY8+sYOCHPc0EnLT4DZn0tSA+nWUujhRgWZpU29EL/gHOouYBvqC4ec+MxURLrBHLi1XRWx3hBaepzRyHt8YBKJQa3xzcpwfPCzdk36K2u6GN1PXM++LH5fr3RIcO4w4srsrL15GFdbu/kRBimrHK4dFDYREYgLsGZFqO/uSNn5C5h/12nB+nBSwVip8kKl2aE0FRhTaCIdgMmGrvk+a+qdqVEBhwxknNiG+c8DNXC5C9KGGGB4H4oA4QQHRFAaIsDT+8o5zYUt/ubHnK5Pv/IZQ+06gboex3EgliUEfHx9t9IK1ZvLiyy+UD44NaivTc0at96akXmGju519MNemjSmamL71xNuKhaB9NTwiEYOz+MIUT8Tbk5rvIu87yN+2p2vnxj9jIcVNbcYaIzy2PDlUSY8iFQKaY6YqBMaIjRyBp0PZawpOCAo7oe27jPTycSEutlemrwCCuAOxhbqCa0hveE+3uOBwBrNHw478RI1h7nqkxkvaHAxaLeBG3geRmCowUlBvSxs7XQHw33nXMefHivqCjiLJYWso6TtWBxqYOUUpiSqJmUBYLrYLY46HBAJTkbRPCPkBj02QmtYSEwvoc3xrNjmcF/jACZiBGicEFXkpc8Iqbl+QZb6HP5PCe+OHjQyQvH3aI1gumtONvc7vYToP+z/3oVmVYTk3XF1LyLBfo13wiVXX/j6z+U9g445JsPn31ewefVxASKd6HvmgoAzIzBgcQoVMUC8dN7K364PDXk09WLEt5CV4pqAmYoFOHkvvFH16Kr7WybkaynG4KDJSlFncZ1HX1WdXmrYXWcXPSmgVguSVEq8AoJETcaaF54aJiU7oU2Ull3elO+6qkPi195+9szD8MktGw8sAYU2uSVHqMaO+hMtNjgABHNf28xWOc9/Gmpxu/69ApXLU6YnxYWUHviTC8EESsAM4Iu1O69oV5PJwpGRgZMqjW8k8Pxbbwle8Ev3z5+qqrdkP5VRccdW9bkzc2KCzprc3kmJYSwutvt9E3YBmaY2MiaFJ3phkgsppMI1J1m+8zBFgZQ3KRfdWVG2Ban03MW3RZYxxJMhAem9Hb1WUM+/O7s/V+e7nwCOcdMbdDplh4r4Mz40bSD6aZBxGrBCnLxKNcbaqo/FOtAU29A61ne1D2QRYtfyO/3nWybHyMScpp7B3x2qxMSI5S0yj4rLQzS40Mqjr+wXH7bX3744VRj36ztJ1ru/qKk/fb75iWsTAyVf4kKyfmGDgcqz3RCFlHmAhXj752Izx2o1hnzcjfs8/0iI3x9/syoF2Rkv3FUq83upP31Og2OuO0nmz8qquud8+c1s29aOS/ugMXuGvPM4fe0tJmJ4sEBbVTAecy8izBzpUoI07RBUN1tWWQ9rZMgDzFanIG7DjfOjQ+U7D5+theiiaDFrKnxVAikUTxrGURIDWUKjkd3zd0WqGzqg3mEb3RZHZe5MCkHewx2muO/+r4pkzCw4qK6HkgMDwDOJN3QKPzmzYqFsNCA4cFwF3L1YvzqRE0XZMQGwdm+gVyj3RWAtGx1uPkffnNmybwEdXVBdTfEqMUQFHB+jdOl88+v1xuzkLCGmEaT9QVisaCh30a0EBNdSNSmcWIYTUcjTA9T2ryD+f4o+ZyDGjfmKWPZfALZ5NauAQggmrOJHAo9sUCSiHaPqZ94vZBAyfDgmozkYCAWCOw71Q7EAoFVixJp+iZO2sK0yx6jDbrIvWiJ9kIzarCac4QF4qAl/MjMscgvXC2lqbl9/Q4IGYyBBKvENAYyFESXk/vHLCycYYBZVyajfVyz/ELMBtfheHknzhzQVOlM+ccaeq9sNdinEg1GTLRxpAivmM/1kZdlWlTg/stSQ1+emRbSF6gSjqtl4IGzEMsK3ScT+a2wwOpgmS5/f6luGdGcrHwsOfffE9fu9kg1MpFhRU70BlTkh0bHI/NKiAkcbi+Go2EPnmqf//TWosd/tyLrSSIYTozlh+YMamjl9T1kHV3jmvNury+4qNX4LNFkuUIe14aFwj+5YoBHzowUVYW8mMAXFWL+2cm4enFvYomGPSUuaFJ9jJBJdBlskQ9+UPTVdbNj/rQoPWybjQ4Z4lxQ1aEzSQAm7c1DAfLZseZHazvMicTSswt4HDtnpOIkIGsiHlSW6dRhTJQjdOCk1fJAW8dwVlwStyMnSXPcMYpxoIBA7b2cMIHRaeD07+R3J1oMT+pM9hjy3A7+yO/nuDw+CVkz4RS17JBWJd2GyhjS1dK8eGJhIO26YMeRusXFzf3LfP7745H3yGU8XoGQw9niG4PJZcarYNnsaOqvH+1GIbQXtK+o7fYbF015ra5B761p7Z9S3Gp4qExnXGx2uINtLq84QMw3poUpji1MCnkjXiU9lJcbRq0oz3n1N+R6JidU1xjPKwA8d/37LI64nUWtT7i8Pg85c1YcJvnTmfPxcQ3QQxEiFjxN7rHDN6670QuhQVK4FbtWcCdQ3Mj6EcE3+539tb/i8rlu/E5s+zW8Rrjnbq9EIRZYktXSx7EeczLnyU2sbRwHnByrgslYynjOdXpr5Ku7K5/CeTKEB9p4/hqYIYsG91JKlFheblTQC3IRr340va1bkz05AcLAwMDAwHBBTwNbAgYGBgYGJkAYGBgYGJgAYWBgYGBgAoSBgYGBgQkQBgYGBgYGJkAYGBgYGJgAYWBgYGBgAoSBgYGBgQkQBgYGBgYmQBgYGBgYGJgAYWBgYGBgAoSBgYGBgQkQBgYGBgYmQBgYGBgYmABhYGBgYGBgAoSBgYGBgQkQBgYGBgYmQBgYGBgYmABhYGBgYGAChIGBgYGBgQkQBgYGBgYmQBgYGBgYmABhYGBgYGAChIGBgYGBCRAGBgYGBgYmQBgYGBgYmABhYGBgYPhPwv8AaHNw7/Li9wAAAAAASUVORK5CYII="
 
 # ==============================================================
 # Global State
 # ==============================================================
 current_user = None
+db_worker = None
+
+
+# ------------------ STARTUP TIMING ------------------
+# `inventory_app.py --startup-report` (or INVENTORY_STARTUP_REPORT=1) shows
+# how long each launch phase took once the main window is up. Times run
+# from the first import, so a one-file build's unpacking isn't included,
+# and the time spent typing the password is left out of the total.
+STARTUP_REPORT = "--startup-report" in sys.argv or bool(os.environ.get("INVENTORY_STARTUP_REPORT"))
+LOGIN_WAIT = "waiting for login"
+startup_marks = [("start", STARTUP_T0)]
+
+
+def startup_mark(phase):
+    startup_marks.append((phase, time.perf_counter()))
+
+
+def startup_report():
+    lines, total = [], 0.0
+    for (_, prev), (phase, t) in zip(startup_marks, startup_marks[1:]):
+        lines.append(f"{phase:<22}{(t - prev) * 1000:8.0f} ms")
+        if phase != LOGIN_WAIT:
+            total += t - prev
+    lines.append(f"{'total':<22}{total * 1000:8.0f} ms")
+    return "\n".join(lines)
+
+
+# ------------------ SERVER MODE ------------------
+# `inventory_app.py --server http://storepc:8765` (or INVENTORY_SERVER=...)
+# runs as a thin client of inventory_server, which owns the database,
+# instead of opening the file over the share.
+def server_url():
+    if "--server" in sys.argv[1:-1]:
+        return sys.argv[sys.argv.index("--server") + 1]
+    return os.environ.get("INVENTORY_SERVER")
+
+
+def show_startup_report():
+    if sys.stderr:      # None in the --windowed build
+        print(startup_report(), file=sys.stderr)
+    else:
+        messagebox.showinfo("Startup timing", startup_report())
 
 
 # helper for tooltip
@@ -45,65 +102,6 @@ class ToolTip:
             self.tip.destroy()
             self.tip = None
 
-# ------------------ DB INIT ------------------
-def init_db():
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-
-    # categories
-    c.execute("""CREATE TABLE IF NOT EXISTS categories (
-        category_id INTEGER PRIMARY KEY AUTOINCREMENT,
-        category_name TEXT UNIQUE NOT NULL
-    )""")
-
-    # inventory
-    c.execute("""CREATE TABLE IF NOT EXISTS inventory (
-        item_id INTEGER PRIMARY KEY AUTOINCREMENT,
-        item_name TEXT NOT NULL,
-        category TEXT NOT NULL,
-        quantity INTEGER NOT NULL,
-        min_stock INTEGER NOT NULL,
-        UNIQUE(item_name, category)
-    )""")
-
-    # transactions
-    c.execute("""CREATE TABLE IF NOT EXISTS transactions (
-        txn_id INTEGER PRIMARY KEY AUTOINCREMENT,
-        item_id INTEGER,
-        item_name TEXT,
-        category TEXT,
-        quantity INTEGER,
-        txn_type TEXT,
-        ts TIMESTAMP DEFAULT (datetime('now', '+5 hours', '30 minutes')),
-        txn_date DATE,
-        user_name TEXT,
-        bill_no TEXT,
-        rate REAL,
-        gst REAL,
-        destination TEXT,
-        performed_by TEXT
-    )""")
-
-    # users
-    c.execute("""CREATE TABLE IF NOT EXISTS users (
-        user_id INTEGER PRIMARY KEY AUTOINCREMENT,
-        username TEXT UNIQUE NOT NULL,
-        password TEXT NOT NULL,
-        role TEXT CHECK(role IN ('super_admin','admin','user')) NOT NULL
-    )""")
-
-    # Ensure at least 1 admin exists
-    c.execute("SELECT * FROM users WHERE role='super_admin'")
-    if not c.fetchone():
-        # default admin: admin/admin
-        default_pass = hashlib.sha256("rk@rishi#05".encode()).hexdigest()
-        c.execute("INSERT INTO users (username, password, role) VALUES (?, ?, ?)", 
-                ("rishi_kumar", default_pass, "super_admin"))
-
-    conn.commit()
-    conn.close()
-
-
 # ==============================================================
 # Login Window
 # ==============================================================
@@ -122,16 +120,12 @@ def login_window(root):
 
     def do_login():
         global current_user
-        username = username_entry.get()
-        password = password_entry.get()
-        password = hashlib.sha256(password.encode()).hexdigest()
-        conn = sqlite3.connect("inventory.db")
-        c = conn.cursor()
-        c.execute("SELECT username, role FROM users WHERE username=? AND password=?", (username, password))
-        row = c.fetchone()
-        conn.close()
-        if row:
-            current_user = {"username": row[0], "role": row[1]}
+        try:
+            current_user = inventory_core.authenticate(username_entry.get(), password_entry.get())
+        except ConnectionError as e:
+            messagebox.showerror("Server", str(e))
+            return
+        if current_user:
             login.destroy()
         else:
             messagebox.showerror("Error", "Invalid credentials")
@@ -140,12 +134,15 @@ def login_window(root):
 
     login.transient(root)
     login.grab_set()
+    login.after_idle(lambda: startup_mark("login window shown"))
     root.wait_window(login)
+    startup_mark(LOGIN_WAIT)
 
 
 # ==============================================================
 # User Management (Admin Only)
 # ==============================================================
+@inventory_diag.timed("open Manage Users")
 def manage_users():
     top = tk.Toplevel(root)
     top.title("User Management")
@@ -163,17 +160,7 @@ def manage_users():
         tree.heading(col, text=col.capitalize())
     tree.pack(fill="both", expand=True)
 
-    conn = sqlite3.connect("inventory.db")
-    c = conn.cursor()
-    c.execute("""
-        SELECT u.username, u.role, MAX(t.ts) as last_txn
-        FROM users u
-        LEFT JOIN transactions t ON u.username = t.performed_by
-        GROUP BY u.username, u.role
-        ORDER BY last_txn DESC
-    """)
-    rows = c.fetchall()
-    conn.close()
+    rows = db.query(db.LAST_ACTIVITY_SQL)
 
     for row in rows:
         tree.insert("", "end", values=row)
@@ -197,17 +184,15 @@ def add_user_window(parent):
     tk.OptionMenu(win, role_var, "admin", "user").pack()
 
     def save_user():
-        conn = sqlite3.connect("inventory.db")
-        c = conn.cursor()
         try:
-            password = hashlib.sha256(p_entry.get().encode()).hexdigest()
-            c.execute("INSERT INTO users (username, password, role) VALUES (?,?,?)", (u_entry.get(), password, role_var.get()))
-            conn.commit()
+            # a removed account's name can be taken again
+            inventory_core.create_user(current_user, u_entry.get(), p_entry.get(), role_var.get())
             messagebox.showinfo("Success", "User added")
             win.destroy()
         except sqlite3.IntegrityError:
             messagebox.showerror("Error", "Username already exists")
-        conn.close()
+        except (PermissionError, ValueError) as e:
+            messagebox.showerror("Error", str(e))
 
     tk.Button(win, text="Save", command=save_user).pack(pady=5)
 
@@ -246,11 +231,7 @@ def update_user_window(parent):
     def load_users():
         for r in tree.get_children():
             tree.delete(r)
-        conn = sqlite3.connect("inventory.db")
-        c = conn.cursor()
-        c.execute("SELECT username, role FROM users WHERE role !=? AND username!=?", ("super_admin", current_user["username"]))
-        rows = c.fetchall()
-        conn.close()
+        rows = db.query("SELECT username, role FROM users WHERE role !=? AND username!=? AND active=1", ("super_admin", current_user["username"]))
         for r in rows:
             tree.insert("", "end", values=r)
 
@@ -276,32 +257,19 @@ def update_user_window(parent):
             messagebox.showerror("Error", "No user selected")
             return
 
-        if username == "super_admin":
-            messagebox.showerror("Error", "You cannot alter the super_admin account")
-            return
-
         new_password = p_entry.get()
-        new_role = role_var.get()
-
-        conn = sqlite3.connect("inventory.db")
-        c = conn.cursor()
-
-        if new_password.strip():  # if password given
-            password = hashlib.sha256(new_password.encode()).hexdigest()
-            c.execute("UPDATE users SET password=?, role=? WHERE username=?", 
-                      (password, new_role, username))
-        else:  # only update role
-            c.execute("UPDATE users SET role=? WHERE username=?", 
-                      (new_role, username))
-
-        if c.rowcount:
-            conn.commit()
-            messagebox.showinfo("Success", f"User '{username}' updated")
-            load_users()
-        else:
+        try:
+            # the password only changes when one is given
+            inventory_core.update_user(current_user, username, role_var.get(),
+                                       new_password if new_password.strip() else None)
+        except LookupError:
             messagebox.showerror("Error", "User not found")
-
-        conn.close()
+            return
+        except (PermissionError, ValueError) as e:
+            messagebox.showerror("Error", str(e))
+            return
+        messagebox.showinfo("Success", f"User '{username}' updated")
+        load_users()
 
     tk.Button(form, text="Update User", command=reset).grid(row=3, column=0, columnspan=2, pady=10)
 
@@ -326,36 +294,13 @@ def delete_user_window(parent):
             messagebox.showerror("Error", "You can't delete your own account")
             return
 
-        conn = sqlite3.connect(DB_NAME)
-        c = conn.cursor()
-
-        admin_password = hashlib.sha256(p_entry.get().encode()).hexdigest()
-        # Verify admin’s own password
-        c.execute("SELECT username FROM users WHERE username=? AND password=?", 
-                  (current_user["username"], admin_password))
-        row = c.fetchone()
-        if row:
-            # Get role of user to be deleted
-            c.execute("SELECT role FROM users WHERE username=?", (u_entry.get(),))
-            user_role = c.fetchone()
-
-            if not user_role:
-                messagebox.showerror("Error", "User does not exist")
-                conn.close()
-                return
-
-            if user_role[0] == 'super_admin':
-                messagebox.showerror("Error", "You can't delete a super_admin account")
-                conn.close()
-                return
-
-            c.execute("DELETE FROM users WHERE username=?", (u_entry.get(),))
-            conn.commit()
-            messagebox.showinfo("Success", f"User '{u_entry.get()}' removed successfully")
-        else:
-            messagebox.showerror("Error", "Invalid admin password")
-        
-        conn.close()
+        # checked against the admin's own password, then the account's role
+        try:
+            inventory_core.deactivate_user(current_user, u_entry.get(), p_entry.get())
+        except (PermissionError, LookupError) as e:
+            messagebox.showerror("Error", str(e))
+            return
+        messagebox.showinfo("Success", f"User '{u_entry.get()}' removed successfully")
 
 
     tk.Button(win, text="Delete", command=delete).pack(pady=5)
@@ -375,25 +320,220 @@ def self_reset_password():
     new_entry.pack()
 
     def change():
-        conn = sqlite3.connect("inventory.db")
-        c = conn.cursor()
-        c.execute("SELECT password FROM users WHERE username=?", (current_user["username"],))
-        row = c.fetchone()
-        old_password = hashlib.sha256(old_entry.get().encode()).hexdigest()
-        if row and row[0] == old_password:
-            new_password = hashlib.sha256(new_entry.get().encode()).hexdigest()
-            c.execute("UPDATE users SET password=? WHERE username=?", (new_password, current_user["username"]))
-            conn.commit()
-            messagebox.showinfo("Success", "Password changed")
-            win.destroy()
-        else:
+        try:
+            inventory_core.change_password(current_user, old_entry.get(), new_entry.get())
+        except PermissionError:
             messagebox.showerror("Error", "Old password incorrect")
-        conn.close()
+            return
+        messagebox.showinfo("Success", "Password changed")
+        win.destroy()
 
     tk.Button(win, text="Change", command=change).pack(pady=5)
 
 
+# helper for slow work that must not block the Tk loop
+def run_in_background(widget, work, on_done):
+    """Run work() on a thread, then call on_done(result, error) on the Tk thread."""
+    result = {}
+
+    def target():
+        try:
+            result["value"] = work()
+        except Exception as e:
+            result["error"] = e
+
+    t = threading.Thread(target=target, daemon=True)
+    t.start()
+
+    def poll():
+        if not widget.winfo_exists():
+            return
+        if t.is_alive():
+            widget.after(50, poll)
+        else:
+            on_done(result.get("value"), result.get("error"))
+
+    widget.after(50, poll)
+
+
+# run work() on the DB worker; on_done(result) runs on the Tk thread, and
+# only if the window is still open. Requests with the same key supersede
+# each other, so a newer search cancels an older one still in flight.
+def db_call(win, work, on_done=None, key=None, op=None, on_error=None):
+    started = time.perf_counter()
+
+    def done(result, error):
+        if not win.winfo_exists():
+            return
+        if error:
+            if on_error and on_error(error):    # handled (e.g. stock changed)
+                return
+            if db.is_busy(error):
+                messagebox.showerror("Busy", "The database is busy with another PC's changes.\n"
+                                             "Nothing was saved; please try again.", parent=win)
+            else:
+                messagebox.showerror("Error", f"Database error:\n{error}", parent=win)
+            return
+        if on_done:
+            on_done(result)
+        if op:      # request to rows on screen: queueing, query and drawing
+            inventory_diag.record(op, time.perf_counter() - started)
+
+    return db_worker.submit(work, done, key=None if key is None else (str(win), key))
+
+
+# refresh a result list once typing pauses, not on every keystroke
+def search_as_you_type(entry, refresh, delay_ms=SEARCH_DEBOUNCE_MS):
+    pending = {"id": None}
+
+    def on_key(event):
+        if pending["id"]:
+            entry.after_cancel(pending["id"])
+        pending["id"] = entry.after(delay_ms, refresh)
+
+    entry.bind("<KeyRelease>", on_key)
+
+
+# re-run refresh() while the window is open whenever any write (another
+# PC's included) has moved the rows version: one tiny read per check
+def poll_changes(win, refresh, interval_ms=GRID_POLL_MS):
+    if not interval_ms:
+        return
+    seen = {}
+
+    def check():
+        if not win.winfo_exists():
+            return
+        db_call(win, lambda: db.query_one(db.ROWS_VERSION_SQL)[0], changed, key="poll")
+        win.after(interval_ms, check)
+
+    def changed(version):
+        if seen.setdefault("version", version) != version:
+            seen["version"] = version
+            refresh()
+
+    check()
+
+
+# yyyy-mm-dd date picker capped at today; tkcalendar (and babel behind
+# it) is imported on the first window that needs one, not at launch
+def date_entry(parent, width=12):
+    from tkcalendar import DateEntry
+    return DateEntry(parent, width=width, maxdate=datetime.today(), date_pattern="yyyy-mm-dd")
+
+
+# fill a combobox with suggestions (best first) and narrow them to the
+# typed prefix as the user types
+def suggest(combo, values):
+    combo.config(values=values)
+
+    def on_key(event):
+        typed = combo.get().strip().lower()
+        combo.config(values=[v for v in values if v.lower().startswith(typed)] if typed else values)
+
+    combo.bind("<KeyRelease>", on_key)
+
+
+# progress window for long background jobs (imports, exports)
+class ProgressDialog:
+    def __init__(self, parent, title, unit="rows"):
+        self.unit = unit
+        self.total = 0
+        self.done = 0
+        self.started = time.perf_counter()
+        self.cancel = threading.Event()
+
+        self.win = tk.Toplevel(parent)
+        self.win.title(title)
+        self.win.geometry("380x140")
+        self.win.transient(parent)
+        self.win.grab_set()
+        self.win.protocol("WM_DELETE_WINDOW", self.cancel.set)
+
+        self.bar = ttk.Progressbar(self.win, length=340, mode="determinate")
+        self.bar.pack(pady=(20, 5))
+        self.label = tk.Label(self.win, text="Starting...")
+        self.label.pack()
+        self.cancel_btn = tk.Button(self.win, text="Cancel", command=self.cancel.set)
+        self.cancel_btn.pack(pady=10)
+
+    # set_total/update are called from the worker thread; they only store
+    # numbers, the Tk widgets are refreshed from the main loop below
+    def set_total(self, total):
+        self.total = total
+
+    def update(self, done):
+        self.done = done
+
+    def _refresh(self):
+        if not self.win.winfo_exists():
+            return
+        if self.cancel.is_set():
+            self.label.config(text="Cancelling...")
+            self.cancel_btn.config(state="disabled")
+        elif self.done:
+            text = f"{self.done:,} / {self.total:,} {self.unit}" if self.total else f"{self.done:,} {self.unit}"
+            if self.total:
+                elapsed = time.perf_counter() - self.started
+                remaining = max(self.total - self.done, 0) * elapsed / self.done
+                text += f"  -  ETA {int(remaining // 60)}:{int(remaining % 60):02d}"
+            self.label.config(text=text)
+        self.bar.config(maximum=max(self.total, 1), value=min(self.done, self.total or 0))
+        self.win.after(200, self._refresh)
+
+    def run(self, work, on_done):
+        """Run work() in the background; on_done(result, error) after the dialog closes."""
+        def finished(result, error):
+            self.win.destroy()
+            on_done(result, error)
+
+        self._refresh()
+        run_in_background(self.win, work, finished)
+
+
+# save-as dialog + background streaming export of a query to CSV, or to an
+# .xlsx workbook with one sheet per year/month of the split_on date column
+def start_export(parent, title, sql, params, excel=False, split_on=None):
+    if excel:
+        filetypes = [("Excel files", "*.xlsx")]
+    else:
+        filetypes = [("CSV files", "*.csv"), ("Compressed CSV", "*.csv.gz")]
+    file_path = filedialog.asksaveasfilename(
+        parent=parent,
+        defaultextension=filetypes[0][1][1:],
+        filetypes=filetypes,
+        title=title
+    )
+    if not file_path:
+        return
+
+    per = "year"
+    if excel and split_on:
+        per = "month" if messagebox.askyesno(
+            "Excel export", "One sheet per month?\n(No = one sheet per year)", parent=parent) else "year"
+
+    dlg = ProgressDialog(parent, "Exporting")
+
+    def work():
+        dlg.set_total(inventory_export.count_rows(sql, params))
+        if excel:
+            return inventory_export.export_xlsx(sql, params, file_path, split_on=split_on, per=per,
+                                                progress=dlg.update, cancel=dlg.cancel)
+        return inventory_export.export_csv(sql, params, file_path, progress=dlg.update, cancel=dlg.cancel)
+
+    def done(rows, error):
+        if isinstance(error, inventory_export.ExportCancelled):
+            messagebox.showinfo("Cancelled", "Export cancelled", parent=parent)
+        elif error:
+            messagebox.showerror("Error", f"Failed to export:\n{error}", parent=parent)
+        else:
+            messagebox.showinfo("Success", f"{rows} rows exported to {file_path}", parent=parent)
+
+    dlg.run(work, done)
+
+
 # ------------------ CATEGORY MGMT ------------------
+@inventory_diag.timed("open Manage Categories")
 def manage_categories():
     win = tk.Toplevel(root)
     win.title("Manage Categories")
@@ -414,11 +554,7 @@ def manage_categories():
             messagebox.showerror("Error", "Enter category name")
             return
         try:
-            conn = sqlite3.connect(DB_NAME)
-            c = conn.cursor()
-            c.execute("INSERT INTO categories (category_name) VALUES (?)", (name,))
-            conn.commit()
-            conn.close()
+            inventory_core.add_category(name)
             messagebox.showinfo("Success", "Category added")
             load_categories()
         except sqlite3.IntegrityError:
@@ -436,11 +572,7 @@ def manage_categories():
     def load_categories():
         for r in tree.get_children():
             tree.delete(r)
-        conn = sqlite3.connect(DB_NAME)
-        c = conn.cursor()
-        c.execute("SELECT * FROM categories")
-        rows = c.fetchall()
-        conn.close()
+        rows = db.query("SELECT * FROM categories")
         for r in rows:
             tree.insert("", "end", values=r)
 
@@ -450,19 +582,21 @@ def manage_categories():
             messagebox.showerror("Error", "Select a category to delete")
             return
         cat_id, cat_name = tree.item(selected[0], "values")
-        conn = sqlite3.connect(DB_NAME)
-        c = conn.cursor()
-        c.execute("DELETE FROM categories WHERE category_id=?", (cat_id,))
-        conn.commit()
-        conn.close()
+        try:
+            inventory_core.delete_category(cat_id)
+        except sqlite3.IntegrityError:
+            messagebox.showerror("Error", f"Category '{cat_name}' is still used by items or transactions")
+            return
         messagebox.showinfo("Deleted", f"Category '{cat_name}' deleted")
         load_categories()
 
-    tk.Button(frame, text="Delete Selected", command=delete_category).pack(pady=5)
+    if current_user["role"] in ["super_admin", "admin"]:
+        tk.Button(frame, text="Delete Selected", command=delete_category).pack(pady=5)
     load_categories()
 
 
 # ------------------ ADD ITEM ------------------
+@inventory_diag.timed("open Add Item")
 def add_item_window():
     win = tk.Toplevel(root)
     win.title("Add Item")
@@ -480,12 +614,8 @@ def add_item_window():
     name_combo.grid(row=0, column=1, pady=5)
 
     # Autofill item names
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute("SELECT DISTINCT item_name FROM inventory")
-    names = [r[0] for r in c.fetchall()]
-    conn.close()
-    name_combo["values"] = names
+    db_call(win, lambda: inventory_lookups.get("item_names"),
+            lambda names: suggest(name_combo, names))
 
     # --- Category ---
     tk.Label(frame, text="Category:").grid(row=1, column=0, sticky="w")
@@ -494,12 +624,8 @@ def add_item_window():
     cat_combo.grid(row=1, column=1, pady=5)
 
     def load_cat_options():
-        conn = sqlite3.connect(DB_NAME)
-        c = conn.cursor()
-        c.execute("SELECT category_name FROM categories")
-        rows = [r[0] for r in c.fetchall()]
-        conn.close()
-        cat_combo["values"] = rows
+        db_call(win, lambda: inventory_lookups.get("categories"),
+                lambda cats: cat_combo.config(values=cats))
     load_cat_options()
 
     # --- Quantity ---
@@ -533,16 +659,12 @@ def add_item_window():
     user_combo = ttk.Combobox(frame, textvariable=user_var, width=27)
     user_combo.grid(row=7, column=1, pady=5)
 
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute("SELECT DISTINCT user_name FROM transactions WHERE txn_type='IN'")
-    users = [r[0] for r in c.fetchall() if r[0]]
-    conn.close()
-    user_combo["values"] = users
+    db_call(win, lambda: inventory_lookups.get("received_from"),
+            lambda users: suggest(user_combo, users))
 
     # --- Date Picker ---
     tk.Label(frame, text="Transaction Date:").grid(row=8, column=0, sticky="w")
-    txn_date = DateEntry(frame, width=27, maxdate=datetime.today(), date_pattern="yyyy-mm-dd")
+    txn_date = date_entry(frame, width=27)
     txn_date.grid(row=8, column=1, pady=5)
 
     # --- Save Item ---
@@ -565,35 +687,19 @@ def add_item_window():
         rate = float(rate) if rate else None
         gst = float(gst) if gst else None
 
-        conn = sqlite3.connect(DB_NAME)
-        c = conn.cursor()
-
-        # check by name+category
-        c.execute("SELECT item_id FROM inventory WHERE item_name=? AND category=?", (name, cat))
-        row = c.fetchone()
-        if row:  # update qty
-            c.execute("UPDATE inventory SET quantity=quantity+?, min_stock=? WHERE item_name=? AND category=?",
-                      (qty, mnstk, name, cat))
-            item_id = row[0]
-        else:  # new
-            c.execute("INSERT INTO inventory (item_name, category, quantity, min_stock) VALUES (?, ?, ?, ?)",
-                      (name, cat, qty, mnstk))
-            item_id = c.lastrowid
-
-        c.execute("""INSERT INTO transactions 
-                     (item_id, item_name, category, quantity, txn_type, user_name, bill_no, rate, gst, txn_date, performed_by) 
-                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                  (item_id, name, cat, qty, "IN", uname, bill_no, rate, gst, tdate, current_user["username"]))
-
-        conn.commit()
-        conn.close()
-        messagebox.showinfo("Success", "Item saved successfully")
-        win.destroy()
+        def saved(item_id):
+            messagebox.showinfo("Success", "Item saved successfully")
+            win.destroy()
+
+        performed_by = current_user["username"]
+        db_call(win, lambda: inventory_core.receive_item(name, cat, qty, mnstk, bill_no, rate, gst,
+                                                         uname, tdate, performed_by), saved, op="save_item")
 
     tk.Button(frame, text="Save", command=save_item).grid(row=9, column=1, pady=15)
 
 
 # ------------------ REMOVE ITEM ------------------
+@inventory_diag.timed("open Issue Item")
 def issue_item_window():
     win = tk.Toplevel(root)
     win.title("Issue Item")
@@ -614,20 +720,18 @@ def issue_item_window():
         tree.heading(col, text=col)
         tree.column(col, width=100)
     tree.grid(row=1, column=0, columnspan=3, pady=10)
+    grid = Grid(tree)
 
     def search_items():
-        val = f"%{search_entry.get()}%"
-        conn = sqlite3.connect(DB_NAME)
-        c = conn.cursor()
-        c.execute("SELECT item_id, item_name, category, quantity FROM inventory WHERE item_name LIKE ?", (val,))
-        rows = c.fetchall()
-        conn.close()
-        for r in tree.get_children():
-            tree.delete(r)
-        for r in rows:
-            tree.insert("", "end", values=r)
+        query, params = db.inventory_query(search_entry.get(), columns="item_id, item_name, category, quantity",
+                                           sort=grid.sort)
+        db_call(win, lambda: db.query(query, params), grid.sync, key="search", op="search_items")
+
+    grid.sortable(dict(zip(cols, ("item_id", "item_name", "category", "quantity"))), search_items)
 
     tk.Button(frame, text="Search", command=search_items).grid(row=0, column=2)
+    search_as_you_type(search_entry, search_items)
+    poll_changes(win, search_items)
 
     tk.Label(frame, text="Quantity to Remove:").grid(row=2, column=0, sticky="w")
     qty_entry = tk.Entry(frame, width=30)
@@ -638,19 +742,15 @@ def issue_item_window():
     user_combo = ttk.Combobox(frame, textvariable=user_var, width=27)
     user_combo.grid(row=3, column=1, pady=5)
 
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute("SELECT DISTINCT user_name FROM transactions WHERE txn_type='OUT'")
-    users = [r[0] for r in c.fetchall() if r[0]]
-    conn.close()
-    user_combo["values"] = users
+    db_call(win, lambda: inventory_lookups.get("issued_to"),
+            lambda users: suggest(user_combo, users))
 
     tk.Label(frame, text="Destination:").grid(row=4, column=0, sticky="w")
     dest_entry = tk.Entry(frame, width=30)
     dest_entry.grid(row=4, column=1, pady=5)
 
     tk.Label(frame, text="Transaction Date:").grid(row=5, column=0, sticky="w")
-    txn_date = DateEntry(frame, width=27, maxdate=datetime.today(), date_pattern="yyyy-mm-dd")
+    txn_date = date_entry(frame, width=27)
     txn_date.grid(row=5, column=1, pady=5)
 
     def issue_item():
@@ -667,27 +767,33 @@ def issue_item_window():
             return
         qty = int(qty)
 
+        # the list may be stale; this only catches the obvious case, the
+        # real check happens atomically in inventory_core.issue_item
         item_id, name, cat, current_qty = tree.item(selected[0], "values")
         current_qty = int(current_qty)
         if qty > current_qty:
             messagebox.showerror("Error", "Not enough stock")
             return
 
-        conn = sqlite3.connect(DB_NAME)
-        c = conn.cursor()
-        c.execute("UPDATE inventory SET quantity=quantity-? WHERE item_id=?", (qty, item_id))
-        c.execute("""INSERT INTO transactions 
-                     (item_id, item_name, category, quantity, txn_type, user_name, destination, txn_date, performed_by) 
-                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                  (item_id, name, cat, qty, "OUT", uname, dest, tdate, current_user["username"]))
-        conn.commit()
-        conn.close()
-        messagebox.showinfo("Success", "Item issued successfully")
-        win.destroy()
+        def issued(_):
+            messagebox.showinfo("Success", "Item issued successfully")
+            win.destroy()
+
+        performed_by = current_user["username"]
+        db_call(win, lambda: inventory_core.issue_item(item_id, name, cat, qty, uname, dest, tdate, performed_by),
+                issued, op="issue_item", on_error=stock_changed)
+
+    def stock_changed(error):
+        if not isinstance(error, inventory_core.StockChanged):
+            return False
+        messagebox.showwarning("Stock changed", str(error), parent=win)
+        search_items()
+        return True
 
     tk.Button(frame, text="Issue", command=issue_item).grid(row=6, column=1, pady=15)
 
 
+@inventory_diag.timed("open Delete Item")
 def delete_item_window():
     win = tk.Toplevel(root)
     win.title("Delete Item")
@@ -708,20 +814,18 @@ def delete_item_window():
         tree.heading(col, text=col)
         tree.column(col, width=100)
     tree.grid(row=1, column=0, columnspan=3, pady=10)
+    grid = Grid(tree)
 
     def search_items():
-        val = f"%{search_entry.get()}%"
-        conn = sqlite3.connect(DB_NAME)
-        c = conn.cursor()
-        c.execute("SELECT item_id, item_name, category, quantity FROM inventory WHERE item_name LIKE ?", (val,))
-        rows = c.fetchall()
-        conn.close()
-        for r in tree.get_children():
-            tree.delete(r)
-        for r in rows:
-            tree.insert("", "end", values=r)
+        query, params = db.inventory_query(search_entry.get(), columns="item_id, item_name, category, quantity",
+                                           sort=grid.sort)
+        db_call(win, lambda: db.query(query, params), grid.sync, key="search", op="search_items")
+
+    grid.sortable(dict(zip(cols, ("item_id", "item_name", "category", "quantity"))), search_items)
 
     tk.Button(frame, text="Search", command=search_items).grid(row=0, column=2)
+    search_as_you_type(search_entry, search_items)
+    poll_changes(win, search_items)
 
     def delete_item():
         selected = tree.selection()
@@ -729,25 +833,27 @@ def delete_item_window():
             messagebox.showerror("Error", "Select item")
             return
 
-        item_id, name, cat, current_qty = tree.item(selected[0], "values")
-        current_qty = int(current_qty)
-        del_date = datetime.today().strftime("%Y-%m-%d")
-
-        conn = sqlite3.connect(DB_NAME)
-        c = conn.cursor()
-        c.execute("DELETE FROM inventory WHERE item_id=?", (item_id))
-        c.execute("""INSERT INTO transactions 
-                     (item_id, item_name, category, quantity, txn_type, user_name, txn_date, performed_by) 
-                     VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                  (item_id, name, cat, current_qty, "DEL", "-", del_date, current_user["username"]))
-        conn.commit()
-        conn.close()
-        messagebox.showinfo("Success", "Item deleted successfully")
-        win.destroy()
+        item_id, name, cat, _ = tree.item(selected[0], "values")
+
+        def deleted(_):
+            messagebox.showinfo("Success", "Item deleted successfully")
+            win.destroy()
+
+        def already_gone(error):
+            if not isinstance(error, inventory_core.StockChanged):
+                return False
+            messagebox.showwarning("Item changed", str(error), parent=win)
+            search_items()
+            return True
+
+        performed_by = current_user["username"]
+        db_call(win, lambda: inventory_core.delete_item(item_id, name, cat, performed_by), deleted,
+                op="delete_item", on_error=already_gone)
 
     tk.Button(frame, text="Delete", command=delete_item).grid(row=6, column=1, pady=15)
 
 # ------------------ VIEW INVENTORY ------------------
+@inventory_diag.timed("open View Inventory")
 def view_inventory():
     win = tk.Toplevel(root)
     win.title("Inventory")
@@ -765,77 +871,99 @@ def view_inventory():
     tk.Label(filter_frame, text="Category:").grid(row=0, column=2, padx=5)
     cat_var = tk.StringVar(value="All")
     cat_combo = ttk.Combobox(filter_frame, textvariable=cat_var, width=20)
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute("SELECT category_name FROM categories")
-    cats = [r[0] for r in c.fetchall()]
-    conn.close()
-    cat_combo["values"] = ["All"] + cats
+    cat_combo["values"] = ["All"]
+    db_call(win, lambda: inventory_lookups.get("categories"),
+            lambda cats: cat_combo.config(values=["All"] + cats))
     cat_combo.grid(row=0, column=3, padx=5)
 
+    low_only_var = tk.BooleanVar(value=False)
+    tk.Checkbutton(filter_frame, text="Low stock only", variable=low_only_var,
+                   command=lambda: load_items()).grid(row=0, column=5, padx=5)
+
+    # Paged like the transactions window: low stock first comes from the
+    # low_stock table and the rest in id order (see db.inventory_query),
+    # a page at a time, keyed on the last row shown, so the window opens
+    # as fast on a 100k-item catalog as on a small one.
+    page = {"filters": None, "sort": None, "after": None, "done": True, "loading": False}
+
+    def load_items():
+        # low stock first (closer to zero first) until a heading is clicked
+        filters = (search_entry.get(), cat_var.get(), low_only_var.get())
+        same_view = (filters, grid.sort) == (page["filters"], page["sort"])
+        limit = max(ITEM_PAGE_SIZE, len(grid)) if same_view else ITEM_PAGE_SIZE
+        page.update(filters=filters, sort=grid.sort, after=None, done=False, loading=True)
+        more_btn.config(state="disabled")
+        query, params = items_query(filters, None, limit)
+
+        def show_first(rows):
+            grid.sync(r[:db.INVENTORY_COLUMN_COUNT] for r in rows)
+            page_loaded(rows, limit)
+
+        db_call(win, lambda: db.query(query, params), show_first, key="items", op="load_items")
+
+    def items_query(filters, after, limit):
+        name, cat, low_only = filters
+        return db.inventory_query(name, cat, low_only=low_only, low_first=True, sort=page["sort"],
+                                  after=after, limit=limit)
+
+    def load_next_page():
+        if page["done"] or page["loading"]:
+            return
+        page["loading"] = True
+        more_btn.config(state="disabled")
+        query, params = items_query(page["filters"], page["after"], ITEM_PAGE_SIZE)
+        db_call(win, lambda: db.query(query, params), show_page, key="items", op="load_items")
+
+    def show_page(rows):
+        grid.extend(r[:db.INVENTORY_COLUMN_COUNT] for r in rows)
+        page_loaded(rows, ITEM_PAGE_SIZE)
+
+    def page_loaded(rows, limit):
+        if rows:
+            page["after"] = rows[-1][db.INVENTORY_COLUMN_COUNT:]
+        page["done"] = len(rows) < limit
+        page["loading"] = False
+        more_btn.config(state="disabled" if page["done"] else "normal")
+
+    def on_scroll(first, last):
+        scrollbar.set(first, last)
+        if float(last) > 0.95:
+            load_next_page()
+
+    page_frame = tk.Frame(win, padx=10)
+    page_frame.pack(fill="x", side="bottom")
+    more_btn = tk.Button(page_frame, text="Load more", command=load_next_page)
+    more_btn.pack(side="left")
+
     cols = ("ID", "Name", "Category", "Qty", "Min Stock")
-    tree = ttk.Treeview(win, columns=cols, show="headings", height=15)
+    tree_frame = tk.Frame(win)
+    tree_frame.pack(fill="both", expand=True, pady=10)
+    tree = ttk.Treeview(tree_frame, columns=cols, show="headings", height=15)
     for col in cols:
         tree.heading(col, text=col)
         tree.column(col, width=130)
-    tree.pack(fill="both", expand=True, pady=10)
-
-    def load_items():
-        val = f"%{search_entry.get()}%"
-        cat = cat_var.get()
-        conn = sqlite3.connect(DB_NAME)
-        c = conn.cursor()
-        if cat and cat != "All":
-            c.execute("SELECT item_id, item_name, category, quantity, min_stock FROM inventory WHERE item_name LIKE ? AND category=?", (val, cat))
-        else:
-            c.execute("SELECT item_id, item_name, category, quantity, min_stock FROM inventory WHERE item_name LIKE ?", (val,))
-        rows = c.fetchall()
-        conn.close()
-        # Clear old rows
-        for r in tree.get_children():
-            tree.delete(r)
-
-        # Separate items below min_stock
-        low_stock = [r for r in rows if r[3] < r[4]]
-        normal_stock = [r for r in rows if r[3] >= r[4]]
-
-        # Sort low stock items by quantity ASC (closer to zero first)
-        low_stock.sort(key=lambda x: x[3])
-
-        # Insert low stock first with tag
-        for r in low_stock:
-            tree.insert("", "end", values=r, tags=("low",))
-
-        # Insert remaining items
-        for r in normal_stock:
-            tree.insert("", "end", values=r)
-
-        # Define tag style for highlighting
-        tree.tag_configure("low", background="#ffcccc")  # light red
+    scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=tree.yview)
+    tree.configure(yscrollcommand=on_scroll)
+    scrollbar.pack(side="right", fill="y")
+    tree.pack(side="left", fill="both", expand=True)
+    tree.tag_configure("low", background="#ffcccc")  # light red
+    # rows below min_stock are tagged for highlighting
+    grid = Grid(tree, tags=lambda r: ("low",) if r[3] < r[4] else ())
+    grid.sortable(dict(zip(cols, db.INVENTORY_SORTS)), load_items)
 
     tk.Button(filter_frame, text="Search", command=load_items).grid(row=0, column=4, padx=10)
+    search_as_you_type(search_entry, load_items)
+    cat_combo.bind("<<ComboboxSelected>>", lambda e: load_items())
     load_items()
+    poll_changes(win, load_items)
 
     # --- Export to CSV Button ---
+    # exports what the grid shows: same filters, same order
     def export_to_csv():
-        file_path = filedialog.asksaveasfilename(
-            defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv")],
-            title="Save Inventory As"
-        )
-        if not file_path:
-            return
-        try:
-            conn = sqlite3.connect(DB_NAME)
-            df = pd.read_sql_query(
-                "SELECT item_name, category, quantity, min_stock FROM inventory",
-                conn
-            )
-            conn.close()
-            df.to_csv(file_path, index=False)
-            messagebox.showinfo("Success", f"Inventory exported to {file_path}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to export:\n{e}")
+        query, params = db.inventory_query(search_entry.get(), cat_var.get(),
+                                           low_only=low_only_var.get(), low_first=True,
+                                           columns="item_name, category, quantity, min_stock", sort=grid.sort)
+        start_export(win, "Save Inventory As", query, params)
 
     # bottom-right placement
     bottom_frame = tk.Frame(win, padx=10, pady=10)
@@ -847,123 +975,76 @@ def bulk_insert():
     file_path = filedialog.askopenfilename(filetypes=[("CSV or Excel files", "*.csv *.xlsx")])
     if not file_path:
         return
-    try:
-        if file_path.endswith(".csv"):
-            df = pd.read_csv(file_path)
-        else:
-            df = pd.read_excel(file_path)
-    except Exception as e:
-        messagebox.showerror("Error", f"Failed to read file:\n{e}")
-        return
-
-    required_headers = ["item_name", "category", "quantity", "min_stock",
-                        "bill_no", "rate", "gst", "user_name", "txn_date"]
-    if not all(h in df.columns for h in required_headers):
-        messagebox.showerror("Error", f"File must contain headers:\n{', '.join(required_headers)}")
-        return
 
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-
-    for _, row in df.iterrows():
-        name = str(row["item_name"]).strip()
-        cat = str(row["category"]).strip()
-        qty = int(row["quantity"])
-        mnstk = int(row["min_stock"]) if not pd.isna(row["min_stock"]) else 0
-        bill_no = str(row["bill_no"]) if not pd.isna(row["bill_no"]) else None
-        rate = float(row["rate"]) if not pd.isna(row["rate"]) else None
-        gst = float(row["gst"]) if not pd.isna(row["gst"]) else None
-        uname = str(row["user_name"]).strip()
-        tdate = str(row["txn_date"]).strip() if not pd.isna(row["txn_date"]) else datetime.today().strftime("%Y-%m-%d")
-
-        # --- ensure category exists ---
-        c.execute("SELECT category_id FROM categories WHERE category_name=?", (cat,))
-        cat_row = c.fetchone()
-        if not cat_row:
-            c.execute("INSERT INTO categories (category_name) VALUES (?)", (cat,))
-            conn.commit()  # commit so it's available for inventory
-
-        # --- check if item exists in inventory ---
-        c.execute("SELECT item_id FROM inventory WHERE item_name=? AND category=?", (name, cat))
-        row_exist = c.fetchone()
-        if row_exist:
-            item_id = row_exist[0]
-            c.execute("UPDATE inventory SET quantity=quantity+?, min_stock=? WHERE item_id=?",
-                      (qty, mnstk, item_id))
+    # Streams the file in chunks on a worker thread: memory stays bounded,
+    # the window stays responsive, and cancel rolls the whole file back.
+    dlg = ProgressDialog(root, "Bulk Insert")
+    import inventory_bulk      # pulls in pandas; only paid for when used
+
+    def work():
+        dlg.set_total(inventory_bulk.count_rows(file_path))
+        return inventory_bulk.receive_stream(file_path, current_user["username"],
+                                             progress=dlg.update, cancel=dlg.cancel)
+
+    def done(result, error):
+        if isinstance(error, inventory_bulk.ImportCancelled):
+            messagebox.showinfo("Cancelled", "Bulk insert cancelled, nothing was saved")
+        elif error:
+            messagebox.showerror("Error", f"Bulk insert failed, nothing was saved:\n{error}")
         else:
-            c.execute("INSERT INTO inventory (item_name, category, quantity, min_stock) VALUES (?, ?, ?, ?)",
-                      (name, cat, qty, mnstk))
-            item_id = c.lastrowid
+            messagebox.showinfo(
+                "Success",
+                f"Bulk insert completed successfully\n"
+                f"{result['rows']} rows, {result['items']} items in {result['seconds']:.1f}s "
+                f"({result['rows_per_sec']:.0f} rows/s)"
+            )
 
-        # --- insert transaction log ---
-        c.execute("""INSERT INTO transactions 
-                     (item_id, item_name, category, quantity, txn_type, user_name, bill_no, rate, gst, txn_date, performed_by) 
-                     VALUES (?, ?, ?, ?, 'IN', ?, ?, ?, ?, ?, ?)""",
-                  (item_id, name, cat, qty, uname, bill_no, rate, gst, tdate, current_user["username"]))
-        conn.commit()
-    conn.close()
-    messagebox.showinfo("Success", "Bulk insert completed successfully")
+    dlg.run(work, done)
 
 
 def bulk_issue():
     file_path = filedialog.askopenfilename(filetypes=[("CSV or Excel files", "*.csv *.xlsx")])
     if not file_path:
         return
-    try:
-        if file_path.endswith(".csv"):
-            df = pd.read_csv(file_path)
-        else:
-            df = pd.read_excel(file_path)
-    except Exception as e:
-        messagebox.showerror("Error", f"Failed to read file:\n{e}")
-        return
 
-    required_headers = ["item_name", "category", "quantity", "user_name", "txn_date"]
-    if not all(h in df.columns for h in required_headers):
-        messagebox.showerror("Error", f"File must contain headers:\n{', '.join(required_headers)}")
-        return
+    # reading the file and its one write transaction, which may wait out
+    # another PC's lock or the server, run on a worker thread
+    dlg = ProgressDialog(root, "Bulk Issue")
+    import inventory_bulk
 
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-
-    for _, row in df.iterrows():
-        name = str(row["item_name"]).strip()
-        cat = str(row["category"]).strip()
-        qty = int(row["quantity"])
-        uname = str(row["user_name"]).strip()
-        dest = str(row["destination"]).strip()
-        tdate = str(row["txn_date"]).strip() if not pd.isna(row["txn_date"]) else datetime.today().strftime("%Y-%m-%d")
-
-        # --- ensure category exists ---
-        c.execute("SELECT category_id FROM categories WHERE category_name=?", (cat,))
-        cat_row = c.fetchone()
-        if not cat_row:
-            continue
-
-        # --- check if item exists in inventory ---
-        c.execute("SELECT item_id, quantity FROM inventory WHERE item_name=? AND category=?", (name, cat))
-        row_exist = c.fetchone()
-        if row_exist:
-            item_id = row_exist[0]
-            available_qty = row_exist[0]
-            if(available_qty>=qty):
-                c.execute("UPDATE inventory SET quantity=quantity-? WHERE item_id=?",
-                        (qty, item_id))
-            else:
-                continue
-        else:
-            continue
+    def work():
+        return inventory_bulk.issue_file(file_path, current_user["username"], cancel=dlg.cancel)
 
-        c.execute("""INSERT INTO transactions 
-                     (item_id, item_name, category, quantity, txn_type, user_name, destination, txn_date, performed_by) 
-                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                  (item_id, name, cat, qty, "OUT", uname, dest, tdate, current_user["username"]))
-        conn.commit()
-    conn.close()
-    messagebox.showinfo("Success", "Bulk issue completed successfully")
+    def done(result, error):
+        if isinstance(error, inventory_bulk.ImportCancelled):
+            messagebox.showinfo("Cancelled", "Bulk issue cancelled, nothing was saved")
+            return
+        if error:
+            messagebox.showerror("Error", f"Bulk issue failed, nothing was saved:\n{error}")
+            return
+
+        summary = (f"{result['issued']} of {result['rows']} rows issued in {result['seconds']:.1f}s "
+                   f"({result['rows_per_sec']:.0f} rows/s)")
+        rejected = result["rejected"]
+        if rejected.empty:
+            messagebox.showinfo("Success", f"Bulk issue completed successfully\n{summary}")
+            return
+
+        if messagebox.askyesno("Bulk issue completed",
+                               f"{summary}\n{len(rejected)} rows were rejected.\n\nSave the rejection report?"):
+            report_path = filedialog.asksaveasfilename(
+                defaultextension=".csv",
+                filetypes=[("CSV files", "*.csv")],
+                title="Save Rejection Report As"
+            )
+            if report_path:
+                rejected.to_csv(report_path, index=False)
+
+    dlg.run(work, done)
 
 
 # ------------------ VIEW TRANSACTIONS ------------------
+@inventory_diag.timed("open View Transactions")
 def view_transactions():
     win = tk.Toplevel(root)
     win.title("Transactions")
@@ -986,12 +1067,9 @@ def view_transactions():
     tk.Label(filter_frame, text="Category:").grid(row=0, column=4, padx=5)
     cat_var = tk.StringVar(value="All")
     cat_combo = ttk.Combobox(filter_frame, textvariable=cat_var, width=15)
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    c.execute("SELECT category_name FROM categories")
-    cats = [r[0] for r in c.fetchall()]
-    conn.close()
-    cat_combo["values"] = ["All"] + cats
+    cat_combo["values"] = ["All"]
+    db_call(win, lambda: inventory_lookups.get("categories"),
+            lambda cats: cat_combo.config(values=["All"] + cats))
     cat_combo.grid(row=0, column=5, padx=5)
 
     tk.Label(filter_frame, text="User:").grid(row=0, column=6, padx=5)
@@ -1000,128 +1078,392 @@ def view_transactions():
 
     tk.Label(filter_frame, text="From:").grid(row=0, column=8, padx=5)
     default_from_date = datetime.today() - timedelta(days=90)   # 90 days before today
-    from_cal = DateEntry(filter_frame, width=12, maxdate=datetime.today(), date_pattern="yyyy-mm-dd")
+    from_cal = date_entry(filter_frame, width=12)
     from_cal.set_date(default_from_date)  # set default value
     from_cal.grid(row=0, column=9, padx=5)
 
     tk.Label(filter_frame, text="To:").grid(row=0, column=10, padx=5)
-    to_cal = DateEntry(filter_frame, width=12, maxdate=datetime.today(), date_pattern="yyyy-mm-dd")
+    to_cal = date_entry(filter_frame, width=12)
     to_cal.grid(row=0, column=11, padx=5)
 
+    # Rows are fetched a page at a time, keyed on (ts, txn_id) of the last
+    # row shown, so opening a year-long range costs the same as a day. A
+    # refresh re-reads as many rows as are shown and only redraws those
+    # that changed (see Grid.sync). Sorting by a column pages the same way,
+    # on that column's key (see db.transactions_query).
+    page = {"filters": None, "sort": None, "after": None, "done": True, "loading": False, "token": 0}
+
     def load_transactions():
-        val = f"%{search_entry.get()}%"
         ttype = type_var.get()
         from_date = from_cal.get_date()
         to_date = to_cal.get_date()
         cat = cat_var.get()
-        uname = f"%{user_entry.get()}%"
 
         if to_date < from_date:
             messagebox.showerror("Error", "To-Date cannot be earlier than From-Date")
             return
 
-        conn = sqlite3.connect(DB_NAME)
-        c = conn.cursor()
-        query = "SELECT txn_id, item_name, category, quantity, txn_type, txn_date, user_name, bill_no, rate, gst, destination, performed_by FROM transactions WHERE item_name LIKE ? AND user_name LIKE ?"
-        params = [val, uname]
+        show_transactions((search_entry.get(), user_entry.get(), ttype, cat, from_date, to_date))
 
-        if ttype != "All":
-            query += " AND txn_type=?"
-            params.append(ttype)
+    def refresh_transactions():
+        # the background poll re-reads what was last loaded; the filter
+        # fields may be half-edited, and aren't checked (or complained
+        # about) until the user searches
+        if page["filters"] is not None:
+            show_transactions(page["filters"])
 
-        if cat != "All":
-            query += " AND category=?"
-            params.append(cat)
+    def show_transactions(filters):
+        same_view = (filters, grid.sort) == (page["filters"], page["sort"])
+        limit = max(TXN_PAGE_SIZE, len(grid)) if same_view else TXN_PAGE_SIZE
+        page.update(filters=filters, sort=grid.sort, after=None, done=False, loading=True, token=page["token"] + 1)
+        more_btn.config(state="disabled")
+        query, params = db.transactions_query(*filters, limit=limit, sort=grid.sort)
 
-        query += " AND txn_date BETWEEN ? AND ? ORDER BY ts DESC"
-        params.extend([from_date, to_date])
+        def show_first(rows):
+            grid.sync(r[:db.TXN_COLUMN_COUNT] for r in rows)
+            page_loaded(rows, limit)
 
-        c.execute(query, params)
-        rows = c.fetchall()
-        conn.close()
+        db_call(win, lambda: db.query(query, params), show_first, key="page", op="load_transactions")
 
-        for r in tree.get_children():
-            tree.delete(r)
-        for r in rows:
-            tree.insert("", "end", values=r)
+        # total count can take a while on a big ledger; don't wait for it
+        token = page["token"]
+        count_label.config(text="Counting...")
+        query, params = db.transactions_count_query(*filters)
+        started = time.perf_counter()
+
+        def show_count(total, error):
+            if not error:
+                inventory_diag.record("load_transactions count", time.perf_counter() - started)
+            if token == page["token"]:
+                count_label.config(text="Count failed" if error else f"{total} transactions")
+
+        run_in_background(win, lambda: db.detached_scalar(query, params), show_count)
+
+    def load_next_page():
+        if page["done"] or page["loading"]:
+            return
+        page["loading"] = True
+        more_btn.config(state="disabled")
+        query, params = db.transactions_query(*page["filters"], after=page["after"], limit=TXN_PAGE_SIZE,
+                                              sort=page["sort"])
+        # a new search supersedes (and interrupts) a page still loading
+        db_call(win, lambda: db.query(query, params), show_page, key="page", op="load_transactions")
+
+    def show_page(rows):
+        grid.extend(r[:db.TXN_COLUMN_COUNT] for r in rows)
+        page_loaded(rows, TXN_PAGE_SIZE)
+
+    def page_loaded(rows, limit):
+        if rows:
+            page["after"] = rows[-1][db.TXN_COLUMN_COUNT:]
+        page["done"] = len(rows) < limit
+        page["loading"] = False
+        more_btn.config(state="disabled" if page["done"] else "normal")
+
+    def on_scroll(first, last):
+        scrollbar.set(first, last)
+        if float(last) > 0.95:
+            load_next_page()
+
+    page_frame = tk.Frame(win, padx=10)
+    page_frame.pack(fill="x", side="bottom")
+    count_label = tk.Label(page_frame, text="")
+    count_label.pack(side="left")
+    more_btn = tk.Button(page_frame, text="Load more", command=load_next_page)
+    more_btn.pack(side="left", padx=10)
 
     cols = ("ID", "Name", "Category", "Qty", "Type", "Txn Date", "User", "Bill No", "Rate", "GST", "Destination", "Entry Performed By")
-    tree = ttk.Treeview(win, columns=cols, show="headings", height=15)
+    tree_frame = tk.Frame(win)
+    tree_frame.pack(fill="both", expand=True, pady=10)
+    tree = ttk.Treeview(tree_frame, columns=cols, show="headings", height=15)
     for col in cols:
         tree.heading(col, text=col)
         tree.column(col, width=100)
-    tree.pack(fill="both", expand=True, pady=10)
+    scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=tree.yview)
+    tree.configure(yscrollcommand=on_scroll)
+    scrollbar.pack(side="right", fill="y")
+    tree.pack(side="left", fill="both", expand=True)
+    grid = Grid(tree)
+    grid.sortable(dict(zip(cols, db.TXN_COLUMN_NAMES)), load_transactions)
 
     tk.Button(filter_frame, text="Search", command=load_transactions).grid(row=0, column=12, padx=10)
+    search_as_you_type(search_entry, load_transactions)
     load_transactions()
+    poll_changes(win, refresh_transactions)
 
     # --- Export to CSV Button ---
+    # exports the rows matching the filters currently shown, not the grid page
     def export_to_csv():
-        file_path = filedialog.asksaveasfilename(
-            defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv")],
-            title="Save Transactions As"
-        )
-        if not file_path:
+        if page["filters"] is None:
             return
-        try:
-            conn = sqlite3.connect(DB_NAME)
-            df = pd.read_sql_query(
-                """SELECT txn_id, item_name, category, quantity, txn_type, txn_date, 
-                          user_name, bill_no, rate, gst, destination, performed_by 
-                   FROM transactions""",
-                conn
-            )
-            conn.close()
-            df.to_csv(file_path, index=False)
-            messagebox.showinfo("Success", f"Transactions exported to {file_path}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to export:\n{e}")
+        query, params = db.transactions_query(*page["filters"], sort=page["sort"])
+        start_export(win, "Save Transactions As", query, params)
 
     # bottom-right placement
     bottom_frame = tk.Frame(win, padx=10, pady=10)
     bottom_frame.pack(fill="x", side="bottom")
     tk.Button(bottom_frame, text="Export to CSV", command=export_to_csv).pack(side="right")
 
-    # def export_to_excel():
-    #     file_path = filedialog.asksaveasfilename(
-    #         defaultextension=".xlsx",
-    #         filetypes=[("Excel files", "*.xlsx")],
-    #         title="Save Transactions As"
-    #     )
-    #     if not file_path:
-    #         return
+    # streamed straight from the cursor into a write-only workbook, a
+    # sheet per year or month of txn_date, so memory stays flat
+    def export_to_excel():
+        if page["filters"] is None:
+            return
+        query, params = db.transactions_query(*page["filters"], sort=page["sort"])
+        start_export(win, "Save Transactions As", query, params, excel=True, split_on="txn_date")
+
+    tk.Button(bottom_frame, text="Export to Excel", command=export_to_excel).pack(side="right", padx=10)
+
+    # move old rows to the archive file; they still show up (and search)
+    # whenever the From date reaches back past the cutoff
+    def archive_old():
+        dlg = tk.Toplevel(win)
+        dlg.title("Archive Transactions")
+        dlg.grab_set()
+        tk.Label(dlg, text="Archive transactions dated before:").pack(padx=10, pady=(10, 5))
+        cutoff_cal = date_entry(dlg, width=12)
+        cutoff_cal.set_date(inventory_archive.default_cutoff())
+        cutoff_cal.pack(padx=10)
+        status = tk.Label(dlg, text="")
+        status.pack(padx=10, pady=5)
+
+        def start():
+            cutoff = cutoff_cal.get_date().strftime("%Y-%m-%d")
+            if not messagebox.askyesno("Archive", f"Move all transactions before {cutoff} to the archive?",
+                                       parent=dlg):
+                return
+            go_btn.config(state="disabled")
+            status.config(text="Archiving...")
+
+            def done(result, error):
+                if error:
+                    messagebox.showerror("Archive", f"Archiving failed: {error}", parent=win)
+                else:
+                    messagebox.showinfo("Archive", f"{result['archived']} transactions archived "
+                                                   f"in {result['seconds']:.1f}s", parent=win)
+                dlg.destroy()
+                load_transactions()
+
+            run_in_background(dlg, lambda: inventory_archive.archive_before(cutoff), done)
+
+        go_btn = tk.Button(dlg, text="Archive", command=start)
+        go_btn.pack(pady=(0, 10))
+
+    if current_user["role"] in ["super_admin", "admin"]:
+        tk.Button(bottom_frame, text="Archive...", command=archive_old).pack(side="left")
+
+
+# ------------------ REPORTS ------------------
+# Consumption summaries from the rollup tables only (see db.ROLLUPS), so
+# a month or a year costs the same however big the ledger gets.
+@inventory_diag.timed("open Reports")
+def reports_window():
+    win = tk.Toplevel(root)
+    win.title("Reports")
+    win.geometry("900x600")
+    win.transient(root)
+    win.grab_set()
+
+    filter_frame = tk.Frame(win, padx=10, pady=10)
+    filter_frame.pack(fill="x")
 
-    #     try:
-    #         conn = sqlite3.connect(DB_NAME)
-    #         df = pd.read_sql_query(
-    #             """SELECT txn_id, item_name, category, quantity, txn_type, txn_date, 
-    #                     user_name, bill_no, rate, gst, destination, performed_by 
-    #             FROM transactions""",
-    #             conn
-    #         )
-    #         conn.close()
+    tk.Label(filter_frame, text="Period:").grid(row=0, column=0, padx=5)
+    period_var = tk.StringVar(value="Monthly")
+    ttk.Combobox(filter_frame, textvariable=period_var, values=list(db.REPORT_PERIODS),
+                 state="readonly", width=9).grid(row=0, column=1, padx=5)
 
-    #         # Ensure txn_date is datetime
-    #         df["txn_date"] = pd.to_datetime(df["txn_date"], errors="coerce")
+    tk.Label(filter_frame, text="By:").grid(row=0, column=2, padx=5)
+    group_var = tk.StringVar(value="Item")
+    ttk.Combobox(filter_frame, textvariable=group_var, values=list(db.REPORT_GROUPS),
+                 state="readonly", width=12).grid(row=0, column=3, padx=5)
 
-    #         # Group by year and write each group to a separate sheet
-    #         with pd.ExcelWriter(file_path, engine="openpyxl") as writer:
-    #             for year, group in df.groupby(df["txn_date"].dt.year):
-    #                 sheet_name = str(year) if pd.notnull(year) else "Unknown"
-    #                 group.to_excel(writer, sheet_name=sheet_name, index=False)
+    tk.Label(filter_frame, text="Type:").grid(row=0, column=4, padx=5)
+    type_var = tk.StringVar(value="OUT")
+    ttk.Combobox(filter_frame, textvariable=type_var, values=["OUT", "IN"],
+                 state="readonly", width=5).grid(row=0, column=5, padx=5)
 
-    #         messagebox.showinfo("Success", f"Transactions exported to {file_path}")
+    tk.Label(filter_frame, text="From:").grid(row=0, column=6, padx=5)
+    from_cal = date_entry(filter_frame, width=12)
+    from_cal.set_date(datetime.today().replace(month=1, day=1))
+    from_cal.grid(row=0, column=7, padx=5)
 
-    #     except Exception as e:
-    #         messagebox.showerror("Error", f"Failed to export:\n{e}")
+    tk.Label(filter_frame, text="To:").grid(row=0, column=8, padx=5)
+    to_cal = date_entry(filter_frame, width=12)
+    to_cal.grid(row=0, column=9, padx=5)
 
-    # tk.Button(bottom_frame, text="Export to Excel", command=export_to_excel).pack(side="right")
+    current = {"query": None}
+
+    def load_report():
+        from_date, to_date = from_cal.get_date(), to_cal.get_date()
+        if to_date < from_date:
+            messagebox.showerror("Error", "To-Date cannot be earlier than From-Date", parent=win)
+            return
+        query, params = db.report_query(period_var.get(), group_var.get(), type_var.get(), from_date, to_date)
+        current["query"] = (query, params)
+        priced = type_var.get() in db.PRICED_TYPES
+        db_call(win, lambda: db.query(query, params), lambda rows: show_report(rows, priced),
+                key="report", op="load_report")
+
+    def show_report(rows, priced):
+        # issues carry no rate: no Value/GST columns rather than zeros
+        tree["displaycolumns"] = cols if priced else [c for c in cols if c not in ("Value", "GST")]
+        for r in tree.get_children():
+            tree.delete(r)
+        for r in rows:
+            tree.insert("", "end", values=r)
+        text = f"{len(rows)} rows    Qty {sum(r[2] for r in rows)}"
+        if priced:
+            text += f"    Value {sum(r[3] for r in rows):,.2f}"
+        total_label.config(text=text)
+
+    tk.Button(filter_frame, text="Show", command=load_report).grid(row=0, column=10, padx=10)
+
+    bottom_frame = tk.Frame(win, padx=10, pady=10)
+    bottom_frame.pack(fill="x", side="bottom")
+    total_label = tk.Label(bottom_frame, text="")
+    total_label.pack(side="left")
+
+    def export_report(excel=False):
+        if current["query"]:
+            start_export(win, "Save Report As", *current["query"], excel=excel)
+
+    tk.Button(bottom_frame, text="Export to CSV", command=export_report).pack(side="right")
+    tk.Button(bottom_frame, text="Export to Excel", command=lambda: export_report(excel=True)).pack(side="right", padx=10)
+
+    # the rollups are trigger-maintained; this is only for after repairs
+    # or manual edits made outside the app
+    def rebuild():
+        if not messagebox.askyesno("Rebuild", "Recompute all report totals from the transaction ledger?", parent=win):
+            return
+        total_label.config(text="Rebuilding...")
+
+        def rebuilt(buckets):
+            messagebox.showinfo("Rebuild", f"{buckets} report buckets rebuilt", parent=win)
+            load_report()
+
+        db_call(win, db.rebuild_rollups, rebuilt)
+
+    if current_user["role"] in ["super_admin", "admin"]:
+        tk.Button(bottom_frame, text="Rebuild", command=rebuild).pack(side="right", padx=10)
+
+    cols = ("Period", "Name", "Qty", "Value", "GST", "Txns")
+    tree_frame = tk.Frame(win)
+    tree_frame.pack(fill="both", expand=True, pady=10)
+    tree = ttk.Treeview(tree_frame, columns=cols, show="headings", height=15)
+    for col in cols:
+        tree.heading(col, text=col)
+        tree.column(col, width=300 if col == "Name" else 100)
+    scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=tree.yview)
+    tree.configure(yscrollcommand=scrollbar.set)
+    scrollbar.pack(side="right", fill="y")
+    tree.pack(side="left", fill="both", expand=True)
+
+    load_report()
+
+
+# ------------------ DIAGNOSTICS ------------------
+# What inventory_diag has measured this session: p50/p95 per window and
+# refresh, per SQL statement, and the slowest statements seen. Admins
+# only; figures are in-memory and start over with each launch.
+def diagnostics_window():
+    win = tk.Toplevel(root)
+    win.title("Diagnostics")
+    win.geometry("1000x550")
+    win.transient(root)
+
+    notebook = ttk.Notebook(win)
+    notebook.pack(fill="both", expand=True, padx=10, pady=10)
+
+    def make_tree(title, cols, widths):
+        frame = tk.Frame(notebook)
+        notebook.add(frame, text=title)
+        tree = ttk.Treeview(frame, columns=cols, show="headings")
+        for col, width in zip(cols, widths):
+            tree.heading(col, text=col)
+            tree.column(col, width=width, stretch=col in ("Operation", "SQL"),
+                        anchor="w" if col in ("Operation", "SQL", "When", "Thread") else "e")
+        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        tree.pack(side="left", fill="both", expand=True)
+        return tree
+
+    stat_cols = ("Count", "p50 ms", "p95 ms", "Max ms")
+    ops_tree = make_tree("Operations", ("Operation",) + stat_cols, (400, 80, 80, 80, 80))
+    sql_tree = make_tree("Queries", ("SQL",) + stat_cols, (600, 80, 80, 80, 80))
+    slow_tree = make_tree("Slowest", ("ms", "Rows", "When", "Thread", "SQL"), (80, 60, 140, 90, 600))
+
+    def fill(tree, rows):
+        tree.delete(*tree.get_children())
+        for r in rows:
+            tree.insert("", "end", values=r)
+
+    def refresh():
+        fill(ops_tree, [(name, n, f"{p50:.1f}", f"{p95:.1f}", f"{top:.1f}")
+                        for name, n, p50, p95, top in inventory_diag.operations()])
+        fill(sql_tree, [(sql, n, f"{p50:.1f}", f"{p95:.1f}", f"{top:.1f}")
+                        for sql, n, p50, p95, top in inventory_diag.statements()])
+        fill(slow_tree, [(f"{ms:.1f}", "-" if rows is None else rows, when, thread, sql)
+                         for ms, sql, rows, when, thread in inventory_diag.slowest()])
+
+    def clear():
+        inventory_diag.reset()
+        refresh()
+
+    bottom_frame = tk.Frame(win, padx=10, pady=10)
+    bottom_frame.pack(fill="x", side="bottom")
+    tk.Label(bottom_frame, text="Log queries slower than (ms):").pack(side="left")
+    threshold = tk.Entry(bottom_frame, width=8)
+    threshold.insert(0, f"{inventory_diag.settings['slow_ms']:g}")
+    threshold.pack(side="left", padx=5)
+
+    def apply_threshold():
+        try:
+            inventory_diag.settings["slow_ms"] = float(threshold.get())
+        except ValueError:
+            messagebox.showerror("Error", "Threshold must be a number", parent=win)
+
+    tk.Button(bottom_frame, text="Apply", command=apply_threshold).pack(side="left")
+    tk.Label(bottom_frame, text=f"  Log: {os.path.abspath(inventory_diag.SLOW_LOG)}", fg="gray").pack(side="left")
+    tk.Button(bottom_frame, text="Reset", command=clear).pack(side="right")
+    tk.Button(bottom_frame, text="Refresh", command=refresh).pack(side="right", padx=10)
+
+    refresh()
+
+
+# ------------------ RECONCILIATION ------------------
+def show_reconcile_result(result):
+    drift = result["drift"]
+    if not drift:
+        return
+    lines = []
+    for item_id, name, cat, stored, ledger in drift[:10]:
+        if stored is None:
+            lines.append(f"#{item_id} (deleted): ledger still shows {ledger}")
+        else:
+            lines.append(f"#{item_id} {name} / {cat}: stock {stored}, ledger {ledger}")
+    if len(drift) > 10:
+        lines.append(f"... and {len(drift) - 10} more")
+    if messagebox.askyesno(
+        "Stock check",
+        f"{len(drift)} item(s) no longer match the transaction ledger:\n\n" + "\n".join(lines) +
+        "\n\nSet stock to the ledger figures?"
+    ):
+        db_call(root, lambda: inventory_reconcile.reconcile(repair=True),
+                lambda r: messagebox.showinfo("Stock check", f"{r['repaired']} item(s) repaired"))
 
 
 if __name__ == "__main__":
-    init_db()
+    startup_mark("imports")
+    inventory_diag.install()
+    if server_url():
+        import inventory_client
+        db.use_server(inventory_client.Client(server_url()))
+    else:
+        init_db()
+    startup_mark("init_db")
     root = tk.Tk()
+    startup_mark("tk root")
     # root.withdraw() # Hide until login
 
     login_window(root)
@@ -1131,31 +1473,79 @@ if __name__ == "__main__":
 
     # root.deiconify()
     root.title("Inventory Management")
-    root.geometry("400x600")
+
+    # every window's queries and writes run on this thread, not the Tk loop
+    db_worker = DBExecutor()
+    db_worker.attach(root)
+
+    # incremental ledger-vs-stock check: only ledger rows added since the
+    # last run are read, so it's cheap enough for every startup
+    if current_user["role"] in ["super_admin", "admin"]:
+        db_call(root, inventory_reconcile.reconcile, show_reconcile_result)
+    root.geometry("400x850")
 
     top_frame = tk.Frame(root)
     top_frame.pack(fill="x")
 
     if current_user["role"] in ["super_admin", "admin"]:
         tk.Button(top_frame, text="Manage Users", command=manage_users).pack(side="left")
+        tk.Button(top_frame, text="Diagnostics", command=diagnostics_window).pack(side="left")
 
     tk.Button(top_frame, text="Reset Password", command=self_reset_password).pack(side="right")
 
-    # Decode the base64 string
-    image_bytes = base64.b64decode(image_data)
-    image = Image.open(BytesIO(image_bytes))
-    photo = ImageTk.PhotoImage(image)
-
-    # Create a label to display the image
-    label = tk.Label(root, image=photo)
+    # The logo is filled in once the window is up. Tk 8.6 reads the base64
+    # PNG itself; PIL is only imported as a fallback for older Tk builds.
+    label = tk.Label(root)
     label.pack()
 
+    def load_logo():
+        try:
+            photo = tk.PhotoImage(data=image_data)
+        except tk.TclError:
+            import base64
+            from io import BytesIO
+            from PIL import Image, ImageTk
+            photo = ImageTk.PhotoImage(Image.open(BytesIO(base64.b64decode(image_data))))
+        label.config(image=photo)
+        label.image = photo     # keep a reference or Tk drops the image
+        startup_mark("logo")
+        if STARTUP_REPORT:
+            show_startup_report()
+
+    root.after_idle(load_logo)
+
+    # --- Low stock panel ---
+    # reads the trigger-maintained low_stock table, so it costs the same
+    # however big the catalog gets; refreshed every LOW_STOCK_REFRESH_MS
+    low_frame = tk.LabelFrame(root, text="Low stock", padx=5, pady=5)
+    low_frame.pack(fill="x", padx=10)
+    low_count_label = tk.Label(low_frame, text="Loading...", fg="#b00000")
+    low_count_label.pack(anchor="w")
+    low_list = tk.Listbox(low_frame, height=4)
+    low_list.pack(fill="x")
+
+    def refresh_low_stock():
+        db_call(root, lambda: (db.query_one(db.LOW_STOCK_COUNT_SQL)[0], db.query(db.LOW_STOCK_TOP_SQL, (4,))),
+                show_low_stock, key="low_stock")
+        root.after(LOW_STOCK_REFRESH_MS, refresh_low_stock)
+
+    def show_low_stock(result):
+        count, top = result
+        low_count_label.config(text=f"{count} item(s) below minimum stock" if count else "All items above minimum stock",
+                               fg="#b00000" if count else "black")
+        low_list.delete(0, "end")
+        for name, cat, qty, min_stock in top:
+            low_list.insert("end", f"{name} ({cat}): {qty} / min {min_stock}")
+
+    refresh_low_stock()
+
     tk.Button(root, text="Manage Categories", command=manage_categories, width=25).pack(pady=10)
     tk.Button(root, text="Add Item", command=add_item_window, width=25).pack(pady=10)
     tk.Button(root, text="Issue Item", command=issue_item_window, width=25).pack(pady=10)
     tk.Button(root, text="Delete Item", command=delete_item_window, width=25).pack(pady=10)
     tk.Button(root, text="View Inventory", command=view_inventory, width=25).pack(pady=10)
     tk.Button(root, text="View Transactions", command=view_transactions, width=25).pack(pady=10)
+    tk.Button(root, text="Reports", command=reports_window, width=25).pack(pady=10)
 
     # --- New Bulk Insert Button ---
     bulk_ins_btn = tk.Button(root, text="Bulk Insert Items", command=bulk_insert, width=25)
@@ -1169,15 +1559,17 @@ if __name__ == "__main__":
         "rate, gst, user_name, txn_date"
     )
 
-    # # --- New Bulk Issue Button ---
-    # bulk_iss_btn = tk.Button(root, text="Bulk Issue Items", command=bulk_issue, width=25)
-    # bulk_iss_btn.pack(pady=10)
+    # --- New Bulk Issue Button ---
+    bulk_iss_btn = tk.Button(root, text="Bulk Issue Items", command=bulk_issue, width=25)
+    bulk_iss_btn.pack(pady=10)
 
-    # # Tooltip for Bulk Issue
-    # ToolTip(
-    #     bulk_iss_btn,
-    #     "Upload CSV/XLSX with headers:\n"
-    #     "item_name, category, quantity, user_name, destination, txn_date"
-    # )
+    # Tooltip for Bulk Issue
+    ToolTip(
+        bulk_iss_btn,
+        "Upload CSV/XLSX with headers:\n"
+        "item_name, category, quantity, user_name, destination, txn_date\n"
+        "(destination is optional)"
+    )
 
+    startup_mark("main window built")
     root.mainloop()
@@ -0,0 +1,62 @@
+# ==============================================================
+# Ledger archiving
+# ==============================================================
+# Moves ledger rows dated before a cutoff into the archive file that every
+# connection attaches (see inventory_db.archive_path), so the live ledger
+# and its indexes stay small. Queries only read the archive when their
+# date range starts before the cutoff; reports are unaffected, the rollups
+# keep the archived rows' totals.
+import time
+from datetime import datetime, timedelta
+
+import inventory_db as db
+
+KEEP_DAYS = 730          # default: archive what is more than two years old
+
+
+def default_cutoff():
+    return (datetime.today() - timedelta(days=KEEP_DAYS)).strftime("%Y-%m-%d")
+
+
+@db.remote_call(kind="exclusive", admin=True)
+def archive_before(cutoff, vacuum=True):
+    """
+    Move ledger rows with txn_date < cutoff ('YYYY-MM-DD') to the archive.
+    Two steps, each its own transaction: copy into the archive, then drop
+    from the live ledger and record the cutoff. If interrupted between
+    them, the rows are in both files but only counted once, and running
+    again finishes the move. Runs on a private connection; safe to call
+    from a worker thread. Returns rows archived, cutoff and seconds.
+    """
+    started = time.perf_counter()
+    cutoff = str(cutoff)
+    conn = db.connect()
+    try:
+        # 1. copy, with the text the archive's own search index needs
+        with db.transaction(conn=conn) as c:
+            c.execute("""DELETE FROM archive.transactions_fts WHERE rowid IN
+                         (SELECT txn_id FROM main.ledger WHERE txn_date < ?)""", (cutoff,))
+            c.execute("INSERT OR REPLACE INTO archive.ledger SELECT * FROM main.ledger WHERE txn_date < ?",
+                      (cutoff,))
+            c.execute("""INSERT INTO archive.transactions_fts (rowid, item_name, category, destination, bill_no)
+                         SELECT txn_id, item_name, category, destination, bill_no
+                         FROM main.transactions WHERE txn_date < ?""", (cutoff,))
+
+        # 2. drop from the live ledger; the rollups keep counting them
+        with db.transaction(conn=conn) as c:
+            db.set_meta(c, db.ROLLUPS_KEEP_KEY, 1)
+            c.execute("""DELETE FROM main.ledger WHERE txn_date < ?
+                         AND txn_id IN (SELECT txn_id FROM archive.ledger)""", (cutoff,))
+            moved = c.rowcount
+            c.execute("DELETE FROM app_meta WHERE key=?", (db.ROLLUPS_KEEP_KEY,))
+            if cutoff > (db.get_meta(c, db.ARCHIVE_CUTOFF_KEY) or ""):
+                db.set_meta(c, db.ARCHIVE_CUTOFF_KEY, cutoff)
+
+        if moved:
+            # fresh statistics for choosing between the archive's indexes
+            conn.execute("ANALYZE archive")
+        if vacuum and moved:
+            conn.execute("VACUUM main")
+    finally:
+        conn.close()
+    return {"archived": moved, "cutoff": cutoff, "seconds": time.perf_counter() - started}
@@ -0,0 +1,376 @@
+# ==============================================================
+# Benchmarks
+# ==============================================================
+# Times the query and write paths behind the windows (load_items,
+# load_transactions, search_items, save_item, issue_item, bulk insert /
+# issue, exports) against a synthetic database, headless. The generator
+# is deterministic: the same scale and seed always build the same file,
+# so numbers from two releases are comparable.
+#
+#   python inventory_bench.py --scale 100k --save baseline_100k.json
+#   python inventory_bench.py --scale 100k --compare baseline_100k.json
+#
+# Generated databases are kept (see --data-dir) and reused; the write
+# benchmarks run on a fresh copy each time.
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+import inventory_core
+import inventory_db as db
+import inventory_export
+
+# scale -> (items, ledger rows)
+SCALES = {
+    "10k": (1000, 10000),
+    "100k": (5000, 100000),
+    "1m": (20000, 1000000),
+}
+SEED = 42
+END_DATE = date(2025, 12, 31)      # fixed, so the data never depends on today
+DAYS = 3 * 365
+PAGE_SIZE = 200                    # the list windows' page (TXN_PAGE_SIZE, ITEM_PAGE_SIZE)
+BENCH_USER = "bench_admin"
+REGRESSION_TOLERANCE = 0.25        # slower than baseline by more than this...
+NOISE_FLOOR_MS = 1.0               # ...and by at least this much
+
+NOUNS = ["bolt", "nut", "washer", "screw", "bearing", "gasket", "valve", "pipe", "cable", "switch",
+         "fuse", "relay", "filter", "belt", "hose", "clamp", "bracket", "spring", "seal", "motor"]
+KINDS = ["steel", "brass", "nylon", "copper", "rubber", "ceramic", "zinc", "plastic", "alloy", "teflon"]
+SIZES = ["M4", "M6", "M8", "M10", "M12", "6mm", "10mm", "1/2in", "3/4in", "1in", "2in", "XL"]
+CATEGORIES = ["Electrical", "Plumbing", "Fasteners", "Hydraulics", "Tools", "Safety", "Stationery",
+              "Cleaning", "HVAC", "Lighting", "Mechanical", "Lab", "IT", "Furniture", "Paint"]
+
+
+# ------------------ DATA GENERATOR ------------------
+def _item_names(rng, count):
+    names, seen = [], set()
+    while len(names) < count:
+        name = f"{rng.choice(KINDS)} {rng.choice(NOUNS)} {rng.choice(SIZES)}"
+        cat = rng.choice(CATEGORIES)
+        if (name, cat) in seen:
+            name = f"{name} {len(names)}"
+        seen.add((name, cat))
+        names.append((name, cat))
+    return names
+
+
+def generate(path, items, txns, seed=SEED):
+    """
+    Build a database at `path` with `items` items and `txns` ledger rows
+    spread over the DAYS before END_DATE, through the app's own schema.
+    Popular items get most of the traffic. OUT rows never exceed the
+    stock on hand, and each item's stock is its ledger net.
+    """
+    rng = random.Random(seed)
+    for p in (path, db.archive_path(path)):
+        if os.path.exists(p):
+            os.remove(p)
+    db.use_database(path)
+    db.init_db()
+
+    catalog = _item_names(rng, items)
+    suppliers = [f"Supplier {i:03d}" for i in range(150)]
+    takers = [f"Dept {i:03d}" for i in range(400)]
+    destinations = [f"Block {chr(65 + i % 26)}-{i // 26}" for i in range(40)]
+    weights = [1 / (rank + 1) ** 0.8 for rank in range(items)]
+    start = END_DATE - timedelta(days=DAYS)
+
+    with db.transaction() as c:
+        c.executemany("INSERT INTO users (username, password, role) VALUES (?, ?, ?)",
+                      [(BENCH_USER, inventory_core.hash_password("bench"), "admin")] +
+                      [(f"clerk{i}", inventory_core.hash_password("bench"), "user") for i in range(7)])
+        c.executemany("INSERT INTO categories (category_name) VALUES (?)", [(k,) for k in CATEGORIES])
+        c.executemany("""INSERT INTO items (item_name, category_id, quantity, min_stock)
+                         SELECT ?, category_id, 0, ? FROM categories WHERE category_name=?""",
+                      [(name, rng.randint(0, 20), cat) for name, cat in catalog])
+        c.executemany("INSERT INTO counterparties (direction, name) VALUES ('IN', ?)", [(n,) for n in suppliers])
+        c.executemany("INSERT INTO counterparties (direction, name) VALUES ('OUT', ?)", [(n,) for n in takers])
+        c.executemany("INSERT INTO destinations (name) VALUES (?)", [(n,) for n in destinations])
+        item_ids = [r[0] for r in c.execute("SELECT item_id FROM items ORDER BY item_id")]
+        party = dict(((d, n), i) for i, d, n in c.execute("SELECT counterparty_id, direction, name FROM counterparties"))
+        dest_ids = [r[0] for r in c.execute("SELECT destination_id FROM destinations ORDER BY destination_id")]
+        user_ids = [r[0] for r in c.execute("SELECT user_id FROM users ORDER BY user_id")]
+
+        stock = [0] * items
+        rows = []
+
+        def flush():
+            c.executemany("""INSERT INTO ledger (item_id, quantity, txn_type, ts, txn_date, counterparty_id,
+                                                 bill_no, rate, gst, destination_id, performed_by_id)
+                             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""", rows)
+            rows.clear()
+
+        with db.deferred_rollups(c):
+            picks = rng.choices(range(items), weights=weights, k=txns)
+            for n, k in enumerate(picks):
+                # evenly through the days, office hours, always increasing
+                at = n * DAYS * 36000 // txns
+                day = start + timedelta(days=at // 36000)
+                secs = 8 * 3600 + at % 36000
+                ts = f"{day} {secs // 3600:02d}:{secs // 60 % 60:02d}:{secs % 60:02d}"
+                want = rng.randint(1, 10)
+                if stock[k] >= want and rng.random() < 0.65:
+                    stock[k] -= want
+                    rows.append((item_ids[k], want, "OUT", ts, str(day), party["OUT", rng.choice(takers)],
+                                 None, None, None, rng.choice(dest_ids), rng.choice(user_ids)))
+                else:
+                    qty = rng.randint(10, 100)
+                    stock[k] += qty
+                    rows.append((item_ids[k], qty, "IN", ts, str(day), party["IN", rng.choice(suppliers)],
+                                 f"INV-{n:07d}", round(rng.uniform(1, 500), 2), rng.choice([5, 12, 18, 28]),
+                                 None, rng.choice(user_ids)))
+                if len(rows) == 10000:
+                    flush()
+            flush()
+
+        c.executemany("UPDATE items SET quantity=? WHERE item_id=?", zip(stock, item_ids))
+        c.execute("""UPDATE counterparties SET
+                     uses = (SELECT COUNT(*) FROM ledger l WHERE l.counterparty_id = counterparties.counterparty_id),
+                     last_used = (SELECT MAX(ts) FROM ledger l WHERE l.counterparty_id = counterparties.counterparty_id)""")
+    with db.transaction() as c:
+        c.execute("ANALYZE")
+    db.close()
+    return path
+
+
+def dataset(scale, seed=SEED, data_dir=None, regenerate=False):
+    """Path of the generated database for a scale, building it on first use."""
+    data_dir = data_dir or os.path.join(tempfile.gettempdir(), "inventory_bench")
+    os.makedirs(data_dir, exist_ok=True)
+    path = os.path.join(data_dir, f"bench_{scale}_{seed}.db")
+    if regenerate or not os.path.exists(path):
+        items, txns = SCALES[scale]
+        started = time.perf_counter()
+        generate(path, items, txns, seed)
+        print(f"generated {path} ({txns} rows) in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return path
+
+
+# ------------------ BENCHMARKS ------------------
+def _timed(fn, runs):
+    times, rows = [], 0
+    for _ in range(runs):
+        started = time.perf_counter()
+        rows = fn()
+        times.append((time.perf_counter() - started) * 1000)
+    times.sort()
+    return {
+        "runs": runs,
+        "median_ms": round(statistics.median(times), 3),
+        "p95_ms": round(times[min(len(times) - 1, int(len(times) * 0.95))], 3),
+        "min_ms": round(times[0], 3),
+        "rows": rows,
+    }
+
+
+def _fetch(query_params):
+    query, params = query_params
+    return lambda: len(db.query(query, params))
+
+
+def _read_benchmarks():
+    to_date = END_DATE
+    d90, d365 = to_date - timedelta(days=90), to_date - timedelta(days=365)
+    first_page = db.query(*db.transactions_query(from_date=d90, to_date=to_date, limit=PAGE_SIZE))
+    after = first_page[-1][db.TXN_COLUMN_COUNT:] if first_page else None
+    by_item = ("item_name", False)
+    item_page = db.query(*db.transactions_query(from_date=d90, to_date=to_date, limit=PAGE_SIZE, sort=by_item))
+    item_after = item_page[-1][db.TXN_COLUMN_COUNT:] if item_page else None
+    items_page = db.query(*db.inventory_query(low_first=True, limit=PAGE_SIZE))
+    item_last = items_page[-1][db.INVENTORY_COLUMN_COUNT:] if items_page else None
+    name = db.query_one("SELECT item_name FROM items ORDER BY item_id LIMIT 1")[0]
+    word = name.split()[1][:3]
+    return [
+        ("load_items", 20, _fetch(db.inventory_query(low_first=True, limit=PAGE_SIZE))),
+        ("load_items next page", 20, _fetch(db.inventory_query(low_first=True, after=item_last, limit=PAGE_SIZE))),
+        ("load_items category", 20, _fetch(db.inventory_query(cat=CATEGORIES[0], low_first=True, limit=PAGE_SIZE))),
+        ("load_items by stock", 20, _fetch(db.inventory_query(sort=("quantity", False), limit=PAGE_SIZE))),
+        ("load_items low only", 20, _fetch(db.inventory_query(low_only=True, low_first=True, limit=PAGE_SIZE))),
+        ("search_items", 50, _fetch(db.inventory_query(word, columns="item_id, item_name, category, quantity"))),
+        ("search_items exact", 50, _fetch(db.inventory_query(name, columns="item_id, item_name, category, quantity"))),
+        ("load_transactions page", 50,
+         _fetch(db.transactions_query(from_date=d90, to_date=to_date, limit=PAGE_SIZE))),
+        ("load_transactions next page", 50,
+         _fetch(db.transactions_query(from_date=d90, to_date=to_date, after=after, limit=PAGE_SIZE))),
+        ("load_transactions type+category", 50,
+         _fetch(db.transactions_query(ttype="OUT", cat=CATEGORIES[1], from_date=d90, to_date=to_date,
+                                      limit=PAGE_SIZE))),
+        ("load_transactions sorted by item next page", 50,
+         _fetch(db.transactions_query(from_date=d90, to_date=to_date, after=item_after, limit=PAGE_SIZE,
+                                      sort=by_item))),
+        ("load_transactions largest issues ever", 20,
+         _fetch(db.transactions_query(ttype="OUT", from_date="0000-01-01", to_date="9999-12-31",
+                                      limit=PAGE_SIZE, sort=("quantity", True)))),
+        ("load_transactions search", 20,
+         _fetch(db.transactions_query(name=word, from_date=d365, to_date=to_date, limit=PAGE_SIZE))),
+        ("load_transactions count 90d", 10,
+         lambda: db.query_one(*db.transactions_count_query(from_date=d90, to_date=to_date))[0]),
+        ("load_transactions count all", 5,
+         lambda: db.query_one(*db.transactions_count_query(from_date="0000-01-01", to_date="9999-12-31"))[0]),
+        ("report monthly by category", 20,
+         _fetch(db.report_query("Monthly", "Category", "OUT", d365, to_date))),
+        ("report daily by item", 10,
+         _fetch(db.report_query("Daily", "Item", "OUT", d90, to_date))),
+    ]
+
+
+def _write_benchmarks(work_dir):
+    rng = random.Random(SEED + 1)
+    stocked = db.query("SELECT item_id, item_name, category FROM inventory WHERE quantity > 100 ORDER BY item_id")
+    sample = db.query("SELECT item_name, category FROM inventory ORDER BY item_id LIMIT 500")
+    today = str(END_DATE)
+    counter = iter(range(10 ** 9))
+
+    def save_item_existing():
+        name, cat = rng.choice(sample)
+        inventory_core.receive_item(name, cat, 5, 1, "B-1", 10.0, 18, "Supplier 001", today, BENCH_USER)
+        return 1
+
+    def save_item_new():
+        inventory_core.receive_item(f"bench item {next(counter)}", "Tools", 5, 1, "B-2", 10.0, 18,
+                                    "Supplier 001", today, BENCH_USER)
+        return 1
+
+    def issue_item():
+        item_id, name, cat = rng.choice(stocked)
+        inventory_core.issue_item(item_id, name, cat, 1, "Dept 001", "Block A-0", today, BENCH_USER)
+        return 1
+
+    receive_path = os.path.join(work_dir, "receive.csv")
+    with open(receive_path, "w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(["item_name", "category", "quantity", "min_stock", "bill_no", "rate", "gst", "user_name",
+                    "txn_date"])
+        for n in range(5000):
+            name, cat = sample[n % len(sample)]
+            w.writerow([name, cat, 10, 2, f"BULK-{n}", 12.5, 18, f"Supplier {n % 150:03d}", today])
+
+    def bulk_insert():
+        import inventory_bulk
+        return inventory_bulk.receive_stream(receive_path, BENCH_USER)["rows"]
+
+    def bulk_issue():
+        import pandas as pd
+        import inventory_bulk
+        df = pd.DataFrame({
+            "item_name": [stocked[n % len(stocked)][1] for n in range(2000)],
+            "category": [stocked[n % len(stocked)][2] for n in range(2000)],
+            "quantity": 1,
+            "user_name": [f"Dept {n % 400:03d}" for n in range(2000)],
+            "destination": "Block B-0",
+            "txn_date": today,
+        })
+        return inventory_bulk.issue(df, BENCH_USER)["issued"]
+
+    year = (END_DATE - timedelta(days=365), END_DATE)
+    quarter = (END_DATE - timedelta(days=90), END_DATE)
+
+    def export(kind, query_params):
+        out = os.path.join(work_dir, f"export.{kind}")
+
+        def run():
+            if kind == "xlsx":
+                return inventory_export.export_xlsx(*query_params, out, split_on="txn_date", per="month")
+            return inventory_export.export_csv(*query_params, out)
+        return run
+
+    # exports first, while the data is still exactly what the generator made
+    return [
+        ("export inventory csv", 5,
+         export("csv", db.inventory_query(columns="item_name, category, quantity, min_stock"))),
+        ("export transactions csv 1y", 3, export("csv", db.transactions_query(from_date=year[0], to_date=year[1]))),
+        ("export transactions xlsx 90d", 1,
+         export("xlsx", db.transactions_query(from_date=quarter[0], to_date=quarter[1]))),
+        ("save_item existing", 50, save_item_existing),
+        ("save_item new", 50, save_item_new),
+        ("issue_item", 50, issue_item),
+        ("bulk_insert 5k rows", 3, bulk_insert),
+        ("bulk_issue 2k rows", 3, bulk_issue),
+    ]
+
+
+def run(scale, seed=SEED, data_dir=None, only=None, regenerate=False):
+    """Run every benchmark on the dataset for `scale`; returns the results document."""
+    source = dataset(scale, seed, data_dir, regenerate)
+    items, txns = SCALES[scale]
+    results = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        # reads and writes both on a scratch copy; the cached dataset stays pristine
+        db.use_database(source)
+        copy = db.backup(os.path.join(work_dir, "bench.db"))[0]
+        db.use_database(copy)
+        db.init_db()
+        db.query("SELECT COUNT(*) FROM ledger")     # open and warm the shared connection
+        for name, runs, fn in _read_benchmarks() + _write_benchmarks(work_dir):
+            if only and only not in name:
+                continue
+            results[name] = _timed(fn, runs)
+            print(f"{name:<34}{results[name]['median_ms']:>10.2f} ms  (p95 {results[name]['p95_ms']:.2f})",
+                  file=sys.stderr)
+        db.close()
+    return {
+        "meta": {
+            "scale": scale, "items": items, "txns": txns, "seed": seed,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(), "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(), "machine": platform.machine(),
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, tolerance=REGRESSION_TOLERANCE):
+    """Benchmarks whose median got slower than the baseline's by more than tolerance: [(name, old, new)]."""
+    slower = []
+    for name, res in current["results"].items():
+        old = baseline["results"].get(name)
+        if old is None:
+            continue
+        before, after = old["median_ms"], res["median_ms"]
+        if after > before * (1 + tolerance) and after - before >= NOISE_FLOOR_MS:
+            slower.append((name, before, after))
+    return slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="inventory_bench", description="Inventory performance benchmarks")
+    parser.add_argument("--scale", choices=list(SCALES), default="10k")
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--data-dir", help="where generated databases are kept (default: system temp)")
+    parser.add_argument("--only", help="run only benchmarks whose name contains this")
+    parser.add_argument("--save", help="write the results as JSON here")
+    parser.add_argument("--compare", help="baseline JSON to check against; exit 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=REGRESSION_TOLERANCE)
+    parser.add_argument("--regenerate", action="store_true", help="rebuild the dataset even if cached")
+    args = parser.parse_args(argv)
+
+    current = run(args.scale, args.seed, args.data_dir, args.only, args.regenerate)
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(current, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline["meta"]["scale"] != args.scale or baseline["meta"]["seed"] != args.seed:
+            print("warning: baseline was taken on a different dataset", file=sys.stderr)
+        slower = compare(current, baseline, args.tolerance)
+        for name, before, after in slower:
+            print(f"REGRESSION {name}: {before:.2f} ms -> {after:.2f} ms", file=sys.stderr)
+        if slower:
+            return 1
+        print("no regressions", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
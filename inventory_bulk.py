@@ -0,0 +1,371 @@
+# ==============================================================
+# Bulk receive / issue engines
+# ==============================================================
+# Set-based replacements for the old row-by-row loops: the whole file is
+# normalized with pandas, staged into a temp table and applied with a
+# handful of statements inside one transaction, so a 50k-line file is a
+# single fsync and a crash leaves nothing half-applied.
+import time
+from datetime import datetime
+
+import pandas as pd
+
+import inventory_core
+import inventory_db as db
+
+RECEIVE_HEADERS = ["item_name", "category", "quantity", "min_stock",
+                   "bill_no", "rate", "gst", "user_name", "txn_date"]
+
+
+def missing_headers(df, required):
+    return [h for h in required if h not in df.columns]
+
+
+# ------------------ NORMALIZATION ------------------
+def _text(col):
+    return col.astype(str).str.strip()
+
+
+def _nullable(col):
+    """NaN -> None so sqlite stores NULL rather than the float nan."""
+    return col.astype(object).where(col.notna(), None)
+
+
+def _dates(col):
+    today = datetime.today().strftime("%Y-%m-%d")
+    if pd.api.types.is_datetime64_any_dtype(col):
+        out = col.dt.strftime("%Y-%m-%d")
+    else:
+        out = _text(col)
+    return out.where(col.notna(), today)
+
+
+def _int_column(col, name, default=None, minimum=0):
+    nums = pd.to_numeric(col, errors="coerce")
+    if default is not None:
+        nums = nums.fillna(default)
+    bad = nums.isna() | (nums != nums.round()) | (nums < minimum)
+    if bad.any():
+        lines = ", ".join(str(i + 2) for i in col.index[bad][:10])   # +2: header row, 1-based
+        raise ValueError(f"Invalid {name} (must be a whole number of at least {minimum}) on line(s) {lines}")
+    return nums.astype("int64")
+
+
+def normalize_receipts(df):
+    """Clean a receive file into the column types the ledger expects."""
+    out = pd.DataFrame({
+        "item_name": _text(df["item_name"]),
+        "category": _text(df["category"]),
+        "quantity": _int_column(df["quantity"], "quantity", minimum=1),
+        "min_stock": _int_column(df["min_stock"], "min_stock", default=0),
+        "bill_no": _nullable(df["bill_no"].astype(str).where(df["bill_no"].notna())),
+        "rate": _nullable(pd.to_numeric(df["rate"], errors="coerce")),
+        "gst": _nullable(pd.to_numeric(df["gst"], errors="coerce")),
+        "user_name": _text(df["user_name"]),
+        "txn_date": _dates(df["txn_date"]),
+    })
+    return out.reset_index(drop=True)
+
+
+# ------------------ RECEIVE ------------------
+def _apply_receipts(c, rows, performed_by):
+    """Stage one normalized frame and apply it on cursor c; returns the per-item totals."""
+    # one inventory upsert per (item, category); min_stock follows the
+    # last line for that item, as the old per-row loop did
+    per_item = (rows.groupby(["item_name", "category"], sort=False)
+                    .agg(quantity=("quantity", "sum"), min_stock=("min_stock", "last"))
+                    .reset_index())
+
+    c.execute("""CREATE TEMP TABLE IF NOT EXISTS bulk_receive (
+        seq INTEGER PRIMARY KEY, item_name TEXT, category TEXT, quantity INTEGER,
+        bill_no TEXT, rate REAL, gst REAL, user_name TEXT, txn_date TEXT
+    )""")
+    c.execute("DELETE FROM temp.bulk_receive")
+    c.executemany(
+        """INSERT INTO temp.bulk_receive
+           (item_name, category, quantity, bill_no, rate, gst, user_name, txn_date)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+        rows[["item_name", "category", "quantity", "bill_no", "rate", "gst",
+              "user_name", "txn_date"]].itertuples(index=False, name=None))
+
+    c.execute("""INSERT OR IGNORE INTO categories (category_name)
+                 SELECT DISTINCT category FROM temp.bulk_receive""")
+
+    c.executemany(
+        """INSERT INTO items (item_name, category_id, quantity, min_stock)
+           SELECT ?, category_id, ?, ? FROM categories WHERE category_name=?
+           ON CONFLICT(item_name, category_id) DO UPDATE
+           SET quantity=quantity+excluded.quantity, min_stock=excluded.min_stock, active=1""",
+        per_item[["item_name", "quantity", "min_stock", "category"]].itertuples(index=False, name=None))
+
+    inventory_core.touch_counterparties(c, "IN", rows["user_name"].value_counts().to_dict())
+
+    # straight into the ledger table: the names resolve in one join here
+    # rather than row by row in the transactions view's insert trigger
+    with db.deferred_rollups(c):
+        c.execute("""INSERT INTO ledger
+                     (item_id, quantity, txn_type, counterparty_id, bill_no, rate, gst, txn_date, performed_by_id)
+                     SELECT i.item_id, b.quantity, 'IN', p.counterparty_id,
+                            b.bill_no, b.rate, b.gst, b.txn_date, (SELECT user_id FROM users WHERE username=?)
+                     FROM temp.bulk_receive b
+                     JOIN categories k ON k.category_name=b.category
+                     JOIN items i ON i.item_name=b.item_name AND i.category_id=k.category_id
+                     LEFT JOIN counterparties p ON p.direction='IN' AND p.name=b.user_name
+                     ORDER BY b.seq""", (performed_by,))
+    c.execute("DELETE FROM temp.bulk_receive")
+    return per_item
+
+
+def _stats(rows, started, **extra):
+    seconds = time.perf_counter() - started
+    return {
+        "rows": rows,
+        **extra,
+        "seconds": seconds,
+        "rows_per_sec": rows / seconds if seconds else float(rows),
+    }
+
+
+@db.remote_call(performer=True)
+def receive(df, performed_by):
+    """
+    Apply a receive (IN) file already loaded as a DataFrame in one
+    transaction. Returns a dict with rows, items, seconds and rows_per_sec.
+    """
+    started = time.perf_counter()
+    rows = normalize_receipts(df)
+    with db.transaction() as c:
+        per_item = _apply_receipts(c, rows, performed_by)
+    return _stats(len(rows), started, items=len(per_item))
+
+
+# ------------------ STREAMING RECEIVE ------------------
+CHUNK_ROWS = 5000
+
+
+class ImportCancelled(Exception):
+    pass
+
+
+def _is_csv(path):
+    return path.lower().endswith(".csv")
+
+
+def read_file(path):
+    """Load a whole CSV/XLSX file as a DataFrame (bulk issue, small files)."""
+    return pd.read_csv(path) if _is_csv(path) else pd.read_excel(path)
+
+
+def count_rows(path):
+    """Data rows in the file, for progress/ETA; cheap compared to parsing."""
+    if _is_csv(path):
+        lines = 0
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                lines += block.count(b"\n")
+        return max(lines - 1, 0)
+    from openpyxl import load_workbook
+    wb = load_workbook(path, read_only=True)
+    try:
+        return max((wb.active.max_row or 1) - 1, 0)
+    finally:
+        wb.close()
+
+
+def read_chunks(path, chunk_rows=CHUNK_ROWS):
+    """
+    Yield the file as DataFrames of at most chunk_rows rows, so memory
+    stays bounded no matter how big the file is. Row indexes continue
+    across chunks so validation errors still point at the right line.
+    """
+    if _is_csv(path):
+        yield from pd.read_csv(path, chunksize=chunk_rows)
+    else:
+        yield from _xlsx_chunks(path, chunk_rows)
+
+
+def _xlsx_chunks(path, chunk_rows):
+    from openpyxl import load_workbook
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        it = wb.active.iter_rows(values_only=True)
+        header = [str(h).strip() if h is not None else "" for h in next(it, ())]
+        width = len(header)
+        batch, start = [], 0
+        for r in it:
+            if not any(v is not None for v in r):
+                continue
+            batch.append(tuple(r[:width]) + (None,) * (width - len(r)))
+            if len(batch) == chunk_rows:
+                yield pd.DataFrame(batch, columns=header, index=range(start, start + len(batch)))
+                start += len(batch)
+                batch = []
+        if batch:
+            yield pd.DataFrame(batch, columns=header, index=range(start, start + len(batch)))
+    finally:
+        wb.close()
+
+
+def receive_stream(path, performed_by, progress=None, cancel=None, chunk_rows=CHUNK_ROWS):
+    """
+    Stream a receive file chunk by chunk on a private connection, all in
+    one transaction: cancelling or any bad line rolls the whole file back.
+    progress(rows_done) is called after each chunk; cancel is a
+    threading.Event checked between chunks. Meant for a worker thread.
+    Returns the same dict as receive().
+    """
+    if db.remote():
+        return _receive_remote(path, performed_by, progress, cancel, chunk_rows)
+    started = time.perf_counter()
+    done = 0
+    items = set()
+    conn = db.connect()
+    try:
+        with db.transaction(conn=conn) as c:
+            for chunk in read_chunks(path, chunk_rows):
+                if done == 0:
+                    missing = missing_headers(chunk, RECEIVE_HEADERS)
+                    if missing:
+                        raise ValueError(f"File must contain headers:\n{', '.join(RECEIVE_HEADERS)}")
+                if cancel is not None and cancel.is_set():
+                    raise ImportCancelled()
+                rows = normalize_receipts(chunk)
+                per_item = _apply_receipts(c, rows, performed_by)
+                items.update(zip(per_item["item_name"], per_item["category"]))
+                done += len(rows)
+                if progress:
+                    progress(done)
+    finally:
+        conn.close()
+    return _stats(done, started, items=len(items))
+
+
+def _receive_remote(path, performed_by, progress, cancel, chunk_rows):
+    # the server can't see this file, and one request is one transaction
+    # there: read it all here and send it as a single receive()
+    chunks = []
+    for chunk in read_chunks(path, chunk_rows):
+        if not chunks and missing_headers(chunk, RECEIVE_HEADERS):
+            raise ValueError(f"File must contain headers:\n{', '.join(RECEIVE_HEADERS)}")
+        if cancel is not None and cancel.is_set():
+            raise ImportCancelled()
+        chunks.append(chunk)
+    df = pd.concat(chunks) if chunks else pd.DataFrame(columns=RECEIVE_HEADERS)
+    result = receive(df, performed_by)
+    if progress:
+        progress(result["rows"])
+    return result
+
+
+# ------------------ ISSUE ------------------
+ISSUE_HEADERS = ["item_name", "category", "quantity", "user_name", "txn_date"]
+REJECT_COLUMNS = ["line", "item_name", "category", "quantity", "user_name", "reason"]
+
+
+@db.remote_call(performer=True)
+def issue(df, performed_by):
+    """
+    Validate an issue (OUT) file against current stock and apply every
+    acceptable line in one transaction. Lines drawing on the same item
+    are taken in file order, each from what the lines before it left; one
+    asking for more than that is rejected. Returns rows, issued, seconds, rows_per_sec and a
+    `rejected` DataFrame with the reason for each skipped line.
+    """
+    started = time.perf_counter()
+    dest = df["destination"] if "destination" in df.columns else pd.Series(None, index=df.index, dtype=object)
+    rows = pd.DataFrame({
+        "line": df.index + 2,      # header row + 1-based, as seen in Excel
+        "item_name": _text(df["item_name"]),
+        "category": _text(df["category"]),
+        "quantity": pd.to_numeric(df["quantity"], errors="coerce"),
+        "user_name": _text(df["user_name"]).where(df["user_name"].notna(), ""),
+        "destination": _nullable(_text(dest).where(dest.notna())),
+        "txn_date": _dates(df["txn_date"]),
+    }).reset_index(drop=True)
+
+    with db.transaction() as c:
+        # stock for every distinct (item, category) in the file, in one query,
+        # read inside the write transaction so it can't change under us
+        c.execute("CREATE TEMP TABLE IF NOT EXISTS bulk_issue_keys (item_name TEXT, category TEXT)")
+        c.execute("DELETE FROM temp.bulk_issue_keys")
+        c.executemany("INSERT INTO temp.bulk_issue_keys VALUES (?, ?)",
+                      rows[["item_name", "category"]].drop_duplicates().itertuples(index=False, name=None))
+        stock = pd.DataFrame(
+            c.execute("""SELECT k.item_name, k.category, i.item_id, i.quantity,
+                                EXISTS(SELECT 1 FROM categories WHERE category_name=k.category)
+                         FROM temp.bulk_issue_keys k
+                         LEFT JOIN inventory i ON i.item_name=k.item_name AND i.category=k.category""").fetchall(),
+            columns=["item_name", "category", "item_id", "available", "known_category"])
+        c.execute("DELETE FROM temp.bulk_issue_keys")
+        rows = rows.merge(stock, how="left", on=["item_name", "category"])
+
+        reason = pd.Series("", index=rows.index, dtype=object)
+
+        def reject(mask, why):
+            reason[mask & (reason == "")] = why
+
+        qty = rows["quantity"]
+        reject(qty.isna() | (qty <= 0) | (qty != qty.round()), "invalid quantity")
+        reject(rows["user_name"] == "", "missing user_name")
+        reject(rows["known_category"] != 1, "unknown category")
+        reject(rows["item_id"].isna(), "item not in inventory")
+
+        # first fit in file order: a line that doesn't fit is rejected and
+        # leaves what is left of the item to the lines after it
+        left = {}
+        fits = reason == ""
+        for line, item_id, available, wanted in zip(rows.index[fits], rows["item_id"][fits],
+                                                    rows["available"][fits], qty[fits]):
+            have = left.get(item_id, available)
+            if wanted > have:
+                reason[line] = f"insufficient stock: {int(have)} left, {int(wanted)} requested"
+            else:
+                left[item_id] = have - wanted
+
+        ok = reason == ""
+        accepted = rows[ok].astype({"item_id": "int64", "quantity": "int64"})
+
+        per_item = accepted.groupby("item_id")["quantity"].sum()
+        c.executemany("UPDATE items SET quantity=quantity-? WHERE item_id=?",
+                      zip(per_item.tolist(), per_item.index.tolist()))
+        inventory_core.touch_counterparties(c, "OUT", accepted["user_name"].value_counts().to_dict())
+        c.executemany("INSERT OR IGNORE INTO destinations (name) VALUES (?)",
+                      ((d,) for d in accepted["destination"].dropna().unique() if d))
+        with db.deferred_rollups(c):
+            c.executemany(
+                """INSERT INTO ledger
+                   (item_id, quantity, txn_type, counterparty_id, destination_id, txn_date, performed_by_id)
+                   VALUES (?, ?, 'OUT',
+                           (SELECT counterparty_id FROM counterparties WHERE direction='OUT' AND name=?),
+                           (SELECT destination_id FROM destinations WHERE name=?), ?,
+                           (SELECT user_id FROM users WHERE username=?))""",
+                ((*r, performed_by) for r in accepted[["item_id", "quantity", "user_name", "destination",
+                                                        "txn_date"]].itertuples(index=False, name=None)))
+
+    # report the quantity exactly as typed, not the coerced number
+    as_typed = df["quantity"].reset_index(drop=True)
+    rejected = rows[~ok].assign(quantity=as_typed[~ok], reason=reason[~ok])[REJECT_COLUMNS]
+    return _stats(len(rows), started, issued=len(accepted), rejected=rejected)
+
+
+def issue_file(path, performed_by, cancel=None):
+    """
+    Read an issue file and apply it with issue(), on a private connection
+    so the shared one stays free meanwhile. cancel (a threading.Event) is
+    checked once the file is read, before anything is written. Meant for
+    a worker thread.
+    """
+    df = read_file(path)
+    if missing_headers(df, ISSUE_HEADERS):
+        raise ValueError(f"File must contain headers:\n{', '.join(ISSUE_HEADERS)}")
+    if cancel is not None and cancel.is_set():
+        raise ImportCancelled()
+    if db.remote():
+        return issue(df, performed_by)
+    conn = db.connect()
+    db.bind_thread_connection(conn)
+    try:
+        return issue(df, performed_by)
+    finally:
+        db.bind_thread_connection(None)
+        conn.close()
@@ -0,0 +1,240 @@
+# ==============================================================
+# Command-line entry point
+# ==============================================================
+# Headless front end for batch jobs (supplier feeds, nightly exports,
+# backups) so they can run from the task scheduler without the GUI.
+# Imports nothing from Tk, PIL or tkcalendar; pandas is only loaded by
+# the commands that read spreadsheets.
+#
+#   python inventory_cli.py -u store_admin import feed.csv
+#   python inventory_cli.py -u store_admin export transactions out.xlsx --from 2025-01-01
+#
+# The password is read from INVENTORY_PASSWORD, or prompted for.
+# Exit status: 0 done, 1 failed (nothing saved), 2 bad usage or login,
+# 3 done with problems (rejected issue lines, unrepaired stock drift).
+import argparse
+import getpass
+import os
+import sys
+from datetime import datetime
+
+import inventory_core
+import inventory_db as db
+import inventory_export
+import inventory_reconcile
+
+ADMIN_ROLES = ("super_admin", "admin")
+EXIT_FAILED, EXIT_USAGE, EXIT_PROBLEMS = 1, 2, 3
+
+
+class CommandError(Exception):
+    pass
+
+
+def _progress(label):
+    """Rows-done callback printing to stderr, only when someone is watching."""
+    if not sys.stderr.isatty():
+        return None
+
+    def report(done):
+        print(f"\r{label}: {done} rows", end="", file=sys.stderr, flush=True)
+    return report
+
+
+def _require_admin(user):
+    if user["role"] not in ADMIN_ROLES:
+        raise CommandError("this command needs an admin account")
+
+
+# ------------------ COMMANDS ------------------
+def cmd_import(args, user):
+    import inventory_bulk
+    try:
+        result = inventory_bulk.receive_stream(args.file, user["username"], progress=_progress("imported"),
+                                               chunk_rows=args.chunk_rows)
+    finally:
+        if sys.stderr.isatty():
+            print(file=sys.stderr)
+    print(f"{result['rows']} rows, {result['items']} items in {result['seconds']:.1f}s "
+          f"({result['rows_per_sec']:.0f} rows/s)")
+    return 0
+
+
+def cmd_issue(args, user):
+    import inventory_bulk
+    df = inventory_bulk.read_file(args.file)
+    if inventory_bulk.missing_headers(df, inventory_bulk.ISSUE_HEADERS):
+        raise CommandError(f"file must contain headers: {', '.join(inventory_bulk.ISSUE_HEADERS)}")
+    result = inventory_bulk.issue(df, user["username"])
+    print(f"{result['issued']} of {result['rows']} rows issued in {result['seconds']:.1f}s "
+          f"({result['rows_per_sec']:.0f} rows/s)")
+    rejected = result["rejected"]
+    if rejected.empty:
+        return 0
+    print(f"{len(rejected)} rows rejected")
+    if args.rejects:
+        rejected.to_csv(args.rejects, index=False)
+        print(f"rejection report: {args.rejects}")
+    else:
+        print(rejected.to_string(index=False))
+    return EXIT_PROBLEMS
+
+
+def _export_query(args):
+    if args.what == "inventory":
+        return db.inventory_query(args.name, args.category, columns="item_name, category, quantity, min_stock")
+    if args.what == "report":
+        return db.report_query(args.period, args.group, args.type if args.type != "All" else "OUT",
+                               args.from_date, args.to_date)
+    return db.transactions_query(args.name, args.party, args.type, args.category, args.from_date, args.to_date)
+
+
+def cmd_export(args, user):
+    query, params = _export_query(args)
+    progress = _progress("exported")
+    try:
+        if args.path.lower().endswith(".xlsx"):
+            rows = inventory_export.export_xlsx(
+                query, params, args.path, progress=progress, per=args.split_by or "year",
+                split_on="txn_date" if args.what == "transactions" and args.split_by else None)
+        else:
+            rows = inventory_export.export_csv(query, params, args.path, progress=progress)
+    finally:
+        if progress:
+            print(file=sys.stderr)
+    print(f"{rows} rows written to {args.path}")
+    return 0
+
+
+def cmd_reconcile(args, user):
+    if args.repair:
+        _require_admin(user)
+    if args.reset:
+        _require_admin(user)
+        inventory_reconcile.reset()
+    result = inventory_reconcile.reconcile(repair=args.repair)
+    print(f"{result['new_rows']} new ledger rows checked")
+    for item_id, name, cat, stored, ledger in result["drift"]:
+        if stored is None:
+            print(f"#{item_id} (deleted): ledger still shows {ledger}")
+        else:
+            print(f"#{item_id} {name} / {cat}: stock {stored}, ledger {ledger}")
+    if args.repair:
+        print(f"{result['repaired']} item(s) repaired")
+    if result["drift"] and not args.repair:
+        return EXIT_PROBLEMS
+    return 0
+
+
+def cmd_backup(args, user):
+    _require_admin(user)
+    dest = args.dest
+    if os.path.isdir(dest):
+        dest = os.path.join(dest, f"inventory-{datetime.now():%Y%m%d-%H%M%S}.db")
+    for path in db.backup(dest):
+        print(f"written {path}")
+    return 0
+
+
+def cmd_archive(args, user):
+    _require_admin(user)
+    import inventory_archive
+    result = inventory_archive.archive_before(args.before or inventory_archive.default_cutoff(),
+                                              vacuum=not args.no_vacuum)
+    print(f"{result['archived']} transactions before {result['cutoff']} archived in {result['seconds']:.1f}s")
+    return 0
+
+
+def cmd_rebuild_rollups(args, user):
+    _require_admin(user)
+    print(f"{db.rebuild_rollups()} report buckets rebuilt")
+    return 0
+
+
+# ------------------ ARGUMENTS ------------------
+def build_parser():
+    parser = argparse.ArgumentParser(prog="inventory_cli", description="Inventory batch operations")
+    parser.add_argument("-u", "--username", default=os.environ.get("INVENTORY_USER"),
+                        help="account to act as (default: $INVENTORY_USER)")
+    parser.add_argument("--db", help="database file (default: $INVENTORY_DB or inventory.db)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("import", help="receive stock from a CSV/XLSX file (all or nothing)")
+    p.add_argument("file")
+    p.add_argument("--chunk-rows", type=int, default=5000)
+    p.set_defaults(run=cmd_import)
+
+    p = sub.add_parser("issue", help="issue stock from a CSV/XLSX file; bad lines are rejected")
+    p.add_argument("file")
+    p.add_argument("--rejects", help="write rejected lines to this CSV instead of printing them")
+    p.set_defaults(run=cmd_issue)
+
+    p = sub.add_parser("export", help="export transactions, inventory or a report to .csv/.csv.gz/.xlsx")
+    p.add_argument("what", choices=["transactions", "inventory", "report"])
+    p.add_argument("path")
+    p.add_argument("--from", dest="from_date", default="0000-01-01", help="YYYY-MM-DD")
+    p.add_argument("--to", dest="to_date", default="9999-12-31", help="YYYY-MM-DD")
+    p.add_argument("--name", default="", help="item name / bill no search")
+    p.add_argument("--party", default="", help="received from / issued to contains")
+    p.add_argument("--type", default="All", choices=["All", "IN", "OUT", "DEL"])
+    p.add_argument("--category", default="All")
+    p.add_argument("--period", default="Monthly", choices=list(db.REPORT_PERIODS))
+    p.add_argument("--group", default="Item", choices=list(db.REPORT_GROUPS))
+    p.add_argument("--split-by", choices=["year", "month"], help="one .xlsx sheet per year/month (transactions)")
+    p.set_defaults(run=cmd_export)
+
+    p = sub.add_parser("reconcile", help="check stock against the transaction ledger")
+    p.add_argument("--repair", action="store_true", help="set stock to the ledger figures")
+    p.add_argument("--reset", action="store_true", help="recompute from the whole ledger")
+    p.set_defaults(run=cmd_reconcile)
+
+    p = sub.add_parser("backup", help="online copy of the database (and archive) to a file or folder")
+    p.add_argument("dest")
+    p.set_defaults(run=cmd_backup)
+
+    p = sub.add_parser("archive", help="move old transactions to the archive database")
+    p.add_argument("--before", help="cutoff date YYYY-MM-DD (default: two years ago)")
+    p.add_argument("--no-vacuum", action="store_true")
+    p.set_defaults(run=cmd_archive)
+
+    p = sub.add_parser("rebuild-rollups", help="recompute report totals from the ledger")
+    p.set_defaults(run=cmd_rebuild_rollups)
+    return parser
+
+
+def login(username):
+    if not username:
+        raise CommandError("no account given (--username or INVENTORY_USER)")
+    password = os.environ.get("INVENTORY_PASSWORD")
+    if password is None:
+        if not sys.stdin.isatty():
+            raise CommandError("no password (set INVENTORY_PASSWORD when running unattended)")
+        password = getpass.getpass(f"Password for {username}: ")
+    user = inventory_core.authenticate(username, password)
+    if not user:
+        raise CommandError("invalid credentials")
+    return user
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.db:
+        db.use_database(args.db)
+    try:
+        db.init_db()
+        return args.run(args, login(args.username))
+    except CommandError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return EXIT_USAGE
+    except KeyboardInterrupt:
+        print("interrupted", file=sys.stderr)
+        return EXIT_FAILED
+    except Exception as e:
+        print(f"error: {e}", file=sys.stderr)
+        return EXIT_FAILED
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+# ==============================================================
+# Inventory server client
+# ==============================================================
+# Thin-client side of inventory_server: the desktop app (or CLI) calls
+# db.use_server(Client(url)) and from then on inventory_db's read helpers
+# and every @db.remote_call function travel here as small JSON requests
+# over a kept-alive HTTP connection per thread, instead of opening the
+# database file. Also holds the wire format shared with the server.
+import http.client
+import json
+import sqlite3
+import threading
+import time
+import urllib.parse
+from datetime import date, datetime
+
+import inventory_core
+import inventory_db as db
+
+DEFAULT_URL = "http://127.0.0.1:8765"
+TIMEOUT_S = 600           # bulk files and archiving run inside one request
+LOGIN = "inventory_core.authenticate"
+
+
+class ServerUnavailable(ConnectionError):
+    pass
+
+
+# ------------------ WIRE FORMAT ------------------
+# JSON, plus dates as ISO text (what sqlite stores anyway) and pandas
+# DataFrames (bulk files, rejection reports) in pandas' own "split" form.
+def _default(value):
+    if isinstance(value, datetime):
+        return value.isoformat(" ")
+    if isinstance(value, date):
+        return value.isoformat()
+    if type(value).__name__ == "DataFrame":
+        return {"__frame__": value.to_json(orient="split", date_format="iso")}
+    if hasattr(value, "item"):          # numpy scalars
+        return value.item()
+    raise TypeError(f"{type(value).__name__} can't be sent to the server")
+
+
+def _object_hook(obj):
+    if "__frame__" in obj:
+        from io import StringIO
+        import pandas as pd
+        return pd.read_json(StringIO(obj["__frame__"]), orient="split", dtype=False, convert_dates=False)
+    return obj
+
+
+def encode(value):
+    return json.dumps(value, default=_default).encode()
+
+
+def decode(data):
+    return json.loads(data, object_hook=_object_hook)
+
+
+# errors the app handles by type travel as {"type", "message", "data"}
+_ERRORS = {
+    "IntegrityError": sqlite3.IntegrityError,
+    "OperationalError": sqlite3.OperationalError,
+    "DatabaseError": sqlite3.DatabaseError,
+    "ValueError": ValueError,
+    "PermissionError": PermissionError,
+    "LookupError": LookupError,
+}
+
+
+def error_payload(error):
+    # named after the nearest type the client knows (Unauthorized -> PermissionError)
+    known = next((t.__name__ for t in type(error).__mro__ if t.__name__ in _ERRORS), type(error).__name__)
+    payload = {"type": known, "message": str(error)}
+    if isinstance(error, inventory_core.StockChanged):
+        payload["data"] = {"name": error.name, "available": error.available}
+    return payload
+
+
+def raise_error(payload):
+    if payload["type"] == "StockChanged":
+        raise inventory_core.StockChanged(payload["data"]["name"], payload["data"]["available"])
+    raise _ERRORS.get(payload["type"], RuntimeError)(payload["message"])
+
+
+# ------------------ CLIENT ------------------
+class Client:
+    """Connection to one inventory_server; safe to share between threads."""
+
+    def __init__(self, url=DEFAULT_URL, timeout=TIMEOUT_S):
+        parts = urllib.parse.urlsplit(url if "//" in url else f"http://{url}")
+        self.url = url
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 8765
+        self.timeout = timeout
+        self.token = None
+        self._local = threading.local()
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        fresh = conn is None
+        if fresh:
+            conn = self._local.conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        return conn, fresh
+
+    def _drop(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _headers(self):
+        headers = {"Content-Type": "application/json"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        return headers
+
+    def _post(self, path, payload, trace=None):
+        body = encode(payload)
+        started = time.perf_counter()
+        while True:
+            conn, fresh = self._connection()
+            try:
+                conn.request("POST", path, body, self._headers())
+                resp = conn.getresponse()
+                reply = decode(resp.read())
+                break
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError) as e:
+                # a kept-alive connection the server has since closed: the
+                # request never arrived, so sending it again is safe
+                self._drop()
+                if fresh:
+                    raise ServerUnavailable(f"inventory server at {self.url}: {e}") from None
+            except (OSError, http.client.HTTPException) as e:
+                self._drop()
+                raise ServerUnavailable(f"inventory server at {self.url}: {e}") from None
+        if db._trace is not None:
+            db._trace(trace or path, time.perf_counter() - started, None)
+        if "error" in reply:
+            raise_error(reply["error"])
+        return reply["result"]
+
+    # ------------------ db.use_server interface ------------------
+    def call(self, name, args=(), kwargs=None):
+        if name == LOGIN:
+            username, password = args
+            result = self._post("/login", {"username": username, "password": password}, f"RPC {name}")
+            if result is None:
+                return None
+            self.token = result["token"]
+            return result["user"]
+        return self._post("/call", {"name": name, "args": list(args), "kwargs": kwargs or {}}, f"RPC {name}")
+
+    def query(self, sql, params=()):
+        return [tuple(r) for r in self._post("/query", {"sql": sql, "params": list(params)}, sql)]
+
+    def query_one(self, sql, params=()):
+        row = self._post("/query_one", {"sql": sql, "params": list(params)}, sql)
+        return tuple(row) if row is not None else None
+
+    def scalar(self, sql, params=()):
+        return self._post("/scalar", {"sql": sql, "params": list(params)}, sql)
+
+    def iter_rows(self, sql, params=(), chunk_rows=5000):
+        """Column names, then row chunks, as the server streams them (JSON lines)."""
+        # its own connection: the server closes it when the stream ends
+        conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        try:
+            try:
+                conn.request("POST", "/rows", encode({"sql": sql, "params": list(params), "chunk_rows": chunk_rows}),
+                             self._headers())
+                resp = conn.getresponse()
+            except (OSError, http.client.HTTPException) as e:
+                raise ServerUnavailable(f"inventory server at {self.url}: {e}") from None
+            for line in resp:
+                msg = decode(line)
+                if "error" in msg:
+                    raise_error(msg["error"])
+                if msg.get("end"):
+                    return
+                yield msg["columns"] if "columns" in msg else [tuple(r) for r in msg["rows"]]
+            # never hand a half export over as a whole one
+            raise ServerUnavailable(f"inventory server at {self.url} closed the stream early")
+        finally:
+            conn.close()
+
+    def health(self):
+        conn, _ = self._connection()
+        try:
+            conn.request("GET", "/health")
+            return decode(conn.getresponse().read())["result"]
+        except (OSError, http.client.HTTPException) as e:
+            self._drop()
+            raise ServerUnavailable(f"inventory server at {self.url}: {e}") from None
@@ -0,0 +1,237 @@
+# ==============================================================
+# Stock operations
+# ==============================================================
+# The single-item write paths behind the Add / Issue / Delete windows,
+# free of any UI so they can run on the DB worker thread (or anywhere
+# else). Each one is a single short transaction: the stock check is the
+# write itself (a conditional UPDATE), so two PCs issuing the same item
+# can't both succeed on stock only one of them had, and a transaction
+# that loses the race for the write lock is retried (db.retry_busy).
+# Thin clients run them on the inventory server (db.remote_call), as they
+# do the account and category changes further down.
+import hashlib
+import sqlite3
+from datetime import datetime
+
+import inventory_db as db
+
+
+class StockChanged(Exception):
+    """The stock the caller saw is gone (issued or deleted elsewhere); refresh and retry."""
+
+    def __init__(self, name, available):
+        self.name = name
+        self.available = available
+        if available is None:
+            msg = f"{name} is no longer in inventory."
+        else:
+            msg = f"Stock of {name} changed since the list was loaded: only {available} left."
+        super().__init__(msg + "\nRefresh the list and try again.")
+
+
+def touch_counterparties(c, direction, counts):
+    """Record uses of "Received From" (IN) / "Issued To" (OUT) names: {name: times}."""
+    c.executemany(
+        """INSERT INTO counterparties (direction, name, uses, last_used)
+           VALUES (?, ?, ?, datetime('now', '+5 hours', '30 minutes'))
+           ON CONFLICT(direction, name) DO UPDATE
+           SET uses = uses + excluded.uses, last_used = excluded.last_used""",
+        [(direction, name, n) for name, n in counts.items() if name])
+
+
+def check_quantity(qty):
+    """Stock moves in whole units above zero; anything else is refused before it reaches the ledger."""
+    if isinstance(qty, bool) or not isinstance(qty, int) or qty <= 0:
+        raise ValueError(f"Quantity must be a whole number above 0 (got {qty!r})")
+
+
+@db.remote_call(performer=True)
+@db.retry_busy
+def receive_item(name, cat, qty, min_stock, bill_no, rate, gst, user_name, txn_date, performed_by):
+    """Add stock (creating the item if new) and log an IN row. Returns item_id."""
+    check_quantity(qty)
+    with db.transaction() as c:
+        # check by name+category, including items deleted earlier
+        cat_id = db.category_id(c, cat)
+        c.execute("SELECT item_id FROM items WHERE item_name=? AND category_id=?", (name, cat_id))
+        row = c.fetchone()
+        if row:  # update qty (and bring it back if deleted)
+            c.execute("UPDATE items SET quantity=quantity+?, min_stock=?, active=1 WHERE item_id=?",
+                      (qty, min_stock, row[0]))
+            item_id = row[0]
+        else:  # new
+            c.execute("INSERT INTO items (item_name, category_id, quantity, min_stock) VALUES (?, ?, ?, ?)",
+                      (name, cat_id, qty, min_stock))
+            item_id = c.lastrowid
+
+        c.execute("""INSERT INTO transactions
+                     (item_id, item_name, category, quantity, txn_type, user_name, bill_no, rate, gst, txn_date, performed_by)
+                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                  (item_id, name, cat, qty, "IN", user_name, bill_no, rate, gst, txn_date, performed_by))
+        touch_counterparties(c, "IN", {user_name: 1})
+    return item_id
+
+
+@db.remote_call(performer=True)
+@db.retry_busy
+def issue_item(item_id, name, cat, qty, user_name, destination, txn_date, performed_by):
+    """Take stock out and log an OUT row; StockChanged if there isn't `qty` left."""
+    check_quantity(qty)
+    with db.transaction() as c:
+        c.execute("UPDATE items SET quantity=quantity-? WHERE item_id=? AND active=1 AND quantity>=?",
+                  (qty, item_id, qty))
+        if c.rowcount == 0:
+            row = c.execute("SELECT quantity FROM items WHERE item_id=? AND active=1", (item_id,)).fetchone()
+            raise StockChanged(name, row[0] if row else None)
+        touch_counterparties(c, "OUT", {user_name: 1})
+        if destination:
+            c.execute("INSERT OR IGNORE INTO destinations (name) VALUES (?)", (destination,))
+        # straight into the ledger: the item and names are known, which
+        # skips the view trigger's lookups while we hold the write lock
+        c.execute("""INSERT INTO ledger
+                     (item_id, quantity, txn_type, counterparty_id, destination_id, txn_date, performed_by_id)
+                     VALUES (?, ?, 'OUT',
+                             (SELECT counterparty_id FROM counterparties WHERE direction='OUT' AND name=?),
+                             (SELECT destination_id FROM destinations WHERE name=?), ?,
+                             (SELECT user_id FROM users WHERE username=?))""",
+                  (item_id, qty, user_name, destination, txn_date, performed_by))
+
+
+@db.remote_call(performer=True)
+@db.retry_busy
+def delete_item(item_id, name, cat, performed_by):
+    """
+    Remove an item from inventory and log a DEL row for the stock it held
+    at that moment (read under the write lock, not from the caller's
+    list). Returns that quantity; StockChanged if already deleted.
+    """
+    del_date = datetime.today().strftime("%Y-%m-%d")
+    with db.transaction() as c:
+        row = c.execute("SELECT quantity FROM items WHERE item_id=? AND active=1", (item_id,)).fetchone()
+        if row is None:
+            raise StockChanged(name, None)
+        qty = row[0]
+        # the row stays (inactive) for the ledger history to point at
+        c.execute("UPDATE items SET active=0, quantity=0 WHERE item_id=?", (item_id,))
+        c.execute("""INSERT INTO transactions
+                     (item_id, item_name, category, quantity, txn_type, user_name, txn_date, performed_by)
+                     VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                  (item_id, name, cat, qty, "DEL", "-", del_date, performed_by))
+    return qty
+
+
+# ------------------ USERS ------------------
+def hash_password(password):
+    return hashlib.sha256(password.encode()).hexdigest()
+
+
+@db.remote_call(kind="read")
+def authenticate(username, password):
+    """{"username", "role"} for an active account with this password, else None."""
+    row = db.query_one("SELECT username, role FROM users WHERE username=? AND password=? AND active=1",
+                       (username, hash_password(password)))
+    return {"username": row[0], "role": row[1]} if row else None
+
+
+# Account changes check their rules here rather than in the windows, so a
+# thin client gets the same answers from the server. `caller` is the
+# logged-in account ({"username", "role"}); on a server, its session's.
+ADMIN_ROLES = ("super_admin", "admin")
+ASSIGNABLE_ROLES = ("admin", "user")
+
+
+def _check_admin(c, caller):
+    # the role as it is now, not as it was at login
+    row = c.execute("SELECT role FROM users WHERE username=? AND active=1", (caller["username"],)).fetchone()
+    if row is None or row[0] not in ADMIN_ROLES:
+        raise PermissionError("Only an admin can manage users")
+
+
+def _check_role(role):
+    if role not in ASSIGNABLE_ROLES:
+        raise ValueError(f"Role must be one of: {', '.join(ASSIGNABLE_ROLES)}")
+
+
+def _check_managed(c, caller, username):
+    # admins manage the other accounts; super_admins are left alone
+    if username == caller["username"]:
+        raise PermissionError("You can't change your own account here")
+    row = c.execute("SELECT role FROM users WHERE username=? AND active=1", (username,)).fetchone()
+    if row is None:
+        raise LookupError("User does not exist")
+    if row[0] == "super_admin":
+        raise PermissionError("You can't alter a super_admin account")
+
+
+@db.remote_call(admin=True, caller=True)
+@db.retry_busy
+def create_user(caller, username, password, role):
+    """Add an account (or bring back a removed one of that name); IntegrityError if taken."""
+    _check_role(role)
+    with db.transaction() as c:
+        _check_admin(c, caller)
+        c.execute("""INSERT INTO users (username, password, role) VALUES (?,?,?)
+                     ON CONFLICT(username) DO UPDATE
+                     SET password=excluded.password, role=excluded.role, active=1
+                     WHERE active=0""", (username, hash_password(password), role))
+        if c.rowcount == 0:
+            raise sqlite3.IntegrityError(f"Username {username} already exists")
+
+
+@db.remote_call(admin=True, caller=True)
+@db.retry_busy
+def update_user(caller, username, role, password=None):
+    """Change another account's role, and its password when one is given."""
+    _check_role(role)
+    with db.transaction() as c:
+        _check_admin(c, caller)
+        _check_managed(c, caller, username)
+        if password:
+            c.execute("UPDATE users SET password=?, role=? WHERE username=?",
+                      (hash_password(password), role, username))
+        else:
+            c.execute("UPDATE users SET role=? WHERE username=?", (role, username))
+
+
+@db.remote_call(admin=True, caller=True)
+@db.retry_busy
+def deactivate_user(caller, username, caller_password):
+    """
+    Remove an account, confirmed with the caller's own password. It is
+    only deactivated: the ledger still names it.
+    """
+    with db.transaction() as c:
+        _check_admin(c, caller)
+        if c.execute("SELECT 1 FROM users WHERE username=? AND password=? AND active=1",
+                     (caller["username"], hash_password(caller_password))).fetchone() is None:
+            raise PermissionError("Invalid admin password")
+        _check_managed(c, caller, username)
+        c.execute("UPDATE users SET active=0 WHERE username=?", (username,))
+
+
+@db.remote_call(caller=True)
+@db.retry_busy
+def change_password(caller, old_password, new_password):
+    """The caller's own password; PermissionError if old_password is wrong."""
+    with db.transaction() as c:
+        c.execute("UPDATE users SET password=? WHERE username=? AND password=? AND active=1",
+                  (hash_password(new_password), caller["username"], hash_password(old_password)))
+        if c.rowcount == 0:
+            raise PermissionError("Old password incorrect")
+
+
+# ------------------ CATEGORIES ------------------
+@db.remote_call()
+@db.retry_busy
+def add_category(name):
+    """IntegrityError if it already exists."""
+    with db.transaction() as c:
+        c.execute("INSERT INTO categories (category_name) VALUES (?)", (name,))
+
+
+@db.remote_call(admin=True)
+@db.retry_busy
+def delete_category(category_id):
+    """IntegrityError while items or ledger rows still use it."""
+    with db.transaction() as c:
+        c.execute("DELETE FROM categories WHERE category_id=?", (category_id,))
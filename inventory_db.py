@@ -0,0 +1,1435 @@
+# ==============================================================
+# Data access layer
+# ==============================================================
+# One long-lived, tuned SQLite connection shared by every screen.
+# Opening a connection per click costs a file open, a schema parse and
+# a cold page cache every time, which dominates latency on a network
+# share. Everything in the app goes through the helpers below instead.
+import os
+import re
+import random
+import hashlib
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+DB_NAME = os.environ.get("INVENTORY_DB", "inventory.db")
+
+# Ledger rows moved out by inventory_archive live in a second file next to
+# the main one (INVENTORY_ARCHIVE overrides), attached to every connection
+# as `archive`.
+ARCHIVE_SUFFIX = "_archive"
+
+# WAL needs every client on the same host (shared memory); set
+# INVENTORY_JOURNAL_MODE=DELETE when the file lives on an SMB share.
+JOURNAL_MODE = os.environ.get("INVENTORY_JOURNAL_MODE", "WAL")
+BUSY_TIMEOUT_MS = 5000
+CACHE_SIZE_KB = 64 * 1024          # negative cache_size == KiB
+MMAP_SIZE = 256 * 1024 * 1024
+STATEMENT_CACHE = 256              # prepared statements kept per connection
+
+_conn = None
+_lock = threading.RLock()
+_local = threading.local()      # per-thread connection override (DB worker)
+
+
+def connect(path=None):
+    """Open a new connection with the app's pragmas applied."""
+    conn = sqlite3.connect(
+        path or DB_NAME,
+        timeout=BUSY_TIMEOUT_MS / 1000,
+        isolation_level=None,              # we issue BEGIN/COMMIT ourselves
+        check_same_thread=False,
+        cached_statements=STATEMENT_CACHE,
+    )
+    conn.execute(f"PRAGMA journal_mode={JOURNAL_MODE}")
+    conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(f"PRAGMA cache_size=-{CACHE_SIZE_KB}")
+    conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA foreign_keys=ON")
+    # attaching only opens the file; nothing in it is read until a query
+    # routed to all_transactions (or the archiver) actually uses it
+    conn.execute("ATTACH DATABASE ? AS archive", (archive_path(path or DB_NAME),))
+    conn.execute(f"PRAGMA archive.journal_mode={JOURNAL_MODE}")
+    _create_all_transactions(conn)
+    return conn
+
+
+def _create_all_transactions(conn):
+    # only once both ledgers exist: on a new or not yet converted file the
+    # view would point at missing tables, and SQLite re-checks every view
+    # on ALTER TABLE ... RENAME, failing the migration. init_db makes it then.
+    for schema in ("main", "archive"):
+        if conn.execute(f"SELECT 1 FROM {schema}.sqlite_master WHERE type='table' AND name='ledger'").fetchone() is None:
+            return
+    conn.execute(f"CREATE TEMP VIEW IF NOT EXISTS all_transactions AS {ALL_TRANSACTIONS_SQL}")
+
+
+def archive_path(path=None):
+    root, ext = os.path.splitext(path or DB_NAME)
+    return os.environ.get("INVENTORY_ARCHIVE") or f"{root}{ARCHIVE_SUFFIX}{ext or '.db'}"
+
+
+def get_conn():
+    """Return this thread's own connection if bound, else the shared one."""
+    global _conn
+    own = getattr(_local, "conn", None)
+    if own is not None:
+        return own
+    with _lock:
+        if _conn is None:
+            _conn = connect()
+        return _conn
+
+
+def bind_thread_connection(conn):
+    """Make the helpers below use `conn` whenever called from this thread."""
+    _local.conn = conn
+
+
+@contextmanager
+def _using(conn=None):
+    # a thread's own connection needs no locking; the shared one does
+    conn = conn or getattr(_local, "conn", None)
+    if conn is not None:
+        yield conn
+    else:
+        with _lock:
+            yield get_conn()
+
+
+def use_database(path):
+    """Point the shared connection at another file (CLI, benchmarks)."""
+    global DB_NAME
+    close()
+    DB_NAME = path
+
+
+def close():
+    global _conn
+    with _lock:
+        if _conn is not None:
+            _conn.execute("PRAGMA optimize")   # refresh planner stats for new indexes
+            _conn.close()
+            _conn = None
+
+
+# ------------------ TRACE HOOK ------------------
+# set_trace(fn) has every statement run through the helpers below report
+# fn(sql, seconds, rows) when it finishes, failed ones included: rows is
+# the number fetched for reads, changed for writes, None if unknown.
+# Off (a single None check) until someone installs a tracer.
+_trace = None
+
+
+def set_trace(fn):
+    global _trace
+    _trace = fn
+
+
+def _traced(sql, run, count):
+    if _trace is None:
+        return run()
+    started = time.perf_counter()
+    rows = None
+    try:
+        result = run()
+        rows = count(result)
+        return result
+    finally:
+        _trace(sql, time.perf_counter() - started, rows)
+
+
+class _TracedCursor(sqlite3.Cursor):
+    """Cursor for transaction() while a tracer is installed."""
+
+    def execute(self, sql, params=()):
+        return _traced(sql, lambda: super(_TracedCursor, self).execute(sql, params), _changed)
+
+    def executemany(self, sql, seq):
+        return _traced(sql, lambda: super(_TracedCursor, self).executemany(sql, seq), _changed)
+
+
+def _changed(cursor):
+    return cursor.rowcount if cursor.rowcount >= 0 else None
+
+
+# ------------------ SERVER MODE ------------------
+# A desktop started with --server (see inventory_client) never opens the
+# file: use_server(client) sends the read helpers below to the
+# inventory_server that owns it, and every function marked @remote_call
+# runs there instead of here. The server looks the same functions up in
+# REMOTE_CALLS and runs them locally, so each write path has one
+# implementation. kind: "read" runs right away, "write" is queued for the
+# server's single writer (batched with others into one commit),
+# "exclusive" runs on its own (it manages its own connection). With
+# caller=True the first argument is the account making the call: locally
+# the app passes its logged-in user, the server its session's account in
+# place of whatever the client sent. performer=True does the same for a
+# `performed_by` argument (the username the ledger records).
+_server = None
+REMOTE_CALLS = {}        # "module.function" -> (function, kind, admin only, takes caller, takes performer)
+
+
+def use_server(client):
+    global _server
+    close()
+    _server = client
+
+
+def remote():
+    """True in a thin client: the database is on the other end of a server."""
+    return _server is not None
+
+
+def remote_call(kind="write", admin=False, caller=False, performer=False):
+    def wrap(fn):
+        name = f"{fn.__module__}.{fn.__name__}"
+        REMOTE_CALLS[name] = (fn, kind, admin, caller, performer)
+
+        @wraps(fn)
+        def run(*args, **kwargs):
+            if _server is not None:
+                return _server.call(name, args, kwargs)
+            return fn(*args, **kwargs)
+        return run
+    return wrap
+
+
+# ------------------ READ HELPERS ------------------
+def query(sql, params=()):
+    if _server is not None:
+        return _server.query(sql, params)
+    with _using() as conn:
+        return _traced(sql, lambda: conn.execute(sql, params).fetchall(), len)
+
+
+def query_one(sql, params=()):
+    if _server is not None:
+        return _server.query_one(sql, params)
+    with _using() as conn:
+        return _traced(sql, lambda: conn.execute(sql, params).fetchone(), lambda row: int(row is not None))
+
+
+def detached_scalar(sql, params=()):
+    """
+    Single value from a private connection, for long reads (counts) run
+    off the UI thread that shouldn't hold the shared connection.
+    """
+    if _server is not None:
+        return _server.scalar(sql, params)
+    conn = connect()
+    try:
+        return _traced(sql, lambda: conn.execute(sql, params).fetchone()[0], lambda _: 1)
+    finally:
+        conn.close()
+
+
+def iter_rows(sql, params=(), chunk_rows=5000):
+    """
+    Yield the column names, then the rows of `sql` in lists of at most
+    chunk_rows, read on a private connection (or streamed from the
+    server), so an export holds one chunk in memory however big it is.
+    """
+    if _server is not None:
+        yield from _server.iter_rows(sql, params, chunk_rows)
+        return
+    conn = connect()
+    try:
+        cur = conn.execute(sql, params)
+        yield [d[0] for d in cur.description]
+        while True:
+            rows = cur.fetchmany(chunk_rows)
+            if not rows:
+                return
+            yield rows
+    finally:
+        conn.close()
+
+
+def query_column(sql, params=()):
+    """First column of every row, e.g. for combobox values."""
+    return [r[0] for r in query(sql, params)]
+
+
+# ------------------ WRITE HELPERS ------------------
+@contextmanager
+def transaction(immediate=True, conn=None):
+    """
+    Yield a cursor inside BEGIN ... COMMIT, rolling back on any error.
+    IMMEDIATE takes the write lock up front so we fail fast on contention
+    instead of deadlocking on lock upgrade halfway through. Pass `conn`
+    to run on a private connection (background jobs) instead of the
+    shared one. Inside another transaction on the same connection (the
+    server's batched commits) it becomes a savepoint instead, so an
+    error only undoes this block.
+    """
+    with _using(conn) as conn:
+        c = conn.cursor() if _trace is None else conn.cursor(_TracedCursor)
+        if conn.in_transaction:
+            c.execute("SAVEPOINT nested")
+            try:
+                yield c
+            except BaseException:
+                c.execute("ROLLBACK TO nested")
+                c.execute("RELEASE nested")
+                raise
+            else:
+                c.execute("RELEASE nested")
+            finally:
+                c.close()
+            return
+        c.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+        try:
+            yield c
+        except BaseException:
+            conn.rollback()
+            raise
+        else:
+            _traced("COMMIT", conn.commit, lambda _: None)    # the fsync, on a slow share
+        finally:
+            c.close()
+
+
+# SQLite's busy handler already waits up to BUSY_TIMEOUT_MS for the write
+# lock; when another PC still holds it after that (or a commit on a share
+# is refused), the whole transaction is rolled back and rerun a few times
+# with growing, jittered pauses so competing clients don't retry in step.
+WRITE_RETRIES = 3
+RETRY_BACKOFF_S = 0.1
+
+
+def is_busy(error):
+    """True for "database is locked/busy" errors, the ones worth retrying."""
+    if not isinstance(error, sqlite3.OperationalError):
+        return False
+    code = getattr(error, "sqlite_errorcode", None)       # Python 3.11+
+    if code is not None:
+        return code & 0xFF in (sqlite3.SQLITE_BUSY, sqlite3.SQLITE_LOCKED)
+    return "locked" in str(error) or "busy" in str(error)
+
+
+def retry_busy(fn):
+    """Decorator for a function that runs one transaction: retry it on SQLITE_BUSY."""
+    @wraps(fn)
+    def run(*args, **kwargs):
+        for attempt in range(WRITE_RETRIES + 1):
+            try:
+                return fn(*args, **kwargs)
+            except sqlite3.OperationalError as e:
+                if attempt == WRITE_RETRIES or not is_busy(e):
+                    raise
+                time.sleep(RETRY_BACKOFF_S * 2 ** attempt * random.uniform(0.5, 1.5))
+    return run
+
+
+# ------------------ SCHEMA ------------------
+# Items and the ledger are stored against integer keys; the `inventory`
+# and `transactions` views put the names back so every screen, export
+# and report can keep reading the familiar row shape. Older files are
+# converted by the migrations further down, run from init_db.
+SCHEMA_VERSION = 1
+
+
+def init_db():
+    with transaction() as c:
+        c.execute("""CREATE TABLE IF NOT EXISTS app_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        )""")
+        c.execute("DROP VIEW IF EXISTS temp.all_transactions")   # see _create_all_transactions
+        migrated = _migrate(c)
+        _create_tables(c)
+        _create_archive(c)
+        _create_all_transactions(c)
+
+        # Ensure at least 1 admin exists
+        c.execute("SELECT * FROM users WHERE role='super_admin'")
+        if not c.fetchone():
+            # default admin: admin/admin
+            default_pass = hashlib.sha256("rk@rishi#05".encode()).hexdigest()
+            c.execute("INSERT INTO users (username, password, role) VALUES (?, ?, ?)",
+                      ("rishi_kumar", default_pass, "super_admin"))
+
+        for stmt in INDEXES:
+            c.execute(stmt)
+
+        _create_fts(c)
+        _create_low_stock(c)
+        _create_rollups(c)
+        _create_lookup_versions(c)
+        set_meta(c, "schema_version", SCHEMA_VERSION)
+    if migrated:
+        # hand the pages the old text columns used back to the filesystem
+        with _using() as conn:
+            conn.execute("VACUUM")
+
+
+def _create_tables(c):
+    # categories
+    c.execute("""CREATE TABLE IF NOT EXISTS categories (
+        category_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        category_name TEXT UNIQUE NOT NULL
+    )""")
+
+    # users; removed accounts are only deactivated, the ledger still names them
+    c.execute("""CREATE TABLE IF NOT EXISTS users (
+        user_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT UNIQUE NOT NULL,
+        password TEXT NOT NULL,
+        role TEXT CHECK(role IN ('super_admin','admin','user')) NOT NULL,
+        active INTEGER NOT NULL DEFAULT 1
+    )""")
+
+    # every item ever stocked; deleting one from inventory clears `active`
+    # so its ledger history keeps pointing at a real row
+    c.execute("""CREATE TABLE IF NOT EXISTS items (
+        item_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        item_name TEXT NOT NULL,
+        category_id INTEGER NOT NULL REFERENCES categories (category_id),
+        quantity INTEGER NOT NULL DEFAULT 0,
+        min_stock INTEGER NOT NULL DEFAULT 0,
+        active INTEGER NOT NULL DEFAULT 1,
+        UNIQUE(item_name, category_id)
+    )""")
+
+    # "Issued To" destinations
+    c.execute("""CREATE TABLE IF NOT EXISTS destinations (
+        destination_id INTEGER PRIMARY KEY,
+        name TEXT UNIQUE NOT NULL
+    )""")
+
+    _create_counterparties(c)
+
+    # the ledger
+    c.execute("""CREATE TABLE IF NOT EXISTS ledger (
+        txn_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        item_id INTEGER NOT NULL REFERENCES items (item_id),
+        quantity INTEGER,
+        txn_type TEXT,
+        ts TIMESTAMP DEFAULT (datetime('now', '+5 hours', '30 minutes')),
+        txn_date DATE,
+        counterparty_id INTEGER REFERENCES counterparties (counterparty_id),
+        bill_no TEXT,
+        rate REAL,
+        gst REAL,
+        destination_id INTEGER REFERENCES destinations (destination_id),
+        performed_by_id INTEGER REFERENCES users (user_id)
+    )""")
+
+    c.execute("""CREATE VIEW IF NOT EXISTS inventory AS
+        SELECT i.item_id, i.item_name, c.category_name AS category, i.quantity, i.min_stock
+        FROM items i JOIN categories c ON c.category_id = i.category_id
+        WHERE i.active = 1""")
+
+    c.execute(f"CREATE VIEW IF NOT EXISTS transactions AS {TXN_VIEW_SQL.format(ledger='ledger', main='', join='JOIN')}")
+
+    # ledger rows are still written by name through the view; the names
+    # are resolved (and added when new) here, in one place. NOT EXISTS
+    # rather than OR IGNORE so AUTOINCREMENT ids aren't used up per row.
+    c.execute("""CREATE TRIGGER IF NOT EXISTS transactions_insert INSTEAD OF INSERT ON transactions BEGIN
+        INSERT INTO categories (category_name)
+            SELECT new.category WHERE NOT EXISTS (SELECT 1 FROM categories WHERE category_name = new.category);
+        INSERT INTO items (item_id, item_name, category_id, active)
+            SELECT new.item_id, new.item_name, k.category_id, 0
+            FROM categories k WHERE k.category_name = new.category
+            AND NOT EXISTS (SELECT 1 FROM items i WHERE i.item_id = new.item_id
+                            OR (i.item_name = new.item_name AND i.category_id = k.category_id));
+        INSERT OR IGNORE INTO counterparties (direction, name)
+            SELECT new.txn_type, new.user_name
+            WHERE new.txn_type IN ('IN', 'OUT') AND new.user_name != '';
+        INSERT OR IGNORE INTO destinations (name)
+            SELECT new.destination WHERE new.destination != '';
+        INSERT INTO users (username, password, role, active)
+            SELECT new.performed_by, '', 'user', 0 WHERE new.performed_by != ''
+            AND NOT EXISTS (SELECT 1 FROM users WHERE username = new.performed_by);
+        INSERT INTO ledger (txn_id, item_id, quantity, txn_type, ts, txn_date, counterparty_id,
+                            bill_no, rate, gst, destination_id, performed_by_id)
+        VALUES (
+            new.txn_id,
+            COALESCE(new.item_id, (SELECT i.item_id FROM items i JOIN categories c USING (category_id)
+                                   WHERE i.item_name = new.item_name AND c.category_name = new.category)),
+            new.quantity, new.txn_type,
+            COALESCE(new.ts, datetime('now', '+5 hours', '30 minutes')),
+            new.txn_date,
+            (SELECT counterparty_id FROM counterparties WHERE direction = new.txn_type AND name = new.user_name),
+            new.bill_no, new.rate, new.gst,
+            (SELECT destination_id FROM destinations WHERE name = new.destination),
+            (SELECT user_id FROM users WHERE username = new.performed_by));
+    END""")
+    c.execute("""CREATE TRIGGER IF NOT EXISTS transactions_delete INSTEAD OF DELETE ON transactions BEGIN
+        DELETE FROM ledger WHERE txn_id = old.txn_id;
+    END""")
+
+    # ledger-vs-stock reconciliation checkpoints, see inventory_reconcile
+    c.execute("""CREATE TABLE IF NOT EXISTS reconcile_checkpoints (
+        item_id INTEGER PRIMARY KEY,
+        last_txn_id INTEGER NOT NULL,
+        net_qty INTEGER NOT NULL
+    )""")
+
+
+# ledger rows with their names put back; {ledger} is the table to read,
+# {main} the schema prefix for the name tables and {join} how the ledger
+# joins its items
+TXN_VIEW_SQL = """
+    SELECT l.txn_id, l.item_id, i.item_name, c.category_name AS category, l.quantity,
+           l.txn_type, l.ts, l.txn_date,
+           CASE l.txn_type WHEN 'DEL' THEN '-' ELSE p.name END AS user_name,
+           l.bill_no, l.rate, l.gst, d.name AS destination, u.username AS performed_by
+    FROM {ledger} l
+    {join} {main}items i ON i.item_id = l.item_id
+    JOIN {main}categories c ON c.category_id = i.category_id
+    LEFT JOIN {main}counterparties p ON p.counterparty_id = l.counterparty_id
+    LEFT JOIN {main}destinations d ON d.destination_id = l.destination_id
+    LEFT JOIN {main}users u ON u.user_id = l.performed_by_id"""
+
+# an archived row still in the main ledger (the archiver was interrupted
+# between its two steps) is only counted once, from main
+ARCHIVE_ONLY = "NOT EXISTS (SELECT 1 FROM main.ledger m WHERE m.txn_id = l.txn_id)"
+
+# the live and archived ledgers as one, for date ranges reaching back past
+# the archive cutoff; a TEMP view, since views in main can't see `archive`.
+# The archive half always starts from its own ledger (CROSS JOIN keeps
+# SQLite from reordering it): an empty or not yet analyzed archive has no
+# statistics, and the planner would otherwise drive it categories-first,
+# seeking every item in turn instead of one date range.
+ALL_TRANSACTIONS_SQL = (
+    "SELECT * FROM main.transactions UNION ALL "
+    + TXN_VIEW_SQL.format(ledger="archive.ledger", main="main.", join="CROSS JOIN") + f" WHERE {ARCHIVE_ONLY}"
+)
+
+# raw ledger rows from both files, for full recomputes (rollups, reconcile)
+LEDGER_ALL = f"(SELECT * FROM main.ledger UNION ALL SELECT * FROM archive.ledger l WHERE {ARCHIVE_ONLY})"
+
+
+# Secondary indexes for the ledger and item access paths. The txn_date
+# ones lead with the equality columns the transactions filter uses so
+# the BETWEEN range is still a seek; a category filter reaches the
+# ledger through its items, hence (item_id, txn_date, ts).
+INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_ledger_date ON ledger (txn_date, ts)",
+    "CREATE INDEX IF NOT EXISTS idx_ledger_type_date ON ledger (txn_type, txn_date, ts)",
+    "CREATE INDEX IF NOT EXISTS idx_ledger_item_date ON ledger (item_id, txn_date, ts)",
+    "CREATE INDEX IF NOT EXISTS idx_ledger_performed_by ON ledger (performed_by_id, ts)",
+    "CREATE INDEX IF NOT EXISTS idx_ledger_counterparty ON ledger (counterparty_id)",
+    "CREATE INDEX IF NOT EXISTS idx_ledger_destination ON ledger (destination_id)",
+    "CREATE INDEX IF NOT EXISTS idx_items_category ON items (category_id, item_name)",
+    # column sorting: the largest issues/receipts first without sorting
+    # the whole range; type and date are in it so the filters are checked
+    # while walking it. And the inventory by stock level.
+    "CREATE INDEX IF NOT EXISTS idx_ledger_quantity ON ledger (quantity, txn_type, txn_date)",
+    "CREATE INDEX IF NOT EXISTS idx_items_quantity ON items (quantity)",
+)
+
+
+def get_meta(c, key, default=None):
+    row = c.execute("SELECT value FROM app_meta WHERE key=?", (key,)).fetchone()
+    return row[0] if row else default
+
+
+def set_meta(c, key, value):
+    c.execute("INSERT INTO app_meta (key, value) VALUES (?, ?) "
+              "ON CONFLICT(key) DO UPDATE SET value=excluded.value", (key, str(value)))
+
+
+def category_id(c, name):
+    """Id of category `name`, adding it if new."""
+    row = c.execute("SELECT category_id FROM categories WHERE category_name=?", (name,)).fetchone()
+    if row:
+        return row[0]
+    return c.execute("INSERT INTO categories (category_name) VALUES (?)", (name,)).lastrowid
+
+
+# ------------------ ARCHIVE ------------------
+# Same ledger columns, minus the foreign keys (they can't cross files; the
+# items, names and users rows it points at are never deleted from main),
+# and a self-contained FTS index since the text views live in main.
+ARCHIVE_CUTOFF_KEY = "archive_cutoff"
+
+
+def _create_archive(c):
+    c.execute("""CREATE TABLE IF NOT EXISTS archive.ledger (
+        txn_id INTEGER PRIMARY KEY,
+        item_id INTEGER NOT NULL,
+        quantity INTEGER,
+        txn_type TEXT,
+        ts TIMESTAMP,
+        txn_date DATE,
+        counterparty_id INTEGER,
+        bill_no TEXT,
+        rate REAL,
+        gst REAL,
+        destination_id INTEGER,
+        performed_by_id INTEGER
+    )""")
+    c.execute("CREATE INDEX IF NOT EXISTS archive.idx_ledger_date ON ledger (txn_date, ts)")
+    c.execute("CREATE INDEX IF NOT EXISTS archive.idx_ledger_type_date ON ledger (txn_type, txn_date, ts)")
+    c.execute("CREATE INDEX IF NOT EXISTS archive.idx_ledger_item_date ON ledger (item_id, txn_date, ts)")
+    cols = ", ".join(FTS_TABLES["transactions_fts"][2])
+    c.execute(f"""CREATE VIRTUAL TABLE IF NOT EXISTS archive.transactions_fts USING fts5(
+        {cols}, tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )""")
+
+
+def archive_cutoff():
+    """Ledger rows dated before this have been moved to the archive (None if never)."""
+    row = query_one("SELECT value FROM app_meta WHERE key=?", (ARCHIVE_CUTOFF_KEY,))
+    return row[0] if row else None
+
+
+def reaches_archive(from_date):
+    cutoff = archive_cutoff()
+    return cutoff is not None and from_date is not None and str(from_date) < cutoff
+
+
+# ------------------ BACKUP ------------------
+BACKUP_PAGES = 1024                # pages copied per step; writers get in between steps
+
+
+def backup(dest, progress=None):
+    """
+    Copy the database to `dest`, and its archive to the matching
+    `<dest>_archive` file, with SQLite's online backup API: the copy is
+    consistent even while others are writing. Each file appears under its
+    final name only once complete. progress(schema, remaining, total) is
+    called between steps. Returns the paths written.
+    """
+    root, ext = os.path.splitext(dest)
+    targets = (("main", dest), ("archive", f"{root}{ARCHIVE_SUFFIX}{ext or '.db'}"))
+    conn = connect()
+    written = []
+    try:
+        for schema, target in targets:
+            tmp_path = target + ".part"
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            out = sqlite3.connect(tmp_path)
+            try:
+                conn.backup(out, pages=BACKUP_PAGES, name=schema,
+                            progress=(lambda _, remaining, total: progress(schema, remaining, total))
+                            if progress else None)
+            finally:
+                out.close()
+            os.replace(tmp_path, target)
+            written.append(target)
+    finally:
+        conn.close()
+    return written
+
+
+# ------------------ MIGRATIONS ------------------
+# (version, step) in order; init_db runs every step newer than the
+# file's schema_version inside its own transaction, so a failed step
+# leaves the file exactly as it was.
+def _migrate(c):
+    version = int(get_meta(c, "schema_version", 0))
+    changed = False
+    for target, step in MIGRATIONS:
+        if version < target:
+            changed = step(c) or changed
+    return changed
+
+
+def _table_exists(c, name, kind="table"):
+    return c.execute("SELECT 1 FROM sqlite_master WHERE type=? AND name=?", (kind, name)).fetchone() is not None
+
+
+def _normalize_ledger(c):
+    """
+    v1: text-keyed inventory/transactions tables -> items + ledger on
+    integer keys. Returns False on a new file (nothing to convert).
+    """
+    if not _table_exists(c, "transactions"):
+        return False
+
+    # derived objects are rebuilt against the new tables afterwards
+    for (name,) in c.execute("""SELECT name FROM sqlite_master WHERE type='trigger'
+                                AND tbl_name IN ('inventory', 'transactions', 'counterparties')""").fetchall():
+        c.execute(f"DROP TRIGGER {name}")
+    for name in ("inventory_fts", "transactions_fts", "low_stock", "counterparties"):
+        c.execute(f"DROP TABLE IF EXISTS {name}")
+    c.execute("ALTER TABLE inventory RENAME TO legacy_inventory")
+    c.execute("ALTER TABLE transactions RENAME TO legacy_transactions")
+    if not any(r[1] == "active" for r in c.execute("PRAGMA table_info(users)")):
+        c.execute("ALTER TABLE users ADD COLUMN active INTEGER NOT NULL DEFAULT 1")
+    _create_tables(c)
+
+    c.execute("""INSERT OR IGNORE INTO categories (category_name)
+                 SELECT category FROM legacy_inventory
+                 UNION SELECT category FROM legacy_transactions WHERE category IS NOT NULL""")
+    c.execute("""INSERT INTO items (item_id, item_name, category_id, quantity, min_stock)
+                 SELECT i.item_id, i.item_name, c.category_id, i.quantity, i.min_stock
+                 FROM legacy_inventory i JOIN categories c ON c.category_name = i.category""")
+    # items that were deleted only live on in the ledger: keep their old
+    # id where it's free; a name that was deleted and added again folds
+    # into the current item
+    c.execute("""INSERT OR IGNORE INTO items (item_id, item_name, category_id, active)
+                 SELECT MIN(t.item_id), t.item_name, c.category_id, 0
+                 FROM legacy_transactions t JOIN categories c ON c.category_name = t.category
+                 GROUP BY t.item_name, c.category_id""")
+    c.execute("""INSERT INTO items (item_name, category_id, active)
+                 SELECT DISTINCT t.item_name, c.category_id, 0
+                 FROM legacy_transactions t JOIN categories c ON c.category_name = t.category
+                 WHERE NOT EXISTS (SELECT 1 FROM items i
+                                   WHERE i.item_name = t.item_name AND i.category_id = c.category_id)""")
+
+    c.execute("""INSERT INTO counterparties (direction, name, uses, last_used)
+                 SELECT txn_type, user_name, COUNT(*), MAX(ts) FROM legacy_transactions
+                 WHERE txn_type IN ('IN','OUT') AND user_name IS NOT NULL AND user_name != ''
+                 GROUP BY txn_type, user_name""")
+    c.execute("""INSERT OR IGNORE INTO destinations (name)
+                 SELECT DISTINCT destination FROM legacy_transactions WHERE destination != ''""")
+    c.execute("""INSERT OR IGNORE INTO users (username, password, role, active)
+                 SELECT DISTINCT performed_by, '', 'user', 0 FROM legacy_transactions
+                 WHERE performed_by != ''""")
+
+    c.execute("""INSERT INTO ledger (txn_id, item_id, quantity, txn_type, ts, txn_date, counterparty_id,
+                                     bill_no, rate, gst, destination_id, performed_by_id)
+                 SELECT t.txn_id, i.item_id, t.quantity, t.txn_type, t.ts, t.txn_date,
+                        (SELECT counterparty_id FROM counterparties
+                         WHERE direction = t.txn_type AND name = t.user_name),
+                        t.bill_no, t.rate, t.gst,
+                        (SELECT destination_id FROM destinations WHERE name = t.destination),
+                        (SELECT user_id FROM users WHERE username = t.performed_by)
+                 FROM legacy_transactions t
+                 JOIN categories c ON c.category_name = t.category
+                 JOIN items i ON i.item_name = t.item_name AND i.category_id = c.category_id
+                 ORDER BY t.txn_id""")
+    lost = c.execute("SELECT (SELECT COUNT(*) FROM legacy_transactions) - (SELECT COUNT(*) FROM ledger)").fetchone()[0]
+    if lost:
+        raise sqlite3.IntegrityError(f"{lost} ledger row(s) have no item name/category; not converting")
+
+    # ids never go backwards, even past rows deleted before the move
+    for new, old in (("items", "legacy_inventory"), ("ledger", "legacy_transactions")):
+        c.execute("""UPDATE sqlite_sequence
+                     SET seq = MAX(seq, COALESCE((SELECT seq FROM sqlite_sequence WHERE name = ?), 0))
+                     WHERE name = ?""", (old, new))
+        c.execute("DELETE FROM sqlite_sequence WHERE name = ?", (old,))
+    c.execute("DROP TABLE legacy_transactions")
+    c.execute("DROP TABLE legacy_inventory")
+
+    # item ids may have been merged above: let reconciliation start over
+    c.execute("DELETE FROM reconcile_checkpoints")
+    c.execute("DELETE FROM app_meta WHERE key LIKE 'reconcile_%'")
+    if _table_exists(c, "lookup_versions"):
+        c.execute("UPDATE lookup_versions SET version = version + 1")
+    return True
+
+
+MIGRATIONS = (
+    (1, _normalize_ledger),
+)
+
+# A file as the app created it before v1, with one receipt and one issue,
+# for migration_check.
+LEGACY_SCHEMA = """
+CREATE TABLE categories (
+    category_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    category_name TEXT UNIQUE NOT NULL
+);
+CREATE TABLE inventory (
+    item_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    item_name TEXT NOT NULL,
+    category TEXT NOT NULL,
+    quantity INTEGER NOT NULL,
+    min_stock INTEGER NOT NULL,
+    UNIQUE(item_name, category)
+);
+CREATE TABLE transactions (
+    txn_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    item_id INTEGER,
+    item_name TEXT,
+    category TEXT,
+    quantity INTEGER,
+    txn_type TEXT,
+    ts TIMESTAMP DEFAULT (datetime('now', '+5 hours', '30 minutes')),
+    txn_date DATE,
+    user_name TEXT,
+    bill_no TEXT,
+    rate REAL,
+    gst REAL,
+    destination TEXT,
+    performed_by TEXT
+);
+CREATE TABLE users (
+    user_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username TEXT UNIQUE NOT NULL,
+    password TEXT NOT NULL,
+    role TEXT CHECK(role IN ('super_admin','admin','user')) NOT NULL
+);
+INSERT INTO users (username, password, role) VALUES ('admin', '', 'super_admin');
+INSERT INTO categories (category_name) VALUES ('Tools');
+INSERT INTO inventory (item_name, category, quantity, min_stock) VALUES ('Screw', 'Tools', 6, 2);
+INSERT INTO transactions (item_id, item_name, category, quantity, txn_type, txn_date, user_name,
+                          bill_no, rate, gst, destination, performed_by)
+VALUES (1, 'Screw', 'Tools', 10, 'IN', '2024-01-02', 'Acme', 'B1', 2.5, 18, '', 'admin'),
+       (1, 'Screw', 'Tools', 4, 'OUT', '2024-01-03', 'Ravi', '', NULL, NULL, 'Workshop', 'admin');
+"""
+
+
+def migration_check():
+    """
+    Convert a pre-v1 file (LEGACY_SCHEMA) with init_db in a scratch
+    directory; returns a list of problems, empty if it came through whole.
+    """
+    import tempfile
+
+    current = DB_NAME
+    archive = os.environ.pop("INVENTORY_ARCHIVE", None)   # keep the scratch archive next to it
+    problems = []
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            use_database(os.path.join(tmp, "legacy.db"))
+            legacy = sqlite3.connect(DB_NAME)
+            legacy.executescript(LEGACY_SCHEMA)
+            legacy.close()
+            try:
+                init_db()
+            except sqlite3.Error as e:
+                return [f"init_db failed: {e}"]
+            if query("SELECT item_name, category, quantity FROM inventory") != [("Screw", "Tools", 6)]:
+                problems.append("inventory rows changed")
+            rows = query("""SELECT txn_type, quantity, user_name, destination, performed_by
+                            FROM all_transactions ORDER BY txn_id""")
+            if rows != [("IN", 10, "Acme", None, "admin"), ("OUT", 4, "Ravi", "Workshop", "admin")]:
+                problems.append(f"ledger rows changed: {rows}")
+    finally:
+        if archive is not None:
+            os.environ["INVENTORY_ARCHIVE"] = archive
+        use_database(current)
+    return problems
+
+
+# ------------------ FULL-TEXT SEARCH ------------------
+# External-content FTS5 indexes over the searchable text columns of the
+# two views. The triggers sit on the underlying tables and only fire on
+# the columns that feed the indexed text (plus `active`, which hides a
+# deleted item), so the frequent quantity updates never touch them.
+# LIKE '%x%' can't use an index; MATCH can.
+# fts -> (content view, key, indexed columns, source table, watched columns)
+FTS_TABLES = {
+    "inventory_fts": ("inventory", "item_id", ("item_name", "category"),
+                      "items", ("item_name", "category_id", "active")),
+    "transactions_fts": ("transactions", "txn_id", ("item_name", "category", "destination", "bill_no"),
+                         "ledger", ("item_id", "destination_id", "bill_no")),
+}
+
+
+def _create_fts(c):
+    for fts, (content, key, cols, source, watched) in FTS_TABLES.items():
+        exists = c.execute("SELECT 1 FROM sqlite_master WHERE name=?", (fts,)).fetchone()
+        col_list = ", ".join(cols)
+        c.execute(f"""CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+            {col_list}, content='{content}', content_rowid='{key}',
+            tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+        )""")
+        # the view row is read while it still holds the values to drop
+        add = f"INSERT INTO {fts}(rowid, {col_list}) SELECT {key}, {col_list} FROM {content} WHERE {key} = new.{key};"
+        drop = (f"INSERT INTO {fts}({fts}, rowid, {col_list}) "
+                f"SELECT 'delete', {key}, {col_list} FROM {content} WHERE {key} = old.{key};")
+        watch = ", ".join(watched)
+        c.execute(f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {source} BEGIN {add} END")
+        c.execute(f"CREATE TRIGGER IF NOT EXISTS {fts}_bd BEFORE DELETE ON {source} BEGIN {drop} END")
+        c.execute(f"CREATE TRIGGER IF NOT EXISTS {fts}_bu BEFORE UPDATE OF {watch} ON {source} BEGIN {drop} END")
+        c.execute(f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {watch} ON {source} BEGIN {add} END")
+        if not exists:
+            # first run on an existing database: index what's already there
+            c.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+# ------------------ LOW STOCK ------------------
+# Active items below min_stock, kept current by triggers on items so the
+# dashboard count and list never scan the catalog.
+def _create_low_stock(c):
+    exists = c.execute("SELECT 1 FROM sqlite_master WHERE name='low_stock'").fetchone()
+    c.execute("""CREATE TABLE IF NOT EXISTS low_stock (
+        item_id INTEGER PRIMARY KEY,
+        quantity INTEGER NOT NULL,
+        min_stock INTEGER NOT NULL
+    )""")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_low_stock_qty ON low_stock (quantity)")
+    c.execute("""CREATE TRIGGER IF NOT EXISTS low_stock_ai AFTER INSERT ON items
+        WHEN new.active = 1 AND new.quantity < new.min_stock BEGIN
+        INSERT OR REPLACE INTO low_stock VALUES (new.item_id, new.quantity, new.min_stock);
+    END""")
+    c.execute("""CREATE TRIGGER IF NOT EXISTS low_stock_au_low AFTER UPDATE OF quantity, min_stock, active ON items
+        WHEN new.active = 1 AND new.quantity < new.min_stock BEGIN
+        INSERT OR REPLACE INTO low_stock VALUES (new.item_id, new.quantity, new.min_stock);
+    END""")
+    c.execute("""CREATE TRIGGER IF NOT EXISTS low_stock_au_ok AFTER UPDATE OF quantity, min_stock, active ON items
+        WHEN new.active = 0 OR new.quantity >= new.min_stock BEGIN
+        DELETE FROM low_stock WHERE item_id = old.item_id;
+    END""")
+    c.execute("""CREATE TRIGGER IF NOT EXISTS low_stock_ad AFTER DELETE ON items BEGIN
+        DELETE FROM low_stock WHERE item_id = old.item_id;
+    END""")
+    if not exists:
+        c.execute("""INSERT INTO low_stock SELECT item_id, quantity, min_stock
+                     FROM items WHERE active = 1 AND quantity < min_stock""")
+
+
+# ------------------ ROLLUPS ------------------
+# IN/OUT totals per day and per month, bucketed separately by item,
+# category, counterparty and destination, kept current by triggers on the
+# ledger so every write path, bulk ones included, updates them as it goes.
+# Reports read only these, so a year by category is a few hundred rows
+# whatever the ledger size. value is quantity * rate and tax its GST
+# share, so only rows that carry a rate (receipts) add to them; reports
+# on issues leave them out (see report_query).
+# rebuild_rollups() recomputes everything from the ledger.
+# table -> period expression over a ledger row
+ROLLUPS = {
+    "rollup_daily": "COALESCE({r}.txn_date, '')",
+    "rollup_monthly": "substr(COALESCE({r}.txn_date, ''), 1, 7)",
+}
+# dimension -> bucket key over a ledger row (0 when the row has none)
+ROLLUP_DIMENSIONS = {
+    "item": "{r}.item_id",
+    "category": "(SELECT category_id FROM items WHERE item_id = {r}.item_id)",
+    "counterparty": "COALESCE({r}.counterparty_id, 0)",
+    "destination": "COALESCE({r}.destination_id, 0)",
+}
+ROLLUP_KEY = "txn_type, dim, period, key_id"
+ROLLUPS_DEFERRED_KEY = "rollups_deferred"
+ROLLUPS_KEEP_KEY = "rollups_keep"
+
+
+def _rollup_upsert(table, dim, r, sign=""):
+    period = ROLLUPS[table].format(r=r)
+    key = ROLLUP_DIMENSIONS[dim].format(r=r)
+    return f"""INSERT INTO {table} ({ROLLUP_KEY}, quantity, value, tax, txns)
+        VALUES (COALESCE({r}.txn_type, ''), '{dim}', {period}, {key},
+                {sign}COALESCE({r}.quantity, 0), {sign}COALESCE({r}.quantity * {r}.rate, 0),
+                {sign}COALESCE({r}.quantity * {r}.rate * {r}.gst / 100, 0), {sign}1)
+        ON CONFLICT ({ROLLUP_KEY}) DO UPDATE
+        SET quantity = quantity + excluded.quantity, value = value + excluded.value,
+            tax = tax + excluded.tax, txns = txns + excluded.txns;"""
+
+
+def _rollup_remove(table, r):
+    # take the row out of every bucket; a bucket whose last row went goes too
+    period = ROLLUPS[table].format(r=r)
+    steps = []
+    for dim, key in ROLLUP_DIMENSIONS.items():
+        steps.append(_rollup_upsert(table, dim, r, "-"))
+        steps.append(f"""DELETE FROM {table} WHERE txn_type = COALESCE({r}.txn_type, '') AND dim = '{dim}'
+            AND period = {period} AND key_id = {key.format(r=r)} AND txns = 0;""")
+    return "\n".join(steps)
+
+
+def _rollup_add(table, r):
+    return "\n".join(_rollup_upsert(table, dim, r) for dim in ROLLUP_DIMENSIONS)
+
+
+def _create_rollups(c):
+    watched = "txn_type, txn_date, item_id, counterparty_id, destination_id, quantity, rate, gst"
+    live = f"WHEN NOT EXISTS (SELECT 1 FROM app_meta WHERE key = '{ROLLUPS_DEFERRED_KEY}')"
+    # rows moved to the archive still count in the reports
+    kept = f"WHEN NOT EXISTS (SELECT 1 FROM app_meta WHERE key = '{ROLLUPS_KEEP_KEY}')"
+    for table in ROLLUPS:
+        exists = c.execute("SELECT 1 FROM sqlite_master WHERE name=?", (table,)).fetchone()
+        c.execute(f"""CREATE TABLE IF NOT EXISTS {table} (
+            txn_type TEXT NOT NULL,
+            dim TEXT NOT NULL,
+            period TEXT NOT NULL,
+            key_id INTEGER NOT NULL,
+            quantity INTEGER NOT NULL,
+            value REAL NOT NULL,
+            tax REAL NOT NULL,
+            txns INTEGER NOT NULL,
+            PRIMARY KEY ({ROLLUP_KEY})
+        ) WITHOUT ROWID""")
+        c.execute(f"CREATE TRIGGER IF NOT EXISTS {table}_ai AFTER INSERT ON ledger {live} "
+                  f"BEGIN {_rollup_add(table, 'new')} END")
+        c.execute(f"CREATE TRIGGER IF NOT EXISTS {table}_ad AFTER DELETE ON ledger {kept} "
+                  f"BEGIN {_rollup_remove(table, 'old')} END")
+        c.execute(f"""CREATE TRIGGER IF NOT EXISTS {table}_au AFTER UPDATE OF {watched} ON ledger BEGIN
+            {_rollup_remove(table, 'old')}
+            {_rollup_add(table, 'new')}
+        END""")
+        if not exists:
+            _fold_rollup(c, table, source=LEDGER_ALL)
+
+
+def _fold_rollup(c, table, after=0, source="ledger"):
+    """Add ledger rows with txn_id > after into `table`, one grouped upsert per dimension."""
+    period = ROLLUPS[table].format(r="l")
+    for dim, key in ROLLUP_DIMENSIONS.items():
+        c.execute(f"""INSERT INTO {table} ({ROLLUP_KEY}, quantity, value, tax, txns)
+            SELECT COALESCE(l.txn_type, ''), '{dim}', {period}, {key.format(r="l")},
+                   SUM(COALESCE(l.quantity, 0)), SUM(COALESCE(l.quantity * l.rate, 0)),
+                   SUM(COALESCE(l.quantity * l.rate * l.gst / 100, 0)), COUNT(*)
+            FROM {source} l WHERE l.txn_id > ? GROUP BY 1, 3, 4
+            ON CONFLICT ({ROLLUP_KEY}) DO UPDATE
+            SET quantity = quantity + excluded.quantity, value = value + excluded.value,
+                tax = tax + excluded.tax, txns = txns + excluded.txns""", (after,))
+
+
+@contextmanager
+def deferred_rollups(c):
+    """
+    For bulk writes, inside their transaction: the per-row insert
+    triggers stand down and the new ledger rows are folded in with a few
+    grouped statements at the end instead. The flag is never committed,
+    so other connections are unaffected.
+    """
+    last = c.execute("SELECT COALESCE(MAX(txn_id), 0) FROM ledger").fetchone()[0]
+    set_meta(c, ROLLUPS_DEFERRED_KEY, 1)
+    yield
+    c.execute("DELETE FROM app_meta WHERE key=?", (ROLLUPS_DEFERRED_KEY,))
+    for table in ROLLUPS:
+        _fold_rollup(c, table, after=last)
+
+
+@remote_call(admin=True)
+def rebuild_rollups(conn=None):
+    """Recompute every rollup table from the ledger, archive included; returns the buckets written."""
+    with transaction(conn=conn) as c:
+        for table in ROLLUPS:
+            c.execute(f"DELETE FROM {table}")
+            _fold_rollup(c, table, source=LEDGER_ALL)
+        return sum(c.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] for table in ROLLUPS)
+
+
+# ------------------ COUNTERPARTIES ------------------
+# Names seen in "Received From" (IN) and "Issued To" (OUT), with how often
+# and how recently each was used, so the combos can rank suggestions
+# without a DISTINCT over the ledger. Ledger rows point at them by id.
+# Kept up to date by the write paths (inventory_core.touch_counterparties).
+def _create_counterparties(c):
+    c.execute("""CREATE TABLE IF NOT EXISTS counterparties (
+        counterparty_id INTEGER PRIMARY KEY,
+        direction TEXT NOT NULL CHECK(direction IN ('IN','OUT')),
+        name TEXT NOT NULL,
+        uses INTEGER NOT NULL DEFAULT 0,
+        last_used TIMESTAMP,
+        UNIQUE (direction, name)
+    )""")
+    c.execute("""CREATE INDEX IF NOT EXISTS idx_counterparties_rank
+                 ON counterparties (direction, uses DESC, last_used DESC, name)""")
+
+
+# ------------------ LOOKUP VERSIONS ------------------
+# One counter per combobox source, bumped by triggers only when that list
+# can actually change, so inventory_lookups can tell with one tiny read
+# whether its cached copy is stale, including after other PCs' writes.
+LOOKUP_TRIGGERS = {
+    "categories": [
+        "AFTER INSERT ON categories",
+        "AFTER DELETE ON categories",
+        "AFTER UPDATE OF category_name ON categories",
+    ],
+    "item_names": [
+        "AFTER INSERT ON items",
+        "AFTER DELETE ON items",
+        "AFTER UPDATE OF item_name, active ON items",
+    ],
+    # the counterparties table is small; any change re-ranks the combos
+    "counterparties": [
+        "AFTER INSERT ON counterparties",
+        "AFTER UPDATE ON counterparties",
+        "AFTER DELETE ON counterparties",
+    ],
+    # anything a list window shows (stock, names, the ledger), so an open
+    # grid can poll for other PCs' changes with one tiny read
+    "rows": [
+        "AFTER INSERT ON items",
+        "AFTER UPDATE ON items",
+        "AFTER DELETE ON items",
+        "AFTER UPDATE OF category_name ON categories",
+        "AFTER INSERT ON ledger",
+        "AFTER UPDATE ON ledger",
+        "AFTER DELETE ON ledger",
+    ],
+}
+ROWS_VERSION_SQL = "SELECT version FROM lookup_versions WHERE name = 'rows'"
+
+
+def _create_lookup_versions(c):
+    c.execute("""CREATE TABLE IF NOT EXISTS lookup_versions (
+        name TEXT PRIMARY KEY,
+        version INTEGER NOT NULL DEFAULT 0
+    )""")
+    for name, events in LOOKUP_TRIGGERS.items():
+        c.execute("INSERT OR IGNORE INTO lookup_versions (name) VALUES (?)", (name,))
+        for i, event in enumerate(events):
+            c.execute(f"""CREATE TRIGGER IF NOT EXISTS lookup_{name}_{i} {event} BEGIN
+                UPDATE lookup_versions SET version = version + 1 WHERE name = '{name}';
+            END""")
+
+
+def bump_lookup(c, name):
+    """For bulk deletes the triggers can't see cheaply (e.g. archiving)."""
+    c.execute("UPDATE lookup_versions SET version = version + 1 WHERE name = ?", (name,))
+
+
+def fts_query(text):
+    """
+    Turn what the user typed into an FTS5 query: every word must match,
+    each as a prefix ("scr dri" finds "Screw Driver"). None if nothing
+    searchable was typed.
+    """
+    tokens = re.findall(r"[^\W_]+", text)
+    return " ".join(f'"{t}"*' for t in tokens) or None
+
+
+# ------------------ SHARED QUERIES ------------------
+# Built here rather than inline in the windows so the plan check below
+# exercises exactly the SQL the screens run.
+TXN_COLUMNS = ("txn_id, item_name, category, quantity, txn_type, txn_date, "
+               "user_name, bill_no, rate, gst, destination, performed_by")
+TXN_COLUMN_NAMES = [col.strip() for col in TXN_COLUMNS.split(",")]
+TXN_COLUMN_COUNT = len(TXN_COLUMN_NAMES)
+
+# sortable transactions columns -> the keyset sort key, ending in txn_id so
+# every row's key is unique; ts (entry time, newest first) is the default
+TXN_SORT_KEYS = {col: (col, "txn_id") for col in TXN_COLUMN_NAMES}
+TXN_SORT_KEYS.update(txn_id=("txn_id",), ts=("ts", "txn_id"), txn_date=("txn_date", "ts", "txn_id"),
+                     txn_type=("txn_type", "ts", "txn_id"))
+TXN_DEFAULT_SORT = ("ts", True)
+NEVER_NULL = ("txn_id", "ts")
+
+COUNTERPARTIES_SQL = "SELECT name FROM counterparties WHERE direction=? ORDER BY uses DESC, last_used DESC, name"
+LAST_ACTIVITY_SQL = """
+    SELECT u.username, u.role, MAX(t.ts) as last_txn
+    FROM users u
+    LEFT JOIN ledger t ON t.performed_by_id = u.user_id
+    WHERE u.active = 1
+    GROUP BY u.username, u.role
+    ORDER BY last_txn DESC
+"""
+
+
+def _transactions_filter(name, user, ttype, cat, from_date, to_date, archived):
+    where = "txn_date BETWEEN ? AND ?"
+    params = [from_date, to_date]
+
+    match = fts_query(name)
+    if match:
+        if archived:
+            where += (" AND txn_id IN (SELECT rowid FROM main.transactions_fts(?)"
+                      " UNION ALL SELECT rowid FROM archive.transactions_fts(?))")
+            params.extend([match, match])
+        else:
+            where += " AND txn_id IN (SELECT rowid FROM transactions_fts WHERE transactions_fts MATCH ?)"
+            params.append(match)
+
+    if user:
+        where += " AND user_name LIKE ?"
+        params.append(f"%{user}%")
+
+    if ttype != "All":
+        where += " AND txn_type=?"
+        params.append(ttype)
+
+    if cat != "All":
+        where += " AND category=?"
+        params.append(cat)
+    return where, params
+
+
+def _transactions_source(from_date, archived):
+    # the archive is only read when the range starts before its cutoff
+    if archived is None:
+        archived = reaches_archive(from_date)
+    return ("all_transactions" if archived else "transactions"), archived
+
+
+def _order_by(keys, descending):
+    return ", ".join(f"{key} {'DESC' if descending else 'ASC'}" for key in keys)
+
+
+def _keyset_after(keys, values, descending):
+    """
+    WHERE condition (and params) for the rows that come after `values` in
+    ORDER BY keys. NULLs sort first ascending and last descending, as
+    SQLite orders them, so a page boundary on a NULL still works.
+    """
+    key, value = keys[0], values[0]
+    if value is None:
+        beyond, params = ("0" if descending else f"{key} IS NOT NULL"), []
+    else:
+        beyond, params = f"{key} {'<' if descending else '>'} ?", [value]
+        if descending and key not in NEVER_NULL:
+            beyond += f" OR {key} IS NULL"
+    if len(keys) == 1:
+        return f"({beyond})", params
+    rest, rest_params = _keyset_after(keys[1:], values[1:], descending)
+    return f"({beyond} OR ({key} IS ? AND {rest}))", params + [value] + rest_params
+
+
+def transactions_query(name="", user="", ttype="All", cat="All", from_date=None, to_date=None,
+                       after=None, limit=None, archived=None, sort=None):
+    """
+    SQL and params for the transactions window filters, sorted by
+    sort=(column, descending), any TXN_SORT_KEYS column; newest first by
+    default. With limit set this is one keyset page: each row carries its
+    sort key as extra trailing columns (row[TXN_COLUMN_COUNT:]), and
+    passing the last shown row's key as `after` gets the next page.
+    Archived rows are included when from_date is before the archive
+    cutoff (or archived=True).
+    """
+    column, descending = sort or TXN_DEFAULT_SORT
+    if column not in TXN_SORT_KEYS:
+        raise ValueError(f"can't sort transactions by {column!r}")
+    keys = TXN_SORT_KEYS[column]
+    source, archived = _transactions_source(from_date, archived)
+    where, params = _transactions_filter(name, user, ttype, cat, from_date, to_date, archived)
+    cols = TXN_COLUMNS if limit is None else f"{TXN_COLUMNS}, {', '.join(keys)}"
+    if after is not None:
+        condition, after_params = _keyset_after(keys, after, descending)
+        where += f" AND {condition}"
+        params.extend(after_params)
+    query = f"SELECT {cols} FROM {source} WHERE {where} ORDER BY {_order_by(keys, descending)}"
+    if limit is not None:
+        query += " LIMIT ?"
+        params.append(limit)
+    return query, params
+
+
+def transactions_count_query(name="", user="", ttype="All", cat="All", from_date=None, to_date=None,
+                             archived=None):
+    source, archived = _transactions_source(from_date, archived)
+    where, params = _transactions_filter(name, user, ttype, cat, from_date, to_date, archived)
+    return f"SELECT COUNT(*) FROM {source} WHERE {where}", params
+
+
+INVENTORY_COLUMNS = "item_id, item_name, category, quantity, min_stock"
+INVENTORY_SORTS = [col.strip() for col in INVENTORY_COLUMNS.split(",")]
+INVENTORY_COLUMN_COUNT = len(INVENTORY_SORTS)
+
+
+LOW_STOCK_COUNT_SQL = "SELECT COUNT(*) FROM low_stock"
+LOW_STOCK_TOP_SQL = """
+    SELECT i.item_name, i.category, l.quantity, l.min_stock
+    FROM low_stock l JOIN inventory i ON i.item_id = l.item_id
+    ORDER BY l.quantity LIMIT ?
+"""
+
+# low-stock rows first (closest to zero first), then the rest in id
+# order. Each band is read in its own index order, low_stock by
+# (quantity, item_id) and items by id, and cut at the page size before
+# the two are put together, so a page never sorts the catalog. A row's
+# keyset key is (band, low_qty, key_id).
+LOW_FIRST_KEYS = ("band", "low_qty", "key_id")
+LOW_BAND_SQL = """SELECT {columns}, 0 AS band, low_qty, low_id AS key_id
+    FROM (SELECT item_id AS low_id, quantity AS low_qty FROM low_stock)
+    CROSS JOIN inventory ON item_id = low_id WHERE {where}"""
+REST_BAND_SQL = """SELECT {columns}, 1 AS band, NULL AS low_qty, item_id AS key_id
+    FROM inventory WHERE quantity >= min_stock AND {where}"""
+
+
+def _inventory_filter(name, cat):
+    where = "1"
+    params = []
+    match = fts_query(name)
+    if match:
+        where += " AND item_id IN (SELECT rowid FROM inventory_fts WHERE inventory_fts MATCH ?)"
+        params.append(match)
+    if cat and cat != "All":
+        where += " AND category=?"
+        params.append(cat)
+    return where, params
+
+
+def _low_first_query(columns, where, params, low_only, after, limit):
+    """The low-first order: one SELECT per band, UNION ALL'd; key columns only come back when paging."""
+    bands = []
+    band_params = []
+    if low_only or after is None or after[0] == 0:
+        low_where, low_params = where, list(params)
+        if after is not None:
+            # never NULL here, so a row value: one seek into idx_low_stock_qty
+            low_where += " AND (low_qty, low_id) > (?, ?)"
+            low_params.extend(after[1:])
+        bands.append((LOW_BAND_SQL.format(columns=columns, where=low_where), "low_qty, low_id"))
+        band_params.append(low_params)
+    if not low_only:
+        rest_where, rest_params = where, list(params)
+        if after is not None and after[0] == 1:
+            rest_where += " AND item_id > ?"
+            rest_params.append(after[2])
+        bands.append((REST_BAND_SQL.format(columns=columns, where=rest_where), "item_id"))
+        band_params.append(rest_params)
+
+    order = f"ORDER BY {_order_by(LOW_FIRST_KEYS, False)}"
+    if limit is None:
+        union = " UNION ALL ".join(sql for sql, _ in bands)
+        return f"SELECT {columns} FROM ({union}) {order}", [p for ps in band_params for p in ps]
+    union = " UNION ALL ".join(f"SELECT * FROM ({sql} ORDER BY {band_order} LIMIT ?)" for sql, band_order in bands)
+    return f"{union} {order} LIMIT ?", [p for ps in band_params for p in ps + [limit]] + [limit]
+
+
+def inventory_query(name="", cat="All", columns=INVENTORY_COLUMNS, low_only=False, low_first=False, sort=None,
+                    after=None, limit=None):
+    """
+    SQL and params for the inventory window filters. sort=(column,
+    descending) orders by an INVENTORY_SORTS column (then item_id) and
+    takes precedence over low_first. Paging works as in
+    transactions_query: with limit set each row ends in its sort key
+    (row[len(columns):]), and passing the last one as `after` gets the
+    next page.
+    """
+    where, params = _inventory_filter(name, cat)
+    if low_first and not sort:
+        return _low_first_query(columns, where, params, low_only, after, limit)
+    if low_only:
+        where += " AND item_id IN (SELECT item_id FROM low_stock)"
+    keys = ()
+    if sort:
+        column, descending = sort
+        if column not in INVENTORY_SORTS:
+            raise ValueError(f"can't sort the inventory by {column!r}")
+        keys = (column,) if column == "item_id" else (column, "item_id")
+        if after is not None:
+            condition, after_params = _keyset_after(keys, after, descending)
+            where += f" AND {condition}"
+            params.extend(after_params)
+    cols = columns if limit is None or not keys else f"{columns}, {', '.join(keys)}"
+    query = f"SELECT {cols} FROM inventory WHERE {where}"
+    if keys:
+        query += f" ORDER BY {_order_by(keys, descending)}"
+    if limit is not None:
+        query += " LIMIT ?"
+        params.append(limit)
+    return query, params
+
+
+# report period -> (rollup table, period column as shown)
+REPORT_PERIODS = {
+    "Daily": ("rollup_daily", "r.period"),
+    "Monthly": ("rollup_monthly", "r.period"),
+    "Yearly": ("rollup_monthly", "substr(r.period, 1, 4)"),
+}
+# report grouping -> (rollup dimension, label, join)
+REPORT_GROUPS = {
+    "Item": ("item", "i.item_name || ' / ' || k.category_name",
+             "JOIN items i ON i.item_id = r.key_id JOIN categories k ON k.category_id = i.category_id"),
+    "Category": ("category", "k.category_name",
+                 "JOIN categories k ON k.category_id = r.key_id"),
+    "Destination": ("destination", "COALESCE(d.name, '-')",
+                    "LEFT JOIN destinations d ON d.destination_id = r.key_id"),
+    "Counterparty": ("counterparty", "COALESCE(p.name, '-')",
+                     "LEFT JOIN counterparties p ON p.counterparty_id = r.key_id"),
+}
+
+
+# transaction types whose rows carry a rate; issues are entered without
+# one, so their value and GST are unknown (NULL), not zero
+PRICED_TYPES = ("IN",)
+
+
+def report_query(period="Monthly", group="Item", ttype="OUT", from_date=None, to_date=None):
+    """SQL and params for the reports window; reads the rollup tables only."""
+    table, period_col = REPORT_PERIODS[period]
+    dim, label, join = REPORT_GROUPS[group]
+    lo, hi = str(from_date), str(to_date)
+    if table == "rollup_monthly":
+        lo, hi = lo[:7], hi[:7]
+    if ttype in PRICED_TYPES:
+        money = "ROUND(SUM(r.value), 2) AS value, ROUND(SUM(r.tax), 2) AS gst"
+    else:
+        money = "NULL AS value, NULL AS gst"
+    query = f"""SELECT {period_col} AS period, {label} AS name, SUM(r.quantity) AS quantity,
+                       {money}, SUM(r.txns) AS txns
+                FROM {table} r {join}
+                WHERE r.txn_type = ? AND r.dim = ? AND r.period BETWEEN ? AND ?
+                GROUP BY 1, r.key_id ORDER BY 1, 3 DESC"""
+    return query, [ttype, dim, lo, hi]
+
+
+# ------------------ PLAN CHECK ------------------
+def _plan_samples():
+    d1, d2 = "2024-01-01", "2024-03-31"
+    yield "load_transactions", transactions_query(from_date=d1, to_date=d2)
+    yield "load_transactions type", transactions_query(ttype="OUT", from_date=d1, to_date=d2)
+    yield "load_transactions category", transactions_query(cat="Tools", from_date=d1, to_date=d2)
+    yield "load_transactions type+category", transactions_query(ttype="IN", cat="Tools", from_date=d1, to_date=d2)
+    yield "load_transactions next page", transactions_query(from_date=d1, to_date=d2,
+                                                            after=("2024-03-01 10:00:00", 100), limit=200)
+    yield "transactions count", transactions_count_query(ttype="OUT", from_date=d1, to_date=d2)
+    yield "archived range", transactions_query(cat="Tools", from_date=d1, to_date=d2, archived=True)
+    yield "archived range search", transactions_query(name="scr", from_date=d1, to_date=d2,
+                                                      after=("2024-03-01 10:00:00", 100), limit=200,
+                                                      archived=True)
+    yield "received from combo", (COUNTERPARTIES_SQL, ("IN",))
+    yield "issued to combo", (COUNTERPARTIES_SQL, ("OUT",))
+    yield "manage_users last activity", (LAST_ACTIVITY_SQL, ())
+    yield "load_transactions name search", transactions_query(name="screw dri", from_date=d1, to_date=d2)
+    yield "load_items category", inventory_query(cat="Tools")
+    yield "search_items", inventory_query(name="scr")
+    yield "load_items page", inventory_query(low_first=True, limit=200)
+    yield "load_items next low page", inventory_query(low_first=True, after=(0, 3, 100), limit=200)
+    yield "load_items next page", inventory_query(low_first=True, after=(1, None, 100), limit=200)
+    yield "low stock only", inventory_query(low_only=True, low_first=True, limit=200)
+    yield "low stock panel", (LOW_STOCK_TOP_SQL, (5,))
+    yield "monthly report", report_query("Monthly", "Item", "OUT", d1, d2)
+    yield "yearly report by category", report_query("Yearly", "Category", "OUT", d1, d2)
+    yield "daily report by destination", report_query("Daily", "Destination", "OUT", d1, d2)
+    yield "largest issues", transactions_query(ttype="OUT", from_date="0000-01-01", to_date="9999-12-31",
+                                               limit=200, sort=("quantity", True))
+    yield "oldest receipts next page", transactions_query(ttype="IN", from_date=d1, to_date=d2, limit=200,
+                                                          after=("2024-01-05", "2024-01-05 09:00:00", 100),
+                                                          sort=("txn_date", False))
+    yield "sorted by item next page", transactions_query(from_date=d1, to_date=d2, limit=200,
+                                                         after=("Screw", 100), sort=("item_name", False))
+    yield "load_items category by stock", inventory_query(cat="Tools", sort=("quantity", True), limit=200)
+    yield "item lookup", ("SELECT item_id FROM inventory WHERE item_name=? AND category=?", ("x", "y"))
+
+
+# small tables a path may scan to drive its index seeks. Sorting by item
+# name walks the categories (a few dozen rows) and seeks each one's items
+# by (category_id, item_name > ?); anywhere else a scan of them means
+# every item is being visited.
+PLAN_DRIVERS = {
+    "sorted by item next page": ("c",),
+    # the first page of the rest band walks items in id order from the
+    # start, and its LIMIT stops it there
+    "load_items page": ("i",),
+    "load_items next low page": ("i",),
+}
+
+
+def full_scans(conn=None):
+    """
+    Run EXPLAIN QUERY PLAN over every indexed access path and return
+    [(label, plan_detail)] for each one that still scans a whole table.
+    A SCAN of a covering index is fine; a bare "SCAN <table>" is not.
+    """
+    conn = conn or get_conn()
+    bad = []
+    for label, (sql, params) in _plan_samples():
+        allowed = ("users", "u") + PLAN_DRIVERS.get(label, ())
+        subqueries = set()
+        for row in conn.execute("EXPLAIN QUERY PLAN " + sql, params):
+            detail = row[-1]
+            if detail.startswith(("CO-ROUTINE ", "MATERIALIZE ")):
+                # already-filtered output of a union view or subquery
+                subqueries.add(detail.split()[1])
+            elif detail.startswith("SCAN ") and "INDEX" not in detail:
+                # users is tiny and drives the join; scanning it is expected
+                if detail.split()[1] in allowed or detail.split()[1] in subqueries:
+                    continue
+                bad.append((label, detail))
+    return bad
+
+
+if __name__ == "__main__":
+    import sys
+
+    failed = migration_check()
+    for problem in failed:
+        print(f"MIGRATION  {problem}")
+    print("migration OK" if not failed else "converting a pre-v1 file failed")
+
+    init_db()
+    problems = full_scans()
+    for label, detail in problems:
+        print(f"FULL SCAN  {label}: {detail}")
+    print("query plans OK" if not problems else f"{len(problems)} query path(s) scan a full table")
+    sys.exit(1 if problems or failed else 0)
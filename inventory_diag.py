@@ -0,0 +1,129 @@
+# ==============================================================
+# Diagnostics
+# ==============================================================
+# Latency figures for "why is this window slow on that machine". Every
+# SQL statement (through inventory_db's trace hook) and every timed UI
+# operation goes into a bounded sample per name, summarized as p50/p95
+# for the diagnostics window. Statements slower than the threshold are
+# also appended to a local log file, so a complaint can come with it.
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from functools import wraps
+
+import inventory_db as db
+
+SLOW_QUERY_MS = float(os.environ.get("INVENTORY_SLOW_QUERY_MS", 250))
+SLOW_LOG = os.environ.get("INVENTORY_SLOW_LOG", "inventory_slow.log")
+SAMPLES = 500            # most recent timings kept per operation / statement
+SLOWEST = 25             # slowest statements kept for the window
+SQL_TEXT = 300           # statement text kept, whitespace collapsed
+
+_lock = threading.Lock()
+_operations = {}         # name -> deque of seconds
+_statements = {}         # normalized sql -> deque of seconds
+_slowest = []            # (seconds, sql, rows, when, thread), slowest first
+settings = {"slow_ms": SLOW_QUERY_MS}
+
+
+def _sample(table, name, seconds):
+    samples = table.get(name)
+    if samples is None:
+        samples = table[name] = deque(maxlen=SAMPLES)
+    samples.append(seconds)
+
+
+# ------------------ RECORDING ------------------
+def record(name, seconds):
+    """Add one timing for a UI operation (window open, refresh, save...)."""
+    with _lock:
+        _sample(_operations, name, seconds)
+
+
+@contextmanager
+def timer(name):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - started)
+
+
+def timed(name):
+    """Decorator form of timer(), e.g. around a window's construction."""
+    def wrap(fn):
+        @wraps(fn)
+        def run(*args, **kwargs):
+            with timer(name):
+                return fn(*args, **kwargs)
+        return run
+    return wrap
+
+
+def record_sql(sql, seconds, rows):
+    """inventory_db trace callback."""
+    text = " ".join(sql.split())[:SQL_TEXT]
+    slow = seconds * 1000 >= settings["slow_ms"]
+    with _lock:
+        _sample(_statements, text, seconds)
+        if slow or len(_slowest) < SLOWEST or seconds > _slowest[-1][0]:
+            entry = (seconds, text, rows, datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                     threading.current_thread().name)
+            _slowest.append(entry)
+            _slowest.sort(key=lambda e: e[0], reverse=True)
+            del _slowest[SLOWEST:]
+    if slow:
+        _log_slow(entry)
+
+
+def _log_slow(entry):
+    seconds, text, rows, when, thread = entry
+    try:
+        with _lock, open(SLOW_LOG, "a", encoding="utf-8") as f:
+            f.write(f"{when}\t{seconds * 1000:.1f} ms\t{'-' if rows is None else rows} rows\t{thread}\t{text}\n")
+    except OSError:
+        pass          # a read-only folder must not break the app
+
+
+def install():
+    """Start tracing every statement the app runs."""
+    db.set_trace(record_sql)
+
+
+def reset():
+    with _lock:
+        _operations.clear()
+        _statements.clear()
+        _slowest.clear()
+
+
+# ------------------ SUMMARY ------------------
+def _percentile(ordered, pct):
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def _summarize(table):
+    with _lock:
+        items = [(name, sorted(samples)) for name, samples in table.items()]
+    rows = [(name, len(s), _percentile(s, 0.50) * 1000, _percentile(s, 0.95) * 1000, s[-1] * 1000)
+            for name, s in items if s]
+    return sorted(rows, key=lambda r: r[3], reverse=True)
+
+
+def operations():
+    """[(name, count, p50_ms, p95_ms, max_ms)], slowest p95 first."""
+    return _summarize(_operations)
+
+
+def statements():
+    """Same as operations(), per distinct SQL statement."""
+    return _summarize(_statements)
+
+
+def slowest():
+    """[(ms, sql, rows, when, thread)], slowest first."""
+    with _lock:
+        return [(s * 1000, text, rows, when, thread) for s, text, rows, when, thread in _slowest]
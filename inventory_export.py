@@ -0,0 +1,125 @@
+# ==============================================================
+# Export engine
+# ==============================================================
+# Streams query results straight to disk in chunks (CSV, or .xlsx through
+# openpyxl's write-only mode), so an export of the whole ledger never
+# holds more than one chunk in memory. Rows come from db.iter_rows: a
+# private connection, or the server in a thin client. Safe to call from
+# a worker thread.
+import csv
+import gzip
+import os
+import re
+
+import inventory_db as db
+
+CHUNK_ROWS = 5000
+XLSX_MAX_ROWS = 1048576            # Excel's per-sheet limit, header included
+
+
+class ExportCancelled(Exception):
+    pass
+
+
+def _open_text(path, compress):
+    if compress:
+        return gzip.open(path, "wt", newline="", encoding="utf-8")
+    return open(path, "w", newline="", encoding="utf-8")
+
+
+def count_rows(sql, params=()):
+    return db.detached_scalar(f"SELECT COUNT(*) FROM ({sql})", params)
+
+
+def export_csv(sql, params, path, progress=None, cancel=None, chunk_rows=CHUNK_ROWS):
+    """
+    Write the rows of `sql` to `path` as CSV (gzip-compressed when the
+    name ends in .gz), with the column names as header. progress(rows)
+    is called after each chunk; cancel is a threading.Event checked
+    between chunks. The file only appears under its final name once
+    complete. Returns the number of rows written.
+    """
+    tmp_path = path + ".part"
+    done = 0
+    chunks = db.iter_rows(sql, params, chunk_rows)
+    try:
+        with _open_text(tmp_path, path.lower().endswith(".gz")) as f:
+            writer = csv.writer(f)
+            writer.writerow(next(chunks))
+            for rows in chunks:
+                if cancel is not None and cancel.is_set():
+                    raise ExportCancelled()
+                writer.writerows(rows)
+                done += len(rows)
+                if progress:
+                    progress(done)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    finally:
+        chunks.close()
+    return done
+
+
+def _sheet_title(value, per):
+    if not value:
+        return "Unknown"
+    title = str(value)[:4] if per == "year" else str(value)[:7]
+    return re.sub(r"[\[\]:*?/\\]", "-", title)      # characters Excel won't take in a name
+
+
+def export_xlsx(sql, params, path, split_on=None, per="year", progress=None, cancel=None,
+                chunk_rows=CHUNK_ROWS):
+    """
+    Write the rows of `sql` to an .xlsx workbook in openpyxl's write-only
+    mode, which streams each sheet to disk instead of building it in
+    memory. With split_on naming a date column, rows go to one sheet
+    per year (per="year") or month (per="month") of that column, in
+    whatever order the query returns them; a sheet that fills up
+    continues on "<name> (2)". progress/cancel and the .part handling
+    work as in export_csv. Returns the number of rows written.
+    """
+    from openpyxl import Workbook
+
+    tmp_path = path + ".part"
+    done = 0
+    chunks = db.iter_rows(sql, params, chunk_rows)
+    wb = Workbook(write_only=True)
+    try:
+        header = next(chunks)
+        key_col = header.index(split_on) if split_on else None
+        sheets = {}            # title -> [worksheet, rows written, part]
+
+        def sheet_for(title):
+            entry = sheets.get(title)
+            if entry is None or entry[1] >= XLSX_MAX_ROWS:
+                part = entry[2] + 1 if entry else 1
+                ws = wb.create_sheet(title if part == 1 else f"{title} ({part})")
+                ws.append(header)
+                entry = sheets[title] = [ws, 1, part]
+            return entry
+
+        for rows in chunks:
+            if cancel is not None and cancel.is_set():
+                raise ExportCancelled()
+            for row in rows:
+                entry = sheet_for(_sheet_title(row[key_col], per) if key_col is not None else "Sheet1")
+                entry[0].append(row)
+                entry[1] += 1
+            done += len(rows)
+            if progress:
+                progress(done)
+        if not sheets:
+            wb.create_sheet("Sheet1").append(header)
+        wb.save(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    finally:
+        wb.close()
+        chunks.close()
+    return done
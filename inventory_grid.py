@@ -0,0 +1,132 @@
+# ==============================================================
+# Keyed grid refresh
+# ==============================================================
+# The list windows used to empty their Treeview and insert every row
+# again on each refresh: slow with thousands of rows, flickering, and
+# the user's selection and scroll position were lost. A Grid remembers
+# what it shows by id (item_id, txn_id) and brings the tree up to date
+# with a fresh query result by touching only what differs, so a refresh
+# costs Tk calls in proportion to what changed, not to the view's size.
+# Clicking a heading sorts the grid; the ORDER BY is the query's (see
+# sortable), so it works with paged loading and uses the indexes.
+
+
+class Grid:
+    """
+    A Treeview whose rows are keyed by one column (row[key], the id),
+    which doubles as the Tk item id. tags(row) gives each row's tags.
+    """
+
+    def __init__(self, tree, key=0, tags=None):
+        self.tree = tree
+        self.key = key
+        self.tags = tags
+        self._rows = {}          # iid -> values shown
+        self._order = []         # iids, top to bottom
+        self._headings = {}      # sortable heading -> its plain text
+        self.sort = None         # (sql column, descending), None = the query's default
+        self._resorted = False   # next sync starts at the top of the new order
+
+    def __len__(self):
+        return len(self._order)
+
+    def _tags(self, row):
+        return self.tags(row) if self.tags else ()
+
+    def sync(self, rows):
+        """
+        Show exactly `rows`, in that order: new ones are inserted, changed
+        ones updated in place, missing ones deleted, and rows still in the
+        same relative order aren't touched. Selection survives for rows
+        that are still there; the row at the top of the view stays there.
+        """
+        tree = self.tree
+        rows = [tuple(r) for r in rows]
+        fresh = {str(r[self.key]): r for r in rows}
+        order = list(fresh)
+        top = None if self._resorted else self._top()
+
+        gone = [iid for iid in self._order if iid not in fresh]
+        if gone:
+            tree.delete(*gone)
+        # walk the new order against the old one; a row is only moved
+        # when it has jumped ahead of rows it used to follow
+        kept = [iid for iid in self._order if iid in fresh]
+        moved = set()
+        j = 0
+        for i, iid in enumerate(order):
+            row = fresh[iid]
+            if iid not in self._rows:
+                tree.insert("", i, iid=iid, values=row, tags=self._tags(row))
+                continue
+            while j < len(kept) and kept[j] in moved:
+                j += 1
+            if j < len(kept) and kept[j] == iid:
+                j += 1
+            else:
+                tree.move(iid, "", i)
+                moved.add(iid)
+            if self._rows[iid] != row:
+                tree.item(iid, values=row, tags=self._tags(row))
+        self._rows = fresh
+        self._order = order
+        if self._resorted:
+            self._resorted = False
+            tree.yview_moveto(0)
+        else:
+            self._keep_top(top)
+
+    def extend(self, rows):
+        """Append rows (the next page) below those shown."""
+        for r in rows:
+            row = tuple(r)
+            iid = str(row[self.key])
+            if iid in self._rows:
+                if self._rows[iid] != row:
+                    self.tree.item(iid, values=row, tags=self._tags(row))
+            else:
+                self.tree.insert("", "end", iid=iid, values=row, tags=self._tags(row))
+                self._order.append(iid)
+            self._rows[iid] = row
+
+    def clear(self):
+        if self._order:
+            self.tree.delete(*self._order)
+        self._rows = {}
+        self._order = []
+
+    # rows inserted or deleted above the view would otherwise scroll the
+    # rows the user was looking at out of it
+    def _top(self):
+        if not self._order:
+            return None
+        index = min(int(self.tree.yview()[0] * len(self._order) + 0.5), len(self._order) - 1)
+        return self._order[index], index
+
+    def _keep_top(self, top):
+        if top is None or top[0] not in self._rows:
+            return
+        index = self._order.index(top[0])
+        if index != top[1]:
+            self.tree.yview_moveto(index / len(self._order))
+
+    # ------------------ SORTING ------------------
+    def sortable(self, columns, reload):
+        """
+        Sort on heading clicks. columns maps each sortable heading to the
+        SQL column behind it; a click stores (column, descending) in
+        self.sort and calls reload(), which passes it on to the query. A
+        second click on the same heading reverses the order.
+        """
+        self._headings = {heading: self.tree.heading(heading, "text") for heading in columns}
+        for heading, column in columns.items():
+            self.tree.heading(heading, command=lambda h=heading, c=column: self._sort_by(h, c, reload))
+
+    def _sort_by(self, heading, column, reload):
+        descending = self.sort == (column, False)
+        self.sort = (column, descending)
+        self._resorted = True
+        for h, text in self._headings.items():
+            arrow = (" \u25bc" if descending else " \u25b2") if h == heading else ""
+            self.tree.heading(h, text=text + arrow)
+        reload()
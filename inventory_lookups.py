@@ -0,0 +1,39 @@
+# ==============================================================
+# Lookup cache for combobox sources
+# ==============================================================
+# Category, item name and counterparty lists are re-read only when their
+# trigger-maintained version in lookup_versions has moved, so opening a
+# dialog costs one small read instead of a DISTINCT over the ledger.
+import threading
+
+import inventory_db as db
+
+# name -> (version counter, sql, params)
+LOOKUPS = {
+    "categories": ("categories", "SELECT category_name FROM categories", ()),
+    "item_names": ("item_names", "SELECT DISTINCT item_name FROM inventory", ()),
+    "received_from": ("counterparties", db.COUNTERPARTIES_SQL, ("IN",)),
+    "issued_to": ("counterparties", db.COUNTERPARTIES_SQL, ("OUT",)),
+}
+
+_cache = {}            # name -> (db file, version, values)
+_lock = threading.Lock()
+
+
+def get(name):
+    """Current values for a lookup, from cache when still valid."""
+    counter, sql, params = LOOKUPS[name]
+    version = db.query_one("SELECT version FROM lookup_versions WHERE name=?", (counter,))[0]
+    with _lock:
+        cached = _cache.get(name)
+        if cached and cached[0] == db.DB_NAME and cached[1] == version:
+            return cached[2]
+    values = [v for v in db.query_column(sql, params) if v]
+    with _lock:
+        _cache[name] = (db.DB_NAME, version, values)
+    return values
+
+
+def clear():
+    with _lock:
+        _cache.clear()
@@ -0,0 +1,100 @@
+# ==============================================================
+# Ledger-vs-stock reconciliation
+# ==============================================================
+# items.quantity is updated in place while the ledger is written
+# separately; this checks that each item's stock still equals the net of
+# its IN/OUT/DEL rows. Per-item checkpoints hold the net so far, so each
+# run only folds in ledger rows newer than the last one seen; comparing
+# against stock is then one pass over the (small) item catalog.
+import inventory_db as db
+
+WATERMARK_KEY = "reconcile_last_txn_id"
+
+# DEL logs the stock an item held when it was removed, so it nets to zero
+NET_QTY_SQL = """CASE txn_type WHEN 'IN' THEN quantity
+                               WHEN 'OUT' THEN -quantity
+                               WHEN 'DEL' THEN -quantity
+                               ELSE 0 END"""
+
+
+def _fold_new_rows(c):
+    """Add ledger rows past the watermark into the checkpoints; returns rows folded."""
+    watermark = int(db.get_meta(c, WATERMARK_KEY, 0))
+    # archived rows are older than anything new, but a reset re-reads them
+    newest, archived = c.execute("SELECT (SELECT MAX(txn_id) FROM main.ledger), "
+                                 "COALESCE((SELECT MAX(txn_id) FROM archive.ledger), 0)").fetchone()
+    newest = max(newest or 0, archived)
+    if newest <= watermark:
+        return 0
+    source = "ledger" if watermark >= archived else db.LEDGER_ALL
+    c.execute(f"""INSERT INTO reconcile_checkpoints (item_id, last_txn_id, net_qty)
+                  SELECT item_id, MAX(txn_id), SUM({NET_QTY_SQL})
+                  FROM {source}
+                  WHERE txn_id > ? AND txn_id <= ?
+                  GROUP BY item_id
+                  ON CONFLICT(item_id) DO UPDATE
+                  SET last_txn_id=excluded.last_txn_id, net_qty=net_qty+excluded.net_qty""",
+              (watermark, newest))
+    folded = c.execute(f"SELECT COUNT(*) FROM {source} WHERE txn_id > ? AND txn_id <= ?",
+                       (watermark, newest)).fetchone()[0]
+    db.set_meta(c, WATERMARK_KEY, newest)
+    return folded
+
+
+def _drift(c):
+    # items whose stock disagrees with their ledger net, plus deleted
+    # items whose ledger doesn't net to zero
+    return c.execute("""
+        SELECT i.item_id, i.item_name, i.category, i.quantity, COALESCE(k.net_qty, 0)
+        FROM inventory i
+        LEFT JOIN reconcile_checkpoints k ON k.item_id = i.item_id
+        WHERE i.quantity != COALESCE(k.net_qty, 0)
+        UNION ALL
+        SELECT k.item_id, NULL, NULL, NULL, k.net_qty
+        FROM reconcile_checkpoints k
+        WHERE k.net_qty != 0 AND NOT EXISTS (SELECT 1 FROM inventory i WHERE i.item_id = k.item_id)
+        ORDER BY 1
+    """).fetchall()
+
+
+def reconcile(repair=False):
+    """
+    Fold new ledger rows into the checkpoints and report drift as a dict:
+    new_rows (ledger rows processed this run) and drift, a list of
+    (item_id, item_name, category, stored_qty, ledger_qty). Deleted items
+    show stored_qty None. With repair=True, stock for items still in
+    inventory is set to the ledger figure and `repaired` says how many.
+    """
+    return repair_drift() if repair else check()
+
+
+# two remote calls, so a server lets any account check but only admins
+# overwrite stock
+@db.remote_call()
+def check():
+    return _reconcile(repair=False)
+
+
+@db.remote_call(admin=True)
+def repair_drift():
+    return _reconcile(repair=True)
+
+
+def _reconcile(repair):
+    with db.transaction() as c:
+        new_rows = _fold_new_rows(c)
+        drift = _drift(c)
+        repaired = 0
+        if repair:
+            fixes = [(ledger, item_id) for item_id, _, _, stored, ledger in drift if stored is not None]
+            c.executemany("UPDATE items SET quantity=? WHERE item_id=?", fixes)
+            repaired = len(fixes)
+    return {"new_rows": new_rows, "drift": drift, "repaired": repaired}
+
+
+@db.remote_call(admin=True)
+def reset():
+    """Forget all checkpoints; the next run recomputes from the whole ledger."""
+    with db.transaction() as c:
+        c.execute("DELETE FROM reconcile_checkpoints")
+        c.execute("DELETE FROM app_meta WHERE key=?", (WATERMARK_KEY,))
@@ -0,0 +1,381 @@
+# ==============================================================
+# Inventory server
+# ==============================================================
+# Optional: one process on the machine that holds the database file owns
+# it for every desktop on the LAN, instead of each PC opening it over a
+# share. Clients started with --server (inventory_client) send it their
+# reads and the @db.remote_call write paths as JSON over HTTP.
+#
+#   python inventory_server.py                       # 127.0.0.1:8765
+#   python inventory_server.py --host 0.0.0.0 --db D:/stores/inventory.db
+#
+# Client reads share one warm connection (page cache, prepared
+# statements, lookup versions) opened read-only. Clients never send
+# writes as SQL, only as the named @db.remote_call operations (admin-only
+# ones checked against the session). Writes all go through one writer
+# thread that commits whatever has queued up together: one lock and one
+# commit for a burst of issues from several PCs, each call in its own
+# savepoint so a failing one (out of stock) only undoes itself.
+import argparse
+import inspect
+import json
+import queue
+import secrets
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import inventory_archive
+import inventory_bulk
+import inventory_client
+import inventory_core
+import inventory_db as db
+import inventory_reconcile
+
+# importing these fills db.REMOTE_CALLS with what clients may call
+REMOTE_MODULES = (db, inventory_core, inventory_reconcile, inventory_archive, inventory_bulk)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+BATCH_MAX = 64            # calls committed together at most
+BATCH_WAIT_S = 0.002      # how long the writer waits for company
+SESSION_IDLE_S = 12 * 3600
+
+
+class Unauthorized(PermissionError):
+    pass
+
+
+# ------------------ WRITER ------------------
+class Writer:
+    """
+    The server's only writing connection. submit(fn) blocks until fn has
+    run and been committed; calls that arrive together share one
+    transaction (group commit). Exclusive calls (archiving, which opens
+    its own connection and vacuums) run alone between batches.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._held = None
+        self.batches = 0
+        self.calls = 0
+        self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, fn, exclusive=False):
+        future = Future()
+        self._queue.put((fn, exclusive, future))
+        return future.result()
+
+    def pending(self):
+        return self._queue.qsize()
+
+    def _next_batch(self):
+        first = self._held or self._queue.get()
+        self._held = None
+        if first[1]:
+            return [first]
+        batch = [first]
+        deadline = time.monotonic() + BATCH_WAIT_S
+        while len(batch) < BATCH_MAX:
+            try:
+                item = self._queue.get(timeout=max(0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if item[1]:
+                self._held = item          # runs on its own, next
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        db.bind_thread_connection(db.connect())
+        while True:
+            batch = self._next_batch()
+            if batch[0][1]:
+                fn, _, future = batch[0]
+                _settle(future, fn)
+            else:
+                self._commit(batch)
+            self.batches += 1
+            self.calls += len(batch)
+
+    def _commit(self, batch):
+        @db.retry_busy
+        def run():
+            # outcomes are only handed out once the COMMIT has succeeded
+            outcomes = []
+            with db.transaction():
+                for fn, _, _ in batch:
+                    try:
+                        outcomes.append((fn(), None))
+                    except Exception as e:
+                        outcomes.append((None, e))
+            return outcomes
+        try:
+            outcomes = run()
+        except Exception as e:
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, _, future), (result, error) in zip(batch, outcomes):
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+
+
+def _settle(future, fn):
+    try:
+        future.set_result(fn())
+    except Exception as e:
+        future.set_exception(e)
+
+
+# ------------------ SESSIONS ------------------
+class Sessions:
+    """Login tokens -> account, forgotten after SESSION_IDLE_S unused."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._users = {}
+
+    def open(self, user):
+        token = secrets.token_urlsafe(24)
+        with self._lock:
+            self._users[token] = [user, time.monotonic()]
+        return token
+
+    def user(self, token):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._users.get(token)
+            if entry is None or now - entry[1] > SESSION_IDLE_S:
+                self._users.pop(token, None)
+                raise Unauthorized("not logged in (or the session expired); log in again")
+            entry[1] = now
+            return entry[0]
+
+    def __len__(self):
+        return len(self._users)
+
+
+# ------------------ READS ------------------
+# Client SQL runs on read-only connections of its own: query_only refuses
+# writes, the authorizer refuses ATTACH/DETACH and pragmas, and password
+# hashes read as NULL (only authenticate, on the server's own connection,
+# compares them).
+_DENIED = (sqlite3.SQLITE_ATTACH, sqlite3.SQLITE_DETACH, sqlite3.SQLITE_PRAGMA)
+_HIDDEN = (("users", "password"),)
+
+
+def _authorizer(action, table, column, *_):
+    if action in _DENIED:
+        return sqlite3.SQLITE_DENY
+    if action == sqlite3.SQLITE_READ and (table, column) in _HIDDEN:
+        return sqlite3.SQLITE_IGNORE
+    return sqlite3.SQLITE_OK
+
+
+def read_only(conn):
+    conn.execute("PRAGMA query_only=1")
+    conn.set_authorizer(_authorizer)
+    return conn
+
+
+def _scalar(sql, params):
+    # a private connection, like db.detached_scalar: long counts don't
+    # hold up the shared one
+    conn = read_only(db.connect())
+    try:
+        return conn.execute(sql, params).fetchone()[0]
+    finally:
+        conn.close()
+
+
+# ------------------ HTTP ------------------
+class InventoryServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, verbose=False):
+        super().__init__(address, Handler)
+        self.verbose = verbose
+        self.writer = Writer()
+        self.sessions = Sessions()
+        self.reader = read_only(db.connect())
+        self.reader_lock = threading.Lock()
+        self.started = time.time()
+
+    def read(self, sql, params, one=False):
+        with self.reader_lock:
+            cur = self.reader.execute(sql, params)
+            return cur.fetchone() if one else cur.fetchall()
+
+    def health(self):
+        return {
+            "db": db.DB_NAME,
+            "uptime_s": round(time.time() - self.started),
+            "sessions": len(self.sessions),
+            "pending_writes": self.writer.pending(),
+            "write_calls": self.writer.calls,
+            "write_batches": self.writer.batches,
+        }
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"          # keep-alive: one connection per client thread
+    disable_nagle_algorithm = True         # headers and body go out as separate writes
+    server_version = "InventoryServer/1"
+
+    def log_message(self, fmt, *args):
+        if self.server.verbose:
+            super().log_message(fmt, *args)
+
+    def _reply(self, status, payload):
+        body = inventory_client.encode(payload)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _user(self):
+        auth = self.headers.get("Authorization", "")
+        return self.server.sessions.user(auth[7:] if auth.startswith("Bearer ") else "")
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._reply(200, {"result": self.server.health()})
+        else:
+            self._reply(404, {"error": {"type": "LookupError", "message": f"no such endpoint {self.path}"}})
+
+    def do_POST(self):
+        try:
+            request = inventory_client.decode(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            route = self.ROUTES.get(self.path)
+            if route is None:
+                raise LookupError(f"no such endpoint {self.path}")
+            if route is Handler.rows:
+                return self.rows(request)
+            self._reply(200, {"result": route(self, request)})
+        except Exception as e:
+            self._reply(_status(e), {"error": inventory_client.error_payload(e)})
+
+    # ------------------ endpoints ------------------
+    def login(self, request):
+        fn = db.REMOTE_CALLS[inventory_client.LOGIN][0]
+        user = fn(request["username"], request["password"])
+        if not user:
+            return None
+        return {"user": user, "token": self.server.sessions.open(user)}
+
+    def call(self, request):
+        user = self._user()
+        entry = db.REMOTE_CALLS.get(request["name"])
+        if entry is None or request["name"] == inventory_client.LOGIN:
+            raise LookupError(f"no such operation {request['name']}")
+        fn, kind, admin, caller, performer = entry
+        if admin and user["role"] not in inventory_core.ADMIN_ROLES:
+            raise Unauthorized("this operation needs an admin account")
+        args, kwargs = request.get("args", []), request.get("kwargs", {})
+        # whoever the client says it is, it runs as the session's account
+        if caller:
+            args = [user] + args[1:]
+        if performer:
+            bound = inspect.signature(fn).bind_partial(*args, **kwargs)
+            bound.arguments["performed_by"] = user["username"]
+            args, kwargs = bound.args, bound.kwargs
+        if kind == "read":
+            return fn(*args, **kwargs)
+        return self.server.writer.submit(lambda: fn(*args, **kwargs), exclusive=kind == "exclusive")
+
+    def query(self, request):
+        self._user()
+        return self.server.read(request["sql"], request.get("params", []))
+
+    def query_one(self, request):
+        self._user()
+        return self.server.read(request["sql"], request.get("params", []), one=True)
+
+    def scalar(self, request):
+        self._user()
+        return _scalar(request["sql"], request.get("params", []))
+
+    def rows(self, request):
+        """Stream a result as JSON lines: columns, row chunks, then end (or error)."""
+        self._user()
+        conn = read_only(db.connect())
+        try:
+            cur = conn.execute(request["sql"], request.get("params", []))
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.close_connection = True
+            self._line({"columns": [d[0] for d in cur.description]})
+            try:
+                while True:
+                    chunk = cur.fetchmany(request.get("chunk_rows", 5000))
+                    if not chunk:
+                        break
+                    self._line({"rows": chunk})
+                self._line({"end": True})
+            except Exception as e:
+                self._line({"error": inventory_client.error_payload(e)})
+        finally:
+            conn.close()
+
+    def _line(self, msg):
+        self.wfile.write(inventory_client.encode(msg) + b"\n")
+
+    ROUTES = {"/login": login, "/call": call, "/query": query, "/query_one": query_one,
+              "/scalar": scalar, "/rows": rows}
+
+
+def _status(error):
+    if isinstance(error, Unauthorized):
+        return 401 if "log in" in str(error) else 403
+    if isinstance(error, LookupError):
+        return 404
+    if isinstance(error, (KeyError, TypeError, json.JSONDecodeError)):
+        return 400
+    if isinstance(error, (inventory_core.StockChanged, sqlite3.IntegrityError, ValueError)):
+        return 409
+    return 500
+
+
+# ------------------ MAIN ------------------
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, verbose=False):
+    db.init_db()
+    server = InventoryServer((host, port), verbose=verbose)
+    print(f"inventory server on http://{host}:{server.server_port} ({db.DB_NAME})", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.reader.close()
+        db.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="inventory_server", description="Serve the inventory database to thin clients")
+    parser.add_argument("--host", default=DEFAULT_HOST,
+                        help="address to listen on (0.0.0.0 for the whole LAN; default: this machine only)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--db", help="database file (default: $INVENTORY_DB or inventory.db)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log every request")
+    args = parser.parse_args(argv)
+    if args.db:
+        db.use_database(args.db)
+    serve(args.host, args.port, args.verbose)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+# ==============================================================
+# Background DB executor
+# ==============================================================
+# A single worker thread runs every query and write the windows need, in
+# submission order, so a slow lock or a long query on the shared file
+# never stalls the Tk main loop. Results come back through a queue that
+# the UI drains from its own thread with widget.after (see attach()).
+import queue
+import sqlite3
+import threading
+
+import inventory_db as db
+
+
+class Request:
+    def __init__(self, fn, on_done, key, generation):
+        self.fn = fn
+        self.on_done = on_done
+        self.key = key
+        self.generation = generation
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class DBExecutor:
+    """
+    submit(fn, on_done, key) queues fn() for the worker thread; on_done
+    (result, error) runs later on the UI thread. Requests sharing a key
+    supersede each other: when a newer one arrives, an older one that is
+    still queued is skipped, one that is running is interrupted, and its
+    result is dropped. Use a key per refreshable view (e.g. a search box).
+    """
+
+    def __init__(self):
+        self._requests = queue.Queue()
+        self._results = queue.Queue()
+        self._latest = {}
+        self._running = None
+        self._guard = threading.Lock()
+        self._conn = None
+        self._thread = threading.Thread(target=self._run, name="db-worker", daemon=True)
+        self._thread.start()
+
+    def submit(self, fn, on_done=None, key=None):
+        with self._guard:
+            generation = self._latest.get(key, 0) + 1
+            if key is not None:
+                self._latest[key] = generation
+                running = self._running
+                if running is not None and running.key == key:
+                    running.cancel()
+                    if self._conn is not None:
+                        self._conn.interrupt()
+        req = Request(fn, on_done, key, generation)
+        self._requests.put(req)
+        return req
+
+    def _superseded(self, req):
+        return req.cancelled or (req.key is not None and self._latest.get(req.key) != req.generation)
+
+    def _run(self):
+        # the worker owns its connection, so interrupting it can only ever
+        # abort the worker's own statement; a thin client has none (the
+        # server runs the statement, a superseded result is just dropped)
+        if not db.remote():
+            self._conn = db.connect()
+            db.bind_thread_connection(self._conn)
+        while True:
+            req = self._requests.get()
+            if req is None:
+                if self._conn is not None:
+                    self._conn.close()
+                return
+            with self._guard:
+                if self._superseded(req):
+                    continue
+                self._running = req
+            result = error = None
+            try:
+                result = req.fn()
+            except sqlite3.OperationalError as e:
+                if not self._superseded(req):      # interrupted on purpose otherwise
+                    error = e
+            except Exception as e:
+                error = e
+            finally:
+                with self._guard:
+                    self._running = None
+            self._results.put((req, result, error))
+
+    def pump(self):
+        """Deliver finished results; call from the UI thread only."""
+        while True:
+            try:
+                req, result, error = self._results.get_nowait()
+            except queue.Empty:
+                return
+            if req.on_done and not self._superseded(req):
+                req.on_done(result, error)
+
+    def attach(self, widget, interval_ms=20):
+        """Poll for results from widget's event loop."""
+        def tick():
+            self.pump()
+            widget.after(interval_ms, tick)
+        tick()
+
+    def shutdown(self):
+        self._requests.put(None)
+        self._thread.join(timeout=5)
@@ -0,0 +1,90 @@
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import inventory_bench  # noqa: E402
+import inventory_client  # noqa: E402
+import inventory_core  # noqa: E402
+import inventory_db as db  # noqa: E402
+
+ADMIN = ("rishi_kumar", "rk@rishi#05")     # the account init_db creates
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    """A fresh database file (and archive next to it) as the shared connection."""
+    monkeypatch.delenv("INVENTORY_ARCHIVE", raising=False)
+    previous = db.DB_NAME
+    db.use_database(str(tmp_path / "inventory.db"))
+    db.init_db()
+    yield db.DB_NAME
+    db.use_database(previous)
+
+
+@pytest.fixture(scope="session")
+def _generated(tmp_path_factory):
+    previous = db.DB_NAME
+    path = inventory_bench.generate(str(tmp_path_factory.mktemp("bench") / "bench.db"), items=1000, txns=10000)
+    db.use_database(previous)
+    return path
+
+
+@pytest.fixture
+def generated(_generated, monkeypatch):
+    """The benchmark's synthetic ledger (1000 items, 10k rows, analyzed); read it, don't change it."""
+    monkeypatch.delenv("INVENTORY_ARCHIVE", raising=False)
+    previous = db.DB_NAME
+    db.use_database(_generated)
+    yield _generated
+    db.use_database(previous)
+
+
+def receive(name, cat, qty, min_stock=0, date="2024-01-02", user="Acme", rate=2.5, gst=18):
+    return inventory_core.receive_item(name, cat, qty, min_stock, "B1", rate, gst, user, date, ADMIN[0])
+
+
+def issue(item_id, name, cat, qty, date="2024-01-03", user="Ravi", destination="Workshop"):
+    inventory_core.issue_item(item_id, name, cat, qty, user, destination, date, ADMIN[0])
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture
+def server(tmp_path):
+    """An inventory_server on its own file; yields a logged-out Client."""
+    port = _free_port()
+    env = dict(os.environ, INVENTORY_DB=str(tmp_path / "served.db"))
+    env.pop("INVENTORY_ARCHIVE", None)
+    proc = subprocess.Popen([sys.executable, os.path.join(ROOT, "inventory_server.py"), "--port", str(port)],
+                            env=env, stdout=subprocess.DEVNULL)
+    client = inventory_client.Client(f"http://127.0.0.1:{port}")
+    try:
+        deadline = time.monotonic() + 20
+        while True:
+            try:
+                client.health()
+                break
+            except inventory_client.ServerUnavailable:
+                if proc.poll() is not None or time.monotonic() > deadline:
+                    raise
+                time.sleep(0.1)
+        yield client
+    finally:
+        db.use_server(None)
+        proc.terminate()
+        proc.wait()
+
+
+def login(client, username, password):
+    return client.call(inventory_client.LOGIN, (username, password))
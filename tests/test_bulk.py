@@ -0,0 +1,69 @@
+import pandas as pd
+import pytest
+
+import inventory_bulk
+import inventory_db as db
+from conftest import ADMIN, receive
+
+
+def _issue_file(lines):
+    return pd.DataFrame(lines, columns=["item_name", "category", "quantity", "user_name", "txn_date"])
+
+
+def _stock(item_id):
+    return db.query_one("SELECT quantity FROM items WHERE item_id=?", (item_id,))[0]
+
+
+def test_issue_is_first_fit_in_file_order(database):
+    screw = receive("Screw", "Tools", 10)
+    nail = receive("Nail", "Tools", 3)
+    result = inventory_bulk.issue(_issue_file([
+        ("Screw", "Tools", 6, "Ravi", "2024-01-03"),
+        ("Screw", "Tools", 6, "Ravi", "2024-01-03"),     # only 4 left after the first line
+        ("Nail", "Tools", 3, "Ravi", "2024-01-03"),
+        ("Screw", "Tools", 4, "Ravi", "2024-01-03"),     # still fits what the rejected line left
+        ("Screw", "Tools", 1, "Ravi", "2024-01-03"),
+    ]), ADMIN[0])
+
+    assert result["issued"] == 3
+    assert result["rejected"][["line", "reason"]].values.tolist() == [
+        [3, "insufficient stock: 4 left, 6 requested"],
+        [6, "insufficient stock: 0 left, 1 requested"],
+    ]
+    assert (_stock(screw), _stock(nail)) == (0, 0)
+    assert db.query("SELECT item_name, quantity FROM transactions WHERE txn_type='OUT' ORDER BY txn_id") == [
+        ("Screw", 6), ("Nail", 3), ("Screw", 4)]
+
+
+def test_issue_rejection_reasons(database):
+    screw = receive("Screw", "Tools", 10)
+    receive("Paper", "Stationery", 5)
+    result = inventory_bulk.issue(_issue_file([
+        ("Screw", "Tools", 0, "Ravi", "2024-01-03"),
+        ("Screw", "Tools", -2, "Ravi", "2024-01-03"),
+        ("Screw", "Tools", 1.5, "Ravi", "2024-01-03"),
+        ("Screw", "Tools", "two", "Ravi", "2024-01-03"),
+        ("Screw", "Tools", 1, None, "2024-01-03"),
+        ("Screw", "Garden", 1, "Ravi", "2024-01-03"),
+        ("Bolt", "Tools", 1, "Ravi", "2024-01-03"),
+        ("Screw", "Tools", 2, "Ravi", "2024-01-03"),
+    ]), ADMIN[0])
+
+    rejected = result["rejected"]
+    assert rejected["reason"].tolist() == ["invalid quantity"] * 4 + [
+        "missing user_name", "unknown category", "item not in inventory"]
+    assert rejected["line"].tolist() == [2, 3, 4, 5, 6, 7, 8]
+    # the quantity is reported as it was typed
+    assert rejected["quantity"].tolist()[:4] == [0, -2, 1.5, "two"]
+    assert result["issued"] == 1
+    assert _stock(screw) == 8
+
+
+@pytest.mark.parametrize("qty", [0, -3, 2.5])
+def test_receive_rejects_bad_quantities(database, qty):
+    df = pd.DataFrame([("Screw", "Tools", 5, 0, "B1", 2.5, 18, "Acme", "2024-01-02"),
+                       ("Nail", "Tools", qty, 0, "B2", 1.0, 18, "Acme", "2024-01-02")],
+                      columns=inventory_bulk.RECEIVE_HEADERS)
+    with pytest.raises(ValueError, match=r"quantity .* line\(s\) 3$"):
+        inventory_bulk.receive(df, ADMIN[0])
+    assert db.query("SELECT * FROM items") == []
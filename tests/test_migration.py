@@ -0,0 +1,34 @@
+import sqlite3
+
+import inventory_core
+import inventory_db as db
+from conftest import ADMIN
+
+
+def test_migration_check():
+    assert db.migration_check() == []
+
+
+def test_legacy_file_converts_and_stays_usable(tmp_path, monkeypatch):
+    monkeypatch.delenv("INVENTORY_ARCHIVE", raising=False)
+    path = str(tmp_path / "legacy.db")
+    legacy = sqlite3.connect(path)
+    legacy.executescript(db.LEGACY_SCHEMA)
+    legacy.close()
+
+    previous = db.DB_NAME
+    db.use_database(path)
+    try:
+        db.init_db()
+        db.init_db()            # a second start finds nothing left to convert
+        assert db.query_one("SELECT quantity FROM inventory WHERE item_name='Screw'") == (6,)
+        assert db.query("SELECT txn_type, quantity, user_name FROM transactions ORDER BY txn_id") == [
+            ("IN", 10, "Acme"), ("OUT", 4, "Ravi")]
+        # the converted file takes new writes through the usual paths
+        item_id = db.query_one("SELECT item_id FROM inventory WHERE item_name='Screw'")[0]
+        inventory_core.issue_item(item_id, "Screw", "Tools", 2, "Ravi", "Workshop", "2024-01-04", ADMIN[0])
+        assert db.query_one("SELECT quantity FROM inventory WHERE item_id=?", (item_id,)) == (4,)
+        assert db.query_one("SELECT COUNT(*) FROM all_transactions") == (3,)
+        assert db.full_scans() == []
+    finally:
+        db.use_database(previous)
@@ -0,0 +1,59 @@
+import pytest
+
+import inventory_db as db
+
+ALL_DATES = {"from_date": "0000-01-01", "to_date": "9999-12-31"}
+PAGE = 397
+ITEM_PAGE = 3           # small enough that page breaks fall inside the low-stock band
+
+
+def _pages(make_query, width, size=PAGE):
+    rows, after = [], None
+    while True:
+        page = db.query(*make_query(after, size))
+        rows += [r[:width] for r in page]
+        if len(page) < size:
+            return rows
+        after = page[-1][width:]
+
+
+@pytest.mark.parametrize("descending", [True, False])
+@pytest.mark.parametrize("column", sorted(db.TXN_SORT_KEYS))
+def test_transaction_pages_cover_each_row_once(generated, column, descending):
+    sort = (column, descending)
+    rows = _pages(lambda after, size: db.transactions_query(ttype="All", after=after, limit=size, sort=sort, **ALL_DATES),
+                  db.TXN_COLUMN_COUNT)
+    ids = [r[0] for r in rows]
+    assert len(ids) == len(set(ids)) == db.query_one("SELECT COUNT(*) FROM ledger")[0]
+    assert rows == db.query(*db.transactions_query(sort=sort, **ALL_DATES))
+
+
+def test_transaction_pages_with_filters(generated):
+    filters = {"ttype": "OUT", "cat": db.query_one("SELECT category FROM inventory LIMIT 1")[0], **ALL_DATES}
+    rows = _pages(lambda after, size: db.transactions_query(after=after, limit=size, **filters), db.TXN_COLUMN_COUNT)
+    assert rows and rows == db.query(*db.transactions_query(**filters))
+
+
+@pytest.mark.parametrize("low_only", [False, True])
+@pytest.mark.parametrize("cat", ["All", "Electrical"])
+def test_low_first_pages_cover_each_item_once(generated, low_only, cat):
+    rows = _pages(lambda after, size: db.inventory_query(cat=cat, low_only=low_only, low_first=True,
+                                                         after=after, limit=size),
+                  db.INVENTORY_COLUMN_COUNT, ITEM_PAGE)
+    ids = [r[0] for r in rows]
+    assert len(ids) == len(set(ids))
+    # low stock first, nearest to zero first, then the rest by id
+    expected = sorted((r for r in db.query(*db.inventory_query(cat=cat)) if not low_only or r[3] < r[4]),
+                      key=lambda r: (r[3] >= r[4], r[3] if r[3] < r[4] else 0, r[0]))
+    assert rows == expected
+    assert sum(r[3] < r[4] for r in rows) > ITEM_PAGE
+
+
+@pytest.mark.parametrize("descending", [True, False])
+@pytest.mark.parametrize("column", db.INVENTORY_SORTS)
+def test_sorted_inventory_pages_cover_each_item_once(generated, column, descending):
+    sort = (column, descending)
+    rows = _pages(lambda after, size: db.inventory_query(sort=sort, after=after, limit=size),
+                  db.INVENTORY_COLUMN_COUNT, ITEM_PAGE)
+    assert len({r[0] for r in rows}) == len(rows) == db.query_one("SELECT COUNT(*) FROM inventory")[0]
+    assert rows == db.query(*db.inventory_query(sort=sort))
@@ -0,0 +1,11 @@
+import inventory_db as db
+
+
+def test_no_full_scans_on_a_new_file(database):
+    assert db.full_scans() == []
+
+
+def test_no_full_scans_with_statistics(generated):
+    # once ANALYZE has seen a real ledger the planner may pick other plans
+    assert db.query_one("SELECT COUNT(*) FROM sqlite_stat1")[0] > 0
+    assert db.full_scans() == []
@@ -0,0 +1,46 @@
+import pandas as pd
+
+import inventory_archive
+import inventory_bulk
+import inventory_core
+import inventory_db as db
+from conftest import ADMIN, issue, receive
+
+
+def _rollups():
+    return {table: db.query(f"SELECT * FROM {table} WHERE txns != 0 ORDER BY {db.ROLLUP_KEY}")
+            for table in db.ROLLUPS}
+
+
+def _activity():
+    screw = receive("Screw", "Tools", 50, rate=2.5, date="2024-01-02")
+    paper = receive("Paper", "Stationery", 20, rate=0.5, user="PaperCo", date="2024-01-20")
+    receive("Screw", "Tools", 10, rate=3.0, date="2024-02-03")
+    issue(screw, "Screw", "Tools", 7, date="2024-02-04")
+    issue(paper, "Paper", "Stationery", 5, destination="", date="2024-02-28")
+    inventory_bulk.receive(pd.DataFrame(
+        [("Nail", "Tools", 30, 5, "B9", 0.1, 18, "Acme", "2024-03-01"),
+         ("Screw", "Tools", 5, 5, None, None, None, "Acme", "2024-03-01")],
+        columns=inventory_bulk.RECEIVE_HEADERS), ADMIN[0])
+    inventory_bulk.issue(pd.DataFrame(
+        [("Nail", "Tools", 4, "Ravi", "2024-03-02"), ("Screw", "Tools", 1, "Mina", "2024-03-05")],
+        columns=inventory_bulk.ISSUE_HEADERS), ADMIN[0])
+    inventory_core.delete_item(paper, "Paper", "Stationery", ADMIN[0])
+
+
+def test_rollups_match_a_rebuild(database):
+    _activity()
+    kept = _rollups()
+    assert all(kept.values())
+    db.rebuild_rollups()
+    assert _rollups() == kept
+
+
+def test_rollups_survive_archiving(database):
+    _activity()
+    kept = _rollups()
+    result = inventory_archive.archive_before("2024-02-15", vacuum=False)
+    assert result["archived"] == 4
+    assert _rollups() == kept
+    db.rebuild_rollups()            # reads the archive too
+    assert _rollups() == kept
@@ -0,0 +1,97 @@
+import sqlite3
+
+import pandas as pd
+import pytest
+
+import inventory_bulk
+import inventory_client
+import inventory_core
+import inventory_db as db
+import inventory_server
+from conftest import ADMIN, login
+
+ADMIN_CALLS = sorted(name for name, entry in db.REMOTE_CALLS.items() if entry[2])
+
+
+@pytest.fixture
+def clerk(server):
+    """(admin client, clerk client): the clerk is a plain user account."""
+    login(server, *ADMIN)
+    db.use_server(server)
+    inventory_core.create_user({"username": ADMIN[0]}, "bob", "pw", "user")
+    clerk = inventory_client.Client(server.url)
+    assert login(clerk, "bob", "pw") == {"username": "bob", "role": "user"}
+    return server, clerk
+
+
+def test_every_remote_module_is_served():
+    assert {fn.__module__ for fn, *_ in db.REMOTE_CALLS.values()} == {
+        m.__name__ for m in inventory_server.REMOTE_MODULES}
+
+
+def test_calls_need_a_session(server):
+    with pytest.raises(PermissionError, match="log in"):
+        server.call("inventory_core.add_category", ("Tools",))
+    with pytest.raises(PermissionError, match="log in"):
+        server.query("SELECT * FROM items")
+
+
+def test_performed_by_is_the_session_account(clerk):
+    admin, bob = clerk
+    db.use_server(bob)
+    item = inventory_core.receive_item("Screw", "Tools", 10, 1, "B1", 2.5, 18, "Acme", "2024-01-02", ADMIN[0])
+    inventory_core.issue_item(item, "Screw", "Tools", 2, "Ravi", "", "2024-01-03", performed_by=ADMIN[0])
+    inventory_bulk.issue(pd.DataFrame([("Screw", "Tools", 1, "Ravi", "2024-01-04")],
+                                      columns=inventory_bulk.ISSUE_HEADERS), ADMIN[0])
+    inventory_core.delete_item(item, "Screw", "Tools", ADMIN[0])
+    assert db.query("SELECT txn_type, performed_by FROM transactions ORDER BY txn_id") == [
+        ("IN", "bob"), ("OUT", "bob"), ("OUT", "bob"), ("DEL", "bob")]
+
+
+def test_caller_is_the_session_account(clerk):
+    admin, bob = clerk
+    posing = {"username": ADMIN[0], "role": "super_admin"}
+    db.use_server(bob)
+    # changes bob's own password, whoever the request claims to be
+    inventory_core.change_password(posing, "pw", "stolen")
+    assert login(inventory_client.Client(admin.url), *ADMIN)
+    assert login(inventory_client.Client(admin.url), "bob", "stolen")
+    with pytest.raises(PermissionError):
+        inventory_core.create_user(posing, "mallory", "pw", "admin")
+    assert db.query("SELECT username FROM users WHERE username='mallory'") == []
+
+
+@pytest.mark.parametrize("name", ADMIN_CALLS)
+def test_admin_calls_refused_for_users(clerk, name):
+    admin, bob = clerk
+    with pytest.raises(PermissionError, match="admin account"):
+        bob.call(name, ())
+
+
+def test_admin_calls_allowed_for_admins(clerk):
+    admin, bob = clerk
+    assert admin.call("inventory_db.rebuild_rollups", ()) == 0
+    assert admin.call("inventory_reconcile.repair_drift", ()) is not None
+
+
+def test_non_positive_quantities_refused(clerk):
+    admin, bob = clerk
+    db.use_server(bob)
+    item = inventory_core.receive_item("Screw", "Tools", 5, 1, "B1", 2.5, 18, "Acme", "2024-01-02", "bob")
+    for qty in (-500, 0, 1.5):
+        with pytest.raises(ValueError, match="Quantity"):
+            inventory_core.issue_item(item, "Screw", "Tools", qty, "Ravi", "", "2024-01-03", "bob")
+        with pytest.raises(ValueError, match="Quantity"):
+            inventory_core.receive_item("Screw", "Tools", qty, 1, "B1", 2.5, 18, "Acme", "2024-01-02", "bob")
+    assert db.query("SELECT quantity FROM items WHERE item_id=?", (item,)) == [(5,)]
+    assert db.query("SELECT COUNT(*) FROM transactions") == [(1,)]
+
+
+def test_client_sql_is_read_only(clerk):
+    admin, bob = clerk
+    assert {row[0] for row in bob.query("SELECT password FROM users")} == {None}
+    with pytest.raises(sqlite3.OperationalError):
+        bob.query("UPDATE users SET role='super_admin' WHERE username='bob'")
+    with pytest.raises(sqlite3.DatabaseError):
+        bob.query("PRAGMA query_only=0")
+    assert bob.query("SELECT role FROM users WHERE username='bob'") == [("user",)]